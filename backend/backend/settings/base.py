@@ -157,7 +157,7 @@ AUTH_USER_MODEL = 'the_user_app.CustomUserModel'  # This refers to the model imp
 # REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'the_user_app.interfaces.api.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'EXCEPTION_HANDLER': 'core.interface.api.exception.exception_handlers.domain_exception_handler',
@@ -229,6 +229,54 @@ CACHES = {
 SESSION_ENGINE = "django.contrib.sessions.backends.cache"
 SESSION_CACHE_ALIAS = "default"
 
+# Store product autocomplete
+# Suggestions are served from an in-process index loaded at worker start
+# (see gunicorn_config.post_worker_init). Set to False to query the database instead.
+STORE_AUTOCOMPLETE_INDEX_ENABLED = True
+
+# How products.search_vector is kept up to date: 'always' (second UPDATE after
+# every save), 'dirty' (only when name/description changed) or 'trigger'
+# (database trigger, install with `manage_search_vectors install-trigger`)
+STORE_SEARCH_VECTOR_MODE = 'dirty'
+
+# Search analytics
+# Searches are buffered in process and written in batches every FLUSH_SIZE
+# events or FLUSH_INTERVAL seconds, together with the hourly rollups the
+# analytics queries read. Set BUFFERED to False to write each search inline.
+STORE_SEARCH_ANALYTICS_BUFFERED = True
+STORE_SEARCH_ANALYTICS_FLUSH_SIZE = 500
+STORE_SEARCH_ANALYTICS_FLUSH_INTERVAL = 5.0  # seconds
+STORE_SEARCH_ANALYTICS_MAX_BUFFERED = 50000  # older events are dropped beyond this
+
+# Token authentication
+# Blacklist lookups go through a Redis-backed Bloom filter first and only
+# possible members reach the database. User rows resolved from tokens are
+# cached for a few seconds (0 disables the snapshot cache).
+AUTH_TOKEN_BLACKLIST_FILTER_ENABLED = True
+AUTH_TOKEN_BLACKLIST_FILTER_BITS = 2 ** 20  # per expiry day, ~1% false positives at 100k tokens
+AUTH_TOKEN_BLACKLIST_FILTER_HASHES = 7
+AUTH_TOKEN_BLACKLIST_FILTER_REFRESH_SECONDS = 2.0  # max age of a process's local copy
+AUTH_USER_SNAPSHOT_TTL_SECONDS = 30
+
+# Geocoding cache
+# Results are kept in an in-process LRU in front of the geocode_cache table,
+# shared by the store and deliveries services. Unresolvable addresses are
+# cached for NEGATIVE_TTL so they aren't sent to the provider on every request.
+GEOCODE_CACHE_ENABLED = True
+GEOCODE_CACHE_LRU_SIZE = 10000
+GEOCODE_CACHE_TTL = 60 * 60 * 24 * 90  # seconds
+GEOCODE_CACHE_NEGATIVE_TTL = 60 * 60 * 24  # seconds
+GEOCODE_CACHE_COORDINATE_PRECISION = 4  # decimals of the reverse lookup key (~11m)
+
+# Hydrated carts are cached for CART_CACHE_TIMEOUT seconds and dropped on every
+# item mutation. 0 disables the cache.
+CART_CACHE_TIMEOUT = 60 * 5  # seconds
+
+# Recovery emails are sent CART_RECOVERY_DELAY_HOURS after a cart is marked,
+# by runs popping due carts from the schedule CART_RECOVERY_BATCH_SIZE at a time
+CART_RECOVERY_DELAY_HOURS = 24
+CART_RECOVERY_BATCH_SIZE = 500
+
 # Celery Configuration - common settings
 CELERY_RESULT_BACKEND = 'django-db'
 CELERY_ACCEPT_CONTENT = ['application/json']
@@ -240,6 +288,13 @@ CELERY_TIMEZONE = 'UTC'
 # Note: CELERY_BROKER_URL should be defined in environment-specific settings
 CELERY_BEAT_SCHEDULE = {}
 
+# Domain events outbox
+# Events are written to the outbox table inside the caller's transaction and
+# relayed to Celery in batches by core.domain_events.tasks.relay_outbox_events
+DOMAIN_EVENTS_OUTBOX_ENABLED = True
+DOMAIN_EVENTS_OUTBOX_BATCH_SIZE = 100
+DOMAIN_EVENTS_OUTBOX_RELAY_INTERVAL = 1.0  # seconds between relay runs
+
 # -------------------------------------------------------------------------
 # Django Channels Configuration
 # -------------------------------------------------------------------------
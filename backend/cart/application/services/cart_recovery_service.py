@@ -1,112 +1,113 @@
 import logging
 import uuid
-from typing import List, Tuple
+from typing import Iterator, List, Optional, Tuple
+from django.conf import settings
 from django.utils import timezone
-from django.core.cache import cache
 
+from cart.domain.models.entities import Cart
 from cart.domain.repositories.repository_interfaces import CartRepository
+from cart.domain.services.recovery_schedule_interface import CartRecoverySchedule
 from cart.application.services.cart_service import CartApplicationService
 
 logger = logging.getLogger(__name__)
 
 class CartRecoveryService:
     """Service for handling cart recovery operations
-    
+
     This service is responsible for identifying abandoned carts,
     sending recovery emails, and tracking recovery attempts.
+
+    Due carts are popped from the recovery schedule in batches and each batch
+    is hydrated in one repository call.
     """
-    
-    def __init__(self, cart_repository: CartRepository, cart_service: CartApplicationService):
+
+    def __init__(self, cart_repository: CartRepository, cart_service: CartApplicationService,
+                 recovery_schedule: CartRecoverySchedule, batch_size: Optional[int] = None):
         self.cart_repository = cart_repository
         self.cart_service = cart_service
-        
+        self.recovery_schedule = recovery_schedule
+        self.batch_size = batch_size or getattr(settings, 'CART_RECOVERY_BATCH_SIZE', 500)
+
     def get_carts_for_recovery(self) -> List[uuid.UUID]:
         """Get all carts that are marked for recovery and ready to be processed
-        
+
+        The carts are removed from the schedule, whether they need an email or not.
+
         Returns:
             List of cart IDs that need recovery emails
         """
-        recovery_carts = []
-        
-        # Get all keys from cache that match the pattern
-        # Note: This is a simplified implementation using Django's cache
-        # In a production environment, you might want to use a more robust solution
-        # like a dedicated queue or a scheduled task
-        all_keys = cache.keys("cart_recovery:*")
-        now = timezone.now()
-        
-        for key in all_keys:
-            # Extract cart ID from key
-            try:
-                cart_id = uuid.UUID(key.split(":", 1)[1])
-                recovery_time_str = cache.get(key)
-                
-                if not recovery_time_str:
-                    continue
-                    
-                recovery_time = timezone.datetime.fromisoformat(recovery_time_str)
-                
-                # Check if it's time to send the recovery email
-                if now >= recovery_time:
-                    # Get the cart to verify it still exists and has items
-                    cart = self.cart_repository.get_cart(cart_id=cart_id)
-                    if cart and not cart.is_empty():
-                        recovery_carts.append(cart_id)
-                    
-                    # Remove from cache regardless of whether we'll process it
-                    # This prevents repeated processing of deleted carts
-                    cache.delete(key)
-            except (ValueError, IndexError, TypeError) as e:
-                logger.error(f"Error processing recovery cart key {key}: {str(e)}")
-                # Clean up invalid keys
-                cache.delete(key)
-                
-        return recovery_carts
-        
+        return [cart.id for batch in self._due_cart_batches() for cart in batch]
+
     def send_recovery_email(self, cart_id: uuid.UUID) -> bool:
         """Send a recovery email for an abandoned cart
-        
+
         Args:
             cart_id: UUID of the cart
-            
+
         Returns:
             True if email was sent successfully
         """
         try:
-            # Get cart
             cart = self.cart_repository.get_cart(cart_id=cart_id)
-            if not cart or cart.is_empty():
-                return False
-            
+        except Exception as e:
+            logger.error(f"Error sending recovery email for cart {cart_id}: {str(e)}")
+            return False
+        if not cart or cart.is_empty():
+            return False
+        return self._send_recovery_email(cart)
+
+    def process_pending_recoveries(self) -> Tuple[int, int]:
+        """Process all pending cart recoveries
+
+        Returns:
+            Tuple of (total_processed, successful_sends)
+        """
+        total = 0
+        successful = 0
+
+        for carts in self._due_cart_batches():
+            total += len(carts)
+            successful += sum(1 for cart in carts if self._send_recovery_email(cart))
+
+        return total, successful
+
+    def _due_cart_batches(self) -> Iterator[List[Cart]]:
+        """Pop due carts from the schedule and hydrate them, one batch at a time
+
+        Carts deleted or emptied since they were scheduled are dropped. The
+        schedule may pop fewer carts than asked for, so popping stops only
+        once nothing is due.
+
+        Yields:
+            Lists of at most batch_size non-empty carts
+        """
+        now = timezone.now()
+        while True:
+            cart_ids = self.recovery_schedule.pop_due(now, self.batch_size)
+            if not cart_ids:
+                return
+
+            carts = [cart for cart in self.cart_repository.get_carts(cart_ids) if not cart.is_empty()]
+            if carts:
+                yield carts
+
+    def _send_recovery_email(self, cart: Cart) -> bool:
+        """Send the recovery email of a hydrated cart"""
+        try:
             # Here we would implement the actual email sending logic
             # This could involve using Django's email functionality or a third-party service
-            
+
             # For demonstration purposes, we'll just log that we would send an email
-            logger.info(f"Would send recovery email for cart {cart_id} to user {cart.user_id}")
-            logger.info(f"Cart contains {len(cart.items)} items with total price {cart.total_price}")
-            
+            logger.info(f"Would send recovery email for cart {cart.id} to user {cart.user_id}")
+            logger.info(f"Cart contains {len(cart.items)} items with total price {cart.cart_total_price}")
+
             # In a real implementation, we would:
             # 1. Generate a recovery URL with a token
             # 2. Create an email template with cart details
             # 3. Send the email
             # 4. Track the email send in your database
-            
+
             return True
         except Exception as e:
-            logger.error(f"Error sending recovery email for cart {cart_id}: {str(e)}")
+            logger.error(f"Error sending recovery email for cart {cart.id}: {str(e)}")
             return False
-            
-    def process_pending_recoveries(self) -> Tuple[int, int]:
-        """Process all pending cart recoveries
-        
-        Returns:
-            Tuple of (total_processed, successful_sends)
-        """
-        cart_ids = self.get_carts_for_recovery()
-        successful = 0
-        
-        for cart_id in cart_ids:
-            if self.send_recovery_email(cart_id):
-                successful += 1
-                
-        return len(cart_ids), successful
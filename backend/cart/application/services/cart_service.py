@@ -1,20 +1,23 @@
 from typing import List, Optional, Tuple
 import uuid
 import logging
+from django.conf import settings
 from django.utils import timezone
-from django.core.cache import cache
 
 from cart.domain.models.entities import Cart, CartItem
 from cart.domain.repositories.repository_interfaces import CartRepository, CartItemRepository
+from cart.domain.services.recovery_schedule_interface import CartRecoverySchedule
 
 logger = logging.getLogger(__name__)
 
 class CartApplicationService:
     """Application service for cart-related use cases"""
     
-    def __init__(self, cart_repository: CartRepository, cart_item_repository: CartItemRepository):
+    def __init__(self, cart_repository: CartRepository, cart_item_repository: CartItemRepository,
+                 recovery_schedule: Optional[CartRecoverySchedule] = None):
         self.cart_repository = cart_repository
         self.cart_item_repository = cart_item_repository
+        self.recovery_schedule = recovery_schedule
     
     def get_cart(self, cart_id: uuid.UUID = None, user_id: uuid.UUID = None, 
                 store_brand_id: uuid.UUID = None) -> Optional[Cart]:
@@ -166,14 +169,11 @@ class CartApplicationService:
             if not item:
                 return False, "Item not found"
                 
-            # Remove the item
+            # Remove the item, the repository updates the cart totals
             success = self.cart_item_repository.remove_item(item_id)
             if not success:
                 return False, "Failed to remove item from cart"
                 
-            # Recalculate cart totals
-            self.cart_repository.recalculate_cart_totals(cart_id)
-                
             return True, ""
         except Exception as e:
             logger.error(f"Error removing item from cart: {str(e)}")
@@ -200,27 +200,31 @@ class CartApplicationService:
             logger.error(f"Error deleting cart: {str(e)}")
             return False, f"Error deleting cart: {str(e)}"
             
-    def reserve_cart(self, cart_id: uuid.UUID, minutes: int = 3600) -> Tuple[bool, str]:
+    def reserve_cart(self, cart_id: uuid.UUID, minutes: int = 3600,
+                     expected_version: Optional[int] = None) -> Tuple[bool, str]:
         """Reserve a cart for checkout
         
         Args:
             cart_id: UUID of the cart
             minutes: Number of minutes to reserve the cart for
+            expected_version: Version of the cart being checked out (optional),
+                the reservation fails if the cart changed since
             
         Returns:
             Tuple of (success, error_message)
-            success is True if cart was reserved successfully
+            success is True if this call won the reservation
             error_message is empty if successful, otherwise contains the error
         """
         try:
-            cart = self.cart_repository.get_cart(cart_id=cart_id)
-            if not cart:
-                return False, "Cart not found"
-                
-            # Update the cart model
-            self.cart_repository.reserve(cart_id, minutes)
+            if self.cart_repository.reserve(cart_id, minutes, expected_version):
+                return True, ""
             
-            return True, ""
+            # Lost the reservation, find out why
+            if self.cart_repository.is_reserved(cart_id):
+                return False, "Cart is already reserved"
+            if not self.cart_repository.get_cart(cart_id=cart_id):
+                return False, "Cart not found"
+            return False, "Cart was modified, please review it before checking out"
         except Exception as e:
             logger.error(f"Error reserving cart: {str(e)}")
             return False, f"Error reserving cart: {str(e)}"
@@ -237,12 +241,8 @@ class CartApplicationService:
             error_message is empty if successful, otherwise contains the error
         """
         try:
-            cart = self.cart_repository.get_cart(cart_id=cart_id)
-            if not cart:
+            if not self.cart_repository.release_reservation(cart_id):
                 return False, "Cart not found"
-                
-            # Update the cart model
-            self.cart_repository.release_reservation(cart_id)
             
             return True, ""
         except Exception as e:
@@ -263,10 +263,10 @@ class CartApplicationService:
         if not cart or cart.is_empty():
             return False
         
-        # Add to recovery queue (implementation depends on the email system)
-        recovery_time = timezone.now() + timezone.timedelta(hours=24)
-        
-        # Example implementation using Django's cache
-        cache.set(f"cart_recovery:{cart_id}", str(recovery_time), 86400)  # 24 hours
+        if self.recovery_schedule is None:
+            logger.warning(f"No recovery schedule configured, cart {cart_id} not marked for recovery")
+            return False
         
-        return True
+        # Marking the cart again postpones its recovery
+        delay = getattr(settings, 'CART_RECOVERY_DELAY_HOURS', 24)
+        return self.recovery_schedule.schedule(cart_id, timezone.now() + timezone.timedelta(hours=delay))
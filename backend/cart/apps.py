@@ -27,7 +27,7 @@ class CartConfig(AppConfig):
         try:
             # Only register celery tasks if celery is configured
             if hasattr(settings, 'CELERY_BEAT_SCHEDULE'):
-                from cart.tasks import process_cart_recoveries
+                from cart.tasks import process_cart_recoveries, reconcile_cart_totals
                 
                 # Add the task to the celery beat schedule if not already there
                 if 'cart.tasks.process_cart_recoveries' not in settings.CELERY_BEAT_SCHEDULE:
@@ -37,6 +37,14 @@ class CartConfig(AppConfig):
                         'options': {'expires': 3540},  # Expire after 59 minutes
                     }
                     logger.info("Registered cart recovery task with Celery Beat")
+                
+                if 'cart.tasks.reconcile_cart_totals' not in settings.CELERY_BEAT_SCHEDULE:
+                    settings.CELERY_BEAT_SCHEDULE['cart.tasks.reconcile_cart_totals'] = {
+                        'task': 'cart.tasks.reconcile_cart_totals',
+                        'schedule': 6 * 3600.0,  # Run every 6 hours
+                        'options': {'expires': 6 * 3600 - 60},
+                    }
+                    logger.info("Registered cart totals reconciliation with Celery Beat")
         except ImportError:
             logger.warning("Celery not installed, skipping task registration")
         except Exception as e:
@@ -36,6 +36,8 @@ class Cart:
     # Cart totals for direct use in UI and validation
     cart_total_price: float = 0.0
     cart_total_items: int = 0
+    # Version of the stored cart, for optimistic concurrency control
+    version: int = 0
     
     def calculate_cart_price_total(self) -> float:
         """Calculate the total price of all items in the cart"""
@@ -41,6 +41,18 @@ class CartRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def get_carts(self, cart_ids: List[uuid.UUID]) -> List[Cart]:
+        """Get several carts at once
+        
+        Args:
+            cart_ids: UUIDs of the carts
+            
+        Returns:
+            List of the Cart objects found, missing carts are skipped
+        """
+        pass
+    
     @abstractmethod
     def create_or_get_cart(self, user_id: uuid.UUID, store_brand_id: uuid.UUID) -> Cart:
         """Create a new cart or get existing one
@@ -66,6 +78,15 @@ class CartRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def reconcile_cart_totals(self) -> int:
+        """Fix carts whose totals drifted from their items
+        
+        Returns:
+            Number of carts fixed
+        """
+        pass
+
     @abstractmethod
     def add_item_to_cart(self, cart_id: uuid.UUID, store_product_id: uuid.UUID,
                         quantity: int
@@ -127,15 +148,18 @@ class CartRepository(ABC):
         pass
         
     @abstractmethod
-    def reserve(self, cart_id: uuid.UUID, minutes: int = 15) -> bool:
-        """Reserve a cart for a specified time
+    def reserve(self, cart_id: uuid.UUID, minutes: int = 15,
+                expected_version: Optional[int] = None) -> bool:
+        """Reserve a cart for a specified time, unless it is already reserved
         
         Args:
             cart_id: UUID of the cart
             minutes: Number of minutes to reserve the cart for
+            expected_version: Only reserve the cart if it is still at this version (optional)
             
         Returns:
-            True if successful, False otherwise
+            True if the reservation was won, False if the cart is missing,
+            already reserved or changed since expected_version
         """
         pass
         
@@ -0,0 +1,58 @@
+"""
+Cart recovery schedule interface for the cart domain.
+
+Carts marked for recovery are scheduled at the time their recovery email is
+due. The schedule is an index on that time, so finding the due carts never
+scans carts that are not due yet.
+"""
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List
+import uuid
+
+
+class CartRecoverySchedule(ABC):
+    """Interface for the schedule of cart recovery emails"""
+
+    @abstractmethod
+    def schedule(self, cart_id: uuid.UUID, due_at: datetime) -> bool:
+        """
+        Schedule the recovery of a cart, replacing any earlier due time
+
+        Args:
+            cart_id: UUID of the cart
+            due_at: When the recovery email is due
+
+        Returns:
+            True if the cart was scheduled
+        """
+        pass
+
+    @abstractmethod
+    def cancel(self, cart_id: uuid.UUID) -> bool:
+        """
+        Remove a cart from the schedule
+
+        Args:
+            cart_id: UUID of the cart
+
+        Returns:
+            True if the cart was scheduled
+        """
+        pass
+
+    @abstractmethod
+    def pop_due(self, now: datetime, limit: int) -> List[uuid.UUID]:
+        """
+        Remove and return carts whose recovery is due, earliest first
+
+        A cart is returned to a single caller even when several pop concurrently.
+
+        Args:
+            now: Carts due at or before this time are returned
+            limit: Maximum number of carts to return
+
+        Returns:
+            List of cart IDs, empty when no cart is due
+        """
+        pass
@@ -14,23 +14,13 @@ class CartModel(models.Model):
     reserved_until = models.DateTimeField(null=True, blank=True)
     cart_total_price = models.DecimalField(max_digits=10, decimal_places=2, default=0)
     cart_total_items = models.IntegerField(default=0)
+    # Incremented by every update of the row, for optimistic concurrency control
+    version = models.PositiveIntegerField(default=0)
 
     class Meta:
         unique_together = ['user', 'store_brand']  # One cart per user per store
         db_table = 'carts'
         
-    def reserve(self, minutes=15):
-        """Reserve cart items for a specified time"""
-        self.reserved_until = timezone.now() + timezone.timedelta(minutes=minutes)
-        self.save()
-        return self
-    
-    def release_reservation(self):
-        """Release cart reservation"""
-        self.reserved_until = None
-        self.save()
-        return self
-    
     def is_reserved(self):
         """Check if cart is currently reserved"""
         return self.reserved_until and self.reserved_until > timezone.now()
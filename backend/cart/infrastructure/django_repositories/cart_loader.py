@@ -0,0 +1,172 @@
+"""
+Cart hydration in a constant number of queries, with an optional cache
+
+A cart is loaded with its store brand in one query and its items, joined
+with their store product and product, in a second one, whatever the number
+of items. Only the columns the domain entities need are selected.
+
+Hydrated carts are cached for CART_CACHE_TIMEOUT seconds (0 disables the
+cache). Each entry records the cart generation read before the cart was
+loaded; the transaction mutating the items moves the generation on commit,
+so an entry written by a reader that loaded the cart before that commit no
+longer matches and is reloaded.
+"""
+import logging
+import uuid
+from typing import List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Prefetch, QuerySet
+
+from cart.domain.models.entities import Cart, CartItem
+from cart.infrastructure.django_models.orm_models import CartItemModel, CartModel
+
+logger = logging.getLogger(__name__)
+
+CART_CACHE_KEY = 'cart:hydrated:{}'
+CART_GENERATION_KEY = 'cart:generation:{}'
+
+# Queries run by load_cart and load_carts, whatever the number of items
+CART_LOAD_QUERIES = 2
+
+CART_FIELDS = (
+    'id', 'user_id', 'store_brand_id', 'created_at', 'updated_at',
+    'cart_total_price', 'cart_total_items', 'version',
+    'store_brand__id', 'store_brand__name', 'store_brand__image_logo',
+)
+CART_ITEM_FIELDS = (
+    'id', 'cart_id', 'quantity', 'added_at', 'product_price', 'item_total_price',
+    'store_product__id',
+    'store_product__product__id', 'store_product__product__name',
+    'store_product__product__description', 'store_product__product__image_url',
+)
+
+
+def cart_queryset() -> QuerySet:
+    """Carts with their store brand and items, ready for cart_model_to_entity"""
+    items = CartItemModel.objects.select_related(
+        'store_product__product'
+    ).only(*CART_ITEM_FIELDS).order_by('added_at')
+    return CartModel.objects.select_related('store_brand').only(*CART_FIELDS).prefetch_related(
+        Prefetch('cart_items', queryset=items)
+    )
+
+
+def cart_model_to_entity(cart_model: CartModel) -> Cart:
+    """Convert a cart loaded by cart_queryset to a domain entity, without queries
+
+    Args:
+        cart_model: CartModel from cart_queryset
+
+    Returns:
+        Cart domain entity
+    """
+    items = []
+    for item_model in cart_model.cart_items.all():
+        product = item_model.store_product.product
+        items.append(CartItem(
+            id=item_model.id,
+            store_product_id=item_model.store_product.id,
+            quantity=item_model.quantity,
+            product_name=product.name,
+            product_image_thumbnail=str(product.image_thumbnail),
+            product_image_url=str(product.image_url),
+            product_price=float(item_model.product_price),
+            product_description=product.description,
+            item_total_price=float(item_model.item_total_price),
+            added_at=item_model.added_at
+        ))
+
+    return Cart(
+        id=cart_model.id,
+        user_id=cart_model.user_id,
+        store_brand_id=cart_model.store_brand_id,
+        store_brand_name=cart_model.store_brand.name,
+        store_brand_logo=str(cart_model.store_brand.image_logo),
+        items=items,
+        created_at=cart_model.created_at,
+        updated_at=cart_model.updated_at,
+        cart_total_price=float(cart_model.cart_total_price),
+        cart_total_items=cart_model.cart_total_items,
+        version=cart_model.version
+    )
+
+
+def load_cart(**filters) -> Optional[Cart]:
+    """Load one cart in CART_LOAD_QUERIES queries
+
+    Args:
+        **filters: Lookups identifying the cart, e.g. id=... or user_id=..., store_brand_id=...
+
+    Returns:
+        Cart domain entity, None if not found
+    """
+    cart_model = cart_queryset().filter(**filters).first()
+    return cart_model_to_entity(cart_model) if cart_model else None
+
+
+def load_carts(**filters) -> List[Cart]:
+    """Load several carts in CART_LOAD_QUERIES queries"""
+    return [cart_model_to_entity(cart_model) for cart_model in cart_queryset().filter(**filters)]
+
+
+def get_cached_cart(cart_id: uuid.UUID) -> Optional[Cart]:
+    """Hydrated cart from the cache, loaded and cached on a miss
+
+    Args:
+        cart_id: UUID of the cart
+
+    Returns:
+        Cart domain entity, None if not found
+    """
+    timeout = getattr(settings, 'CART_CACHE_TIMEOUT', 0)
+    # Inside a transaction the cart may hold uncommitted item changes, bypass the cache
+    if not timeout or transaction.get_connection().in_atomic_block:
+        return load_cart(id=cart_id)
+
+    key = CART_CACHE_KEY.format(cart_id)
+    generation_key = CART_GENERATION_KEY.format(cart_id)
+    try:
+        cached = cache.get_many([key, generation_key])
+        generation = cached.get(generation_key)
+        if generation is None:
+            cache.add(generation_key, uuid.uuid4().hex, timeout)
+            generation = cache.get(generation_key)
+    except Exception as e:
+        logger.warning(f"Could not read cart {cart_id} from the cache: {str(e)}")
+        return load_cart(id=cart_id)
+
+    entry = cached.get(key)
+    if entry is not None and generation is not None and entry[0] == generation:
+        return entry[1]
+
+    # Tagged with the generation read before loading: a commit in between makes it a miss
+    cart = load_cart(id=cart_id)
+    if cart is not None and generation is not None:
+        try:
+            cache.set(key, (generation, cart), timeout)
+        except Exception as e:
+            logger.warning(f"Could not cache cart {cart_id}: {str(e)}")
+    return cart
+
+
+def invalidate_cached_cart(cart_id: uuid.UUID) -> None:
+    """Move the cart generation on and drop its cached entry once the current transaction commits
+
+    Args:
+        cart_id: UUID of the mutated cart
+    """
+    timeout = getattr(settings, 'CART_CACHE_TIMEOUT', 0)
+    if not timeout:
+        return
+
+    def invalidate():
+        try:
+            cache.set(CART_GENERATION_KEY.format(cart_id), uuid.uuid4().hex, timeout)
+            cache.delete(CART_CACHE_KEY.format(cart_id))
+        except Exception as e:
+            logger.warning(f"Could not drop cart {cart_id} from the cache: {str(e)}")
+
+    transaction.on_commit(invalidate)
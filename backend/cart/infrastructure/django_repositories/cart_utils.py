@@ -4,10 +4,14 @@ Utility functions for cart repositories
 import logging
 import uuid
 from decimal import Decimal
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+
+from django.db.models import DecimalField, F, Sum, Value
+from django.db.models.functions import Coalesce
 
 from cart.domain.models.entities import Cart, CartItem
 from cart.infrastructure.django_models.orm_models import CartModel, CartItemModel
+from .cart_loader import invalidate_cached_cart
 
 logger = logging.getLogger(__name__)
 
@@ -51,11 +55,15 @@ def cart_model_to_domain(cart_model: CartModel) -> Cart:
         store_brand_logo=store_brand_logo,
         items=cart_items,
         cart_total_price=float(cart_model.cart_total_price),
-        cart_total_items=cart_model.cart_total_items
+        cart_total_items=cart_model.cart_total_items,
+        version=cart_model.version
     )
 
 def update_cart_totals(cart_id: uuid.UUID) -> bool:
-    """Update cart totals using domain entity methods
+    """Recompute cart totals from its items in SQL
+    
+    Item mutations keep the totals up to date with apply_cart_totals_delta;
+    this full recompute is for batch operations and fixing inconsistencies.
     
     Args:
         cart_id: UUID of the cart
@@ -64,21 +72,88 @@ def update_cart_totals(cart_id: uuid.UUID) -> bool:
         True if successful, False otherwise
     """
     try:
-        cart_model = CartModel.objects.get(id=cart_id)
-        cart_entity = cart_model_to_domain(cart_model)
-        
-        # Use domain entity methods for calculations
-        cart_model.cart_total_price = Decimal(str(cart_entity.calculate_cart_price_total()))
-        cart_model.cart_total_items = cart_entity.calculate_cart_total_items()
-        cart_model.save(update_fields=['cart_total_price', 'cart_total_items'])
+        totals = CartItemModel.objects.filter(cart_id=cart_id).aggregate(
+            total_price=Sum('item_total_price'),
+            total_items=Sum('quantity')
+        )
+        updated = CartModel.objects.filter(id=cart_id).update(
+            cart_total_price=totals['total_price'] or Decimal('0'),
+            cart_total_items=totals['total_items'] or 0,
+            version=F('version') + 1
+        )
+        if not updated:
+            logger.error(f"Cart with ID {cart_id} not found")
+            return False
+        invalidate_cached_cart(cart_id)
         return True
-    except CartModel.DoesNotExist:
-        logger.error(f"Cart with ID {cart_id} not found")
-        return False
     except Exception as e:
         logger.error(f"Error updating cart totals: {str(e)}")
         return False
 
+def apply_cart_totals_delta(cart_id: uuid.UUID, price_delta: Decimal, items_delta: int) -> bool:
+    """Shift cart totals by the change of one line item
+    
+    A single UPDATE with F() expressions, so concurrent mutations of the
+    same cart add up instead of overwriting each other. Call it in the
+    transaction of the item change.
+    
+    Args:
+        cart_id: UUID of the cart
+        price_delta: Change of the line item total price
+        items_delta: Change of the line item quantity
+        
+    Returns:
+        True if the cart was updated, False if it doesn't exist
+    """
+    if not price_delta and not items_delta:
+        return True
+    updated = CartModel.objects.filter(id=cart_id).update(
+        cart_total_price=F('cart_total_price') + price_delta,
+        cart_total_items=F('cart_total_items') + items_delta,
+        version=F('version') + 1
+    )
+    invalidate_cached_cart(cart_id)
+    return updated == 1
+
+def reconcile_cart_totals(batch_size: int = 1000) -> List[Dict[str, Any]]:
+    """Find carts whose stored totals drifted from their items, and fix them
+    
+    Compares the totals of every cart with the sums of its items in one
+    aggregate query. Fixes are conditional on the cart version, so a cart
+    mutated meanwhile is left for the next run.
+    
+    Args:
+        batch_size: Maximum number of carts fixed per call
+        
+    Returns:
+        One dictionary per fixed cart, with the stored and expected totals
+    """
+    drifted = CartModel.objects.annotate(
+        items_price=Coalesce(Sum('cart_items__item_total_price'), Value(Decimal('0')),
+                             output_field=DecimalField(max_digits=10, decimal_places=2)),
+        items_count=Coalesce(Sum('cart_items__quantity'), Value(0))
+    ).exclude(
+        cart_total_price=F('items_price'),
+        cart_total_items=F('items_count')
+    ).values('id', 'version', 'cart_total_price', 'cart_total_items', 'items_price', 'items_count')[:batch_size]
+    
+    fixed = []
+    for row in drifted:
+        updated = CartModel.objects.filter(id=row['id'], version=row['version']).update(
+            cart_total_price=row['items_price'],
+            cart_total_items=row['items_count'],
+            version=F('version') + 1
+        )
+        if updated:
+            invalidate_cached_cart(row['id'])
+            logger.warning(
+                f"Cart {row['id']} totals drifted: stored price={row['cart_total_price']} "
+                f"items={row['cart_total_items']}, expected price={row['items_price']} "
+                f"items={row['items_count']}"
+            )
+            fixed.append(row)
+    return fixed
+
 def calculate_item_total_price(item_model: CartItemModel) -> Decimal:
     """Calculate item total price using domain entity
     
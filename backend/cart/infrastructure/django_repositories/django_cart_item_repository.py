@@ -4,12 +4,13 @@ import logging
 from decimal import Decimal
 
 from django.db import transaction
+from django.db.models import F
 
 from cart.domain.models.entities import CartItem
 from cart.domain.repositories.repository_interfaces import CartItemRepository
 from cart.infrastructure.django_models.orm_models import CartItemModel, CartModel
 from store.models import StoreProduct
-from .cart_utils import update_cart_totals, calculate_item_total_price
+from .cart_utils import apply_cart_totals_delta, calculate_item_total_price
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +26,9 @@ class DjangoCartItemRepository(CartItemRepository):
                 quantity: int) -> CartItem:
         """Add an item to a cart
         
+        The cart totals are shifted by the added line in the same transaction,
+        without reloading the other items.
+        
         Args:
             cart_id: UUID of the cart
             store_product_id: UUID of the store product
@@ -35,45 +39,50 @@ class DjangoCartItemRepository(CartItemRepository):
         """
         try:
             with transaction.atomic():
-                # Validate store product exists
-                try:
-                    store_product = StoreProduct.objects.get(id=store_product_id)
-                except StoreProduct.DoesNotExist:
-                    logger.error(f"Store product with ID {store_product_id} not found")
-                    return None
-                    
                 # Check if item already exists
-                existing_item = CartItemModel.objects.filter(
+                existing_item = CartItemModel.objects.select_related(
+                    'store_product__product'
+                ).filter(
                     cart_id=cart_id,
                     store_product_id=store_product_id
                 ).first()
                 
                 if existing_item:
-                    # Update quantity
+                    # Update quantity in SQL, concurrent adds of the same product add up
+                    added_price = existing_item.product_price * quantity
+                    CartItemModel.objects.filter(id=existing_item.id).update(
+                        quantity=F('quantity') + quantity,
+                        item_total_price=F('item_total_price') + added_price
+                    )
                     existing_item.quantity += quantity
-                    existing_item.save()
+                    existing_item.item_total_price = calculate_item_total_price(existing_item)
                     
-                    # Update cart totals
-                    update_cart_totals(cart_id)
+                    apply_cart_totals_delta(cart_id, added_price, quantity)
                     
                     return self._to_domain(existing_item)
-                else:
-                    # Create new item
-                    item_model = CartItemModel(
-                        cart_id=cart_id,
-                        store_product_id=store_product_id,
-                        product_price=store_product.price,
-                        quantity=quantity
-                    )
-                    
-                    # Calculate item total price
-                    item_model.item_total_price = calculate_item_total_price(item_model)
-                    item_model.save()
-                    
-                    # Update cart totals
-                    update_cart_totals(cart_id)
-                    
-                    return self._to_domain(item_model)
+                
+                # Validate store product exists
+                try:
+                    store_product = StoreProduct.objects.select_related('product').get(id=store_product_id)
+                except StoreProduct.DoesNotExist:
+                    logger.error(f"Store product with ID {store_product_id} not found")
+                    return None
+                
+                # Create new item
+                item_model = CartItemModel(
+                    cart_id=cart_id,
+                    store_product=store_product,
+                    product_price=store_product.price,
+                    quantity=quantity
+                )
+                
+                # Calculate item total price
+                item_model.item_total_price = calculate_item_total_price(item_model)
+                item_model.save()
+                
+                apply_cart_totals_delta(cart_id, item_model.item_total_price, quantity)
+                
+                return self._to_domain(item_model)
         except Exception as e:
             logger.error(f"Error adding item to cart: {str(e)}")
             return None
@@ -103,13 +112,15 @@ class DjangoCartItemRepository(CartItemRepository):
         Returns:
             List of CartItem objects
         """
-        item_models = CartItemModel.objects.filter(cart_id=cart_id)
+        item_models = CartItemModel.objects.select_related('store_product__product').filter(cart_id=cart_id)
         return [self._to_domain(item_model) for item_model in item_models]
     
     def update_item_quantity(self, item_id: uuid.UUID, 
                             quantity: int) -> Tuple[Optional[CartItem], bool]:
         """Update the quantity of a cart item
         
+        The item row is locked while its change is applied to the cart totals.
+        
         Args:
             item_id: UUID of the item to update
             quantity: New quantity value
@@ -121,8 +132,7 @@ class DjangoCartItemRepository(CartItemRepository):
             with transaction.atomic():
                 # Get the item
                 try:
-                    item_model = CartItemModel.objects.get(id=item_id)
-                    cart_id = item_model.cart_id
+                    item_model = self._get_locked_item(item_id)
                 except CartItemModel.DoesNotExist:
                     logger.error(f"Cart item with ID {item_id} not found")
                     return None, False
@@ -130,16 +140,18 @@ class DjangoCartItemRepository(CartItemRepository):
                 # Delete item if quantity is less than 1
                 if quantity < 1:
                     item_model.delete()
-                    update_cart_totals(cart_id)
+                    apply_cart_totals_delta(item_model.cart_id, -item_model.item_total_price, -item_model.quantity)
                     return None, True
                 
                 # Update quantity
+                price_delta = -item_model.item_total_price
+                items_delta = quantity - item_model.quantity
                 item_model.quantity = quantity
                 item_model.item_total_price = calculate_item_total_price(item_model)
-                item_model.save()
+                item_model.save(update_fields=['quantity', 'item_total_price'])
+                price_delta += item_model.item_total_price
                 
-                # Update cart totals
-                update_cart_totals(cart_id)
+                apply_cart_totals_delta(item_model.cart_id, price_delta, items_delta)
                 
                 return self._to_domain(item_model), False
         except Exception as e:
@@ -159,8 +171,9 @@ class DjangoCartItemRepository(CartItemRepository):
             with transaction.atomic():
                 # Get the item
                 try:
-                    item_model = CartItemModel.objects.get(id=item_id)
-                    cart_id = item_model.cart_id
+                    item_model = CartItemModel.objects.select_for_update().only(
+                        'id', 'cart_id', 'quantity', 'item_total_price'
+                    ).get(id=item_id)
                 except CartItemModel.DoesNotExist:
                     logger.error(f"Cart item with ID {item_id} not found")
                     return False
@@ -168,14 +181,19 @@ class DjangoCartItemRepository(CartItemRepository):
                 # Delete the item
                 item_model.delete()
                 
-                # Update cart totals
-                update_cart_totals(cart_id)
+                apply_cart_totals_delta(item_model.cart_id, -item_model.item_total_price, -item_model.quantity)
                 
                 return True
         except Exception as e:
             logger.error(f"Error removing item: {str(e)}")
             return False
     
+    def _get_locked_item(self, item_id: uuid.UUID) -> CartItemModel:
+        """Get a cart item with its product, locking the item row only"""
+        return CartItemModel.objects.select_related(
+            'store_product__product'
+        ).select_for_update(of=('self',)).get(id=item_id)
+    
     def _to_domain(self, item_model: CartItemModel) -> CartItem:
         """Convert ORM model to domain model
         
@@ -4,11 +4,15 @@ import uuid
 import logging
 
 from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
 
 from cart.domain.models.entities import Cart, CartItem
 from cart.domain.repositories.repository_interfaces import CartRepository
-from cart.infrastructure.django_models.orm_models import CartModel
-from store.models import StoreBrand
+from cart.infrastructure.django_models.orm_models import CartItemModel, CartModel
+from .cart_loader import (
+    cart_model_to_entity, get_cached_cart, invalidate_cached_cart, load_cart, load_carts
+)
 
 logger = logging.getLogger(__name__)
 
@@ -20,31 +24,26 @@ class DjangoCartRepository(CartRepository):
     def get_cart(self, cart_id: uuid.UUID = None, user_id: uuid.UUID = None, 
                store_brand_id: uuid.UUID = None
                ) -> Optional[Cart]:
-        """Get a cart with options to include product details"""
-        try:
-            # Build query based on provided parameters
-            query = {}
-            if cart_id is not None:
-                query['id'] = cart_id
-            elif user_id is not None and store_brand_id is not None:
-                query['user_id'] = user_id
-                query['store_brand_id'] = store_brand_id
-            else:
-                raise ValueError("Either cart_id or both user_id and store_brand_id must be provided")
-            
-            # Get cart model
-            cart_model = CartModel.objects.prefetch_related('cart_items').get(**query)
-            
-            # Convert to domain entity
-            return self._to_domain(cart_model)
-        except CartModel.DoesNotExist:
-            logger.debug(f"Cart not found with query: {query}")
-            return None
+        """Get a cart with its items and product details
+        
+        Loaded in a constant number of queries, see cart_loader. Lookups by
+        cart_id go through the hydrated cart cache.
+        """
+        if cart_id is not None:
+            return get_cached_cart(cart_id)
+        if user_id is not None and store_brand_id is not None:
+            return load_cart(user_id=user_id, store_brand_id=store_brand_id)
+        raise ValueError("Either cart_id or both user_id and store_brand_id must be provided")
     
     def get_all_for_user(self, user_id: uuid.UUID) -> List[Cart]:
         """Get all carts for a user"""
-        cart_models = CartModel.objects.prefetch_related('cart_items').filter(user_id=user_id)
-        return [self._to_domain(cart_model) for cart_model in cart_models]
+        return load_carts(user_id=user_id)
+    
+    def get_carts(self, cart_ids: List[uuid.UUID]) -> List[Cart]:
+        """Get several carts in CART_LOAD_QUERIES queries, bypassing the cart cache"""
+        if not cart_ids:
+            return []
+        return load_carts(id__in=cart_ids)
     
     def create_or_get_cart(self, user_id: uuid.UUID, store_brand_id: uuid.UUID) -> Cart:
         """Create a new cart or get existing one
@@ -66,7 +65,7 @@ class DjangoCartRepository(CartRepository):
                 store_brand_id=store_brand_id
             )
             cart_model.save()
-            cart = self._to_domain(cart_model)
+            cart = cart_model_to_entity(cart_model)
         
         return cart
 
@@ -85,6 +84,22 @@ class DjangoCartRepository(CartRepository):
         from .cart_utils import update_cart_totals
         return update_cart_totals(cart_id)
             
+    def reconcile_cart_totals(self) -> int:
+        """Fix carts whose totals drifted from their items
+        
+        Item mutations shift the totals incrementally, this periodic check
+        catches anything that bypassed them (raw SQL, admin edits, bugs).
+        
+        Returns:
+            Number of carts fixed
+        """
+        from .cart_utils import reconcile_cart_totals
+        try:
+            return len(reconcile_cart_totals())
+        except Exception as e:
+            logger.error(f"Error reconciling cart totals: {str(e)}")
+            return 0
+            
     def add_item_to_cart(self, cart_id: uuid.UUID, store_product_id: uuid.UUID,
                         quantity: int) -> Tuple[Optional[Cart], Optional[CartItem]]:
         """Add an item to a cart and return the updated cart
@@ -158,6 +173,7 @@ class DjangoCartRepository(CartRepository):
         try:
             cart_model = CartModel.objects.get(id=cart_id)
             cart_model.delete()
+            invalidate_cached_cart(cart_id)
             return True
         except CartModel.DoesNotExist:
             logger.error(f"Cart with ID {cart_id} not found")
@@ -165,153 +181,62 @@ class DjangoCartRepository(CartRepository):
     
     def clear(self, cart_id: uuid.UUID) -> bool:
         """Remove all items from a cart"""
+        with transaction.atomic():
+            if not CartModel.objects.filter(id=cart_id).update(
+                cart_total_price=0, cart_total_items=0, version=F('version') + 1
+            ):
+                logger.error(f"Cart with ID {cart_id} not found")
+                return False
+            CartItemModel.objects.filter(cart_id=cart_id).delete()
+            invalidate_cached_cart(cart_id)
+        return True
+            
+    def reserve(self, cart_id: uuid.UUID, minutes: int = 15,
+                expected_version: Optional[int] = None) -> bool:
+        """Reserve a cart for a specified time, unless it is already reserved
+        
+        One conditional UPDATE of the reservation columns, so concurrent
+        checkouts of the same cart get a single winner and item mutations
+        running meanwhile are not overwritten.
+        """
+        now = timezone.now()
+        carts = CartModel.objects.filter(
+            Q(reserved_until__isnull=True) | Q(reserved_until__lt=now), id=cart_id
+        )
+        if expected_version is not None:
+            carts = carts.filter(version=expected_version)
+        
         try:
-            cart_model = CartModel.objects.get(id=cart_id)
-            cart_model.cart_items.all().delete()
-            return True
-        except CartModel.DoesNotExist:
-            logger.error(f"Cart with ID {cart_id} not found")
-            return False
-            
-    def reserve(self, cart_id: uuid.UUID, minutes: int = 15) -> bool:
-        """Reserve a cart for a specified time"""
-        try:
-            cart_model = CartModel.objects.get(id=cart_id)
-            cart_model.reserve(minutes=minutes)
-            return True
-        except CartModel.DoesNotExist:
-            logger.error(f"Cart with ID {cart_id} not found")
-            return False
+            won = carts.update(
+                reserved_until=now + timezone.timedelta(minutes=minutes),
+                version=F('version') + 1
+            ) == 1
         except Exception as e:
             logger.error(f"Error reserving cart: {str(e)}")
             return False
+        if won:
+            invalidate_cached_cart(cart_id)
+        return won
             
     def release_reservation(self, cart_id: uuid.UUID) -> bool:
         """Release a cart reservation"""
         try:
-            cart_model = CartModel.objects.get(id=cart_id)
-            cart_model.release_reservation()
-            return True
-        except CartModel.DoesNotExist:
-            logger.error(f"Cart with ID {cart_id} not found")
-            return False
+            released = CartModel.objects.filter(id=cart_id).update(
+                reserved_until=None, version=F('version') + 1
+            )
         except Exception as e:
             logger.error(f"Error releasing cart reservation: {str(e)}")
             return False
+        if not released:
+            logger.error(f"Cart with ID {cart_id} not found")
+            return False
+        invalidate_cached_cart(cart_id)
+        return True
             
     def is_reserved(self, cart_id: uuid.UUID) -> bool:
         """Check if a cart is currently reserved"""
         try:
-            cart_model = CartModel.objects.get(id=cart_id)
-            return cart_model.is_reserved()
-        except CartModel.DoesNotExist:
-            logger.error(f"Cart with ID {cart_id} not found")
-            return False
+            return CartModel.objects.filter(id=cart_id, reserved_until__gt=timezone.now()).exists()
         except Exception as e:
             logger.error(f"Error checking cart reservation: {str(e)}")
             return False
-    
-    def _to_domain(self, cart_model: CartModel) -> Cart:
-        """Convert ORM model to domain model
-        
-        Args:
-            cart_model: CartModel instance
-            
-        Returns:
-            Cart domain entity
-        """
-        # Get store brand details if needed
-        if include_store_details:
-            store_brand_name, store_brand_logo = self._get_store_brand_details(
-                cart_model.store_brand.id)
-        else:
-            store_brand_name, store_brand_logo = None, None
-        
-        # Convert cart items to domain entities using a list comprehension
-        items = self._get_cart_items(cart_model)
-        
-        # Create the cart domain entity
-        cart = Cart(
-            id=cart_model.id,
-            user_id=cart_model.user.id,
-            store_brand_id=cart_model.store_brand.id,
-            store_brand_name=store_brand_name,
-            store_brand_logo=store_brand_logo,
-            items=items,
-            created_at=cart_model.created_at,
-            updated_at=cart_model.updated_at,
-            cart_total_price=float(cart_model.cart_total_price),
-            cart_total_items=cart_model.cart_total_items
-        )
-        
-        # Validation: Ensure the domain entity's calculations match the ORM model
-        self._validate_cart_totals(cart_model, cart, items)
-            
-        return cart
-        
-    def _get_store_brand_details(self, store_brand_id: uuid.UUID
-    ) -> Tuple[Optional[str], Optional[str]]:
-        """Get store brand name and logo
-        
-        Args:
-            store_brand_id: UUID of the store brand
-            
-        Returns:
-            Tuple of (name, logo)
-        """
-        try:
-            store_brand = StoreBrand.objects.get(id=store_brand_id)
-            return store_brand.name, store_brand.logo
-        except StoreBrand.DoesNotExist:
-            return "Unknown", None
-            
-    def _get_cart_items(self, cart_model: CartModel) -> List[CartItem]:
-        """Convert cart item models to domain entities
-        
-        Args:
-            cart_model: CartModel instance
-            store_product_details: Optional store product details
-            
-        Returns:
-            List of CartItem domain entities
-        """
-        items = []
-        for item_model in cart_model.cart_items.all():
-            cart_item = CartItem(
-                id=item_model.id,
-                store_product_id=item_model.store_product.id,
-                quantity=item_model.quantity,
-                product_name=item_model.store_product.product.name,
-                product_image_thumbnail=item_model.store_product.product.image_thumbnail,
-                product_image_url=item_model.store_product.product.image_url,
-                product_price=float(item_model.store_product.price),
-                product_description=item_model.store_product.product.description,
-                item_total_price=float(item_model.item_total_price),
-                added_at=item_model.added_at
-            )
-            items.append(cart_item)
-        return items
-        
-    def _validate_cart_totals(self, cart_model: CartModel, cart: Cart, 
-                             items: List[CartItem]) -> None:
-        """Validate that cart totals match between ORM and domain
-        
-        Args:
-            cart_model: CartModel instance
-            cart: Cart domain entity
-            items: List of CartItem domain entities
-        """
-        if not items:
-            return
-            
-        orm_total = float(cart_model.cart_total_price)
-        domain_total = cart.calculate_cart_price_total()
-        
-        if orm_total != domain_total:
-            logger.warning(
-                f"Cart {cart_model.id} total price mismatch: "
-                f"ORM={orm_total}, Domain={domain_total}"
-            )
-            
-    
-
@@ -1,8 +1,10 @@
 from cart.application.services.cart_service import CartApplicationService
 from cart.application.services.cart_recovery_service import CartRecoveryService
 from cart.domain.repositories.repository_interfaces import CartRepository, CartItemRepository
+from cart.domain.services.recovery_schedule_interface import CartRecoverySchedule
 from cart.infrastructure.django_repositories.django_cart_repository import DjangoCartRepository
 from cart.infrastructure.django_repositories.django_cart_item_repository import DjangoCartItemRepository
+from cart.infrastructure.services.redis_cart_recovery_schedule import RedisCartRecoverySchedule
 
 class CartFactory:
     """Factory for creating cart-related services and repositories"""
@@ -25,6 +27,15 @@ class CartFactory:
         """
         return DjangoCartItemRepository()
     
+    @staticmethod
+    def create_cart_recovery_schedule() -> CartRecoverySchedule:
+        """Create a cart recovery schedule instance
+        
+        Returns:
+            CartRecoverySchedule implementation
+        """
+        return RedisCartRecoverySchedule()
+    
     @staticmethod
     def create_cart_service() -> CartApplicationService:
         """Create a cart service instance
@@ -34,7 +45,8 @@ class CartFactory:
         """
         cart_repository = CartFactory.create_cart_repository()
         cart_item_repository = CartFactory.create_cart_item_repository()
-        return CartApplicationService(cart_repository, cart_item_repository)
+        recovery_schedule = CartFactory.create_cart_recovery_schedule()
+        return CartApplicationService(cart_repository, cart_item_repository, recovery_schedule)
     
     @staticmethod
     def create_cart_recovery_service() -> CartRecoveryService:
@@ -45,4 +57,4 @@ class CartFactory:
         """
         cart_repository = CartFactory.create_cart_repository()
         cart_service = CartFactory.create_cart_service()
-        return CartRecoveryService(cart_repository, cart_service)
+        return CartRecoveryService(cart_repository, cart_service, cart_service.recovery_schedule)
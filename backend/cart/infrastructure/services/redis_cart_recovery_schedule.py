@@ -0,0 +1,86 @@
+"""
+Cart recovery schedule in a Redis sorted set.
+
+Members are cart IDs scored by the Unix time their recovery is due, so due
+carts are read with a range on the score instead of a KEYS scan of the whole
+keyspace. Popping runs ZRANGEBYSCORE and ZREM in one Lua script: concurrent
+recovery runs never get the same cart.
+"""
+import logging
+import uuid
+from datetime import datetime
+from typing import List
+
+from cart.domain.services.recovery_schedule_interface import CartRecoverySchedule
+
+logger = logging.getLogger(__name__)
+
+# Carts popped per script call, Lua's unpack() is limited to a few thousand values
+MAX_POP = 5000
+
+POP_DUE_SCRIPT = """
+local cart_ids = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+if #cart_ids > 0 then
+    redis.call('ZREM', KEYS[1], unpack(cart_ids))
+end
+return cart_ids
+"""
+
+
+class RedisCartRecoverySchedule(CartRecoverySchedule):
+    """Cart recovery schedule stored in one Redis sorted set"""
+
+    SCHEDULE_KEY = "cart:recovery:due"
+
+    def __init__(self, redis_client=None, key: str = SCHEDULE_KEY):
+        """
+        Args:
+            redis_client: Raw (bytes) Redis client, defaults to the cache connection
+            key: Key of the sorted set
+        """
+        self._redis = redis_client
+        self._pop_due_script = None
+        self.key = key
+
+    @property
+    def redis(self):
+        if self._redis is None:
+            from django_redis import get_redis_connection
+            self._redis = get_redis_connection("default")
+        return self._redis
+
+    def schedule(self, cart_id: uuid.UUID, due_at: datetime) -> bool:
+        try:
+            self.redis.zadd(self.key, {str(cart_id): due_at.timestamp()})
+            return True
+        except Exception as e:
+            logger.error(f"Error scheduling recovery of cart {cart_id}: {str(e)}")
+            return False
+
+    def cancel(self, cart_id: uuid.UUID) -> bool:
+        try:
+            return bool(self.redis.zrem(self.key, str(cart_id)))
+        except Exception as e:
+            logger.error(f"Error cancelling recovery of cart {cart_id}: {str(e)}")
+            return False
+
+    def pop_due(self, now: datetime, limit: int) -> List[uuid.UUID]:
+        if self._pop_due_script is None:
+            self._pop_due_script = self.redis.register_script(POP_DUE_SCRIPT)
+
+        cart_ids = []
+        # A pop of invalid members only must not look like an empty schedule
+        while not cart_ids:
+            members = self._pop_due_script(keys=[self.key], args=[now.timestamp(), min(limit, MAX_POP)])
+            if not members:
+                break
+            for member in members:
+                try:
+                    cart_ids.append(uuid.UUID(member.decode() if isinstance(member, bytes) else member))
+                except ValueError:
+                    logger.error(f"Dropped invalid cart ID {member!r} from the recovery schedule")
+        return cart_ids
+
+    def count(self) -> int:
+        """Number of scheduled carts, due or not"""
+        return self.redis.zcard(self.key)
@@ -0,0 +1,94 @@
+import random
+import statistics
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from cart.infrastructure.django_models.orm_models import CartItemModel, CartModel
+from cart.infrastructure.django_repositories.cart_utils import cart_model_to_domain
+from cart.infrastructure.django_repositories.django_cart_item_repository import DjangoCartItemRepository
+from cart.management.fixtures import create_cart_fixture, create_store_fixture
+from core.management.query_counter import QueryCounter
+
+
+def full_reload_totals(cart_id):
+    """The previous totals update: reload the cart and every item with its product"""
+    cart_model = CartModel.objects.get(id=cart_id)
+    cart_entity = cart_model_to_domain(cart_model)
+    cart_model.cart_total_price = Decimal(str(cart_entity.calculate_cart_price_total()))
+    cart_model.cart_total_items = cart_entity.calculate_cart_total_items()
+    cart_model.save(update_fields=['cart_total_price', 'cart_total_items'])
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures the latency and queries of cart item mutations (add, update quantity, '
+        'remove) on carts of several sizes, with incremental totals and with the previous '
+        'full reload. The fixture is rolled back at the end.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', type=str, default='1,20,200', help='Comma-separated cart sizes')
+        parser.add_argument('--mutations', type=int, default=300, help='Mutations per cart size and mode')
+        parser.add_argument('--seed', type=int, default=7)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        repository = DjangoCartItemRepository()
+
+        with transaction.atomic():
+            user, store_brand, _, store_products = create_store_fixture(
+                max(int(size) for size in options['sizes'].split(',')) + options['mutations'], label='Bench'
+            )
+
+            for size in (int(value) for value in options['sizes'].split(',')):
+                for mode in ('incremental', 'full reload'):
+                    cart = create_cart_fixture(user, store_brand, store_products[:size])
+                    spare_products = store_products[size:]
+                    latencies = []
+                    counter = QueryCounter()
+                    for i in range(options['mutations']):
+                        mutation = self._next_mutation(repository, rng, cart.id, spare_products[i], i)
+                        with connection.execute_wrapper(counter):
+                            started = time.perf_counter()
+                            mutation()
+                            if mode == 'full reload':
+                                full_reload_totals(cart.id)
+                            latencies.append(time.perf_counter() - started)
+
+                    drift = self._drift(cart.id)
+                    latencies.sort()
+                    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+                    self.stdout.write(
+                        f'{size:>4} items, {mode:>11}: p50 {statistics.median(latencies) * 1000:.2f}ms, '
+                        f'p99 {p99 * 1000:.2f}ms, {counter.count / len(latencies):.1f} queries per mutation'
+                        f'{", totals drifted: " + drift if drift else ""}'
+                    )
+                    cart.delete()
+
+            transaction.set_rollback(True)
+
+        self.stdout.write(self.style.SUCCESS('Benchmark complete (fixture rolled back)'))
+
+    def _next_mutation(self, repository, rng, cart_id, spare_product, i):
+        """Cycles through add, update quantity and remove, keeping the cart size stable"""
+        kind = i % 3
+        if kind == 0:
+            quantity = rng.randint(1, 3)
+            return lambda: repository.add_item(cart_id, spare_product.id, quantity)
+        item_id = CartItemModel.objects.filter(cart_id=cart_id).values_list('id', flat=True).last()
+        if kind == 1:
+            quantity = rng.randint(1, 5)
+            return lambda: repository.update_item_quantity(item_id, quantity)
+        return lambda: repository.remove_item(item_id)
+
+    def _drift(self, cart_id):
+        cart = CartModel.objects.get(id=cart_id)
+        items = CartItemModel.objects.filter(cart_id=cart_id)
+        expected_price = sum((item.item_total_price for item in items), Decimal('0'))
+        expected_items = sum(item.quantity for item in items)
+        if (cart.cart_total_price, cart.cart_total_items) == (expected_price, expected_items):
+            return ''
+        return f'{cart.cart_total_price}/{cart.cart_total_items} instead of {expected_price}/{expected_items}'
@@ -0,0 +1,157 @@
+import statistics
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from django_redis import get_redis_connection
+
+from cart.application.services.cart_recovery_service import CartRecoveryService
+from cart.infrastructure.django_repositories.django_cart_repository import DjangoCartRepository
+from cart.infrastructure.services.redis_cart_recovery_schedule import RedisCartRecoverySchedule
+
+# Keys written per pipeline when filling the keyspace
+FILL_CHUNK = 10_000
+
+
+class LatencyProbe(threading.Thread):
+    """Times a GET on the shared Redis in a loop, as another client of the cache would"""
+
+    def __init__(self, redis, key, interval_seconds):
+        super().__init__(daemon=True)
+        self.redis = redis
+        self.key = key
+        self.interval_seconds = interval_seconds
+        self.latencies = []
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            started = time.perf_counter()
+            self.redis.get(self.key)
+            self.latencies.append(time.perf_counter() - started)
+            time.sleep(self.interval_seconds)
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+    def summary(self):
+        latencies = sorted(self.latencies)
+        if not latencies:
+            return 'no probe'
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        return (f'probe GET p50 {statistics.median(latencies) * 1000:.2f}ms, '
+                f'p99 {p99 * 1000:.2f}ms, max {latencies[-1] * 1000:.1f}ms')
+
+
+def keys_scan_recovery(repository, pattern):
+    """The previous recovery run: KEYS, then a GET, a get_cart and a DELETE per key"""
+    recovery_carts = []
+    now = timezone.now()
+    for key in cache.keys(pattern):
+        cart_id = uuid.UUID(key.rsplit(":", 1)[1])
+        recovery_time = datetime.fromisoformat(cache.get(key))
+        if now >= recovery_time:
+            cart = repository.get_cart(cart_id=cart_id)
+            if cart and not cart.is_empty():
+                recovery_carts.append(cart_id)
+            cache.delete(key)
+    return recovery_carts
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures a cart recovery run with a KEYS scan of the cache vs popping due carts '
+        'from the recovery sorted set, in a keyspace filled with throwaway keys, and the '
+        'latency another client sees on the shared Redis meanwhile. The scheduled carts do '
+        'not exist, so both runs do their lookups but send no email. Benchmark keys are '
+        'removed afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--keys', type=int, default=1_000_000, help='Throwaway keys filling the keyspace')
+        parser.add_argument('--due', type=int, default=5_000, help='Carts due for recovery')
+        parser.add_argument('--pending', type=int, default=50_000, help='Carts scheduled but not due yet')
+        parser.add_argument('--batch', type=int, default=500, help='Carts popped per batch')
+        parser.add_argument('--probe-interval-ms', type=float, default=1.0)
+
+    def handle(self, *args, **options):
+        redis = get_redis_connection("default")
+        prefix = f'cart:bench_recovery:{uuid.uuid4().hex[:8]}'
+        probe_key = cache.make_key(f'{prefix}:probe')
+        repository = DjangoCartRepository()
+        schedule = RedisCartRecoverySchedule(redis_client=redis, key=f'{prefix}:due')
+        interval = options['probe_interval_ms'] / 1000
+
+        try:
+            self._fill(redis, prefix, options['keys'])
+            self.stdout.write(f'{redis.dbsize():,} keys in db')
+
+            self._measure_idle(redis, probe_key, interval)
+
+            self._schedule_keys(prefix, options['due'], options['pending'])
+            self._run('KEYS scan', redis, probe_key, interval,
+                      lambda: len(keys_scan_recovery(repository, f'{prefix}:cart_recovery:*')))
+
+            self._schedule_sorted_set(redis, schedule, options['due'], options['pending'])
+            service = CartRecoveryService(repository, None, schedule, batch_size=options['batch'])
+            self._run('sorted set', redis, probe_key, interval,
+                      lambda: service.process_pending_recoveries()[0])
+            self.stdout.write(f'{schedule.count():,} carts left scheduled (not due)')
+        finally:
+            cache.delete_pattern(f'{prefix}:*')
+            redis.delete(schedule.key)
+
+        self.stdout.write(self.style.SUCCESS('Benchmark complete'))
+
+    def _run(self, label, redis, probe_key, interval, run):
+        probe = LatencyProbe(redis, probe_key, interval)
+        probe.start()
+        started = time.perf_counter()
+        try:
+            sent = run()
+        finally:
+            elapsed = time.perf_counter() - started
+            probe.stop()
+        self.stdout.write(f'{label:>10}: run {elapsed * 1000:,.1f}ms ({sent} emails), {probe.summary()}')
+
+    def _measure_idle(self, redis, probe_key, interval):
+        probe = LatencyProbe(redis, probe_key, interval)
+        probe.start()
+        time.sleep(1)
+        probe.stop()
+        self.stdout.write(f'{"idle":>10}: {probe.summary()}')
+
+    def _fill(self, redis, prefix, size):
+        started = time.perf_counter()
+        for chunk in range(0, size, FILL_CHUNK):
+            pipe = redis.pipeline(transaction=False)
+            for i in range(chunk, min(chunk + FILL_CHUNK, size)):
+                pipe.set(cache.make_key(f'{prefix}:key:{i}'), b'x', ex=3600)
+            pipe.execute()
+        self.stdout.write(f'Filled {size:,} keys in {time.perf_counter() - started:.1f}s')
+
+    @staticmethod
+    def _due_times(due, pending):
+        now = timezone.now()
+        return ([now - timedelta(minutes=1)] * due) + ([now + timedelta(hours=24)] * pending)
+
+    def _schedule_keys(self, prefix, due, pending):
+        """Cart recovery keys as the previous mark_cart_for_recovery wrote them"""
+        due_times = self._due_times(due, pending)
+        for chunk in range(0, len(due_times), FILL_CHUNK):
+            cache.set_many({
+                f'{prefix}:cart_recovery:{uuid.uuid4()}': str(due_at)
+                for due_at in due_times[chunk:chunk + FILL_CHUNK]
+            }, 3600)
+
+    def _schedule_sorted_set(self, redis, schedule, due, pending):
+        due_times = self._due_times(due, pending)
+        for chunk in range(0, len(due_times), FILL_CHUNK):
+            redis.zadd(schedule.key, {
+                str(uuid.uuid4()): due_at.timestamp() for due_at in due_times[chunk:chunk + FILL_CHUNK]
+            })
@@ -0,0 +1,133 @@
+import random
+import statistics
+import threading
+import time
+from collections import Counter
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+
+from cart.application.services.cart_service import CartApplicationService
+from cart.infrastructure.django_models.orm_models import CartItemModel, CartModel
+from cart.infrastructure.django_repositories.django_cart_item_repository import DjangoCartItemRepository
+from cart.infrastructure.django_repositories.django_cart_repository import DjangoCartRepository
+from cart.management.fixtures import create_cart_fixture, create_store_fixture, delete_store_fixture
+
+
+def save_reserve(cart_id, minutes):
+    """The previous reservation: load the cart, check it and rewrite every column with save()"""
+    cart_model = CartModel.objects.get(id=cart_id)
+    if cart_model.is_reserved():
+        return False, "Cart is already reserved"
+    cart_model.reserved_until = timezone.now() + timezone.timedelta(minutes=minutes)
+    cart_model.save()
+    return True, ""
+
+
+class Command(BaseCommand):
+    help = (
+        'Runs concurrent checkouts of the same cart while other clients update its items, '
+        'comparing the previous load + save() reservation with the conditional UPDATE. '
+        'Reports the winners per round, the attempt latency and whether the cart totals '
+        'survived. Needs a database that supports concurrent connections; the fixture is '
+        'committed and deleted at the end.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--checkouts', type=int, default=50, help='Concurrent checkouts per round')
+        parser.add_argument('--item-writers', type=int, default=5, help='Concurrent item updaters per round')
+        parser.add_argument('--writes', type=int, default=5, help='Item updates per writer and round')
+        parser.add_argument('--rounds', type=int, default=20)
+        parser.add_argument('--seed', type=int, default=7)
+
+    def handle(self, *args, **options):
+        user, store_brand, category, store_products = create_store_fixture(options['item_writers'], label='Bench')
+        service = CartApplicationService(DjangoCartRepository(), DjangoCartItemRepository())
+
+        try:
+            for mode in ('save()', 'conditional UPDATE'):
+                cart = create_cart_fixture(user, store_brand, store_products)
+                if mode == 'save()':
+                    reserve = lambda version: save_reserve(cart.id, 15)
+                else:
+                    reserve = lambda version: service.reserve_cart(cart.id, 15, expected_version=version)
+                self._run(mode, cart, reserve, service, options)
+                cart.delete()
+        finally:
+            delete_store_fixture(user, store_brand, category, store_products)
+
+        self.stdout.write(self.style.SUCCESS('Benchmark complete (fixture deleted)'))
+
+    def _run(self, mode, cart, reserve, service, options):
+        rng = random.Random(options['seed'])
+        item_ids = list(CartItemModel.objects.filter(cart_id=cart.id).values_list('id', flat=True))
+        latencies = []
+        outcomes = Counter()
+        winners_per_round = []
+        lock = threading.Lock()
+
+        def checkout(barrier, version, results):
+            try:
+                barrier.wait()
+                started = time.perf_counter()
+                won, error = reserve(version)
+                elapsed = time.perf_counter() - started
+                with lock:
+                    latencies.append(elapsed)
+                    results.append(won)
+                    outcomes['won' if won else error] += 1
+            finally:
+                connection.close()
+
+        def update_items(barrier, item_id, quantities):
+            try:
+                barrier.wait()
+                for quantity in quantities:
+                    service.cart_item_repository.update_item_quantity(item_id, quantity)
+            finally:
+                connection.close()
+
+        started = time.perf_counter()
+        for _ in range(options['rounds']):
+            service.release_cart_reservation(cart.id)
+            version = CartModel.objects.values_list('version', flat=True).get(id=cart.id)
+            barrier = threading.Barrier(options['checkouts'] + len(item_ids))
+            results = []
+            threads = [
+                threading.Thread(target=checkout, args=(barrier, version, results))
+                for _ in range(options['checkouts'])
+            ] + [
+                threading.Thread(target=update_items, args=(
+                    barrier, item_id, [rng.randint(1, 5) for _ in range(options['writes'])]
+                ))
+                for item_id in item_ids
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            winners_per_round.append(sum(results))
+        elapsed = time.perf_counter() - started
+
+        latencies.sort()
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        drift = self._drift(cart.id)
+        self.stdout.write(
+            f'{mode:>18}: {len(latencies) / elapsed:,.0f} checkouts/s, p50 {statistics.median(latencies) * 1000:.2f}ms, '
+            f'p99 {p99 * 1000:.2f}ms, winners per round min {min(winners_per_round)} '
+            f'max {max(winners_per_round)}, {sum(1 for n in winners_per_round if n > 1)} rounds '
+            f'with several winners{", totals drifted: " + drift if drift else ""}'
+        )
+        for outcome, count in outcomes.most_common():
+            self.stdout.write(f'{"":>20}{count:>6} {outcome}')
+
+    def _drift(self, cart_id):
+        cart = CartModel.objects.get(id=cart_id)
+        items = CartItemModel.objects.filter(cart_id=cart_id)
+        expected_price = sum((item.item_total_price for item in items), Decimal('0'))
+        expected_items = sum(item.quantity for item in items)
+        if (cart.cart_total_price, cart.cart_total_items) == (expected_price, expected_items):
+            return ''
+        return f'{cart.cart_total_price}/{cart.cart_total_items} instead of {expected_price}/{expected_items}'
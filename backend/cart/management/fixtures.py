@@ -0,0 +1,85 @@
+"""
+Store and cart fixtures shared by the cart and order benchmarks and tests
+
+Every call creates its own user, store brand, category and products under a
+random run id, so fixtures never collide with existing rows or with each other.
+"""
+import uuid
+from decimal import Decimal
+from typing import List, Optional, Sequence, Tuple
+
+from django.contrib.auth import get_user_model
+
+from cart.infrastructure.django_models.orm_models import CartItemModel, CartModel
+from store.infrastructure.django_models.orm_models import (
+    CategoryModel, ProductModel, StoreBrandModel, StoreProductModel
+)
+
+
+def create_store_fixture(products: int, label: str = 'Test', price: Optional[Decimal] = None
+                         ) -> Tuple[object, StoreBrandModel, CategoryModel, List[StoreProductModel]]:
+    """Create a user and a store brand selling some products
+
+    Args:
+        products: Number of store products
+        label: Prefix of the names, slugs and email
+        price: Price of every store product, prices between 1.99 and 20.99 when omitted
+
+    Returns:
+        Tuple of (user, store_brand, category, store_products)
+    """
+    run_id = uuid.uuid4().hex[:8]
+    prefix = label.lower()
+    user = get_user_model().objects.create_user(email=f'{prefix}-{run_id}@example.com', first_name=label)
+    store_brand = StoreBrandModel.objects.create(name=f'{label} {run_id}', type=prefix, slug=f'{prefix}-{run_id}')
+    category = CategoryModel.objects.create(name=f'{label} {run_id}', path=f'{prefix}_{run_id}',
+                                            slug=f'{prefix}-category-{run_id}')
+    product_models = ProductModel.objects.bulk_create([
+        ProductModel(name=f'Product {i}', slug=f'{prefix}-{run_id}-{i}', quantity=1, unit='u',
+                     description=f'Product {i}')
+        for i in range(products)
+    ])
+    store_products = StoreProductModel.objects.bulk_create([
+        StoreProductModel(store_brand=store_brand, product=product, category=category,
+                          price=price if price is not None else Decimal(f'{1 + i % 20}.99'), price_per_unit=1)
+        for i, product in enumerate(product_models)
+    ])
+    return user, store_brand, category, store_products
+
+
+def create_cart_fixture(user, store_brand: StoreBrandModel, store_products: Sequence[StoreProductModel],
+                        quantity: int = 2) -> CartModel:
+    """Create the cart of a user at a store brand, replacing any previous one
+
+    Args:
+        user: Owner of the cart
+        store_brand: Store brand of the cart
+        store_products: One item is added per store product
+        quantity: Quantity of every item
+
+    Returns:
+        CartModel with its totals set
+    """
+    CartModel.objects.filter(user=user, store_brand=store_brand).delete()
+    cart = CartModel.objects.create(
+        user=user, store_brand=store_brand,
+        cart_total_price=sum((store_product.price * quantity for store_product in store_products), Decimal('0')),
+        cart_total_items=quantity * len(store_products)
+    )
+    CartItemModel.objects.bulk_create([
+        CartItemModel(cart=cart, store_product=store_product, quantity=quantity,
+                      product_price=store_product.price, item_total_price=store_product.price * quantity)
+        for store_product in store_products
+    ])
+    return cart
+
+
+def delete_store_fixture(user, store_brand: StoreBrandModel, category: CategoryModel,
+                         store_products: Sequence[StoreProductModel]) -> None:
+    """Delete what create_store_fixture created, with the user's carts"""
+    CartModel.objects.filter(user=user).delete()
+    StoreProductModel.objects.filter(store_brand=store_brand).delete()
+    ProductModel.objects.filter(id__in=[store_product.product_id for store_product in store_products]).delete()
+    category.delete()
+    store_brand.delete()
+    user.delete()
@@ -25,3 +25,18 @@ def process_cart_recoveries():
         'total_processed': total,
         'successful_sends': successful
     }
+
+
+@shared_task
+def reconcile_cart_totals():
+    """Fix cart totals that drifted from the cart items
+    
+    Item mutations update the totals incrementally; this task should be
+    scheduled to run periodically as a safety net.
+    """
+    cart_repository = CartFactory.create_cart_repository()
+    fixed = cart_repository.reconcile_cart_totals()
+    if fixed:
+        logger.warning(f"Reconciled the totals of {fixed} carts")
+    
+    return {'carts_fixed': fixed}
@@ -0,0 +1,133 @@
+"""
+Query-count regression tests for cart hydration
+
+Loading a cart must cost the same number of queries whatever its number of
+items. A relation touched without being joined or prefetched shows up here as
+a count growing with the cart size.
+"""
+import uuid
+from decimal import Decimal
+from unittest import mock
+
+from django.test import TestCase, TransactionTestCase, override_settings
+
+from cart.infrastructure.django_repositories import cart_loader
+from cart.infrastructure.django_repositories.cart_loader import CART_LOAD_QUERIES
+from cart.infrastructure.django_repositories.django_cart_item_repository import DjangoCartItemRepository
+from cart.infrastructure.django_repositories.django_cart_repository import DjangoCartRepository
+from cart.management.fixtures import create_cart_fixture, create_store_fixture
+
+CART_SIZES = (0, 1, 20, 200)
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+class CartFixtureMixin:
+    """Creates carts of any size for one user and store brand"""
+
+    def create_store(self, products):
+        self.user, self.store_brand, _, self.store_products = create_store_fixture(products, price=Decimal('2.50'))
+
+    def create_cart(self, size):
+        return create_cart_fixture(self.user, self.store_brand, self.store_products[:size])
+
+
+@override_settings(CART_CACHE_TIMEOUT=0, CACHES=LOCMEM_CACHES)
+class CartHydrationQueryCountTests(CartFixtureMixin, TestCase):
+    """Cart loading runs CART_LOAD_QUERIES queries for any cart size"""
+
+    def setUp(self):
+        self.create_store(max(CART_SIZES))
+        self.repository = DjangoCartRepository()
+
+    def test_get_cart_by_id(self):
+        for size in CART_SIZES:
+            with self.subTest(size=size):
+                cart_model = self.create_cart(size)
+                with self.assertNumQueries(CART_LOAD_QUERIES):
+                    cart = self.repository.get_cart(cart_id=cart_model.id)
+                self.assertEqual(len(cart.items), size)
+                self.assertEqual(cart.cart_total_items, 2 * size)
+
+    def test_get_cart_by_user_and_store_brand(self):
+        for size in CART_SIZES:
+            with self.subTest(size=size):
+                self.create_cart(size)
+                with self.assertNumQueries(CART_LOAD_QUERIES):
+                    cart = self.repository.get_cart(user_id=self.user.id, store_brand_id=self.store_brand.id)
+                self.assertEqual(len(cart.items), size)
+
+    def test_get_all_for_user(self):
+        for size in CART_SIZES:
+            with self.subTest(size=size):
+                self.create_cart(size)
+                with self.assertNumQueries(CART_LOAD_QUERIES):
+                    carts = self.repository.get_all_for_user(self.user.id)
+                self.assertEqual(sum(len(cart.items) for cart in carts), size)
+
+    def test_get_carts(self):
+        cart_model = self.create_cart(20)
+        with self.assertNumQueries(CART_LOAD_QUERIES):
+            carts = self.repository.get_carts([cart_model.id, uuid.uuid4()])
+        self.assertEqual([cart.id for cart in carts], [cart_model.id])
+        self.assertEqual(len(carts[0].items), 20)
+
+    def test_missing_cart(self):
+        with self.assertNumQueries(1):
+            self.assertIsNone(self.repository.get_cart(cart_id=uuid.uuid4()))
+
+
+@override_settings(CART_CACHE_TIMEOUT=60, CACHES=LOCMEM_CACHES)
+class CartCacheTests(CartFixtureMixin, TransactionTestCase):
+    """The hydrated cart cache is read through and dropped on item mutations
+
+    A TransactionTestCase, the cache is bypassed inside transactions.
+    """
+
+    def setUp(self):
+        from django.core.cache import cache
+        cache.clear()
+        self.create_store(3)
+        self.repository = DjangoCartRepository()
+        self.item_repository = DjangoCartItemRepository()
+        self.cart_model = self.create_cart(1)
+
+    def test_cached_cart_costs_no_query(self):
+        self.repository.get_cart(cart_id=self.cart_model.id)
+        with self.assertNumQueries(0):
+            cart = self.repository.get_cart(cart_id=self.cart_model.id)
+        self.assertEqual(len(cart.items), 1)
+
+    def test_item_mutations_invalidate_the_cached_cart(self):
+        self.repository.get_cart(cart_id=self.cart_model.id)
+
+        item = self.item_repository.add_item(self.cart_model.id, self.store_products[1].id, 3)
+        cart = self.repository.get_cart(cart_id=self.cart_model.id)
+        self.assertEqual(len(cart.items), 2)
+        self.assertEqual(cart.cart_total_items, 5)
+
+        self.item_repository.update_item_quantity(item.id, 1)
+        self.assertEqual(self.repository.get_cart(cart_id=self.cart_model.id).cart_total_items, 3)
+
+        self.item_repository.remove_item(item.id)
+        cart = self.repository.get_cart(cart_id=self.cart_model.id)
+        self.assertEqual(len(cart.items), 1)
+        self.assertEqual(cart.cart_total_price, 5.0)
+
+        self.repository.clear(self.cart_model.id)
+        self.assertEqual(self.repository.get_cart(cart_id=self.cart_model.id).items, [])
+
+    def test_cart_loaded_before_a_commit_is_not_served(self):
+        stale = cart_loader.load_cart(id=self.cart_model.id)
+
+        def load_then_commit(**filters):
+            # An item change commits after this reader read the generation and loaded the cart
+            self.item_repository.add_item(self.cart_model.id, self.store_products[1].id, 3)
+            return stale
+
+        with mock.patch.object(cart_loader, 'load_cart', load_then_commit):
+            self.assertEqual(len(self.repository.get_cart(cart_id=self.cart_model.id).items), 1)
+
+        cart = self.repository.get_cart(cart_id=self.cart_model.id)
+        self.assertEqual(len(cart.items), 2)
+        self.assertEqual(cart.cart_total_items, 5)
@@ -0,0 +1,57 @@
+"""
+Tests for conditional cart reservations and cart row versioning
+"""
+from decimal import Decimal
+
+from django.test import TestCase, override_settings
+
+from cart.infrastructure.django_models.orm_models import CartModel
+from cart.infrastructure.django_repositories.django_cart_item_repository import DjangoCartItemRepository
+from cart.infrastructure.django_repositories.django_cart_repository import DjangoCartRepository
+from cart.tests.test_cart_queries import LOCMEM_CACHES, CartFixtureMixin
+
+
+@override_settings(CART_CACHE_TIMEOUT=0, CACHES=LOCMEM_CACHES)
+class CartReservationTests(CartFixtureMixin, TestCase):
+    """A reservation is won by a single caller and only writes its own columns"""
+
+    def setUp(self):
+        self.create_store(3)
+        self.repository = DjangoCartRepository()
+        self.item_repository = DjangoCartItemRepository()
+        self.cart_model = self.create_cart(2)
+
+    def test_reservation_is_won_once(self):
+        self.assertTrue(self.repository.reserve(self.cart_model.id))
+        self.assertFalse(self.repository.reserve(self.cart_model.id))
+        self.assertTrue(self.repository.is_reserved(self.cart_model.id))
+
+        self.assertTrue(self.repository.release_reservation(self.cart_model.id))
+        self.assertFalse(self.repository.is_reserved(self.cart_model.id))
+        self.assertTrue(self.repository.reserve(self.cart_model.id))
+
+    def test_expired_reservation_can_be_taken(self):
+        self.assertTrue(self.repository.reserve(self.cart_model.id, minutes=-1))
+        self.assertTrue(self.repository.reserve(self.cart_model.id))
+
+    def test_reservation_of_a_modified_cart_fails(self):
+        version = self.repository.get_cart(cart_id=self.cart_model.id).version
+        self.item_repository.add_item(self.cart_model.id, self.store_products[2].id, 1)
+
+        self.assertFalse(self.repository.reserve(self.cart_model.id, expected_version=version))
+        version = self.repository.get_cart(cart_id=self.cart_model.id).version
+        self.assertTrue(self.repository.reserve(self.cart_model.id, expected_version=version))
+
+    def test_reservation_keeps_concurrent_totals(self):
+        # Totals changed by another request after this cart row was loaded
+        CartModel.objects.filter(id=self.cart_model.id).update(cart_total_price=Decimal('42.00'))
+
+        self.assertTrue(self.repository.reserve(self.cart_model.id))
+        cart_model = CartModel.objects.get(id=self.cart_model.id)
+        self.assertEqual(cart_model.cart_total_price, Decimal('42.00'))
+        self.assertEqual(cart_model.version, self.cart_model.version + 1)
+
+    def test_missing_cart(self):
+        self.cart_model.delete()
+        self.assertFalse(self.repository.reserve(self.cart_model.id))
+        self.assertFalse(self.repository.release_reservation(self.cart_model.id))
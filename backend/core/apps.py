@@ -1,4 +1,8 @@
 from django.apps import AppConfig
+from django.conf import settings
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class CoreConfig(AppConfig):
@@ -9,6 +13,24 @@ class CoreConfig(AppConfig):
         # Import signals to register them
         import core.infrastructure.django_models.signals
 
+        # Schedule the domain event outbox relay with Celery Beat
+        try:
+            if hasattr(settings, 'CELERY_BEAT_SCHEDULE'):
+                from core.domain_events.tasks import relay_outbox_events
+
+                if 'core.domain_events.tasks.relay_outbox_events' not in settings.CELERY_BEAT_SCHEDULE:
+                    interval = getattr(settings, 'DOMAIN_EVENTS_OUTBOX_RELAY_INTERVAL', 1.0)
+                    settings.CELERY_BEAT_SCHEDULE['core.domain_events.tasks.relay_outbox_events'] = {
+                        'task': 'core.domain_events.tasks.relay_outbox_events',
+                        'schedule': interval,
+                        'options': {'expires': max(interval * 5, 10)},
+                    }
+                    logger.info("Registered domain event outbox relay with Celery Beat")
+        except ImportError:
+            logger.warning("Celery not installed, skipping outbox relay registration")
+        except Exception as e:
+            logger.error(f"Error registering outbox relay task: {str(e)}")
+
     def get_exception_mappings(self):
         from core.interface.api.exception.exception_mapping import CORE_EXCEPTION_MAPPING
         return CORE_EXCEPTION_MAPPING
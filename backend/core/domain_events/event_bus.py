@@ -10,6 +10,7 @@ from typing import Type, Callable
 from .events import DomainEvent
 from .event_registry import register_handler, unregister_handler
 from .tasks import process_domain_event
+from .outbox import is_outbox_enabled, write_to_outbox
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +21,7 @@ logger = logging.getLogger(__name__)
 # Key features:
 # - Implemented as a singleton to ensure a single point of event routing
 # - Uses Celery to handle asynchronous processing
+# - Writes events to a transactional outbox that is relayed to Celery in batches
 # - Provides registration methods for connecting events to handlers
 
 class CeleryEventBus:
@@ -88,14 +90,37 @@ class CeleryEventBus:
         """
         Publish an event to be processed asynchronously by Celery
         
+        By default the event is written to the transactional outbox, so it is
+        only dispatched if the caller's database transaction commits. The
+        outbox relay then sends pending events to Celery in batches.
+        Set DOMAIN_EVENTS_OUTBOX_ENABLED = False to fall back to a direct
+        per-event `.delay()`.
+        
         Args:
             event: The event to publish
         """
         event_type_name = type(event).__name__
-        event_data = event.to_dict()
         
         logger.info(f"Publishing event {event_type_name} with ID {event.event_id}")
         
+        if is_outbox_enabled():
+            write_to_outbox(event)
+        else:
+            self.publish_immediately(event)
+    
+    def publish_immediately(self, event: DomainEvent):
+        """
+        Send an event straight to Celery, bypassing the outbox
+        
+        The broker is contacted once per event, and the event is sent even if
+        the caller's transaction later rolls back.
+        
+        Args:
+            event: The event to publish
+        """
+        event_type_name = type(event).__name__
+        event_data = event.to_dict()
+        
         # Send to Celery task for asynchronous processing
         # Celery (configured in celery.py) routes these tasks to available workers
         # Workers execute the task defined in tasks.py, which processes the events
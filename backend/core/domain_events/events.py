@@ -50,3 +50,14 @@ class DomainEvent:
             elif key == 'timestamp' and isinstance(value, str):
                 data[key] = datetime.fromisoformat(value)
         return cls(**data)
+
+
+@dataclass
+class BenchmarkEvent(DomainEvent):
+    """Throwaway event published by the benchmark_event_bus command
+
+    Defined here so workers can rebuild it; no handler is registered for it.
+    """
+    run: str
+    sequence: int
+    payload: str
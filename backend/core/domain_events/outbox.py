@@ -0,0 +1,122 @@
+"""
+Transactional outbox for domain events
+
+Events are stored in the `domain_event_outbox` table inside the publisher's
+database transaction and later relayed to Celery in batches.
+"""
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+
+from .events import DomainEvent
+
+logger = logging.getLogger(__name__)
+
+# - The Outbox
+# Instead of talking to the broker during the request, publishers write a row:
+
+# Key features:
+# - The row commits (or rolls back) together with the caller's own writes
+# - No broker round trip on the request path
+# - A relay drains pending rows in batches of N and sends one Celery task per batch
+# - Delivery is at-least-once: a batch may be re-sent if the relay dies after sending
+
+DEFAULT_OUTBOX_BATCH_SIZE = 100
+
+
+def get_outbox_batch_size() -> int:
+    """Number of events sent per Celery task by the relay"""
+    return getattr(settings, 'DOMAIN_EVENTS_OUTBOX_BATCH_SIZE', DEFAULT_OUTBOX_BATCH_SIZE)
+
+
+def is_outbox_enabled() -> bool:
+    """Whether publishing goes through the outbox instead of a direct .delay()"""
+    return getattr(settings, 'DOMAIN_EVENTS_OUTBOX_ENABLED', True)
+
+
+def write_to_outbox(event: DomainEvent) -> None:
+    """
+    Store an event in the outbox using the current database connection
+    
+    When called inside `transaction.atomic()` the row is part of that
+    transaction, so a rollback discards the event as well.
+    
+    Args:
+        event: The event to store
+    """
+    from core.infrastructure.django_models.event_outbox_orm_model import EventOutboxModel
+
+    EventOutboxModel.objects.create(
+        event_id=event.event_id,
+        event_type=type(event).__name__,
+        payload=event.to_dict(),
+    )
+
+
+class OutboxRelay:
+    """
+    Drains the outbox and dispatches pending events to Celery in batches
+    
+    Several relays may run concurrently: rows are claimed with
+    `SELECT ... FOR UPDATE SKIP LOCKED` so each batch is sent by one relay only.
+    """
+
+    def __init__(self, batch_size: int = None, filters: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            batch_size: Events sent per Celery task
+            filters: Lookups restricting the rows relayed, all pending rows by default
+        """
+        self.batch_size = batch_size or get_outbox_batch_size()
+        self.filters = filters or {}
+
+    def relay_batch(self) -> int:
+        """
+        Send one batch of pending events as a single Celery task
+        
+        Returns:
+            Number of events dispatched
+        """
+        from core.infrastructure.django_models.event_outbox_orm_model import EventOutboxModel
+        from .tasks import process_domain_event_batch
+
+        with transaction.atomic():
+            rows = list(
+                EventOutboxModel.objects
+                .filter(**self.filters)
+                .select_for_update(skip_locked=True)
+                .order_by('id')
+                .values_list('id', 'event_type', 'payload')[:self.batch_size]
+            )
+            if not rows:
+                return 0
+
+            events: List[Tuple[str, dict]] = [(event_type, payload) for _, event_type, payload in rows]
+            process_domain_event_batch.delay(events)
+
+            EventOutboxModel.objects.filter(id__in=[row_id for row_id, _, _ in rows]).delete()
+
+        logger.debug(f"Relayed {len(rows)} events from the outbox")
+        return len(rows)
+
+    def drain(self, max_batches: int = None) -> int:
+        """
+        Relay batches until the outbox is empty
+        
+        Args:
+            max_batches: Optional upper bound on batches sent in this call
+            
+        Returns:
+            Total number of events dispatched
+        """
+        total = 0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            sent = self.relay_batch()
+            if not sent:
+                break
+            total += sent
+            batches += 1
+        return total
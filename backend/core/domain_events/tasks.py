@@ -2,6 +2,8 @@
 Celery tasks for processing domain events
 """
 import logging
+from typing import List, Tuple
+
 from celery import shared_task
 
 from .event_registry import get_handlers_for_event
@@ -18,6 +20,34 @@ logger = logging.getLogger(__name__)
 # - Calls all registered handlers for the event type
 # - Handles errors gracefully without affecting other handlers
 
+def _dispatch_event(event_type_name: str, event_data: dict) -> None:
+    """
+    Recreate an event and run every registered handler for it
+    
+    Handler errors are logged and swallowed; errors while rebuilding the
+    event are raised so the calling task can retry.
+    """
+    logger.info(f"Processing event {event_type_name} with ID {event_data.get('event_id')}")
+    
+    # Recreate the event from data
+    event = create_event_from_data(event_type_name, event_data)
+    
+    # Get handlers for this event type
+    handlers = get_handlers_for_event(event_type_name)
+    
+    if not handlers:
+        logger.warning(f"No handlers registered for event {event_type_name}")
+        return
+    
+    # Process with each handler
+    for handler in handlers:
+        try:
+            handler(event)
+            logger.debug(f"Handler {handler.__name__} processed event {event_type_name}")
+        except Exception as e:
+            logger.error(f"Error in handler {handler.__name__} for event {event_type_name}: {e}")
+            # Don't retry for handler-specific errors, just log them
+
 @shared_task(bind=True, max_retries=3)
 def process_domain_event(self, event_type_name: str, event_data: dict):
     """
@@ -28,29 +58,46 @@ def process_domain_event(self, event_type_name: str, event_data: dict):
         event_data: The serialized event data
     """
     try:
-        logger.info(f"Processing event {event_type_name} with ID {event_data.get('event_id')}")
-        
-        # Recreate the event from data
-        event = create_event_from_data(event_type_name, event_data)
-        
-        # Get handlers for this event type
-        handlers = get_handlers_for_event(event_type_name)
-        
-        if not handlers:
-            logger.warning(f"No handlers registered for event {event_type_name}")
-            return
-        
-        # Process with each handler
-        for handler in handlers:
-            try:
-                handler(event)
-                logger.debug(f"Handler {handler.__name__} processed event {event_type_name}")
-            except Exception as e:
-                logger.error(f"Error in handler {handler.__name__} for event {event_type_name}: {e}")
-                # Don't retry for handler-specific errors, just log them
-                
+        _dispatch_event(event_type_name, event_data)
     except Exception as e:
         logger.error(f"Error processing event {event_type_name}: {e}")
         # Retry the task with exponential backoff
         retry_countdown = 2 ** self.request.retries
         self.retry(exc=e, countdown=retry_countdown)
+
+@shared_task
+def process_domain_event_batch(events: List[Tuple[str, dict]]):
+    """
+    Process a batch of domain events relayed from the outbox
+    
+    Events that cannot be rebuilt are re-queued individually through
+    `process_domain_event` so one bad event doesn't replay the whole batch.
+    
+    Args:
+        events: List of (event_type_name, event_data) pairs, in publish order
+    """
+    logger.info(f"Processing batch of {len(events)} events")
+    
+    for event_type_name, event_data in events:
+        try:
+            _dispatch_event(event_type_name, event_data)
+        except Exception as e:
+            logger.error(f"Error processing event {event_type_name} from batch: {e}")
+            process_domain_event.apply_async(args=(event_type_name, event_data), countdown=1)
+
+@shared_task(ignore_result=True)
+def relay_outbox_events(max_batches: int = None):
+    """
+    Drain pending outbox rows, one Celery task per batch
+    
+    Scheduled periodically with Celery Beat (see CoreConfig.ready)
+    
+    Args:
+        max_batches: Optional upper bound on batches sent in this run
+    """
+    from .outbox import OutboxRelay
+    
+    relayed = OutboxRelay().drain(max_batches=max_batches)
+    if relayed:
+        logger.info(f"Relayed {relayed} events from the outbox")
+    return relayed
@@ -0,0 +1,22 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+import uuid
+
+class EventOutboxModel(models.Model):
+    """Django ORM model for domain events waiting to be dispatched to Celery
+
+    Rows are written inside the publisher's transaction, so an event only
+    becomes visible to the relay if the surrounding transaction commits.
+    """
+    id = models.BigAutoField(primary_key=True)
+    event_id = models.UUIDField(unique=True, default=uuid.uuid4, editable=False)
+    event_type = models.CharField(max_length=255)
+    payload = models.JSONField(encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'domain_event_outbox'
+        ordering = ['id']
+
+    def __str__(self):
+        return f"EventOutbox - {self.event_type} {self.event_id}"
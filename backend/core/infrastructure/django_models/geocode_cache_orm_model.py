@@ -0,0 +1,28 @@
+from django.db import models
+
+
+class GeocodeCacheModel(models.Model):
+    """Django ORM model for a cached geocoding result
+
+    Shared by every service that geocodes addresses. Rows are keyed by the
+    normalized address; unresolvable addresses are stored too (resolved=False)
+    with a shorter expiry, so they aren't sent to the provider again and again.
+    """
+    id = models.BigAutoField(primary_key=True)
+    normalized_address = models.CharField(max_length=500, unique=True)
+    resolved = models.BooleanField(default=True)
+    result = models.JSONField(null=True, blank=True)  # First result of the provider
+    latitude = models.FloatField(null=True, blank=True)
+    longitude = models.FloatField(null=True, blank=True)
+    coordinates_key = models.CharField(max_length=32, blank=True, db_index=True)  # Rounded "lat,lng"
+    updated_at = models.DateTimeField(auto_now=True)
+    expires_at = models.DateTimeField()
+
+    class Meta:
+        db_table = 'geocode_cache'
+        indexes = [
+            models.Index(fields=['expires_at']),
+        ]
+
+    def __str__(self):
+        return f"GeocodeCache - {self.normalized_address}"
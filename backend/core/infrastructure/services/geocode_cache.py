@@ -0,0 +1,291 @@
+"""
+Two-tier cache of geocoding results, shared by the store and deliveries services.
+
+Lookups go to an in-process LRU first, then to the geocode_cache table, and
+only reach the provider when both miss. Addresses are normalized (case,
+accents, punctuation, common abbreviations) so that spellings of the same
+address share one entry. Addresses the provider can't resolve are cached too,
+with a shorter expiry. Provider errors are never cached.
+"""
+import logging
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Geocoding result: the provider's first result, e.g. Google's
+# {"geometry": {"location": {"lat", "lng"}}, "address_components": [...], ...}
+GeocodeResult = Dict[str, Any]
+
+ABBREVIATIONS = {
+    'r': 'rue',
+    'av': 'avenue',
+    'ave': 'avenue',
+    'bd': 'boulevard',
+    'bld': 'boulevard',
+    'bvd': 'boulevard',
+    'pl': 'place',
+    'fbg': 'faubourg',
+    'st': 'saint',
+    'ste': 'sainte',
+    'imp': 'impasse',
+    'rte': 'route',
+    'che': 'chemin',
+}
+SEPARATORS = re.compile(r"[\s,.;:/'\"()-]+")
+
+MISSING = object()
+
+
+def normalize_address(address: str) -> str:
+    """
+    Canonical form of an address, used as cache key
+
+    Args:
+        address: Address as typed by a user
+
+    Returns:
+        Lowercase address without accents or punctuation, with abbreviations expanded
+    """
+    text = unicodedata.normalize('NFKD', address).encode('ascii', 'ignore').decode('ascii').lower()
+    words = [ABBREVIATIONS.get(word, word) for word in SEPARATORS.split(text) if word]
+    return ' '.join(words)[:500]
+
+
+def result_coordinates(result: GeocodeResult) -> Tuple[float, float]:
+    """Latitude and longitude of a geocoding result"""
+    location = result['geometry']['location']
+    return float(location['lat']), float(location['lng'])
+
+
+class GeocodeCache:
+    """In-process LRU in front of the geocode_cache table, with hit rate counters"""
+
+    def __init__(self, lru_size: int = 10000, ttl: int = 60 * 60 * 24 * 90,
+                 negative_ttl: int = 60 * 60 * 24, coordinate_precision: int = 4,
+                 use_database: bool = True):
+        """
+        Args:
+            lru_size: Entries kept in process
+            ttl: Lifetime of a resolved address, in seconds
+            negative_ttl: Lifetime of an unresolvable address, in seconds
+            coordinate_precision: Decimals of the coordinates reverse lookups are keyed on
+            use_database: False to only use the in-process tier
+        """
+        self.lru_size = lru_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.coordinate_precision = coordinate_precision
+        self.use_database = use_database
+        self._lru: 'OrderedDict[Tuple[str, str], Tuple[Optional[GeocodeResult], float]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = dict.fromkeys(('memory_hits', 'database_hits', 'negative_hits', 'misses', 'provider_errors'), 0)
+
+    def geocode(self, address: str, geocoder: Callable[[str], Optional[GeocodeResult]]) -> Optional[GeocodeResult]:
+        """
+        Geocode an address through the cache
+
+        Args:
+            address: Address to geocode
+            geocoder: Calls the provider; returns its first result, None when the
+                address can't be resolved, and raises on provider errors
+
+        Returns:
+            The geocoding result, None if the address can't be resolved
+        """
+        key = normalize_address(address)
+        if not key:
+            return None
+
+        cached = self.get(key)
+        if cached is not MISSING:
+            return cached
+
+        self._count('misses')
+        try:
+            result = geocoder(address)
+        except Exception as e:
+            self._count('provider_errors')
+            logger.error(f"Error geocoding address '{address}': {str(e)}")
+            return None
+
+        self.put(key, result)
+        return result
+
+    def get(self, key: str) -> Any:
+        """
+        Cached result of a normalized address
+
+        Returns:
+            The result (None for an unresolvable address), or MISSING when not cached
+        """
+        entry = self._lru_get(('address', key))
+        if entry is not MISSING:
+            self._count('memory_hits' if entry is not None else 'negative_hits')
+            return entry
+
+        if not self.use_database:
+            return MISSING
+        from core.infrastructure.django_models.geocode_cache_orm_model import GeocodeCacheModel
+        try:
+            row = GeocodeCacheModel.objects.filter(
+                normalized_address=key, expires_at__gt=timezone.now()
+            ).values('resolved', 'result', 'expires_at').first()
+        except Exception as e:
+            logger.warning(f"Could not read the geocode cache: {str(e)}")
+            return MISSING
+        if row is None:
+            return MISSING
+
+        result = row['result'] if row['resolved'] else None
+        self._lru_put(('address', key), result, row['expires_at'].timestamp())
+        self._count('database_hits' if result is not None else 'negative_hits')
+        return result
+
+    def put(self, key: str, result: Optional[GeocodeResult]) -> None:
+        """Cache the result of a normalized address, None for an unresolvable address"""
+        ttl = self.ttl if result is not None else self.negative_ttl
+        expires_at = timezone.now() + timedelta(seconds=ttl)
+        self._lru_put(('address', key), result, expires_at.timestamp())
+
+        coordinates_key = ''
+        latitude = longitude = None
+        if result is not None:
+            latitude, longitude = result_coordinates(result)
+            coordinates_key = self.coordinates_key(latitude, longitude)
+            self._lru_put(('coordinates', coordinates_key), result, expires_at.timestamp())
+
+        if not self.use_database:
+            return
+        from core.infrastructure.django_models.geocode_cache_orm_model import GeocodeCacheModel
+        try:
+            GeocodeCacheModel.objects.bulk_create(
+                [GeocodeCacheModel(
+                    normalized_address=key,
+                    resolved=result is not None,
+                    result=result,
+                    latitude=latitude,
+                    longitude=longitude,
+                    coordinates_key=coordinates_key,
+                    expires_at=expires_at
+                )],
+                update_conflicts=True,
+                unique_fields=['normalized_address'],
+                update_fields=['resolved', 'result', 'latitude', 'longitude', 'coordinates_key', 'updated_at', 'expires_at']
+            )
+        except Exception as e:
+            logger.warning(f"Could not write the geocode cache: {str(e)}")
+
+    def lookup_coordinates(self, latitude: float, longitude: float) -> Optional[GeocodeResult]:
+        """
+        Reverse lookup: a cached result at the same rounded coordinates
+
+        Args:
+            latitude: Latitude in degrees
+            longitude: Longitude in degrees
+
+        Returns:
+            A geocoding result within the rounding precision, None if none is cached
+        """
+        key = self.coordinates_key(latitude, longitude)
+        entry = self._lru_get(('coordinates', key))
+        if entry is not MISSING:
+            self._count('memory_hits')
+            return entry
+
+        if not self.use_database:
+            return None
+        from core.infrastructure.django_models.geocode_cache_orm_model import GeocodeCacheModel
+        try:
+            row = GeocodeCacheModel.objects.filter(
+                coordinates_key=key, resolved=True, expires_at__gt=timezone.now()
+            ).order_by('-updated_at').values('result', 'expires_at').first()
+        except Exception as e:
+            logger.warning(f"Could not read the geocode cache: {str(e)}")
+            return None
+        if row is None:
+            return None
+
+        self._lru_put(('coordinates', key), row['result'], row['expires_at'].timestamp())
+        self._count('database_hits')
+        return row['result']
+
+    def coordinates_key(self, latitude: float, longitude: float) -> str:
+        """Reverse lookup key of coordinates"""
+        return f"{latitude:.{self.coordinate_precision}f},{longitude:.{self.coordinate_precision}f}"
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit counters of this process and the resulting hit rates"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['memory_entries'] = len(self._lru)
+        hits = stats['memory_hits'] + stats['database_hits'] + stats['negative_hits']
+        lookups = hits + stats['misses']
+        stats['hit_rate'] = hits / lookups if lookups else 0.0
+        stats['memory_hit_rate'] = stats['memory_hits'] / lookups if lookups else 0.0
+        return stats
+
+    def clear(self) -> None:
+        """Empty the in-process tier and reset the counters"""
+        with self._lock:
+            self._lru.clear()
+            self._stats = dict.fromkeys(self._stats, 0)
+
+    def _lru_get(self, key: Tuple[str, str]) -> Any:
+        with self._lock:
+            entry = self._lru.get(key)
+            if entry is None:
+                return MISSING
+            result, expires_at = entry
+            if expires_at <= time.time():
+                del self._lru[key]
+                return MISSING
+            self._lru.move_to_end(key)
+            return result
+
+    def _lru_put(self, key: Tuple[str, str], result: Optional[GeocodeResult], expires_at: float) -> None:
+        with self._lock:
+            self._lru[key] = (result, expires_at)
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.lru_size:
+                self._lru.popitem(last=False)
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._stats[counter] += 1
+
+
+geocode_cache = GeocodeCache(
+    lru_size=getattr(settings, 'GEOCODE_CACHE_LRU_SIZE', 10000),
+    ttl=getattr(settings, 'GEOCODE_CACHE_TTL', 60 * 60 * 24 * 90),
+    negative_ttl=getattr(settings, 'GEOCODE_CACHE_NEGATIVE_TTL', 60 * 60 * 24),
+    coordinate_precision=getattr(settings, 'GEOCODE_CACHE_COORDINATE_PRECISION', 4)
+)
+
+
+def cached_geocode(address: str, geocoder: Callable[[str], Optional[GeocodeResult]]) -> Optional[GeocodeResult]:
+    """
+    Geocode through the shared cache, or directly when GEOCODE_CACHE_ENABLED is False
+
+    Args:
+        address: Address to geocode
+        geocoder: Calls the provider, see GeocodeCache.geocode
+
+    Returns:
+        The provider's first result, None if the address can't be resolved or on error
+    """
+    if not getattr(settings, 'GEOCODE_CACHE_ENABLED', True):
+        try:
+            return geocoder(address)
+        except Exception as e:
+            logger.error(f"Error geocoding address '{address}': {str(e)}")
+            return None
+    return geocode_cache.geocode(address, geocoder)
@@ -0,0 +1,83 @@
+import statistics
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.domain_events.event_bus import event_bus
+from core.domain_events.events import BenchmarkEvent
+from core.domain_events.outbox import OutboxRelay, get_outbox_batch_size, write_to_outbox
+
+
+class Command(BaseCommand):
+    help = (
+        'Compares events/sec and p99 publish latency of the per-event .delay() path '
+        'against the transactional outbox + batched relay. Sends real tasks to the '
+        'configured broker, so run it against a development broker. Only the outbox '
+        'rows of this run are relayed, other pending events are left to the relay task.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--events', type=int, default=2000, help='Events published per mode')
+        parser.add_argument('--batch-size', type=int, default=get_outbox_batch_size(),
+                            help='Events per Celery task when relaying the outbox')
+        parser.add_argument('--payload-bytes', type=int, default=256, help='Size of the event payload')
+
+    def handle(self, *args, **options):
+        count = options['events']
+        payload = 'x' * options['payload_bytes']
+        run_id = uuid.uuid4().hex
+
+        self.stdout.write(f'Publishing {count} events per mode...')
+
+        # Direct path: one broker round trip per event, inside the request
+        latencies = []
+        started = time.perf_counter()
+        for i in range(count):
+            event = BenchmarkEvent.create(run=run_id, sequence=i, payload=payload)
+            t0 = time.perf_counter()
+            event_bus.publish_immediately(event)
+            latencies.append(time.perf_counter() - t0)
+        delay_total = time.perf_counter() - started
+        self._report('delay()', count, delay_total, latencies)
+
+        # Outbox path: each publish is an INSERT in the caller's transaction,
+        # then the relay drains the table in batches
+        latencies = []
+        started = time.perf_counter()
+        for i in range(count):
+            event = BenchmarkEvent.create(run=run_id, sequence=i, payload=payload)
+            t0 = time.perf_counter()
+            with transaction.atomic():
+                write_to_outbox(event)
+            latencies.append(time.perf_counter() - t0)
+        publish_total = time.perf_counter() - started
+
+        t0 = time.perf_counter()
+        relayed = OutboxRelay(
+            batch_size=options['batch_size'],
+            filters={'event_type': BenchmarkEvent.__name__, 'payload__run': run_id}
+        ).drain()
+        relay_total = time.perf_counter() - t0
+
+        self._report('outbox publish', count, publish_total, latencies)
+        self.stdout.write(
+            f'  relay: {relayed} events in {relay_total:.3f}s '
+            f'({relayed / relay_total if relay_total else 0:.0f} events/sec, '
+            f'batch size {options["batch_size"]})'
+        )
+        end_to_end = publish_total + relay_total
+        self.stdout.write(
+            f'  end-to-end: {count / end_to_end if end_to_end else 0:.0f} events/sec'
+        )
+
+        self.stdout.write(self.style.SUCCESS('Benchmark complete'))
+
+    def _report(self, label, count, total, latencies):
+        latencies.sort()
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        self.stdout.write(
+            f'{label}: {count / total if total else 0:.0f} events/sec, '
+            f'p50 {statistics.median(latencies) * 1000:.2f}ms, p99 {p99 * 1000:.2f}ms'
+        )
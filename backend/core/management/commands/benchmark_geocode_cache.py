@@ -0,0 +1,110 @@
+import hashlib
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.infrastructure.services.geocode_cache import GeocodeCache, normalize_address
+
+STREETS = [
+    ('Rue', 'de Rivoli'), ('Avenue', 'des Champs-Élysées'), ('Boulevard', 'Saint-Germain'),
+    ('Rue', 'Oberkampf'), ('Place', 'de la République'), ('Rue', 'du Faubourg Saint-Antoine'),
+    ('Avenue', 'Jean Jaurès'), ('Rue', 'de la Paix'), ('Boulevard', 'Voltaire'), ('Rue', 'Sainte-Croix'),
+]
+ABBREVIATED = {'Rue': 'r.', 'Avenue': 'av.', 'Boulevard': 'bd', 'Place': 'pl.'}
+
+
+class FakeGeocoder:
+    """Deterministic geocoder that counts its calls; addresses in 'Nowhere' don't resolve"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, address):
+        self.calls += 1
+        if 'nowhere' in address.lower():
+            return None
+        digest = hashlib.sha256(normalize_address(address).encode()).digest()
+        return {
+            'formatted_address': address,
+            'geometry': {'location': {
+                'lat': 48.80 + digest[0] / 255 * 0.12,
+                'lng': 2.25 + digest[1] / 255 * 0.20,
+            }},
+            'address_components': [],
+        }
+
+
+class Command(BaseCommand):
+    help = (
+        'Replays an address log through the geocode cache with a fake geocoder and counts '
+        'the external calls saved. Also replays it in a fresh process-local tier to show '
+        'the database tier. Runs inside a transaction that is rolled back.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--log', help='File with one address per line to replay instead of a generated log')
+        parser.add_argument('--requests', type=int, default=20000)
+        parser.add_argument('--addresses', type=int, default=3000, help='Distinct addresses in the generated log')
+        parser.add_argument('--unresolvable', type=float, default=0.05, help='Share of unresolvable addresses')
+
+    def handle(self, *args, **options):
+        if options['log']:
+            with open(options['log'], encoding='utf-8') as log_file:
+                addresses = [line.strip() for line in log_file if line.strip()]
+        else:
+            addresses = self._generate_log(options['requests'], options['addresses'], options['unresolvable'])
+        distinct = len({normalize_address(address) for address in addresses})
+        self.stdout.write(f'Replaying {len(addresses):,} lookups of {distinct:,} normalized addresses')
+
+        with transaction.atomic():
+            cache = GeocodeCache(lru_size=10000)
+            self._replay('warm-up worker', cache, addresses)
+            # A new worker: empty in-process tier, rows written by the first one
+            self._replay('new worker', GeocodeCache(lru_size=10000), addresses)
+            transaction.set_rollback(True)
+
+        self.stdout.write(self.style.SUCCESS('Benchmark complete'))
+
+    def _replay(self, label, cache, addresses):
+        geocoder = FakeGeocoder()
+        started = time.perf_counter()
+        for address in addresses:
+            cache.geocode(address, geocoder)
+        elapsed = time.perf_counter() - started
+        stats = cache.stats()
+        self.stdout.write(
+            f'{label:>14}: {geocoder.calls:,} geocoder calls instead of {len(addresses):,} '
+            f'({1 - geocoder.calls / len(addresses):.1%} saved), hit rate {stats["hit_rate"]:.1%} '
+            f'(memory {stats["memory_hits"]:,}, database {stats["database_hits"]:,}, '
+            f'negative {stats["negative_hits"]:,}), {elapsed / len(addresses) * 1e6:.0f}us per lookup'
+        )
+
+    @staticmethod
+    def _generate_log(requests, count, unresolvable):
+        """Addresses with skewed popularity, each typed in several ways"""
+        rng = random.Random(3)
+        base = []
+        for i in range(count):
+            kind, name = rng.choice(STREETS)
+            city = 'Nowhere' if rng.random() < unresolvable else 'Paris'
+            base.append((rng.randint(1, 250), kind, name, f'{75001 + i % 20}', city))
+
+        log = []
+        for _ in range(requests):
+            # 70% of lookups go to a few popular addresses
+            if rng.random() < 0.7:
+                index = min(int(rng.paretovariate(1.2)) - 1, count - 1)
+            else:
+                index = rng.randrange(count)
+            number, kind, name, postal_code, city = base[index]
+            if rng.random() < 0.3:
+                kind = ABBREVIATED.get(kind, kind)
+            address = f'{number} {kind} {name}, {postal_code} {city}'
+            if rng.random() < 0.3:
+                address = address.lower()
+            if rng.random() < 0.2:
+                address = address.replace(',', ' ,').replace('é', 'e').replace('è', 'e')
+            log.append(address)
+        return log
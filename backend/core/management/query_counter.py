@@ -0,0 +1,19 @@
+"""
+Query counting shared by the benchmark commands
+
+Used as `connection.execute_wrapper(counter)`. Unlike CaptureQueriesContext it
+keeps no query log, so long runs are not capped at the 9000 queries Django keeps.
+"""
+
+
+class QueryCounter:
+    """Database execute wrapper counting the statements run while enabled"""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        if self.enabled:
+            self.count += 1
+        return execute(sql, params, many, context)
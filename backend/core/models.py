@@ -10,5 +10,13 @@ from core.infrastructure.django_models.welcom_asset_orm_model import (
     TaskAssetModel as TaskAsset
 )
 
+from core.infrastructure.django_models.event_outbox_orm_model import (
+    EventOutboxModel as EventOutbox
+)
+
+from core.infrastructure.django_models.geocode_cache_orm_model import (
+    GeocodeCacheModel as GeocodeCache
+)
+
 # Re-export models with simplified names for Django admin and migrations
-__all__ = ['CompanyAsset', 'StoreAsset', 'TaskAsset']
+__all__ = ['CompanyAsset', 'StoreAsset', 'TaskAsset', 'EventOutbox', 'GeocodeCache']
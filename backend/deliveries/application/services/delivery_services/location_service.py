@@ -1,17 +1,27 @@
+import time
 import uuid
-from typing import Tuple, Optional, Dict, Any
+from typing import Callable, Tuple, Optional, Dict, Any
 from datetime import datetime, timedelta
 
 from deliveries.domain.models.entities.delivery_entities import DeliveryLocation
 from deliveries.domain.models.value_objects import GeoPoint
+from deliveries.domain.models.route_geometry import RouteCorridor
 from deliveries.domain.repositories.delivery_repo.delivery_location_repository_interfaces import DeliveryLocationRepository
 from deliveries.domain.repositories.delivery_repo.delivery_repository_interfaces import DeliveryRepository
 from deliveries.domain.services.maps_service_interface import MapsServiceInterface
+from deliveries.domain.services.cache_location_service_interface import LocationCacheService
 from core.domain_events.event_bus import event_bus
 from deliveries.domain.models.events.deliveries_events import (
     DeliveryLocationUpdatedEvent
 )
 
+# Message returned when a ping is dropped by the rate limiter
+LOCATION_UPDATE_THROTTLED = "Location update throttled"
+# Message returned when the delivery of a ping does not exist
+DELIVERY_NOT_FOUND = "Delivery not found"
+# Message returned when a ping is cached and will be persisted by the ETA recompute
+LOCATION_UPDATE_ACCEPTED = "Location update accepted"
+
 
 class LocationApplicationService:
     """Application service for delivery location management
@@ -27,10 +37,28 @@ class LocationApplicationService:
         delivery_repository: DeliveryRepository,
         delivery_location_repository: DeliveryLocationRepository,
         maps_service: MapsServiceInterface,
+        location_cache_service: Optional[LocationCacheService] = None,
+        min_update_interval_seconds: float = 0,
+        eta_recompute_scheduler: Optional[Callable[[uuid.UUID, float], None]] = None,
+        eta_debounce_seconds: float = 5,
+        eta_min_distance_meters: float = 250,
+        eta_max_age_seconds: float = 120,
+        route_deviation_meters: float = 75,
+        route_cache_expiry_seconds: int = 3600,
+        delivery_driver_cache_seconds: int = 60,
     ):
         self.delivery_repository = delivery_repository
         self.delivery_location_repository = delivery_location_repository
         self.maps_service = maps_service
+        self.location_cache_service = location_cache_service
+        self.min_update_interval_seconds = min_update_interval_seconds
+        self.eta_recompute_scheduler = eta_recompute_scheduler
+        self.eta_debounce_seconds = eta_debounce_seconds
+        self.eta_min_distance_meters = eta_min_distance_meters
+        self.eta_max_age_seconds = eta_max_age_seconds
+        self.route_deviation_meters = route_deviation_meters
+        self.route_cache_expiry_seconds = route_cache_expiry_seconds
+        self.delivery_driver_cache_seconds = delivery_driver_cache_seconds
     
     def update_delivery_location(self, 
                                delivery_id: uuid.UUID, 
@@ -38,8 +66,13 @@ class LocationApplicationService:
                                longitude: float) -> Tuple[bool, str, Optional[DeliveryLocation]]:
         """Update the current location of a delivery
         
-        This method records the current location of a delivery (typically from a driver's
-        device) and updates the estimated arrival time based on the new location.
+        This is the ingest path for driver GPS pings and only touches the cache:
+        the location is written to the cache and, for the first ping of a burst,
+        a background ETA recompute is scheduled `eta_debounce_seconds` later.
+        Pings arriving less than `min_update_interval_seconds` after the previous
+        accepted one are dropped, and pings for unknown deliveries are rejected
+        using a cached delivery -> driver lookup. Without a cache or scheduler
+        the recompute runs inline.
         
         Args:
             delivery_id: ID of the delivery
@@ -47,65 +80,198 @@ class LocationApplicationService:
             longitude: Current longitude
             
         Returns:
-            Tuple of (success, message, delivery_location)
+            Tuple of (success, message, delivery_location). On the cached path the
+            location is not stored yet, so an accepted ping returns None and
+            LOCATION_UPDATE_ACCEPTED
         """
         # Validate parameters
         if not -90 <= latitude <= 90 or not -180 <= longitude <= 180:
             return False, "Invalid coordinates", None
-            
-        # Check if delivery exists
+        
+        current_location = GeoPoint(latitude=latitude, longitude=longitude)
+        
+        if not self.location_cache_service or not self.eta_recompute_scheduler:
+            return self._update_delivery_location_inline(delivery_id, current_location)
+        
+        # Drop fast-pinging clients with an atomic check in the cache
+        if not self.location_cache_service.allow_location_update(
+            delivery_id, self.min_update_interval_seconds
+        ):
+            return False, LOCATION_UPDATE_THROTTLED, None
+        
+        found, driver_id = self._get_delivery_driver(delivery_id)
+        if not found:
+            return False, DELIVERY_NOT_FOUND, None
+        
+        if not self.location_cache_service.update_delivery_location(
+            delivery_id, current_location, driver_id=driver_id
+        ):
+            return False, "Location could not be recorded", None
+        
+        # Coalesce the burst: only the ping that claims the slot schedules work
+        if self.location_cache_service.claim_eta_recompute(delivery_id, self.eta_debounce_seconds):
+            self.eta_recompute_scheduler(delivery_id, self.eta_debounce_seconds)
+        
+        # Not persisted yet, the recompute stores the latest position of the burst
+        return True, LOCATION_UPDATE_ACCEPTED, None
+    
+    def _get_delivery_driver(self, delivery_id: uuid.UUID) -> Tuple[bool, Optional[uuid.UUID]]:
+        """Check a delivery exists and get its driver, from the cache when possible
+        
+        Returns:
+            Tuple of (found, driver_id)
+        """
+        cached, driver_id = self.location_cache_service.get_delivery_driver(delivery_id)
+        if cached:
+            return True, driver_id
+        
         delivery = self.delivery_repository.get_by_id(delivery_id)
         if not delivery:
-            return False, "Delivery not found", None
+            return False, None
+        
+        self.location_cache_service.cache_delivery_driver(
+            delivery_id, delivery.driver_id, self.delivery_driver_cache_seconds
+        )
+        return True, delivery.driver_id
+    
+    def _update_delivery_location_inline(self, delivery_id: uuid.UUID,
+                                         current_location: GeoPoint
+                                         ) -> Tuple[bool, str, Optional[DeliveryLocation]]:
+        """Record a location and recompute the ETA synchronously"""
+        result = self.recompute_eta(delivery_id, current_location)
+        if not result:
+            return False, DELIVERY_NOT_FOUND, None
+        return True, "Location updated successfully", result["delivery_location"]
+    
+    def recompute_eta(self, delivery_id: uuid.UUID,
+                      current_location: Optional[GeoPoint] = None) -> Optional[Dict[str, Any]]:
+        """Persist the latest location of a delivery and refresh its ETA if needed
+        
+        Runs in the background for each burst of pings. The maps provider is
+        only called when the driver moved at least `eta_min_distance_meters`
+        since the last computed ETA, or when that ETA is older than
+        `eta_max_age_seconds`. Staleness and saved calls are recorded per delivery.
+        
+        Args:
+            delivery_id: ID of the delivery
+            current_location: Location to use, read from the cache when omitted
             
-        # Create GeoPoint from coordinates
-        current_location = GeoPoint(latitude=latitude, longitude=longitude)
+        Returns:
+            Dictionary describing the recompute, or None if there was nothing to do
+        """
+        cache = self.location_cache_service
+        if cache:
+            # Pings arriving from now on schedule the next recompute
+            cache.release_eta_recompute(delivery_id)
+        
+        if current_location is None:
+            current_location = self._get_cached_location(delivery_id)
+            if current_location is None:
+                return None
+        
+        delivery = self.delivery_repository.get_by_id(delivery_id)
+        if not delivery:
+            if cache:
+                cache.clear_delivery_data(delivery_id)
+            return None
+        if cache:
+            # Pick up a driver assigned since the lookup was cached
+            cache.cache_delivery_driver(delivery_id, delivery.driver_id, self.delivery_driver_cache_seconds)
         
-        # Create delivery location record
         delivery_location = self.delivery_location_repository.create(
             delivery_id=delivery_id,
-            location=current_location,
-            recorded_at=datetime.now()
+            driver_id=delivery.driver_id,
+            location=current_location
         )
-            
-        # Update estimated arrival time if destination is available
-        if self.maps_service and delivery.delivery_location_geopoint:
+        
+        now = datetime.now()
+        checkpoint = cache.get_eta_checkpoint(delivery_id) if cache else None
+        staleness_seconds = None
+        needs_recompute = True
+        if checkpoint:
+            last_location, computed_at = checkpoint
+            staleness_seconds = (now - computed_at).total_seconds()
+            moved_meters = last_location.distance_to(current_location) * 1000
+            needs_recompute = (
+                moved_meters >= self.eta_min_distance_meters or
+                staleness_seconds >= self.eta_max_age_seconds
+            )
+        
+        external_call = False
+        estimated_arrival = None
+        if needs_recompute and self.maps_service and delivery.delivery_location_geopoint:
             # Get updated travel time estimate
+            external_call = True
             travel_time_seconds = self.maps_service.estimate_travel_time(
                 origin=current_location,
                 destination=delivery.delivery_location_geopoint
             )
-                
+            
             if travel_time_seconds > 0:
                 # Calculate new estimated arrival time
-                estimated_arrival = datetime.now() + timedelta(seconds=travel_time_seconds)
-                    
+                estimated_arrival = now + timedelta(seconds=travel_time_seconds)
+                
                 # Update delivery with new ETA
                 self.delivery_repository.update_estimated_arrival(
                     delivery_id=delivery_id,
                     estimated_arrival_time=estimated_arrival
                 )
-            
-            # Publish location updated event
-            event_bus.publish(DeliveryLocationUpdatedEvent.create(
-                delivery_id=delivery_id,
-                latitude=latitude,
-                longitude=longitude,
-                recorded_at=delivery_location.recorded_at
-            ))
-            
-            return True, "Location updated successfully", delivery_location
+                if cache:
+                    cache.save_eta_checkpoint(delivery_id, current_location, now, estimated_arrival)
+        
+        if cache:
+            cache.record_eta_metrics(delivery_id, external_call, staleness_seconds)
+        
+        # Publish location updated event
+        event_bus.publish(DeliveryLocationUpdatedEvent.create(
+            delivery_id=delivery_id,
+            latitude=current_location.latitude,
+            longitude=current_location.longitude,
+            recorded_at=delivery_location.timestamp
+        ))
         
-        return False, "Location repository not available", None
+        return {
+            "delivery_location": delivery_location,
+            "external_call": external_call,
+            "estimated_arrival": estimated_arrival,
+            "staleness_seconds": staleness_seconds
+        }
     
-    def get_delivery_route(self, delivery_id: uuid.UUID) -> Optional[Dict[str, Any]]:
+    def _get_cached_location(self, delivery_id: uuid.UUID) -> Optional[GeoPoint]:
+        """Read the latest location of a delivery from the cache"""
+        cached = self.location_cache_service.get_delivery_location(delivery_id)
+        if not cached:
+            return None
+        return GeoPoint(latitude=cached["lat"], longitude=cached["lng"])
+    
+    def get_eta_metrics(self, delivery_id: uuid.UUID) -> Dict[str, float]:
+        """Get ETA staleness and saved external calls for a delivery
+        
+        Args:
+            delivery_id: ID of the delivery
+            
+        Returns:
+            Dictionary of metrics, empty when no cache service is configured
+        """
+        if not self.location_cache_service:
+            return {}
+        return self.location_cache_service.get_eta_metrics(delivery_id)
+    
+    def get_delivery_route(self, delivery_id: uuid.UUID,
+                           current_location: Optional[GeoPoint] = None) -> Optional[Dict[str, Any]]:
         """Get the route information for a delivery
         
-        This method calculates the route between the store and delivery location,
-        providing distance, duration, and polyline data for map display.
+        The route goes from the driver's position (the given one, else the
+        last cached ping, else the store) to the delivery location. It is cached
+        per delivery and destination, and reused as long as the driver stays
+        within `route_deviation_meters` of it: the position is snapped to the
+        cached polyline locally and the remaining distance and duration are
+        scaled accordingly. Directions are only requested again after a
+        deviation. Directions calls and snapping cost are recorded per delivery.
         
         Args:
             delivery_id: ID of the delivery
+            current_location: Optional current position of the driver
             
         Returns:
             Dictionary with route information or None if not available
@@ -114,36 +280,78 @@ class LocationApplicationService:
         delivery = self.delivery_repository.get_by_id(delivery_id)
         if not delivery:
             return None
+        
+        destination = delivery.delivery_location_geopoint
+        origin = current_location
+        if origin is None and self.location_cache_service:
+            origin = self._get_cached_location(delivery_id)
+        if origin is None:
+            origin = delivery.store_location_geopoint
             
         # Check if we have the required location data
-        if not delivery.store_location_geopoint or not delivery.delivery_location_geopoint:
+        if not origin or not destination:
             return None
-            
-        # Calculate route
-        if self.maps_service:
+        
+        cache = self.location_cache_service
+        route_info = None
+        remaining_ratio = 1.0
+        snap_seconds = None
+        cached_route = cache.get_delivery_route(delivery_id, destination) if cache else None
+        if cached_route and cached_route.polyline:
+            started = time.perf_counter()
+            corridor = RouteCorridor.from_polyline(cached_route.polyline)
+            snap = corridor.snap(origin)
+            snap_seconds = time.perf_counter() - started
+            if snap.distance_meters <= self.route_deviation_meters:
+                route_info = cached_route
+                if corridor.length_meters > 0:
+                    remaining_ratio = snap.remaining_meters / corridor.length_meters
+        
+        directions_call = False
+        if route_info is None and self.maps_service:
+            # No cached route, or the driver left it
+            directions_call = True
             route_info = self.maps_service.calculate_route(
-                origin=delivery.store_location_geopoint,
-                destination=delivery.delivery_location_geopoint
+                origin=origin,
+                destination=destination
             )
+            if route_info and cache:
+                cache.cache_delivery_route(delivery_id, route_info, self.route_cache_expiry_seconds)
+        
+        if cache:
+            cache.record_route_metrics(delivery_id, directions_call, snap_seconds)
+        
+        if not route_info:
+            return None
+        
+        # Convert to dictionary for API response
+        return {
+            "origin": {
+                "lat": origin.latitude,
+                "lng": origin.longitude
+            },
+            "destination": {
+                "lat": route_info.destination.latitude,
+                "lng": route_info.destination.longitude
+            },
+            "distance_meters": int(route_info.distance_meters * remaining_ratio),
+            "duration_seconds": int(route_info.duration_seconds * remaining_ratio),
+            "polyline": route_info.polyline,
+            "waypoints": [
+                {"lat": point.latitude, "lng": point.longitude}
+                for point in route_info.waypoints
+            ] if route_info.waypoints else []
+        }
+    
+    def get_route_metrics(self, delivery_id: uuid.UUID) -> Dict[str, float]:
+        """Get directions calls and snapping cost of a delivery's route requests
+        
+        Args:
+            delivery_id: ID of the delivery
             
-            if route_info:
-                # Convert to dictionary for API response
-                return {
-                    "origin": {
-                        "lat": route_info.origin.latitude,
-                        "lng": route_info.origin.longitude
-                    },
-                    "destination": {
-                        "lat": route_info.destination.latitude,
-                        "lng": route_info.destination.longitude
-                    },
-                    "distance_meters": route_info.distance_meters,
-                    "duration_seconds": route_info.duration_seconds,
-                    "polyline": route_info.polyline,
-                    "waypoints": [
-                        {"lat": point.latitude, "lng": point.longitude}
-                        for point in route_info.waypoints
-                    ] if route_info.waypoints else []
-                }
-        
-        return None
\ No newline at end of file
+        Returns:
+            Dictionary of metrics, empty when no cache service is configured
+        """
+        if not self.location_cache_service:
+            return {}
+        return self.location_cache_service.get_route_metrics(delivery_id)
@@ -10,10 +10,12 @@ from uuid import UUID
 from datetime import datetime
 
 from deliveries.domain.models.entities.notification_entities import DriverNotification
-from deliveries.domain.models.value_objects import NotificationStatus
+from deliveries.domain.models.entities.driver_entities import DriverLocation
+from deliveries.domain.models.value_objects import GeoPoint, NotificationStatus, TravelEstimate
 from deliveries.domain.models.entities.delivery_entities import Delivery
 from deliveries.domain.repositories.delivery_repo.delivery_repository_interfaces import DeliveryRepository
 from deliveries.domain.services.notification_service_interface import NotificationServiceInterface
+from deliveries.domain.services.maps_service_interface import MapsServiceInterface
 from deliveries.domain.repositories.driver_repo.driver_location_repository_interfaces import DriverLocationRepository
 from deliveries.domain.repositories.notification_repo.driver_notification_repository_interfaces import DriverNotificationRepository
 
@@ -35,13 +37,15 @@ class DeliveryNotificationService:
         notification_service: NotificationServiceInterface,
         driver_location_repository: DriverLocationRepository,
         notification_repository: DriverNotificationRepository,
-        order_repository: OrderRepository
+        order_repository: OrderRepository,
+        maps_service: Optional[MapsServiceInterface] = None
     ):
         self.delivery_repository = delivery_repository
         self.notification_service = notification_service
         self.driver_location_repository = driver_location_repository 
         self.notification_repository = notification_repository
         self.order_repository = order_repository
+        self.maps_service = maps_service
     
     def prepare_notifications_for_new_order(
         self, 
@@ -77,6 +81,13 @@ class DeliveryNotificationService:
                 exclude_user_id=exclude_user_id
             )
             
+            # Closest drivers by road first, they have to reach the store
+            pickup_location = delivery.store_location_geopoint or delivery.delivery_location_geopoint
+            nearby_drivers = [
+                driver_location
+                for driver_location, _ in self.rank_drivers_by_travel_time(nearby_drivers, pickup_location)
+            ]
+            
             # Create notification content
             title = f"New Order from {delivery.store_brand_name}"
             body = f"New delivery available {delivery.fee:.2f}$ - {delivery.total_items} items"
@@ -109,6 +120,43 @@ class DeliveryNotificationService:
             logger.error(f"Error preparing notifications for new order: {str(e)}")
             return []
     
+    def rank_drivers_by_travel_time(
+        self,
+        driver_locations: List[DriverLocation],
+        destination: GeoPoint
+    ) -> List[Tuple[DriverLocation, Optional[TravelEstimate]]]:
+        """
+        Order candidate drivers by travel time to a destination
+        
+        All candidates are estimated with one batched distance matrix call.
+        Drivers without a route come last. Without a maps service, or if the
+        estimation fails, the given (straight-line) order is kept.
+        
+        Args:
+            driver_locations: Candidate drivers, e.g. from find_nearby_drivers
+            destination: Where the drivers have to go
+            
+        Returns:
+            List of (driver location, travel estimate) from the fastest driver
+        """
+        if not self.maps_service or not driver_locations:
+            return [(driver_location, None) for driver_location in driver_locations]
+        
+        try:
+            estimates = self.maps_service.travel_estimates_to(
+                [driver_location.location for driver_location in driver_locations],
+                destination
+            )
+        except Exception as e:
+            logger.error(f"Error estimating driver travel times: {str(e)}")
+            return [(driver_location, None) for driver_location in driver_locations]
+        
+        # sorted is stable, so ties and unreachable drivers keep the straight-line order
+        return sorted(
+            zip(driver_locations, estimates),
+            key=lambda ranked: ranked[1].duration_seconds if ranked[1] else float('inf')
+        )
+    
     def handle_delivery_acceptance_from_notification(self, delivery_id: UUID, driver_id: UUID) -> Tuple[bool, str, Optional[Delivery]]:
         """
         Handle a driver accepting a delivery
@@ -1,6 +1,39 @@
 from django.apps import AppConfig
+from django.conf import settings
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class DeliveriesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'deliveries'
+    
+    def ready(self):
+        """Initialize app when Django starts"""
+        from django.db.models.signals import post_migrate, pre_migrate
+        from deliveries.infrastructure.django_models.signals import (
+            create_driver_location_history, dedupe_driver_locations
+        )
+
+        pre_migrate.connect(dedupe_driver_locations, sender=self)
+        post_migrate.connect(create_driver_location_history, sender=self)
+
+        # Import and register tasks with Celery
+        try:
+            # Only register celery tasks if celery is configured
+            if hasattr(settings, 'CELERY_BEAT_SCHEDULE'):
+                from deliveries.tasks import maintain_driver_location_history
+                
+                # Add the task to the celery beat schedule if not already there
+                if 'deliveries.tasks.maintain_driver_location_history' not in settings.CELERY_BEAT_SCHEDULE:
+                    settings.CELERY_BEAT_SCHEDULE['deliveries.tasks.maintain_driver_location_history'] = {
+                        'task': 'deliveries.tasks.maintain_driver_location_history',
+                        'schedule': 3600.0,  # Run every hour
+                        'options': {'expires': 3540},  # Expire after 59 minutes
+                    }
+                    logger.info("Registered driver location history maintenance with Celery Beat")
+        except ImportError:
+            logger.warning("Celery not installed, skipping task registration")
+        except Exception as e:
+            logger.error(f"Error registering deliveries tasks: {str(e)}")
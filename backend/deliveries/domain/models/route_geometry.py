@@ -0,0 +1,146 @@
+"""
+Route geometry used to reuse a cached route while a driver follows it.
+
+A route's encoded polyline is decoded once and projected on a local
+equirectangular plane, accurate enough for the few kilometers of a delivery.
+Snapping a driver position to the route then costs one point-to-segment
+distance per segment, without any call to the maps provider.
+"""
+import math
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from deliveries.domain.models.value_objects import GeoPoint
+
+# Meters per degree of latitude, used for the local flat projection
+METERS_PER_DEGREE = 111320.0
+
+
+def decode_polyline(encoded: str) -> List[Tuple[float, float]]:
+    """
+    Decode a Google encoded polyline
+
+    Args:
+        encoded: Polyline in Google's encoded polyline format
+
+    Returns:
+        (latitude, longitude) pairs in route order
+    """
+    points = []
+    index = latitude = longitude = 0
+    length = len(encoded)
+    while index < length:
+        deltas = []
+        for _ in range(2):
+            shift = result = 0
+            while True:
+                byte = ord(encoded[index]) - 63
+                index += 1
+                result |= (byte & 0x1f) << shift
+                shift += 5
+                if byte < 0x20:
+                    break
+            deltas.append(~(result >> 1) if result & 1 else result >> 1)
+        latitude += deltas[0]
+        longitude += deltas[1]
+        points.append((latitude / 1e5, longitude / 1e5))
+    return points
+
+
+def encode_polyline(points: List[Tuple[float, float]]) -> str:
+    """
+    Encode points in Google's encoded polyline format
+
+    Args:
+        points: (latitude, longitude) pairs in route order
+
+    Returns:
+        Encoded polyline
+    """
+    chunks = []
+    previous = (0, 0)
+    for latitude, longitude in points:
+        current = (int(round(latitude * 1e5)), int(round(longitude * 1e5)))
+        for value in (current[0] - previous[0], current[1] - previous[1]):
+            value = ~(value << 1) if value < 0 else value << 1
+            while value >= 0x20:
+                chunks.append(chr((0x20 | (value & 0x1f)) + 63))
+                value >>= 5
+            chunks.append(chr(value + 63))
+        previous = current
+    return ''.join(chunks)
+
+
+@dataclass(frozen=True)
+class RouteSnap:
+    """Position of a point relative to a route"""
+    distance_meters: float  # From the point to the closest point of the route
+    along_meters: float  # Route length before that closest point
+    remaining_meters: float  # Route length after it
+
+
+class RouteCorridor:
+    """A route's geometry, to measure how far a driver is from it"""
+
+    def __init__(self, points: List[Tuple[float, float]]):
+        """
+        Args:
+            points: (latitude, longitude) pairs in route order, at least one
+        """
+        if not points:
+            raise ValueError("A route needs at least one point")
+        self.lat_scale = METERS_PER_DEGREE
+        self.lng_scale = METERS_PER_DEGREE * math.cos(math.radians(points[0][0]))
+        self.xs = [lng * self.lng_scale for _, lng in points]
+        self.ys = [lat * self.lat_scale for lat, _ in points]
+
+        # Route length up to each point
+        self.cumulative = [0.0]
+        for i in range(1, len(points)):
+            self.cumulative.append(
+                self.cumulative[-1] + math.hypot(self.xs[i] - self.xs[i - 1], self.ys[i] - self.ys[i - 1])
+            )
+
+    @classmethod
+    def from_polyline(cls, encoded: str) -> 'RouteCorridor':
+        """Build the corridor of an encoded polyline"""
+        return cls(decode_polyline(encoded))
+
+    @property
+    def length_meters(self) -> float:
+        return self.cumulative[-1]
+
+    def snap(self, point: GeoPoint) -> RouteSnap:
+        """
+        Project a point on the route
+
+        Args:
+            point: Driver position
+
+        Returns:
+            Distance to the route and position along it
+        """
+        x = point.longitude * self.lng_scale
+        y = point.latitude * self.lat_scale
+        xs, ys = self.xs, self.ys
+
+        best_distance = math.hypot(x - xs[0], y - ys[0])
+        best_along = 0.0
+        for i in range(len(xs) - 1):
+            dx = xs[i + 1] - xs[i]
+            dy = ys[i + 1] - ys[i]
+            squared_length = dx * dx + dy * dy
+            if squared_length == 0:
+                continue
+            # Position of the projection on the segment, clamped to its ends
+            t = max(0.0, min(1.0, ((x - xs[i]) * dx + (y - ys[i]) * dy) / squared_length))
+            distance = math.hypot(x - (xs[i] + t * dx), y - (ys[i] + t * dy))
+            if distance < best_distance:
+                best_distance = distance
+                best_along = self.cumulative[i] + t * math.sqrt(squared_length)
+
+        return RouteSnap(
+            distance_meters=best_distance,
+            along_meters=best_along,
+            remaining_meters=self.length_meters - best_along
+        )
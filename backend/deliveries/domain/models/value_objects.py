@@ -124,6 +124,17 @@ class RouteInfo:
         }
 
 
+@dataclass(frozen=True)
+class TravelEstimate:
+    """
+    Value object representing the road distance and travel time between two points.
+    
+    One element of a distance matrix.
+    """
+    distance_meters: int
+    duration_seconds: int
+
+
 class NotificationStatus(Enum):
     """Notification status value object"""
     PENDING = "pending"
@@ -5,7 +5,7 @@ This module defines the repository interfaces for driver devices
 following the Dependency Inversion Principle from SOLID.
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from deliveries.domain.models.entities.driver_entities import DriverDevice
@@ -56,4 +56,29 @@ class DriverDeviceRepository(ABC):
         """
         pass
     
-
+    @abstractmethod
+    def get_active_tokens_for_drivers(self, driver_ids: List[UUID]) -> Dict[UUID, List[str]]:
+        """
+        Get the active device tokens of several drivers in one lookup
+        
+        Args:
+            driver_ids: UUIDs of the drivers
+            
+        Returns:
+            Dictionary mapping driver UUIDs to their active device tokens.
+            Drivers without active devices are omitted.
+        """
+        pass
+    
+    @abstractmethod
+    def deactivate_tokens(self, device_tokens: List[str]) -> int:
+        """
+        Mark device tokens as inactive, e.g. after the push provider rejected them
+        
+        Args:
+            device_tokens: FCM device tokens to deactivate
+            
+        Returns:
+            Number of devices deactivated
+        """
+        pass
@@ -9,7 +9,7 @@ from typing import List, Dict, Any, Optional, Tuple
 from uuid import UUID
 from datetime import datetime
 
-from deliveries.domain.models.value_objects import GeoPoint, RouteInfo
+from deliveries.domain.models.value_objects import GeoPoint, RouteInfo, TravelEstimate
 
 
 class LocationCacheService(ABC):
@@ -38,6 +38,50 @@ class LocationCacheService(ABC):
         """
         pass
     
+    @abstractmethod
+    def allow_location_update(self, delivery_id: UUID, min_interval_seconds: float) -> bool:
+        """
+        Atomically check and record a location ping for rate limiting
+        
+        Args:
+            delivery_id: Unique identifier for the delivery
+            min_interval_seconds: Minimum time between accepted pings
+            
+        Returns:
+            True if the ping should be processed, False if it arrived too soon
+        """
+        pass
+    
+    @abstractmethod
+    def get_delivery_driver(self, delivery_id: UUID) -> Tuple[bool, Optional[UUID]]:
+        """
+        Get the cached driver of a delivery
+        
+        Args:
+            delivery_id: Unique identifier for the delivery
+            
+        Returns:
+            Tuple of (cached, driver_id). cached is False when the delivery is
+            not in the cache; driver_id is None for a delivery without a driver
+        """
+        pass
+    
+    @abstractmethod
+    def cache_delivery_driver(self, delivery_id: UUID, driver_id: Optional[UUID],
+                            expiry_seconds: int = 60) -> bool:
+        """
+        Cache the driver of an existing delivery
+        
+        Args:
+            delivery_id: Unique identifier for the delivery
+            driver_id: Driver of the delivery, None if it has none yet
+            expiry_seconds: Time in seconds before the cache expires
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        pass
+    
     @abstractmethod
     def get_delivery_location(self, delivery_id: UUID) -> Optional[Tuple[GeoPoint, datetime]]:
         """
@@ -111,6 +155,94 @@ class LocationCacheService(ABC):
         """
         pass
     
+    @abstractmethod
+    def cache_delivery_route(self, delivery_id: UUID, route_info: RouteInfo,
+                           expiry_seconds: int = 3600) -> bool:
+        """
+        Cache the route of a delivery towards its destination
+        
+        Args:
+            delivery_id: Unique identifier for the delivery
+            route_info: Route to cache, keyed on its destination
+            expiry_seconds: Time in seconds before the cache expires
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        pass
+    
+    @abstractmethod
+    def get_delivery_route(self, delivery_id: UUID, destination: GeoPoint) -> Optional[RouteInfo]:
+        """
+        Get the cached route of a delivery towards a destination
+        
+        Args:
+            delivery_id: Unique identifier for the delivery
+            destination: Destination of the route
+            
+        Returns:
+            RouteInfo if found in cache, None otherwise
+        """
+        pass
+    
+    @abstractmethod
+    def record_route_metrics(self, delivery_id: UUID, directions_call: bool,
+                           snap_seconds: Optional[float] = None) -> bool:
+        """
+        Accumulate route request metrics for a delivery
+        
+        Args:
+            delivery_id: Unique identifier for the delivery
+            directions_call: Whether the maps provider was called
+            snap_seconds: Time spent snapping the position to the cached route
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        pass
+    
+    @abstractmethod
+    def get_route_metrics(self, delivery_id: UUID) -> Dict[str, float]:
+        """
+        Get the accumulated route request metrics for a delivery
+        
+        Args:
+            delivery_id: Unique identifier for the delivery
+            
+        Returns:
+            Dictionary with requests, directions_calls, calls_saved and
+            avg_snap_microseconds
+        """
+        pass
+    
+    @abstractmethod
+    def get_travel_estimates(self, pairs: List[Tuple[GeoPoint, GeoPoint]]) -> List[Optional[TravelEstimate]]:
+        """
+        Get cached distance matrix elements
+        
+        Args:
+            pairs: (origin, destination) pairs
+            
+        Returns:
+            The cached estimate of each pair, None where there is none
+        """
+        pass
+    
+    @abstractmethod
+    def cache_travel_estimates(self, estimates: Dict[Tuple[GeoPoint, GeoPoint], TravelEstimate],
+                             expiry_seconds: int = 600) -> bool:
+        """
+        Cache distance matrix elements
+        
+        Args:
+            estimates: Estimate of each (origin, destination) pair
+            expiry_seconds: Time in seconds before the cache expires
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        pass
+    
     @abstractmethod
     def update_delivery_eta(self, delivery_id: UUID, eta: datetime) -> bool:
         """
@@ -152,3 +284,94 @@ class LocationCacheService(ABC):
             True if successful, False otherwise
         """
         pass
+    
+    @abstractmethod
+    def claim_eta_recompute(self, delivery_id: UUID, debounce_seconds: float) -> bool:
+        """
+        Atomically mark a delivery as having an ETA recompute pending
+        
+        Also counts the ping towards the delivery's ETA metrics. Pings arriving
+        while a recompute is pending are coalesced into it.
+        
+        Args:
+            delivery_id: Unique identifier for the delivery
+            debounce_seconds: How long the pending mark lasts at most
+            
+        Returns:
+            True if the caller should schedule the recompute, False if one is already pending
+        """
+        pass
+    
+    @abstractmethod
+    def release_eta_recompute(self, delivery_id: UUID) -> bool:
+        """
+        Clear the pending mark so the next ping schedules a new recompute
+        
+        Args:
+            delivery_id: Unique identifier for the delivery
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        pass
+    
+    @abstractmethod
+    def get_eta_checkpoint(self, delivery_id: UUID) -> Optional[Tuple[GeoPoint, datetime]]:
+        """
+        Get the position and time of the last external ETA computation
+        
+        Args:
+            delivery_id: Unique identifier for the delivery
+            
+        Returns:
+            Tuple of (location, computed_at) if an ETA was computed, None otherwise
+        """
+        pass
+    
+    @abstractmethod
+    def save_eta_checkpoint(self, delivery_id: UUID, location: GeoPoint,
+                          computed_at: datetime, eta: datetime) -> bool:
+        """
+        Record an external ETA computation and its result
+        
+        Args:
+            delivery_id: Unique identifier for the delivery
+            location: Position the ETA was computed from
+            computed_at: When the ETA was computed
+            eta: Estimated time of arrival
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        pass
+    
+    @abstractmethod
+    def record_eta_metrics(self, delivery_id: UUID, external_call: bool,
+                         staleness_seconds: Optional[float] = None) -> bool:
+        """
+        Accumulate ETA recompute metrics for a delivery
+        
+        Args:
+            delivery_id: Unique identifier for the delivery
+            external_call: Whether the maps provider was called
+            staleness_seconds: Age of the served ETA when the recompute ran
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        pass
+    
+    @abstractmethod
+    def get_eta_metrics(self, delivery_id: UUID) -> Dict[str, float]:
+        """
+        Get the accumulated ETA recompute metrics for a delivery
+        
+        Args:
+            delivery_id: Unique identifier for the delivery
+            
+        Returns:
+            Dictionary with pings, recomputes, external_calls, calls_saved
+            (pings that did not cost a provider call), last_staleness_seconds
+            and max_staleness_seconds
+        """
+        pass
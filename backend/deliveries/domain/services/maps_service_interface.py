@@ -10,7 +10,7 @@ from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
-from deliveries.domain.models.value_objects import GeoPoint, RouteInfo
+from deliveries.domain.models.value_objects import GeoPoint, RouteInfo, TravelEstimate
 
 
 class MapsServiceInterface(ABC):
@@ -61,6 +61,37 @@ class MapsServiceInterface(ABC):
         """
         pass
     
+    @abstractmethod
+    def distance_matrix(self, origins: List[GeoPoint],
+                        destinations: List[GeoPoint]) -> List[List[Optional[TravelEstimate]]]:
+        """
+        Estimate the road distance and travel time between many points
+        
+        Args:
+            origins: Starting points
+            destinations: Ending points
+            
+        Returns:
+            One row per origin, with one estimate per destination, None where
+            no route was found
+        """
+        pass
+    
+    @abstractmethod
+    def travel_estimates_to(self, origins: List[GeoPoint],
+                            destination: GeoPoint) -> List[Optional[TravelEstimate]]:
+        """
+        Estimate the road distance and travel time from many points to one
+        
+        Args:
+            origins: Starting points, e.g. candidate drivers
+            destination: Ending point
+            
+        Returns:
+            One estimate per origin, None where no route was found
+        """
+        pass
+    
     @abstractmethod
     def find_nearby_places(self, location: GeoPoint, 
                          radius_km: float, 
@@ -26,6 +26,29 @@ MAX_SEARCH_RADIUS_KM = 50.0  # Maximum allowed radius for proximity searches
 # Location update settings
 MIN_LOCATION_UPDATE_INTERVAL_SECONDS = 10  # Minimum time between location updates
 LOCATION_HISTORY_MAX_ENTRIES = 100  # Maximum number of location history entries to keep
+DELIVERY_DRIVER_CACHE_SECONDS = 60  # Lifetime of the cached delivery -> driver lookup checked on each ping
+
+# ETA recompute settings
+ETA_RECOMPUTE_DEBOUNCE_SECONDS = 5  # Pings within this window share one background recompute
+ETA_RECOMPUTE_MIN_DISTANCE_METERS = 250  # Call the maps provider after moving this far...
+ETA_RECOMPUTE_MAX_AGE_SECONDS = 120  # ...or once the last computed ETA is this old
+
+# Route cache settings
+ROUTE_DEVIATION_METERS = 75  # A cached route is reused while the driver stays this close to it
+
+# Distance matrix settings
+DISTANCE_MATRIX_MAX_ELEMENTS = 100  # Provider limit of origins x destinations per request
+DISTANCE_MATRIX_MAX_ORIGINS = 25  # Provider limit of origins per request
+DISTANCE_MATRIX_MAX_DESTINATIONS = 25  # Provider limit of destinations per request
+DISTANCE_MATRIX_WORKERS = 4  # Chunks requested concurrently, shared by the whole process
+DISTANCE_MATRIX_CACHE_EXPIRY_SECONDS = 60 * 10  # Lifetime of a cached element, traffic changes
+
+# Driver location history settings
+DRIVER_LOCATION_HISTORY_RETENTION_DAYS = 90  # Daily partitions older than this are dropped
+DRIVER_LOCATION_PARTITIONS_AHEAD_DAYS = 3  # Daily partitions created in advance
+DRIVER_LOCATION_COMPACT_AFTER_HOURS = 24  # Points older than this are downsampled
+DRIVER_LOCATION_COMPACT_EPSILON_METERS = 10.0  # Douglas-Peucker tolerance
+DRIVER_LOCATION_TRIP_GAP_SECONDS = 600  # A pause longer than this starts a new trip
 
 # Route calculation settings
 ROUTE_CACHE_EXPIRY_SECONDS = 1800  # 30 minutes
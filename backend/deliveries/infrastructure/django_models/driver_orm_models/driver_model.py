@@ -9,6 +9,7 @@ from django.contrib.gis.db import models as gis_models
 from django.contrib.gis.geos import Point
 import uuid
 from django.conf import settings
+from django.utils import timezone
 
 class DriverModel(models.Model):
     """Django ORM model for Driver"""
@@ -47,15 +48,19 @@ class DriverDeviceModel(models.Model):
 
 
 class DriverLocationModel(models.Model):
-    """Django ORM model for tracking driver locations"""
+    """Django ORM model for the current location of a driver
+    
+    Holds a single row per driver, upserted on every ping. The trail of past
+    positions lives in DriverLocationHistoryModel.
+    """
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    driver = models.ForeignKey(DriverModel, on_delete=models.CASCADE, related_name='locations')
+    driver = models.OneToOneField(DriverModel, on_delete=models.CASCADE, related_name='current_location')
     # Geospatial field for location
     location = gis_models.PointField(geography=True, spatial_index=True)
     # Standard fields for latitude/longitude for backward compatibility
     latitude = models.FloatField()
     longitude = models.FloatField()
-    timestamp = models.DateTimeField(auto_now_add=True)
+    timestamp = models.DateTimeField(default=timezone.now)
     is_active = models.BooleanField(default=True)
     
     def save(self, *args, **kwargs):
@@ -72,9 +77,34 @@ class DriverLocationModel(models.Model):
         db_table = 'driver_locations'
         ordering = ['-timestamp']
         indexes = [
-            models.Index(fields=['driver', '-timestamp']),
             gis_models.Index(fields=['location']),
         ]
     
     def __str__(self):
         return f"Location for {self.driver.user.email} at {self.timestamp}"
+
+
+class DriverLocationHistoryModel(models.Model):
+    """Django ORM model for the append-only trail of driver positions
+    
+    The table is range-partitioned by day on `recorded_at`, which Django can't
+    express, so it is unmanaged: the parent table and the first partitions are
+    created after every migrate, later partitions by the hourly task and the
+    `manage_driver_location_history` command. Old points are
+    downsampled by the compaction job, which flags the points it keeps.
+    """
+    id = models.BigAutoField(primary_key=True)
+    driver = models.ForeignKey(DriverModel, on_delete=models.DO_NOTHING, db_constraint=False,
+                               related_name='location_history')
+    latitude = models.FloatField()
+    longitude = models.FloatField()
+    recorded_at = models.DateTimeField(default=timezone.now)
+    is_compacted = models.BooleanField(default=False)
+    
+    class Meta:
+        managed = False
+        db_table = 'driver_location_history'
+        ordering = ['driver', 'recorded_at']
+    
+    def __str__(self):
+        return f"Driver {self.driver_id} at {self.recorded_at}"
@@ -0,0 +1,34 @@
+"""
+Migrate hooks of the deliveries app
+
+The location history table is partitioned, which migrations can't express, so
+it is created after every migrate. Current locations are deduplicated before
+migrate so the unique constraint on their driver can be added.
+"""
+import logging
+
+from django.conf import settings
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+
+def dedupe_driver_locations(sender, **kwargs):
+    """Keep one current location per driver before migrate adds the unique constraint"""
+    from deliveries.infrastructure.services.location_history_service import dedupe_current_locations
+
+    dedupe_current_locations()
+
+
+def create_driver_location_history(sender, **kwargs):
+    """Create the partitioned location history table and its first partitions after migrate"""
+    if connection.vendor != 'postgresql':
+        logger.info("Skipping the driver location history table, it needs PostgreSQL")
+        return
+
+    from deliveries.infrastructure.config.geospatial_settings import DRIVER_LOCATION_PARTITIONS_AHEAD_DAYS
+    from deliveries.infrastructure.services.location_history_service import DriverLocationHistoryMaintenance
+
+    maintenance = DriverLocationHistoryMaintenance()
+    maintenance.ensure_table()
+    maintenance.ensure_partitions(days_ahead=DRIVER_LOCATION_PARTITIONS_AHEAD_DAYS)
@@ -5,7 +5,7 @@ This module provides a Django ORM implementation of the DriverDeviceRepository i
 for managing driver devices.
 """
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from deliveries.domain.models.entities.driver_entities import DriverDevice
@@ -85,6 +85,30 @@ class DjangoDriverDeviceRepository(DriverDeviceRepository):
         except Exception as e:
             logger.error(f"Error getting active devices: {str(e)}")
             return []
+    
+    def get_active_tokens_for_drivers(self, driver_ids: List[UUID]) -> Dict[UUID, List[str]]:
+        """Get the active device tokens of several drivers with a single query"""
+        tokens_by_driver: Dict[UUID, List[str]] = {}
+        if not driver_ids:
+            return tokens_by_driver
+        
+        rows = DriverDeviceModel.objects.filter(
+            driver_id__in=driver_ids,
+            is_active=True
+        ).values_list('driver_id', 'device_token')
+        
+        for driver_id, device_token in rows:
+            tokens_by_driver.setdefault(driver_id, []).append(device_token)
+        return tokens_by_driver
+    
+    def deactivate_tokens(self, device_tokens: List[str]) -> int:
+        """Mark device tokens as inactive with a single UPDATE"""
+        if not device_tokens:
+            return 0
+        return DriverDeviceModel.objects.filter(
+            device_token__in=device_tokens,
+            is_active=True
+        ).update(is_active=False)
             
     def _to_domain_entity(self, device_model: DriverDeviceModel, driver_id: UUID) -> DriverDevice:
         """Convert ORM model to domain entity"""
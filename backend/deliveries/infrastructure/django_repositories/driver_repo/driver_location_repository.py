@@ -11,12 +11,16 @@ from uuid import UUID
 from django.contrib.gis.geos import Point
 from django.contrib.gis.measure import D
 from django.contrib.gis.db.models.functions import Distance
+from django.db import IntegrityError, transaction
 from django.db.models import Q
+from django.utils import timezone
 
 from deliveries.domain.models.entities.driver_entities import DriverLocation
 from deliveries.domain.models.value_objects import GeoPoint
 from deliveries.domain.repositories.driver_repo.driver_location_repository_interfaces import DriverLocationRepository
-from deliveries.infrastructure.django_models.driver_orm_models.driver_model import DriverLocationModel, DriverModel
+from deliveries.infrastructure.django_models.driver_orm_models.driver_model import (
+    DriverLocationHistoryModel, DriverLocationModel
+)
 
 logger = logging.getLogger(__name__)
 
@@ -24,38 +28,49 @@ class DjangoDriverLocationRepository(DriverLocationRepository):
     """Django ORM implementation of DriverLocationRepository"""
     
     def update_driver_location(self, driver_id: UUID, location: GeoPoint) -> bool:
-        """Update a driver's current location"""
+        """Update a driver's current location
+        
+        Upserts the driver's single current-location row and appends the ping
+        to the partitioned history. The cost no longer depends on how many
+        pings the driver sent before. The history insert runs in its own
+        savepoint: failing to record the trail never loses the current position.
+        """
         try:
-            # Get the driver model - use select_for_update to prevent race conditions
-            driver_model = DriverModel.objects.select_for_update().get(id=driver_id)
-            
             # Create a Point object from the GeoPoint
             point = Point(location.longitude, location.latitude, srid=4326)
+            now = timezone.now()
             
-            # Use transaction.atomic to ensure atomicity
-            from django.db import transaction
             with transaction.atomic():
-                # Create a new location entry
-                location_model = DriverLocationModel.objects.create(
-                    driver=driver_model,
-                    location=point,
-                    latitude=location.latitude,
-                    longitude=location.longitude,
-                    is_active=True
+                # INSERT ... ON CONFLICT (driver_id) DO UPDATE
+                DriverLocationModel.objects.bulk_create(
+                    [DriverLocationModel(
+                        driver_id=driver_id,
+                        location=point,
+                        latitude=location.latitude,
+                        longitude=location.longitude,
+                        timestamp=now,
+                        is_active=True
+                    )],
+                    update_conflicts=True,
+                    unique_fields=['driver'],
+                    update_fields=['location', 'latitude', 'longitude', 'timestamp', 'is_active']
                 )
                 
-                # Mark all other locations for this driver as inactive
-                # Use bulk update for better performance
-                DriverLocationModel.objects.filter(
-                    driver=driver_model
-                ).exclude(
-                    id=location_model.id
-                ).update(is_active=False)
+                try:
+                    with transaction.atomic():
+                        DriverLocationHistoryModel.objects.create(
+                            driver_id=driver_id,
+                            latitude=location.latitude,
+                            longitude=location.longitude,
+                            recorded_at=now
+                        )
+                except Exception as e:
+                    logger.error(f"Error recording location history of driver {driver_id}: {str(e)}")
             
             return True
             
-        except DriverModel.DoesNotExist:
-            logger.error(f"Driver with ID {driver_id} not found")
+        except IntegrityError as e:
+            logger.error(f"Error updating location of driver {driver_id}: {str(e)}")
             return False
         except Exception as e:
             logger.error(f"Error updating driver location: {str(e)}")
@@ -64,21 +79,16 @@ class DjangoDriverLocationRepository(DriverLocationRepository):
     def get_driver_location(self, driver_id: UUID) -> Optional[DriverLocation]:
         """Get a driver's current location"""
         try:
-            # Use a more efficient query with select_related to reduce database hits
-            # This fetches the driver and location in a single query
-            location_model = DriverLocationModel.objects.select_related('driver').filter(
-                driver__id=driver_id,
+            location_model = DriverLocationModel.objects.filter(
+                driver_id=driver_id,
                 is_active=True
-            ).order_by('-timestamp').first()
+            ).first()
             
             if location_model:
                 return self._to_domain_entity(location_model)
             
             return None
             
-        except DriverModel.DoesNotExist:
-            logger.error(f"Driver with ID {driver_id} not found")
-            return None
         except Exception as e:
             logger.error(f"Error getting driver location: {str(e)}")
             return None
@@ -130,13 +140,11 @@ class DjangoDriverLocationRepository(DriverLocationRepository):
         """Convert ORM model to domain entity"""
         return DriverLocation(
             id=location_model.id,
-            driver_id=location_model.driver.id,
+            driver_id=location_model.driver_id,
             location=GeoPoint(
                 latitude=location_model.latitude,
                 longitude=location_model.longitude
             ),
             timestamp=location_model.timestamp,
-            is_active=location_model.is_active,
-            created_at=location_model.created_at,
-            updated_at=location_model.updated_at
+            is_active=location_model.is_active
         )
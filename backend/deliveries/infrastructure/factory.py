@@ -42,6 +42,17 @@ from deliveries.application.services.delivery_services.base_delivery_services im
 from deliveries.application.services.delivery_services.location_service import LocationApplicationService
 from deliveries.application.services.delivery_services.search_services import DeliverySearchApplicationService
 
+# Configuration
+from deliveries.infrastructure.config.geospatial_settings import (
+    MIN_LOCATION_UPDATE_INTERVAL_SECONDS,
+    DELIVERY_DRIVER_CACHE_SECONDS,
+    ETA_RECOMPUTE_DEBOUNCE_SECONDS,
+    ETA_RECOMPUTE_MIN_DISTANCE_METERS,
+    ETA_RECOMPUTE_MAX_AGE_SECONDS,
+    ROUTE_DEVIATION_METERS,
+    ROUTE_CACHE_EXPIRY_SECONDS
+)
+
 # Order repository interface (for dependencies)
 from orders.domain.repositories.repository_interfaces import OrderRepository
 
@@ -113,7 +124,7 @@ class ServiceFactory:
             An implementation of MapsServiceInterface
         """
         if cls._maps_service is None:
-            cls._maps_service = GoogleMapsService()
+            cls._maps_service = GoogleMapsService(estimate_cache=cls.create_location_cache_service())
         return cls._maps_service
     
     @classmethod
@@ -209,13 +220,15 @@ class ApplicationServiceFactory:
         notification_repository = RepositoryFactory.create_driver_notification_repository()
         # Note: Order repository would need proper initialization in a real implementation
         order_repository = None
+        maps_service = ServiceFactory.create_maps_service()
         
         return DeliveryNotificationService(
             delivery_repository=delivery_repository,
             notification_service=notification_service,
             driver_location_repository=driver_location_repository,
             notification_repository=notification_repository,
-            order_repository=order_repository
+            order_repository=order_repository,
+            maps_service=maps_service
         )
     
     @classmethod
@@ -245,12 +258,26 @@ class ApplicationServiceFactory:
     @classmethod
     def create_location_application_service(cls) -> LocationApplicationService:
         """Create a location application service instance"""
+        delivery_repository = RepositoryFactory.create_delivery_repository()
         delivery_location_repository = RepositoryFactory.create_delivery_location_repository()
         maps_service = ServiceFactory.create_maps_service()
+        location_cache_service = ServiceFactory.create_location_cache_service()
+        # Imported here, the tasks module builds its services through this factory
+        from deliveries.tasks import schedule_eta_recompute
         
         return LocationApplicationService(
+            delivery_repository=delivery_repository,
             delivery_location_repository=delivery_location_repository,
-            maps_service=maps_service
+            maps_service=maps_service,
+            location_cache_service=location_cache_service,
+            min_update_interval_seconds=MIN_LOCATION_UPDATE_INTERVAL_SECONDS,
+            eta_recompute_scheduler=schedule_eta_recompute,
+            eta_debounce_seconds=ETA_RECOMPUTE_DEBOUNCE_SECONDS,
+            eta_min_distance_meters=ETA_RECOMPUTE_MIN_DISTANCE_METERS,
+            eta_max_age_seconds=ETA_RECOMPUTE_MAX_AGE_SECONDS,
+            route_deviation_meters=ROUTE_DEVIATION_METERS,
+            route_cache_expiry_seconds=ROUTE_CACHE_EXPIRY_SECONDS,
+            delivery_driver_cache_seconds=DELIVERY_DRIVER_CACHE_SECONDS
         )
     
     @classmethod
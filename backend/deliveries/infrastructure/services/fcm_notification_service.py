@@ -8,9 +8,6 @@ import logging
 from typing import Dict, List, Optional, Any
 from uuid import UUID
 
-from django.conf import settings
-from firebase_admin import messaging, credentials, initialize_app
-
 from deliveries.domain.models.value_objects import GeoPoint
 from deliveries.domain.services.notification_service_interface import NotificationServiceInterface
 from deliveries.domain.repositories.driver_repo.driver_device_repository_interfaces import DriverDeviceRepository
@@ -18,107 +15,100 @@ from deliveries.domain.repositories.driver_repo.driver_location_repository_inter
 
 from deliveries.infrastructure.django_repositories.driver_repo.driver_device_repository import DjangoDriverDeviceRepository
 from deliveries.infrastructure.django_repositories.driver_repo.driver_location_repository import DjangoDriverLocationRepository
+from deliveries.infrastructure.services.push_transports import FCMPushTransport, PushTransport
 
 logger = logging.getLogger(__name__)
 
 class FCMNotificationService(NotificationServiceInterface):
-    """Firebase Cloud Messaging implementation of NotificationServiceInterface"""
+    """Firebase Cloud Messaging implementation of NotificationServiceInterface
+    
+    Fan-out to several drivers resolves every device token with one query,
+    sends them in multicast batches of up to 500 tokens and deactivates the
+    tokens FCM reports as invalid with one UPDATE.
+    """
     
     def __init__(self, 
                  driver_device_repository: Optional[DriverDeviceRepository] = None,
-                 driver_location_repository: Optional[DriverLocationRepository] = None):
-        """Initialize the FCM client"""
+                 driver_location_repository: Optional[DriverLocationRepository] = None,
+                 transport: Optional[PushTransport] = None):
+        """Initialize the FCM client
+        
+        Args:
+            driver_device_repository: Repository for device tokens
+            driver_location_repository: Repository for driver locations
+            transport: Push transport, defaults to Firebase (FCMPushTransport)
+        """
         try:
             # Store repositories for device tokens and driver locations
             self.driver_device_repository = driver_device_repository or DjangoDriverDeviceRepository()
             self.driver_location_repository = driver_location_repository or DjangoDriverLocationRepository()
             
-            # Initialize Firebase Admin SDK if not already initialized
-            if not hasattr(FCMNotificationService, '_initialized'):
-                cred = credentials.Certificate(settings.FCM_CREDENTIALS_FILE)
-                initialize_app(cred)
-                FCMNotificationService._initialized = True
+            # Initializes the Firebase Admin SDK once per process
+            self.transport = transport or FCMPushTransport()
                 
             logger.info("FCM notification service initialized")
         except Exception as e:
             logger.error(f"Failed to initialize FCM client: {str(e)}")
             raise
     
-    def _get_device_tokens(self, driver_id: UUID) -> List[str]:
-        """
-        Get FCM device tokens for a driver
-        
-        This method uses the driver device repository to get all active device tokens
-        for a specific driver.
+    def send_to_driver(self, driver_id: UUID, title: str, body: str, data: Optional[Dict[str, Any]] = None) -> bool:
+        """Send a notification to a specific driver"""
+        return self.send_to_drivers([driver_id], title, body, data).get(driver_id, False)
+    
+    def send_to_drivers(self, driver_ids: List[UUID], title: str, body: str, data: Optional[Dict[str, Any]] = None) -> Dict[UUID, bool]:
+        """Send a notification to multiple drivers
         
-        Args:
-            driver_id: UUID of the driver
-            
-        Returns:
-            List of FCM device tokens
+        A driver counts as notified if at least one of their devices received it.
         """
+        results = {driver_id: False for driver_id in driver_ids}
+        if not driver_ids:
+            return results
+        
         try:
-            # Get active devices from the repository
-            devices = self.driver_device_repository.get_active_devices(driver_id)
-            return [device.device_token for device in devices]
+            # Resolve every driver's tokens with a single query
+            tokens_by_driver = self.driver_device_repository.get_active_tokens_for_drivers(driver_ids)
         except Exception as e:
             logger.error(f"Error getting device tokens: {str(e)}")
-            return []
-    
-    def send_to_driver(self, driver_id: UUID, title: str, body: str, data: Optional[Dict[str, Any]] = None) -> bool:
-        """Send a notification to a specific driver"""
-        try:
-            # Get device tokens for this driver
-            tokens = self._get_device_tokens(driver_id)
-            if not tokens:
-                logger.warning(f"No device tokens found for driver {driver_id}")
-                return False
-            
-            # Create the message
-            message = messaging.MulticastMessage(
-                tokens=tokens,
-                notification=messaging.Notification(
-                    title=title,
-                    body=body
-                ),
-                data=data or {},
-                android=messaging.AndroidConfig(
-                    priority="high",
-                    notification=messaging.AndroidNotification(
-                        sound="default",
-                        priority="high",
-                        channel_id="delivery_notifications"
-                    )
-                ),
-                apns=messaging.APNSConfig(
-                    payload=messaging.APNSPayload(
-                        aps=messaging.Aps(
-                            sound="default",
-                            badge=1
-                        )
-                    )
-                )
-            )
-            
-            # Send the message
-            response = messaging.send_multicast(message)
-            success = response.success_count > 0
-            
-            if not success:
-                logger.warning(f"Failed to send notification to driver {driver_id}")
-            
-            return success
+            return results
+        
+        token_owner: Dict[str, UUID] = {}
+        for driver_id, tokens in tokens_by_driver.items():
+            for token in tokens:
+                token_owner[token] = driver_id
+        
+        missing = len(driver_ids) - len(tokens_by_driver)
+        if missing:
+            logger.warning(f"No device tokens found for {missing} of {len(driver_ids)} drivers")
+        
+        tokens = list(token_owner)
+        batch_size = self.transport.max_tokens_per_batch
+        invalid_tokens: List[str] = []
+        
+        for start in range(0, len(tokens), batch_size):
+            batch = tokens[start:start + batch_size]
+            try:
+                batch_results = self.transport.send_multicast(batch, title, body, data)
+            except Exception as e:
+                logger.error(f"Error sending notification batch of {len(batch)} tokens: {str(e)}")
+                continue
             
-        except Exception as e:
-            logger.error(f"Error sending notification to driver {driver_id}: {str(e)}")
-            return False
-    
-    def send_to_drivers(self, driver_ids: List[UUID], title: str, body: str, data: Optional[Dict[str, Any]] = None) -> Dict[UUID, bool]:
-        """Send a notification to multiple drivers"""
-        results = {}
+            for result in batch_results:
+                if result.success:
+                    results[token_owner[result.token]] = True
+                elif result.token_invalid:
+                    invalid_tokens.append(result.token)
+        
+        # Prune tokens the provider no longer accepts, in one statement
+        if invalid_tokens:
+            try:
+                pruned = self.driver_device_repository.deactivate_tokens(invalid_tokens)
+                logger.info(f"Deactivated {pruned} invalid device tokens")
+            except Exception as e:
+                logger.error(f"Error deactivating invalid device tokens: {str(e)}")
         
-        for driver_id in driver_ids:
-            results[driver_id] = self.send_to_driver(driver_id, title, body, data)
+        failed = [driver_id for driver_id, success in results.items() if not success]
+        if failed:
+            logger.warning(f"Failed to send notification to {len(failed)} drivers")
             
         return results
     
@@ -6,14 +6,26 @@ using the Google Maps API. It handles geocoding, routing, travel time estimation
 and place search functionality.
 """
 import logging
+import threading
 import googlemaps
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 
 from django.conf import settings
 
-from deliveries.domain.models.value_objects import GeoPoint, RouteInfo
+from core.infrastructure.services.geocode_cache import cached_geocode
+
+from deliveries.domain.models.value_objects import GeoPoint, RouteInfo, TravelEstimate
+from deliveries.domain.services.cache_location_service_interface import LocationCacheService
 from deliveries.domain.services.maps_service_interface import MapsServiceInterface
+from deliveries.infrastructure.config.geospatial_settings import (
+    DISTANCE_MATRIX_MAX_ELEMENTS,
+    DISTANCE_MATRIX_MAX_ORIGINS,
+    DISTANCE_MATRIX_MAX_DESTINATIONS,
+    DISTANCE_MATRIX_WORKERS,
+    DISTANCE_MATRIX_CACHE_EXPIRY_SECONDS
+)
 
 logger = logging.getLogger(__name__)
 
@@ -27,43 +39,80 @@ class GoogleMapsService(MapsServiceInterface):
     to maintain a clean separation between the domain and external services.
     """
     
-    def __init__(self):
+    # Thread pool shared by every instance in the process, for distance matrix chunks
+    _matrix_executor = None
+    _matrix_executor_lock = threading.Lock()
+    
+    def __init__(self, client=None, estimate_cache: Optional[LocationCacheService] = None,
+                 max_elements: int = DISTANCE_MATRIX_MAX_ELEMENTS,
+                 max_origins: int = DISTANCE_MATRIX_MAX_ORIGINS,
+                 max_destinations: int = DISTANCE_MATRIX_MAX_DESTINATIONS,
+                 estimate_expiry_seconds: int = DISTANCE_MATRIX_CACHE_EXPIRY_SECONDS):
         """
         Initialize the Google Maps client using API key from settings
         
         The API key is retrieved from Django settings, which should be
         configured in the settings file as GOOGLE_MAPS_API_KEY.
+        
+        Args:
+            client: Client to use instead of googlemaps.Client, e.g. an offline fake
+            estimate_cache: Cache of distance matrix elements, none when omitted
+            max_elements: Origins x destinations allowed per distance matrix request
+            max_origins: Origins allowed per distance matrix request
+            max_destinations: Destinations allowed per distance matrix request
+            estimate_expiry_seconds: Lifetime of a cached distance matrix element
+        """
+        self.client = client or googlemaps.Client(key=settings.GOOGLE_MAPS_API_KEY)
+        self.estimate_cache = estimate_cache
+        self.max_elements = max_elements
+        self.max_origins = max_origins
+        self.max_destinations = max_destinations
+        self.estimate_expiry_seconds = estimate_expiry_seconds
+    
+    @classmethod
+    def get_matrix_executor(cls) -> ThreadPoolExecutor:
+        """
+        Get the process-wide thread pool running distance matrix chunks
+        
+        Its size bounds the concurrent requests to the provider across all
+        callers in the process.
         """
-        self.client = googlemaps.Client(key=settings.GOOGLE_MAPS_API_KEY)
+        with cls._matrix_executor_lock:
+            if cls._matrix_executor is None:
+                cls._matrix_executor = ThreadPoolExecutor(
+                    max_workers=DISTANCE_MATRIX_WORKERS,
+                    thread_name_prefix='distance-matrix'
+                )
+            return cls._matrix_executor
     
     def geocode_address(self, address: str) -> Optional[GeoPoint]:
         """
         Convert a text address to geographic coordinates using Google Geocoding API
         
+        Results, including addresses that can't be resolved, go through the
+        shared geocode cache.
+        
         Args:
             address: The address to geocode
             
         Returns:
             GeoPoint with latitude and longitude if successful, None otherwise
         """
-        try:
-            # Call Google Maps Geocoding API
-            geocode_result = self.client.geocode(address)
-            
-            # Check if we got a valid result
-            if geocode_result and len(geocode_result) > 0:
-                location = geocode_result[0]['geometry']['location']
-                return GeoPoint(
-                    latitude=location['lat'],
-                    longitude=location['lng']
-                )
-            
+        result = cached_geocode(address, self._geocode)
+        if result is None:
             logger.warning(f"No geocoding results found for address: {address}")
             return None
-            
-        except Exception as e:
-            logger.error(f"Error geocoding address '{address}': {str(e)}")
-            return None
+        
+        location = result['geometry']['location']
+        return GeoPoint(
+            latitude=location['lat'],
+            longitude=location['lng']
+        )
+    
+    def _geocode(self, address: str) -> Optional[Dict[str, Any]]:
+        """First Google Geocoding API result for an address, None if there is none"""
+        geocode_result = self.client.geocode(address)
+        return geocode_result[0] if geocode_result else None
     
     def calculate_route(self, origin: GeoPoint, 
                        destination: GeoPoint) -> Optional[RouteInfo]:
@@ -183,6 +232,139 @@ class GoogleMapsService(MapsServiceInterface):
             logger.error(f"Error estimating travel time: {str(e)}")
             return 0
     
+    def distance_matrix(self, origins: List[GeoPoint],
+                        destinations: List[GeoPoint]) -> List[List[Optional[TravelEstimate]]]:
+        """
+        Estimate travel between many points using Google Distance Matrix API
+        
+        Elements found in the estimate cache are not requested again. The
+        missing ones are split into chunks within the provider's per-request
+        limits, grouping origins that miss the same destinations, and the
+        chunks are requested concurrently. New elements are cached.
+        
+        Args:
+            origins: Starting points
+            destinations: Ending points
+            
+        Returns:
+            One row per origin, with one estimate per destination, None where
+            no route was found or the request failed
+        """
+        rows: List[List[Optional[TravelEstimate]]] = [[None] * len(destinations) for _ in origins]
+        pairs = [(i, j) for i in range(len(origins)) for j in range(len(destinations))]
+        if not pairs:
+            return rows
+        
+        missing = pairs
+        if self.estimate_cache:
+            cached = self.estimate_cache.get_travel_estimates(
+                [(origins[i], destinations[j]) for i, j in pairs]
+            )
+            missing = []
+            for (i, j), estimate in zip(pairs, cached):
+                if estimate is None:
+                    missing.append((i, j))
+                else:
+                    rows[i][j] = estimate
+            if not missing:
+                return rows
+        
+        # Origins needing the same destinations share chunks
+        needed: Dict[int, List[int]] = {}
+        for i, j in missing:
+            needed.setdefault(i, []).append(j)
+        groups: Dict[Tuple[int, ...], List[int]] = {}
+        for i, destination_indices in needed.items():
+            groups.setdefault(tuple(destination_indices), []).append(i)
+        chunks = [
+            chunk
+            for destination_indices, origin_indices in groups.items()
+            for chunk in self._matrix_chunks(origin_indices, list(destination_indices))
+        ]
+        
+        fetched: Dict[Tuple[GeoPoint, GeoPoint], TravelEstimate] = {}
+        
+        def store(origin_indices, destination_indices, chunk_rows):
+            for i, chunk_row in zip(origin_indices, chunk_rows):
+                for j, estimate in zip(destination_indices, chunk_row):
+                    rows[i][j] = estimate
+                    if estimate is not None:
+                        fetched[(origins[i], destinations[j])] = estimate
+        
+        if len(chunks) == 1:
+            origin_indices, destination_indices = chunks[0]
+            store(origin_indices, destination_indices, self._request_matrix(
+                [origins[i] for i in origin_indices], [destinations[j] for j in destination_indices]
+            ))
+        else:
+            executor = self.get_matrix_executor()
+            futures = {
+                executor.submit(
+                    self._request_matrix,
+                    [origins[i] for i in origin_indices],
+                    [destinations[j] for j in destination_indices]
+                ): (origin_indices, destination_indices)
+                for origin_indices, destination_indices in chunks
+            }
+            for future in as_completed(futures):
+                store(*futures[future], future.result())
+        
+        if self.estimate_cache and fetched:
+            self.estimate_cache.cache_travel_estimates(fetched, self.estimate_expiry_seconds)
+        return rows
+    
+    def travel_estimates_to(self, origins: List[GeoPoint],
+                            destination: GeoPoint) -> List[Optional[TravelEstimate]]:
+        """
+        Estimate travel from many points to one, e.g. candidate drivers to a store
+        
+        Args:
+            origins: Starting points
+            destination: Ending point
+            
+        Returns:
+            One estimate per origin, None where no route was found
+        """
+        return [row[0] for row in self.distance_matrix(origins, [destination])]
+    
+    def _matrix_chunks(self, origin_indices: List[int],
+                       destination_indices: List[int]) -> Iterator[Tuple[List[int], List[int]]]:
+        """Split origins x destinations into requests within the provider limits"""
+        destinations_per_chunk = max(1, min(self.max_destinations, self.max_elements))
+        for start in range(0, len(destination_indices), destinations_per_chunk):
+            chunk_destinations = destination_indices[start:start + destinations_per_chunk]
+            origins_per_chunk = max(1, min(self.max_origins, self.max_elements // len(chunk_destinations)))
+            for origin_start in range(0, len(origin_indices), origins_per_chunk):
+                yield origin_indices[origin_start:origin_start + origins_per_chunk], chunk_destinations
+    
+    def _request_matrix(self, origins: List[GeoPoint],
+                        destinations: List[GeoPoint]) -> List[List[Optional[TravelEstimate]]]:
+        """One Distance Matrix API request, all None when it fails"""
+        rows: List[List[Optional[TravelEstimate]]] = [[None] * len(destinations) for _ in origins]
+        try:
+            matrix = self.client.distance_matrix(
+                origins=[(origin.latitude, origin.longitude) for origin in origins],
+                destinations=[(destination.latitude, destination.longitude) for destination in destinations],
+                mode="driving",
+                departure_time=datetime.now(),
+                traffic_model="best_guess"
+            )
+        except Exception as e:
+            logger.error(f"Error requesting distance matrix: {str(e)}")
+            return rows
+        
+        for i, row in enumerate(matrix.get('rows', [])[:len(origins)]):
+            for j, element in enumerate(row.get('elements', [])[:len(destinations)]):
+                if element.get('status') != 'OK':
+                    continue
+                # Duration in traffic if available, otherwise regular duration
+                duration = element.get('duration_in_traffic') or element['duration']
+                rows[i][j] = TravelEstimate(
+                    distance_meters=element['distance']['value'],
+                    duration_seconds=duration['value']
+                )
+        return rows
+    
     def find_nearby_places(self, location: GeoPoint, 
                          radius_km: float, 
                          place_type: str) -> List[Dict[str, Any]]:
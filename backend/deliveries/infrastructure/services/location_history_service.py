@@ -0,0 +1,341 @@
+"""
+Maintenance of the driver location history table.
+
+The history is an append-only table range-partitioned by day on `recorded_at`.
+This module creates the table and its partitions, drops partitions past the
+retention period and compacts old points: each driver's trail is split into
+trips on time gaps and every trip is simplified with Douglas-Peucker.
+"""
+import logging
+import math
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Iterable, List, Sequence, Tuple
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from deliveries.infrastructure.django_models.driver_orm_models.driver_model import (
+    DriverLocationHistoryModel, DriverLocationModel
+)
+
+logger = logging.getLogger(__name__)
+
+HISTORY_TABLE = DriverLocationHistoryModel._meta.db_table
+PARTITION_NAME = HISTORY_TABLE + "_p{:%Y%m%d}"
+
+# Meters per degree of latitude, used for the local flat projection
+METERS_PER_DEGREE = 111320.0
+
+
+@dataclass
+class CompactionStats:
+    """Result of one compaction run"""
+    drivers: int = 0
+    trips: int = 0
+    points_scanned: int = 0
+    points_kept: int = 0
+    points_deleted: int = 0
+
+
+def simplify_track(points: Sequence[Tuple[float, float]], epsilon_meters: float) -> List[int]:
+    """
+    Simplify a track with the Douglas-Peucker algorithm
+
+    Points are projected on a local equirectangular plane, which is accurate
+    enough for the few kilometers a delivery trip covers.
+
+    Args:
+        points: (latitude, longitude) pairs in track order
+        epsilon_meters: Maximum distance between a dropped point and the simplified track
+
+    Returns:
+        Sorted indices of the points to keep, always including both ends
+    """
+    count = len(points)
+    if count <= 2:
+        return list(range(count))
+
+    lat_scale = METERS_PER_DEGREE
+    lng_scale = METERS_PER_DEGREE * math.cos(math.radians(points[0][0]))
+    xs = [lng * lng_scale for _, lng in points]
+    ys = [lat * lat_scale for lat, _ in points]
+
+    keep = [False] * count
+    keep[0] = keep[-1] = True
+    # Iterative to stay clear of the recursion limit on long trips
+    stack = [(0, count - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+
+        dx = xs[end] - xs[start]
+        dy = ys[end] - ys[start]
+        segment_length = math.hypot(dx, dy)
+
+        max_distance = -1.0
+        max_index = start
+        for i in range(start + 1, end):
+            if segment_length == 0:
+                distance = math.hypot(xs[i] - xs[start], ys[i] - ys[start])
+            else:
+                distance = abs(dy * (xs[i] - xs[start]) - dx * (ys[i] - ys[start])) / segment_length
+            if distance > max_distance:
+                max_distance = distance
+                max_index = i
+
+        if max_distance > epsilon_meters:
+            keep[max_index] = True
+            stack.append((start, max_index))
+            stack.append((max_index, end))
+
+    return [i for i, kept in enumerate(keep) if kept]
+
+
+def split_trips(timestamps: Sequence[datetime], gap_seconds: float) -> List[Tuple[int, int]]:
+    """
+    Split a driver's time-ordered points into trips
+
+    Args:
+        timestamps: Recording times in ascending order
+        gap_seconds: A pause longer than this starts a new trip
+
+    Returns:
+        List of (start, end) index ranges, end exclusive
+    """
+    trips = []
+    start = 0
+    for i in range(1, len(timestamps)):
+        if (timestamps[i] - timestamps[i - 1]).total_seconds() > gap_seconds:
+            trips.append((start, i))
+            start = i
+    if timestamps:
+        trips.append((start, len(timestamps)))
+    return trips
+
+
+def dedupe_current_locations() -> int:
+    """
+    Keep only the latest current-location row of each driver
+
+    driver_locations used to hold several rows per driver. They must be
+    reduced to one before the unique constraint on driver_id is added.
+
+    Returns:
+        Number of rows deleted
+    """
+    table = DriverLocationModel._meta.db_table
+    if table not in connection.introspection.table_names():
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute(f"""
+            DELETE FROM {table} stale
+            USING {table} newer
+            WHERE stale.driver_id = newer.driver_id
+              AND (newer.timestamp, newer.id) > (stale.timestamp, stale.id)
+        """)
+        deleted = cursor.rowcount
+    if deleted:
+        logger.info(f"Deleted {deleted} duplicate current-location rows")
+    return deleted
+
+
+class DriverLocationHistoryMaintenance:
+    """Creates, prunes and compacts the partitioned driver location history"""
+
+    def ensure_table(self) -> None:
+        """Create the partitioned parent table if missing
+
+        There is no default partition: a row for a day without a partition
+        would block creating that day's partition later. A default partition
+        left by an earlier version is retired, its rows moved to daily ones.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(f"""
+                CREATE TABLE IF NOT EXISTS {HISTORY_TABLE} (
+                    id bigserial,
+                    driver_id bigint NOT NULL,
+                    latitude double precision NOT NULL,
+                    longitude double precision NOT NULL,
+                    recorded_at timestamp with time zone NOT NULL,
+                    is_compacted boolean NOT NULL DEFAULT false,
+                    PRIMARY KEY (id, recorded_at)
+                ) PARTITION BY RANGE (recorded_at)
+            """)
+            cursor.execute(f"""
+                CREATE INDEX IF NOT EXISTS {HISTORY_TABLE}_driver_time
+                ON {HISTORY_TABLE} (driver_id, recorded_at)
+            """)
+        self._retire_default_partition()
+
+    def ensure_partitions(self, days_ahead: int = 3, days_back: int = 1) -> List[str]:
+        """
+        Create the daily partitions around today
+
+        Args:
+            days_ahead: Number of future days to pre-create
+            days_back: Number of past days to create if missing
+
+        Returns:
+            Names of the partitions that exist for the range
+        """
+        today = timezone.now().date()
+        with connection.cursor() as cursor:
+            return [
+                self._create_partition(cursor, today + timedelta(days=offset))
+                for offset in range(-days_back, days_ahead + 1)
+            ]
+
+    @staticmethod
+    def _create_partition(cursor, day: date) -> str:
+        """Create the partition of a day if missing and return its name"""
+        name = PARTITION_NAME.format(day)
+        cursor.execute(f"""
+            CREATE TABLE IF NOT EXISTS {name}
+            PARTITION OF {HISTORY_TABLE}
+            FOR VALUES FROM (%s) TO (%s)
+        """, [day.isoformat(), (day + timedelta(days=1)).isoformat()])
+        return name
+
+    def _retire_default_partition(self) -> None:
+        """Detach the default partition, move its rows to daily partitions and drop it"""
+        default = HISTORY_TABLE + "_default"
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute("SELECT to_regclass(%s)", [default])
+            if cursor.fetchone()[0] is None:
+                return
+            cursor.execute(f"ALTER TABLE {HISTORY_TABLE} DETACH PARTITION {default}")
+            cursor.execute(f"SELECT DISTINCT recorded_at::date FROM {default}")
+            for (day,) in cursor.fetchall():
+                self._create_partition(cursor, day)
+            cursor.execute(f"""
+                INSERT INTO {HISTORY_TABLE} (id, driver_id, latitude, longitude, recorded_at, is_compacted)
+                SELECT id, driver_id, latitude, longitude, recorded_at, is_compacted FROM {default}
+            """)
+            moved = cursor.rowcount
+            cursor.execute(f"DROP TABLE {default}")
+        logger.info(f"Retired the default driver location partition, moved {moved} rows")
+
+    def list_partitions(self) -> List[Tuple[str, date]]:
+        """List the daily partitions with the day they cover, oldest first"""
+        with connection.cursor() as cursor:
+            cursor.execute("""
+                SELECT child.relname
+                FROM pg_inherits
+                JOIN pg_class parent ON pg_inherits.inhparent = parent.oid
+                JOIN pg_class child ON pg_inherits.inhrelid = child.oid
+                WHERE parent.relname = %s
+            """, [HISTORY_TABLE])
+            rows = cursor.fetchall()
+
+        partitions = []
+        prefix = HISTORY_TABLE + "_p"
+        for (name,) in rows:
+            if name.startswith(prefix):
+                partitions.append((name, datetime.strptime(name[len(prefix):], "%Y%m%d").date()))
+        return sorted(partitions, key=lambda partition: partition[1])
+
+    def drop_expired_partitions(self, retention_days: int) -> List[str]:
+        """
+        Drop the daily partitions older than the retention period
+
+        Dropping a partition is a metadata operation, unlike a DELETE.
+
+        Args:
+            retention_days: Number of days of history to keep
+
+        Returns:
+            Names of the dropped partitions
+        """
+        cutoff = timezone.now().date() - timedelta(days=retention_days)
+        dropped = []
+        with connection.cursor() as cursor:
+            for name, day in self.list_partitions():
+                if day < cutoff:
+                    cursor.execute(f"DROP TABLE IF EXISTS {name}")
+                    dropped.append(name)
+        if dropped:
+            logger.info(f"Dropped {len(dropped)} expired driver location partitions")
+        return dropped
+
+    def compact(self, older_than: timedelta, epsilon_meters: float,
+                trip_gap_seconds: float, batch_size: int = 5000) -> CompactionStats:
+        """
+        Downsample the history points older than a cutoff
+
+        Points not yet compacted are read per driver in time order, split into
+        trips and simplified. Dropped points are deleted and kept points are
+        flagged so later runs skip them.
+
+        Args:
+            older_than: Only points recorded before now - older_than are compacted
+            epsilon_meters: Douglas-Peucker tolerance
+            trip_gap_seconds: A pause longer than this starts a new trip
+            batch_size: Number of ids per DELETE/UPDATE statement
+
+        Returns:
+            CompactionStats for the run
+        """
+        cutoff = timezone.now() - older_than
+        stats = CompactionStats()
+
+        pending = DriverLocationHistoryModel.objects.filter(
+            is_compacted=False,
+            recorded_at__lt=cutoff
+        ).order_by('driver_id', 'recorded_at').values_list(
+            'driver_id', 'id', 'latitude', 'longitude', 'recorded_at'
+        )
+
+        keep_ids: List[int] = []
+        delete_ids: List[int] = []
+
+        for rows in self._group_by_driver(pending.iterator(chunk_size=batch_size)):
+            stats.drivers += 1
+            stats.points_scanned += len(rows)
+
+            for start, end in split_trips([row[4] for row in rows], trip_gap_seconds):
+                stats.trips += 1
+                trip = rows[start:end]
+                kept = set(simplify_track([(row[2], row[3]) for row in trip], epsilon_meters))
+                for index, row in enumerate(trip):
+                    (keep_ids if index in kept else delete_ids).append(row[1])
+
+            if len(keep_ids) + len(delete_ids) >= batch_size:
+                self._flush(keep_ids, delete_ids, cutoff, stats)
+
+        self._flush(keep_ids, delete_ids, cutoff, stats)
+
+        logger.info(
+            f"Compacted driver location history: {stats.points_scanned} points in "
+            f"{stats.trips} trips, kept {stats.points_kept}, deleted {stats.points_deleted}"
+        )
+        return stats
+
+    @staticmethod
+    def _group_by_driver(rows: Iterable[tuple]) -> Iterable[List[tuple]]:
+        """Group rows ordered by driver into one list per driver"""
+        current_driver = None
+        group: List[tuple] = []
+        for row in rows:
+            if row[0] != current_driver and group:
+                yield group
+                group = []
+            current_driver = row[0]
+            group.append(row)
+        if group:
+            yield group
+
+    @staticmethod
+    def _flush(keep_ids: List[int], delete_ids: List[int], cutoff: datetime,
+               stats: CompactionStats) -> None:
+        """Apply pending compaction decisions and clear the lists"""
+        # The recorded_at bound lets Postgres prune partitions newer than the cutoff
+        history = DriverLocationHistoryModel.objects.filter(recorded_at__lt=cutoff)
+        with transaction.atomic():
+            if delete_ids:
+                stats.points_deleted += history.filter(id__in=delete_ids).delete()[0]
+            if keep_ids:
+                stats.points_kept += history.filter(id__in=keep_ids).update(is_compacted=True)
+        keep_ids.clear()
+        delete_ids.clear()
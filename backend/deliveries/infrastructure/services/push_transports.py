@@ -0,0 +1,150 @@
+"""
+Push transports used by the FCM notification service.
+
+A transport only knows how to deliver one multicast batch to a list of device
+tokens. Keeping it separate from FCMNotificationService lets the fan-out logic
+(token lookup, batching, pruning) run against a local fake, e.g. in benchmarks.
+"""
+import logging
+import random
+import time
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# FCM accepts at most 500 tokens per multicast message
+FCM_MAX_MULTICAST_TOKENS = 500
+
+
+@dataclass
+class PushSendResult:
+    """Outcome of sending a notification to one device token"""
+    token: str
+    success: bool
+    # True when the provider reports the token as no longer valid
+    token_invalid: bool = False
+
+
+class PushTransport(ABC):
+    """Interface for delivering one multicast batch"""
+
+    max_tokens_per_batch: int = FCM_MAX_MULTICAST_TOKENS
+
+    @abstractmethod
+    def send_multicast(self, tokens: List[str], title: str, body: str,
+                       data: Optional[Dict[str, Any]] = None) -> List[PushSendResult]:
+        """
+        Send the same notification to every token
+
+        Args:
+            tokens: Device tokens, at most max_tokens_per_batch
+            title: Notification title
+            body: Notification body text
+            data: Optional additional data to include with the notification
+
+        Returns:
+            One PushSendResult per token, in the same order
+        """
+        pass
+
+
+class FCMPushTransport(PushTransport):
+    """Transport sending batches through the Firebase Admin SDK"""
+
+    _initialized = False
+    _init_lock = threading.Lock()
+
+    def __init__(self):
+        # Initialize Firebase Admin SDK if not already initialized
+        from firebase_admin import credentials, initialize_app
+
+        with FCMPushTransport._init_lock:
+            if not FCMPushTransport._initialized:
+                cred = credentials.Certificate(settings.FCM_CREDENTIALS_FILE)
+                initialize_app(cred)
+                FCMPushTransport._initialized = True
+
+    def send_multicast(self, tokens: List[str], title: str, body: str,
+                       data: Optional[Dict[str, Any]] = None) -> List[PushSendResult]:
+        from firebase_admin import messaging
+
+        message = messaging.MulticastMessage(
+            tokens=tokens,
+            notification=messaging.Notification(
+                title=title,
+                body=body
+            ),
+            # FCM only accepts string values in the data payload
+            data={key: str(value) for key, value in (data or {}).items()},
+            android=messaging.AndroidConfig(
+                priority="high",
+                notification=messaging.AndroidNotification(
+                    sound="default",
+                    priority="high",
+                    channel_id="delivery_notifications"
+                )
+            ),
+            apns=messaging.APNSConfig(
+                payload=messaging.APNSPayload(
+                    aps=messaging.Aps(
+                        sound="default",
+                        badge=1
+                    )
+                )
+            )
+        )
+
+        response = messaging.send_each_for_multicast(message)
+
+        results = []
+        for token, send_response in zip(tokens, response.responses):
+            exception = send_response.exception
+            results.append(PushSendResult(
+                token=token,
+                success=send_response.success,
+                token_invalid=isinstance(exception, (
+                    messaging.UnregisteredError,
+                    messaging.SenderIdMismatchError
+                ))
+            ))
+        return results
+
+
+class FakePushTransport(PushTransport):
+    """
+    Local transport that never leaves the process
+
+    Simulates the latency of one provider call per batch and reports
+    configured tokens as invalid. Every batch is recorded in `batches`.
+    """
+
+    def __init__(self, latency_seconds: float = 0.05, jitter_seconds: float = 0.0,
+                 invalid_tokens: Optional[Set[str]] = None):
+        self.latency_seconds = latency_seconds
+        self.jitter_seconds = jitter_seconds
+        self.invalid_tokens = set(invalid_tokens or ())
+        self.batches: List[List[str]] = []
+
+    def send_multicast(self, tokens: List[str], title: str, body: str,
+                       data: Optional[Dict[str, Any]] = None) -> List[PushSendResult]:
+        if len(tokens) > self.max_tokens_per_batch:
+            raise ValueError(f"Batch of {len(tokens)} tokens exceeds {self.max_tokens_per_batch}")
+
+        self.batches.append(list(tokens))
+        delay = self.latency_seconds + random.uniform(0, self.jitter_seconds)
+        if delay > 0:
+            time.sleep(delay)
+
+        return [
+            PushSendResult(
+                token=token,
+                success=token not in self.invalid_tokens,
+                token_invalid=token in self.invalid_tokens
+            )
+            for token in tokens
+        ]
@@ -8,13 +8,14 @@ This implementation follows the LocationCacheService interface defined in the do
 """
 import json
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
+from uuid import UUID
 import redis
 
 from django.conf import settings
 
-from deliveries.domain.models.value_objects import GeoPoint, RouteInfo
+from deliveries.domain.models.value_objects import GeoPoint, RouteInfo, TravelEstimate
 from deliveries.domain.services.cache_location_service_interface import LocationCacheService
 
 logger = logging.getLogger(__name__)
@@ -39,38 +40,145 @@ class RedisLocationService(LocationCacheService):
     CURRENT_LOCATIONS_KEY = "delivery:locations:current"
     LOCATION_HISTORY_KEY = "delivery:locations:history:{}"
     ROUTE_CACHE_KEY = "delivery:route:{}:{}"
+    DELIVERY_ROUTE_KEY = "delivery:route:by_delivery:{}:{}"
+    ROUTE_METRICS_KEY = "delivery:route:metrics:{}"
+    TRAVEL_ESTIMATE_KEY = "delivery:matrix:{}:{}"
     DELIVERY_META_KEY = "delivery:meta:{}"
+    DELIVERY_DRIVER_KEY = "delivery:driver:{}"
     
     # Default expiration times
     ROUTE_CACHE_EXPIRY = 60 * 30  # 30 minutes
     LOCATION_HISTORY_MAX_SIZE = 100  # Max number of historical points to keep
+    TRAVEL_ESTIMATE_PRECISION = 4  # Decimals of the coordinates matrix elements are keyed on (~11m)
     
-    def __init__(self):
+    THROTTLE_KEY = "delivery:locations:throttle:{}"
+    ETA_PENDING_KEY = "delivery:eta:pending:{}"
+    ETA_METRICS_KEY = "delivery:eta:metrics:{}"
+    
+    ETA_METRICS_EXPIRY = 60 * 60 * 24  # Keep per-delivery ETA metrics for a day
+    
+    # Updates the ETA counters and the running staleness maximum in one call
+    RECORD_ETA_METRICS_SCRIPT = """
+    redis.call('HINCRBY', KEYS[1], 'recomputes', 1)
+    if ARGV[1] == '1' then
+        redis.call('HINCRBY', KEYS[1], 'external_calls', 1)
+    end
+    if ARGV[2] ~= '' then
+        redis.call('HSET', KEYS[1], 'last_staleness_seconds', ARGV[2])
+        local current = tonumber(redis.call('HGET', KEYS[1], 'max_staleness_seconds') or '0')
+        if tonumber(ARGV[2]) > current then
+            redis.call('HSET', KEYS[1], 'max_staleness_seconds', ARGV[2])
+        end
+    end
+    redis.call('EXPIRE', KEYS[1], ARGV[3])
+    return 1
+    """
+    
+    # Connection pool shared by every instance in the process
+    _connection_pool = None
+    
+    @classmethod
+    def get_connection_pool(cls) -> redis.ConnectionPool:
         """
-        Initialize the Redis connection
+        Get the process-wide Redis connection pool
         
-        Connects to Redis using configuration from Django settings.
-        Falls back to localhost if settings are not available.
+        Uses configuration from Django settings and falls back to localhost
+        if settings are not available.
         """
-        try:
-            redis_host = getattr(settings, 'REDIS_HOST', 'localhost')
-            redis_port = getattr(settings, 'REDIS_PORT', 6379)
-            redis_db = getattr(settings, 'REDIS_DB', 0)
-            
-            self.redis = redis.Redis(
-                host=redis_host,
-                port=redis_port,
-                db=redis_db,
+        if cls._connection_pool is None:
+            cls._connection_pool = redis.ConnectionPool(
+                host=getattr(settings, 'REDIS_HOST', 'localhost'),
+                port=getattr(settings, 'REDIS_PORT', 6379),
+                db=getattr(settings, 'REDIS_DB', 0),
+                password=getattr(settings, 'REDIS_PASSWORD', None),
+                max_connections=getattr(settings, 'REDIS_MAX_CONNECTIONS', 50),
                 decode_responses=True  # Automatically decode responses to strings
             )
+        return cls._connection_pool
+    
+    def __init__(self):
+        """
+        Initialize the Redis client on the shared connection pool
+        
+        Connections are opened lazily by the pool, so creating the service
+        doesn't cost a round trip.
+        """
+        self.redis = redis.Redis(connection_pool=self.get_connection_pool())
+        self._record_eta_metrics = self.redis.register_script(self.RECORD_ETA_METRICS_SCRIPT)
+    
+    def allow_location_update(self, delivery_id: str, min_interval_seconds: float) -> bool:
+        """
+        Atomically rate-limit location pings for a delivery
+        
+        Uses SET NX PX on a per-delivery key: the first ping in each interval
+        creates the key and is accepted, the following ones are rejected
+        without any other work.
+        
+        Args:
+            delivery_id: Unique identifier for the delivery
+            min_interval_seconds: Minimum time between accepted pings
             
-            # Test connection
-            self.redis.ping()
-            logger.info(f"Connected to Redis at {redis_host}:{redis_port}/{redis_db}")
+        Returns:
+            True if the ping should be processed, False if it is too soon.
+            Fails open (True) when Redis is unavailable.
+        """
+        if min_interval_seconds <= 0:
+            return True
+        try:
+            return bool(self.redis.set(
+                self.THROTTLE_KEY.format(delivery_id),
+                1,
+                nx=True,
+                px=int(min_interval_seconds * 1000)
+            ))
+        except redis.RedisError as e:
+            logger.error(f"Error checking location throttle for delivery {delivery_id}: {str(e)}")
+            return True
+    
+    def get_delivery_driver(self, delivery_id: str) -> Tuple[bool, Optional[UUID]]:
+        """
+        Get the cached driver of a delivery
+        
+        An empty value marks a delivery that exists but has no driver yet.
+        
+        Args:
+            delivery_id: Unique identifier for the delivery
+            
+        Returns:
+            Tuple of (cached, driver_id)
+        """
+        try:
+            driver_id = self.redis.get(self.DELIVERY_DRIVER_KEY.format(delivery_id))
+        except Exception as e:
+            logger.error(f"Error getting driver of delivery {delivery_id}: {str(e)}")
+            return False, None
+        if driver_id is None:
+            return False, None
+        return True, UUID(driver_id) if driver_id else None
+    
+    def cache_delivery_driver(self, delivery_id: str, driver_id: Optional[UUID],
+                            expiry_seconds: int = 60) -> bool:
+        """
+        Cache the driver of an existing delivery
+        
+        Args:
+            delivery_id: Unique identifier for the delivery
+            driver_id: Driver of the delivery, None if it has none yet
+            expiry_seconds: Time in seconds before the cache expires
             
-        except redis.ConnectionError as e:
-            logger.error(f"Failed to connect to Redis: {str(e)}")
-            self.redis = None
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            self.redis.set(
+                self.DELIVERY_DRIVER_KEY.format(delivery_id),
+                str(driver_id) if driver_id else "",
+                ex=expiry_seconds
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Error caching driver of delivery {delivery_id}: {str(e)}")
+            return False
     
     def update_delivery_location(self, delivery_id: str, location: GeoPoint, 
                                driver_id: Optional[str] = None,
@@ -92,45 +200,41 @@ class RedisLocationService(LocationCacheService):
         Returns:
             True if successful, False otherwise
         """
-        if not self.redis:
-            return False
-            
         try:
             # Current timestamp
             timestamp = datetime.now().isoformat()
             
-            # 1. Add to geospatial index
-            self.redis.geoadd(
-                self.CURRENT_LOCATIONS_KEY,
-                longitude=location.longitude,
-                latitude=location.latitude,
-                member=delivery_id
-            )
-            
-            # 2. Add to location history
             location_data = {
                 "lat": location.latitude,
                 "lng": location.longitude,
                 "timestamp": timestamp,
-                "driver_id": driver_id
+                "driver_id": str(driver_id) if driver_id else None
             }
             
             # Add any additional metadata
             if metadata:
                 location_data.update(metadata)
-                
-            # Add to the history list (newest first)
+            
             history_key = self.LOCATION_HISTORY_KEY.format(delivery_id)
-            self.redis.lpush(history_key, json.dumps(location_data))
             
-            # Trim history to maximum size
-            self.redis.ltrim(history_key, 0, self.LOCATION_HISTORY_MAX_SIZE - 1)
+            # All writes go out in a single MULTI/EXEC round trip
+            pipe = self.redis.pipeline(transaction=True)
+            
+            # 1. Add to geospatial index
+            pipe.geoadd(
+                self.CURRENT_LOCATIONS_KEY,
+                [location.longitude, location.latitude, str(delivery_id)]
+            )
+            
+            # 2. Add to the history list (newest first), trimmed to maximum size
+            pipe.lpush(history_key, json.dumps(location_data))
+            pipe.ltrim(history_key, 0, self.LOCATION_HISTORY_MAX_SIZE - 1)
             
             # 3. Update delivery metadata if provided
             if metadata:
-                meta_key = self.DELIVERY_META_KEY.format(delivery_id)
-                self.redis.hmset(meta_key, metadata)
+                pipe.hset(self.DELIVERY_META_KEY.format(delivery_id), mapping=metadata)
             
+            pipe.execute()
             return True
             
         except Exception as e:
@@ -147,9 +251,6 @@ class RedisLocationService(LocationCacheService):
         Returns:
             Dictionary with location data or None if not found
         """
-        if not self.redis:
-            return None
-            
         try:
             # Get coordinates from geospatial index
             pos = self.redis.geopos(self.CURRENT_LOCATIONS_KEY, delivery_id)
@@ -192,9 +293,6 @@ class RedisLocationService(LocationCacheService):
         Returns:
             List of nearby deliveries with distance information
         """
-        if not self.redis:
-            return []
-            
         try:
             # Find nearby deliveries using GEORADIUS
             nearby = self.redis.georadius(
@@ -208,14 +306,17 @@ class RedisLocationService(LocationCacheService):
                 sort='ASC'       # Sort by distance (nearest first)
             )
             
+            if not nearby:
+                return []
+            
+            # Fetch metadata for every hit in one pipelined round trip
+            pipe = self.redis.pipeline(transaction=False)
+            for delivery_id, _, _ in nearby:
+                pipe.hgetall(self.DELIVERY_META_KEY.format(delivery_id))
+            metadata_list = pipe.execute()
+            
             results = []
-            for item in nearby:
-                delivery_id, distance, coords = item
-                
-                # Get metadata if available
-                meta_key = self.DELIVERY_META_KEY.format(delivery_id)
-                metadata = self.redis.hgetall(meta_key) or {}
-                
+            for (delivery_id, distance, coords), metadata in zip(nearby, metadata_list):
                 # Build result object
                 result = {
                     "delivery_id": delivery_id,
@@ -251,9 +352,6 @@ class RedisLocationService(LocationCacheService):
         Returns:
             True if successful, False otherwise
         """
-        if not self.redis:
-            return False
-            
         try:
             # Create a key based on origin and destination
             cache_key = self.ROUTE_CACHE_KEY.format(
@@ -297,9 +395,6 @@ class RedisLocationService(LocationCacheService):
         Returns:
             Cached route information or None if not found
         """
-        if not self.redis:
-            return None
-            
         try:
             # Create a key based on origin and destination
             cache_key = self.ROUTE_CACHE_KEY.format(
@@ -319,6 +414,201 @@ class RedisLocationService(LocationCacheService):
             logger.error(f"Error getting cached route: {str(e)}")
             return None
     
+    def cache_delivery_route(self, delivery_id: str, route_info: RouteInfo,
+                           expiry_seconds: int = 3600) -> bool:
+        """
+        Cache the route of a delivery towards its destination
+        
+        The key doesn't depend on the origin, so the route is found again
+        wherever the driver is; the caller decides whether it still applies.
+        
+        Args:
+            delivery_id: Unique identifier for the delivery
+            route_info: Route to cache, keyed on its destination
+            expiry_seconds: Time in seconds before the cache expires
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            route_data = {
+                "origin": {"lat": route_info.origin.latitude, "lng": route_info.origin.longitude},
+                "destination": {"lat": route_info.destination.latitude, "lng": route_info.destination.longitude},
+                "distance_meters": route_info.distance_meters,
+                "duration_seconds": route_info.duration_seconds,
+                "polyline": route_info.polyline,
+                "waypoints": [
+                    {"lat": point.latitude, "lng": point.longitude}
+                    for point in (route_info.waypoints or [])
+                ]
+            }
+            self.redis.setex(
+                self._delivery_route_key(delivery_id, route_info.destination),
+                expiry_seconds,
+                json.dumps(route_data)
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Error caching route for delivery {delivery_id}: {str(e)}")
+            return False
+    
+    def get_delivery_route(self, delivery_id: str, destination: GeoPoint) -> Optional[RouteInfo]:
+        """
+        Get the cached route of a delivery towards a destination
+        
+        Args:
+            delivery_id: Unique identifier for the delivery
+            destination: Destination of the route
+            
+        Returns:
+            RouteInfo if found in cache, None otherwise
+        """
+        try:
+            cached = self.redis.get(self._delivery_route_key(delivery_id, destination))
+            if not cached:
+                return None
+            data = json.loads(cached)
+            return RouteInfo(
+                origin=GeoPoint(latitude=data["origin"]["lat"], longitude=data["origin"]["lng"]),
+                destination=GeoPoint(latitude=data["destination"]["lat"], longitude=data["destination"]["lng"]),
+                distance_meters=data["distance_meters"],
+                duration_seconds=data["duration_seconds"],
+                polyline=data["polyline"],
+                waypoints=[
+                    GeoPoint(latitude=point["lat"], longitude=point["lng"])
+                    for point in data["waypoints"]
+                ]
+            )
+        except Exception as e:
+            logger.error(f"Error getting cached route for delivery {delivery_id}: {str(e)}")
+            return None
+    
+    def record_route_metrics(self, delivery_id: str, directions_call: bool,
+                           snap_seconds: Optional[float] = None) -> bool:
+        """
+        Accumulate route request metrics for a delivery
+        
+        Args:
+            delivery_id: Unique identifier for the delivery
+            directions_call: Whether the maps provider was called
+            snap_seconds: Time spent snapping the position to the cached route
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            key = self.ROUTE_METRICS_KEY.format(delivery_id)
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.hincrby(key, "requests", 1)
+            if directions_call:
+                pipe.hincrby(key, "directions_calls", 1)
+            if snap_seconds is not None:
+                pipe.hincrby(key, "snaps", 1)
+                pipe.hincrbyfloat(key, "snap_seconds", snap_seconds)
+            pipe.expire(key, self.ETA_METRICS_EXPIRY)
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Error recording route metrics for delivery {delivery_id}: {str(e)}")
+            return False
+    
+    def get_route_metrics(self, delivery_id: str) -> Dict[str, float]:
+        """
+        Get the accumulated route request metrics for a delivery
+        
+        Args:
+            delivery_id: Unique identifier for the delivery
+            
+        Returns:
+            Dictionary of metrics, zeros when nothing was recorded
+        """
+        try:
+            raw = self.redis.hgetall(self.ROUTE_METRICS_KEY.format(delivery_id))
+        except Exception as e:
+            logger.error(f"Error getting route metrics for delivery {delivery_id}: {str(e)}")
+            raw = {}
+        
+        requests = int(raw.get("requests", 0))
+        directions_calls = int(raw.get("directions_calls", 0))
+        snaps = int(raw.get("snaps", 0))
+        return {
+            "requests": requests,
+            "directions_calls": directions_calls,
+            # Every request used to cost one Directions call
+            "calls_saved": max(requests - directions_calls, 0),
+            "avg_snap_microseconds": float(raw.get("snap_seconds", 0)) / snaps * 1e6 if snaps else 0.0
+        }
+    
+    def _delivery_route_key(self, delivery_id: str, destination: GeoPoint) -> str:
+        return self.DELIVERY_ROUTE_KEY.format(
+            delivery_id, f"{destination.latitude:.5f},{destination.longitude:.5f}"
+        )
+    
+    def get_travel_estimates(self, pairs: List[Tuple[GeoPoint, GeoPoint]]) -> List[Optional[TravelEstimate]]:
+        """
+        Get cached distance matrix elements in one round trip
+        
+        Pairs are keyed on coordinates rounded to TRAVEL_ESTIMATE_PRECISION
+        decimals, so nearby positions share an element.
+        
+        Args:
+            pairs: (origin, destination) pairs
+            
+        Returns:
+            The cached estimate of each pair, None where there is none
+        """
+        if not pairs:
+            return []
+        try:
+            cached = self.redis.mget([self._travel_estimate_key(origin, destination) for origin, destination in pairs])
+        except Exception as e:
+            logger.error(f"Error getting cached travel estimates: {str(e)}")
+            return [None] * len(pairs)
+        
+        estimates = []
+        for value in cached:
+            if value:
+                distance_meters, duration_seconds = value.split(",")
+                estimates.append(TravelEstimate(int(distance_meters), int(duration_seconds)))
+            else:
+                estimates.append(None)
+        return estimates
+    
+    def cache_travel_estimates(self, estimates: Dict[Tuple[GeoPoint, GeoPoint], TravelEstimate],
+                             expiry_seconds: int = 600) -> bool:
+        """
+        Cache distance matrix elements in one round trip
+        
+        Args:
+            estimates: Estimate of each (origin, destination) pair
+            expiry_seconds: Time in seconds before the cache expires
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if not estimates:
+            return True
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for (origin, destination), estimate in estimates.items():
+                pipe.setex(
+                    self._travel_estimate_key(origin, destination),
+                    expiry_seconds,
+                    f"{estimate.distance_meters},{estimate.duration_seconds}"
+                )
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Error caching travel estimates: {str(e)}")
+            return False
+    
+    def _travel_estimate_key(self, origin: GeoPoint, destination: GeoPoint) -> str:
+        precision = self.TRAVEL_ESTIMATE_PRECISION
+        return self.TRAVEL_ESTIMATE_KEY.format(
+            f"{origin.latitude:.{precision}f},{origin.longitude:.{precision}f}",
+            f"{destination.latitude:.{precision}f},{destination.longitude:.{precision}f}"
+        )
+    
     def get_location_history(self, delivery_id: str, 
                           limit: int = 20) -> List[Dict[str, Any]]:
         """
@@ -331,9 +621,6 @@ class RedisLocationService(LocationCacheService):
         Returns:
             List of historical location points
         """
-        if not self.redis:
-            return []
-            
         try:
             history_key = self.LOCATION_HISTORY_KEY.format(delivery_id)
             
@@ -346,3 +633,234 @@ class RedisLocationService(LocationCacheService):
         except Exception as e:
             logger.error(f"Error getting location history for delivery {delivery_id}: {str(e)}")
             return []
+    
+    def get_delivery_location_history(self, delivery_id: str, 
+                                    limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Get location history for a delivery (LocationCacheService interface)
+        
+        Args:
+            delivery_id: Unique identifier for the delivery
+            limit: Maximum number of history entries to return
+            
+        Returns:
+            List of historical location points, most recent first
+        """
+        return self.get_location_history(delivery_id, limit)
+    
+    def update_delivery_eta(self, delivery_id: str, eta: datetime) -> bool:
+        """
+        Update the estimated time of arrival for a delivery
+        
+        Args:
+            delivery_id: Unique identifier for the delivery
+            eta: Estimated time of arrival
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            self.redis.hset(self.DELIVERY_META_KEY.format(delivery_id), "eta", eta.isoformat())
+            return True
+        except Exception as e:
+            logger.error(f"Error updating ETA for delivery {delivery_id}: {str(e)}")
+            return False
+    
+    def get_delivery_eta(self, delivery_id: str) -> Optional[datetime]:
+        """
+        Get the estimated time of arrival for a delivery
+        
+        Args:
+            delivery_id: Unique identifier for the delivery
+            
+        Returns:
+            Estimated time of arrival if available, None otherwise
+        """
+        try:
+            eta = self.redis.hget(self.DELIVERY_META_KEY.format(delivery_id), "eta")
+            return datetime.fromisoformat(eta) if eta else None
+        except Exception as e:
+            logger.error(f"Error getting ETA for delivery {delivery_id}: {str(e)}")
+            return None
+    
+    def clear_delivery_data(self, delivery_id: str) -> bool:
+        """
+        Remove all cached data for a delivery
+        
+        Args:
+            delivery_id: Unique identifier for the delivery
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            pipe = self.redis.pipeline(transaction=True)
+            pipe.zrem(self.CURRENT_LOCATIONS_KEY, str(delivery_id))
+            pipe.delete(
+                self.LOCATION_HISTORY_KEY.format(delivery_id),
+                self.DELIVERY_META_KEY.format(delivery_id),
+                self.THROTTLE_KEY.format(delivery_id),
+                self.ETA_PENDING_KEY.format(delivery_id),
+                self.DELIVERY_DRIVER_KEY.format(delivery_id)
+            )
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Error clearing data for delivery {delivery_id}: {str(e)}")
+            return False
+    
+    def claim_eta_recompute(self, delivery_id: str, debounce_seconds: float) -> bool:
+        """
+        Mark an ETA recompute as pending for a delivery and count the ping
+        
+        Uses SET NX EX on a per-delivery key, so only the first ping of a burst
+        schedules a recompute. The key expires on its own if the worker never
+        releases it.
+        
+        Args:
+            delivery_id: Unique identifier for the delivery
+            debounce_seconds: How long the pending mark lasts at most
+            
+        Returns:
+            True if the caller should schedule the recompute, False if one is pending
+        """
+        try:
+            metrics_key = self.ETA_METRICS_KEY.format(delivery_id)
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.set(
+                self.ETA_PENDING_KEY.format(delivery_id),
+                1,
+                nx=True,
+                # Leave the worker time to run before a new recompute can be claimed
+                ex=max(int(debounce_seconds * 4), 30)
+            )
+            pipe.hincrby(metrics_key, "pings", 1)
+            pipe.expire(metrics_key, self.ETA_METRICS_EXPIRY)
+            claimed, _, _ = pipe.execute()
+            return bool(claimed)
+        except redis.RedisError as e:
+            logger.error(f"Error claiming ETA recompute for delivery {delivery_id}: {str(e)}")
+            return False
+    
+    def release_eta_recompute(self, delivery_id: str) -> bool:
+        """
+        Clear the pending ETA recompute mark for a delivery
+        
+        Args:
+            delivery_id: Unique identifier for the delivery
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            self.redis.delete(self.ETA_PENDING_KEY.format(delivery_id))
+            return True
+        except Exception as e:
+            logger.error(f"Error releasing ETA recompute for delivery {delivery_id}: {str(e)}")
+            return False
+    
+    def get_eta_checkpoint(self, delivery_id: str) -> Optional[Tuple[GeoPoint, datetime]]:
+        """
+        Get the position and time of the last external ETA computation
+        
+        Args:
+            delivery_id: Unique identifier for the delivery
+            
+        Returns:
+            Tuple of (location, computed_at) or None if no ETA was computed yet
+        """
+        try:
+            lat, lng, computed_at = self.redis.hmget(
+                self.DELIVERY_META_KEY.format(delivery_id),
+                "eta_lat", "eta_lng", "eta_computed_at"
+            )
+            if lat is None or lng is None or computed_at is None:
+                return None
+            return (
+                GeoPoint(latitude=float(lat), longitude=float(lng)),
+                datetime.fromisoformat(computed_at)
+            )
+        except Exception as e:
+            logger.error(f"Error getting ETA checkpoint for delivery {delivery_id}: {str(e)}")
+            return None
+    
+    def save_eta_checkpoint(self, delivery_id: str, location: GeoPoint,
+                          computed_at: datetime, eta: datetime) -> bool:
+        """
+        Record an external ETA computation in the delivery metadata
+        
+        Args:
+            delivery_id: Unique identifier for the delivery
+            location: Position the ETA was computed from
+            computed_at: When the ETA was computed
+            eta: Estimated time of arrival
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            self.redis.hset(self.DELIVERY_META_KEY.format(delivery_id), mapping={
+                "eta": eta.isoformat(),
+                "eta_lat": location.latitude,
+                "eta_lng": location.longitude,
+                "eta_computed_at": computed_at.isoformat()
+            })
+            return True
+        except Exception as e:
+            logger.error(f"Error saving ETA checkpoint for delivery {delivery_id}: {str(e)}")
+            return False
+    
+    def record_eta_metrics(self, delivery_id: str, external_call: bool,
+                         staleness_seconds: Optional[float] = None) -> bool:
+        """
+        Accumulate ETA recompute metrics for a delivery
+        
+        Args:
+            delivery_id: Unique identifier for the delivery
+            external_call: Whether the maps provider was called
+            staleness_seconds: Age of the served ETA when the recompute ran
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            self._record_eta_metrics(
+                keys=[self.ETA_METRICS_KEY.format(delivery_id)],
+                args=[
+                    1 if external_call else 0,
+                    f"{staleness_seconds:.3f}" if staleness_seconds is not None else "",
+                    self.ETA_METRICS_EXPIRY
+                ]
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Error recording ETA metrics for delivery {delivery_id}: {str(e)}")
+            return False
+    
+    def get_eta_metrics(self, delivery_id: str) -> Dict[str, float]:
+        """
+        Get the accumulated ETA recompute metrics for a delivery
+        
+        Args:
+            delivery_id: Unique identifier for the delivery
+            
+        Returns:
+            Dictionary of metrics, zeros when nothing was recorded
+        """
+        try:
+            raw = self.redis.hgetall(self.ETA_METRICS_KEY.format(delivery_id))
+        except Exception as e:
+            logger.error(f"Error getting ETA metrics for delivery {delivery_id}: {str(e)}")
+            raw = {}
+        
+        pings = int(raw.get("pings", 0))
+        external_calls = int(raw.get("external_calls", 0))
+        return {
+            "pings": pings,
+            "recomputes": int(raw.get("recomputes", 0)),
+            "external_calls": external_calls,
+            # Every accepted ping used to cost one Distance Matrix call
+            "calls_saved": max(pings - external_calls, 0),
+            "last_staleness_seconds": float(raw.get("last_staleness_seconds", 0)),
+            "max_staleness_seconds": float(raw.get("max_staleness_seconds", 0))
+        }
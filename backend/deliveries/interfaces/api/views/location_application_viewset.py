@@ -23,6 +23,11 @@ from deliveries.interfaces.api.serializers import (
     GeoPointSerializer
 )
 from deliveries.infrastructure.factory import ApplicationServiceFactory
+from deliveries.domain.models.value_objects import GeoPoint
+from deliveries.application.services.delivery_services.location_service import (
+    DELIVERY_NOT_FOUND,
+    LOCATION_UPDATE_THROTTLED
+)
 
 logger = logging.getLogger(__name__)
 
@@ -44,8 +49,10 @@ class LocationApplicationViewSet(BaseViewSet):
         request_body=DeliveryLocationCreateInputSerializer,
         responses={
             201: openapi.Response('Created location', DeliveryLocationOutputSerializer),
+            202: openapi.Response('Location accepted, stored by the next ETA recompute'),
             400: openapi.Response('Invalid input'),
             404: openapi.Response('Delivery not found'),
+            429: openapi.Response('Location updates sent too frequently'),
         }
     )
     @action(detail=True, methods=['post'], url_path='update-location')
@@ -66,12 +73,33 @@ class LocationApplicationViewSet(BaseViewSet):
                 longitude=validated_data['longitude']
             )
             
+            if message == LOCATION_UPDATE_THROTTLED:
+                return Response(
+                    {'error': message},
+                    status=status.HTTP_429_TOO_MANY_REQUESTS
+                )
+            
+            if message == DELIVERY_NOT_FOUND:
+                return Response(
+                    {'error': message},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+            
             if not success:
                 return Response(
                     {'error': message},
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
+            if location is None:
+                # Cached ping, there is no stored location to return yet
+                return Response({
+                    'delivery_id': pk,
+                    'latitude': validated_data['latitude'],
+                    'longitude': validated_data['longitude'],
+                    'message': message
+                }, status=status.HTTP_202_ACCEPTED)
+            
             # Serialize the result using query serializer
             serializer = DeliveryLocationOutputSerializer(location)
             
@@ -122,24 +150,29 @@ class LocationApplicationViewSet(BaseViewSet):
                 'longitude': request.query_params.get('longitude')
             }
             
-            # Convert string parameters to proper types
+            # The driver's position is optional, the route then starts from
+            # the last known one
+            current_location = None
             if query_params['latitude'] and query_params['longitude']:
                 query_params['latitude'] = float(query_params['latitude'])
                 query_params['longitude'] = float(query_params['longitude'])
-            
-            validated_data = self.validate_serializer(
-                NearbyLocationsInputSerializer, 
-                query_params
-            )
-            
-            # Create GeoPoint from validated data
-            current_location = validated_data.to_geo_point()
+                
+                validated_data = self.validate_serializer(
+                    NearbyLocationsInputSerializer, 
+                    query_params
+                )
+                
+                # Create GeoPoint from validated data
+                current_location = GeoPoint(
+                    latitude=validated_data['latitude'],
+                    longitude=validated_data['longitude']
+                )
             
             # Execute the query via application service
             location_service = ApplicationServiceFactory.create_location_application_service()
             route_info = location_service.get_delivery_route(
                 delivery_id=UUID(pk),
-                # current_location=current_location
+                current_location=current_location
             )
             
             if not route_info:
@@ -0,0 +1,129 @@
+import statistics
+import time
+import uuid
+from typing import Dict, List
+
+from django.core.management.base import BaseCommand
+
+from deliveries.domain.models.entities.driver_entities import DriverDevice
+from deliveries.domain.repositories.driver_repo.driver_device_repository_interfaces import DriverDeviceRepository
+from deliveries.infrastructure.services.fcm_notification_service import FCMNotificationService
+from deliveries.infrastructure.services.push_transports import FakePushTransport
+
+
+class InMemoryDriverDeviceRepository(DriverDeviceRepository):
+    """Device repository kept in memory, with a simulated per-query latency"""
+
+    def __init__(self, tokens_by_driver: Dict[uuid.UUID, List[str]], query_latency_seconds: float):
+        self.tokens_by_driver = tokens_by_driver
+        self.query_latency_seconds = query_latency_seconds
+        self.queries = 0
+
+    def _query(self):
+        self.queries += 1
+        if self.query_latency_seconds:
+            time.sleep(self.query_latency_seconds)
+
+    def register_device(self, driver_id, device_token, device_type):
+        self._query()
+        tokens = self.tokens_by_driver.setdefault(driver_id, [])
+        if device_token not in tokens:
+            tokens.append(device_token)
+        return DriverDevice(id=uuid.uuid4(), driver_id=driver_id, device_token=device_token, device_type=device_type)
+
+    def unregister_device(self, driver_id, device_token):
+        self._query()
+        tokens = self.tokens_by_driver.get(driver_id, [])
+        if device_token not in tokens:
+            return False
+        tokens.remove(device_token)
+        return True
+
+    def get_active_devices(self, driver_id):
+        self._query()
+        return [
+            DriverDevice(id=uuid.uuid4(), driver_id=driver_id, device_token=token, device_type='android')
+            for token in self.tokens_by_driver.get(driver_id, [])
+        ]
+
+    def get_active_tokens_for_drivers(self, driver_ids):
+        self._query()
+        return {driver_id: self.tokens_by_driver[driver_id] for driver_id in driver_ids if driver_id in self.tokens_by_driver}
+
+    def deactivate_tokens(self, device_tokens):
+        self._query()
+        return len(device_tokens)
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures driver notification fan-out latency versus driver count, offline, '
+        'comparing the per-driver loop with the batched multicast path. '
+        'Uses an in-memory device repository and the fake push transport.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--drivers', type=str, default='10,50,200,1000',
+                            help='Comma-separated driver counts')
+        parser.add_argument('--devices-per-driver', type=int, default=2)
+        parser.add_argument('--query-latency-ms', type=float, default=1.0,
+                            help='Simulated latency of one token query')
+        parser.add_argument('--send-latency-ms', type=float, default=40.0,
+                            help='Simulated latency of one multicast call')
+        parser.add_argument('--invalid-ratio', type=float, default=0.05,
+                            help='Share of tokens reported as unregistered')
+        parser.add_argument('--repeat', type=int, default=3)
+
+    def handle(self, *args, **options):
+        for count in [int(value) for value in options['drivers'].split(',')]:
+            tokens_by_driver = {
+                uuid.uuid4(): [uuid.uuid4().hex for _ in range(options['devices_per_driver'])]
+                for _ in range(count)
+            }
+            all_tokens = [token for tokens in tokens_by_driver.values() for token in tokens]
+            invalid = set(all_tokens[:int(len(all_tokens) * options['invalid_ratio'])])
+            driver_ids = list(tokens_by_driver)
+
+            legacy_times, bulk_times = [], []
+            legacy_calls = bulk_calls = legacy_queries = bulk_queries = 0
+            for _ in range(options['repeat']):
+                repository = InMemoryDriverDeviceRepository(tokens_by_driver, options['query_latency_ms'] / 1000)
+                transport = FakePushTransport(options['send_latency_ms'] / 1000, invalid_tokens=invalid)
+                service = FCMNotificationService(
+                    driver_device_repository=repository,
+                    driver_location_repository=object(),
+                    transport=transport
+                )
+
+                t0 = time.perf_counter()
+                self._legacy_send_to_drivers(repository, transport, driver_ids)
+                legacy_times.append(time.perf_counter() - t0)
+                legacy_calls, legacy_queries = len(transport.batches), repository.queries
+
+                transport.batches.clear()
+                repository.queries = 0
+                t0 = time.perf_counter()
+                service.send_to_drivers(driver_ids, 'New order', 'A new order is available', {'order_id': 'bench'})
+                bulk_times.append(time.perf_counter() - t0)
+                bulk_calls, bulk_queries = len(transport.batches), repository.queries
+
+            self.stdout.write(
+                f'{count} drivers: per-driver loop {statistics.median(legacy_times) * 1000:.1f}ms '
+                f'({legacy_queries} queries, {legacy_calls} sends) | batched '
+                f'{statistics.median(bulk_times) * 1000:.1f}ms ({bulk_queries} queries, {bulk_calls} sends)'
+            )
+
+        self.stdout.write(self.style.SUCCESS('Benchmark complete'))
+
+    @staticmethod
+    def _legacy_send_to_drivers(repository, transport, driver_ids):
+        """The previous fan-out: one token query and one multicast call per driver"""
+        results = {}
+        for driver_id in driver_ids:
+            tokens = [device.device_token for device in repository.get_active_devices(driver_id)]
+            if not tokens:
+                results[driver_id] = False
+                continue
+            responses = transport.send_multicast(tokens, 'New order', 'A new order is available', {'order_id': 'bench'})
+            results[driver_id] = any(response.success for response in responses)
+        return results
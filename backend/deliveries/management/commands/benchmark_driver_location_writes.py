@@ -0,0 +1,181 @@
+import random
+import statistics
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+# Center of the generated pings (Paris)
+CENTER_LAT = 48.8566
+CENTER_LNG = 2.3522
+
+# Days of history the generated rows are spread over
+HISTORY_DAYS = 30
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures the cost of one driver ping write as location history grows, '
+        'comparing the previous insert + mark-older-rows-inactive pattern with the '
+        'current-location upsert + partitioned history append. Works on temporary '
+        'tables that disappear with the session.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', type=str, default='0,100000,1000000,10000000',
+                            help='Comma-separated history sizes (rows) to measure at')
+        parser.add_argument('--drivers', type=int, default=1000, help='Distinct simulated drivers')
+        parser.add_argument('--pings', type=int, default=300, help='Pings timed at each size')
+
+    def handle(self, *args, **options):
+        drivers = options['drivers']
+        sizes = sorted(int(value) for value in options['sizes'].split(','))
+
+        with connection.cursor() as cursor:
+            self._create_tables(cursor)
+
+            rows = 0
+            for size in sizes:
+                if size > rows:
+                    self.stdout.write(f'Growing history to {size} rows...')
+                    self._grow(cursor, size - rows, drivers)
+                    rows = size
+
+                legacy = self._time_pings(options['pings'], drivers,
+                                          lambda driver_id, lat, lng: self._legacy_ping(cursor, driver_id, lat, lng))
+                current = self._time_pings(options['pings'], drivers,
+                                           lambda driver_id, lat, lng: self._upsert_ping(cursor, driver_id, lat, lng))
+
+                self.stdout.write(
+                    f'{size:>10} rows | insert + mark inactive: {self._summary(legacy)} | '
+                    f'upsert + partitioned append: {self._summary(current)}'
+                )
+
+        self.stdout.write(self.style.SUCCESS('Benchmark complete'))
+
+    def _create_tables(self, cursor):
+        # Same shape and indexes as the previous driver_locations table
+        cursor.execute("""
+            CREATE TEMP TABLE bench_legacy_locations (
+                id uuid PRIMARY KEY,
+                driver_id bigint NOT NULL,
+                location geography(Point, 4326) NOT NULL,
+                latitude double precision NOT NULL,
+                longitude double precision NOT NULL,
+                timestamp timestamp with time zone NOT NULL,
+                is_active boolean NOT NULL
+            )
+        """)
+        cursor.execute("CREATE INDEX ON bench_legacy_locations (driver_id, timestamp DESC)")
+        cursor.execute("CREATE INDEX ON bench_legacy_locations USING gist (location)")
+
+        cursor.execute("""
+            CREATE TEMP TABLE bench_current_locations (
+                id uuid PRIMARY KEY,
+                driver_id bigint NOT NULL UNIQUE,
+                location geography(Point, 4326) NOT NULL,
+                latitude double precision NOT NULL,
+                longitude double precision NOT NULL,
+                timestamp timestamp with time zone NOT NULL,
+                is_active boolean NOT NULL
+            )
+        """)
+        cursor.execute("CREATE INDEX ON bench_current_locations USING gist (location)")
+
+        cursor.execute("""
+            CREATE TEMP TABLE bench_location_history (
+                id bigserial,
+                driver_id bigint NOT NULL,
+                latitude double precision NOT NULL,
+                longitude double precision NOT NULL,
+                recorded_at timestamp with time zone NOT NULL,
+                is_compacted boolean NOT NULL DEFAULT false,
+                PRIMARY KEY (id, recorded_at)
+            ) PARTITION BY RANGE (recorded_at)
+        """)
+        cursor.execute("CREATE INDEX ON bench_location_history (driver_id, recorded_at)")
+        for offset in range(-HISTORY_DAYS, 2):
+            cursor.execute(f"""
+                CREATE TEMP TABLE bench_location_history_{offset + HISTORY_DAYS}
+                PARTITION OF bench_location_history
+                FOR VALUES FROM (current_date + {offset}) TO (current_date + {offset + 1})
+            """)
+
+    def _grow(self, cursor, count, drivers):
+        """Bulk-load `count` past pings into both layouts"""
+        cursor.execute("""
+            INSERT INTO bench_legacy_locations
+            SELECT gen_random_uuid(), driver_id,
+                   ST_SetSRID(ST_MakePoint(lng, lat), 4326)::geography,
+                   lat, lng, recorded_at, false
+            FROM (
+                SELECT (random() * %s)::bigint AS driver_id,
+                       %s + (random() - 0.5) * 0.1 AS lat,
+                       %s + (random() - 0.5) * 0.1 AS lng,
+                       now() - random() * make_interval(days => %s) AS recorded_at
+                FROM generate_series(1, %s)
+            ) generated
+        """, [drivers, CENTER_LAT, CENTER_LNG, HISTORY_DAYS, count])
+        cursor.execute("""
+            INSERT INTO bench_location_history (driver_id, latitude, longitude, recorded_at)
+            SELECT (random() * %s)::bigint,
+                   %s + (random() - 0.5) * 0.1,
+                   %s + (random() - 0.5) * 0.1,
+                   now() - random() * make_interval(days => %s)
+            FROM generate_series(1, %s)
+        """, [drivers, CENTER_LAT, CENTER_LNG, HISTORY_DAYS, count])
+        cursor.execute("ANALYZE bench_legacy_locations")
+        cursor.execute("ANALYZE bench_location_history")
+
+    @staticmethod
+    def _legacy_ping(cursor, driver_id, lat, lng):
+        """The previous write: insert the ping, then flag every older row inactive"""
+        location_id = uuid.uuid4()
+        with transaction.atomic():
+            cursor.execute("""
+                INSERT INTO bench_legacy_locations
+                VALUES (%s, %s, ST_SetSRID(ST_MakePoint(%s, %s), 4326)::geography, %s, %s, now(), true)
+            """, [location_id, driver_id, lng, lat, lat, lng])
+            cursor.execute("""
+                UPDATE bench_legacy_locations SET is_active = false
+                WHERE driver_id = %s AND id <> %s
+            """, [driver_id, location_id])
+
+    @staticmethod
+    def _upsert_ping(cursor, driver_id, lat, lng):
+        """The current write: upsert the driver's row, append to the history"""
+        with transaction.atomic():
+            cursor.execute("""
+                INSERT INTO bench_current_locations
+                VALUES (%s, %s, ST_SetSRID(ST_MakePoint(%s, %s), 4326)::geography, %s, %s, now(), true)
+                ON CONFLICT (driver_id) DO UPDATE SET
+                    location = EXCLUDED.location,
+                    latitude = EXCLUDED.latitude,
+                    longitude = EXCLUDED.longitude,
+                    timestamp = EXCLUDED.timestamp,
+                    is_active = EXCLUDED.is_active
+            """, [uuid.uuid4(), driver_id, lng, lat, lat, lng])
+            cursor.execute("""
+                INSERT INTO bench_location_history (driver_id, latitude, longitude, recorded_at)
+                VALUES (%s, %s, %s, now())
+            """, [driver_id, lat, lng])
+
+    @staticmethod
+    def _time_pings(pings, drivers, write):
+        rng = random.Random(42)
+        durations = []
+        for _ in range(pings):
+            driver_id = rng.randrange(drivers)
+            lat = CENTER_LAT + rng.uniform(-0.05, 0.05)
+            lng = CENTER_LNG + rng.uniform(-0.05, 0.05)
+            t0 = time.perf_counter()
+            write(driver_id, lat, lng)
+            durations.append(time.perf_counter() - t0)
+        return durations
+
+    @staticmethod
+    def _summary(durations):
+        ordered = sorted(durations)
+        p95 = ordered[int(len(ordered) * 0.95) - 1] if len(ordered) > 1 else ordered[0]
+        return f'p50 {statistics.median(ordered) * 1000:.2f}ms p95 {p95 * 1000:.2f}ms'
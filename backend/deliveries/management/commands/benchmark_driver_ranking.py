@@ -0,0 +1,138 @@
+import random
+import time
+import uuid
+from datetime import datetime
+
+from django.core.management.base import BaseCommand
+
+from deliveries.application.services.notification_services.delivery_notification_service import (
+    DeliveryNotificationService
+)
+from deliveries.domain.models.entities.driver_entities import DriverLocation
+from deliveries.domain.models.value_objects import GeoPoint
+from deliveries.infrastructure.services.fake_distance_matrix_client import FakeDistanceMatrixClient
+from deliveries.infrastructure.services.google_maps_service import GoogleMapsService
+from deliveries.infrastructure.services.redis_location_service import RedisLocationService
+
+# Center of the generated fleet (Paris)
+CENTER_LAT = 48.8566
+CENTER_LNG = 2.3522
+METERS_PER_DEGREE = 111320.0
+
+
+class InMemoryEstimateCache:
+    """The travel estimate methods of LocationCacheService, in memory, keyed like Redis"""
+
+    def __init__(self):
+        self.estimates = {}
+
+    def get_travel_estimates(self, pairs):
+        return [self.estimates.get(self._key(origin, destination)) for origin, destination in pairs]
+
+    def cache_travel_estimates(self, estimates, expiry_seconds=600):
+        for (origin, destination), estimate in estimates.items():
+            self.estimates[self._key(origin, destination)] = estimate
+        return True
+
+    @staticmethod
+    def _key(origin, destination):
+        precision = RedisLocationService.TRAVEL_ESTIMATE_PRECISION
+        return (round(origin.latitude, precision), round(origin.longitude, precision),
+                round(destination.latitude, precision), round(destination.longitude, precision))
+
+
+class Command(BaseCommand):
+    help = (
+        'Ranks candidate drivers by travel time to a store with a fake haversine x road '
+        'factor provider, comparing one request per driver with the batched distance '
+        'matrix, with and without the element cache. Also measures many-to-many batches '
+        'of deliveries. Runs offline.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rankings', type=int, default=200, help='Deliveries to rank drivers for')
+        parser.add_argument('--candidates', type=int, default=60, help='Drivers per ranking')
+        parser.add_argument('--fleet', type=int, default=800, help='Drivers the candidates are drawn from')
+        parser.add_argument('--stores', type=int, default=40)
+        parser.add_argument('--batch', type=int, default=10, help='Deliveries per many-to-many batch')
+        parser.add_argument('--latency-ms', type=float, default=20, help='Simulated provider round trip')
+        parser.add_argument('--baseline-rankings', type=int, default=5,
+                            help='Rankings measured with one request per driver')
+
+    def handle(self, *args, **options):
+        rng = random.Random(5)
+        fleet = [
+            DriverLocation(id=uuid.uuid4(), driver_id=uuid.uuid4(),
+                           location=self._random_point(rng, 4000), timestamp=datetime.now())
+            for _ in range(options['fleet'])
+        ]
+        stores = [self._random_point(rng, 3000) for _ in range(options['stores'])]
+        rankings = [
+            (rng.sample(fleet, min(options['candidates'], len(fleet))), rng.choice(stores))
+            for _ in range(options['rankings'])
+        ]
+        latency = options['latency_ms'] / 1000
+
+        client = FakeDistanceMatrixClient(latency_seconds=latency)
+        service = GoogleMapsService(client=client)
+        self._report('one request per driver', client, options['baseline_rankings'], lambda: [
+            [service.distance_matrix([driver.location], [store])[0][0] for driver in drivers]
+            for drivers, store in rankings[:options['baseline_rankings']]
+        ])
+
+        client = FakeDistanceMatrixClient(latency_seconds=latency)
+        service = GoogleMapsService(client=client)
+        self._report('batched', client, len(rankings), lambda: [
+            self._ranking_service(service).rank_drivers_by_travel_time(drivers, store)
+            for drivers, store in rankings
+        ])
+
+        client = FakeDistanceMatrixClient(latency_seconds=latency)
+        service = GoogleMapsService(client=client, estimate_cache=InMemoryEstimateCache())
+        self._report('batched + cache', client, len(rankings), lambda: [
+            self._ranking_service(service).rank_drivers_by_travel_time(drivers, store)
+            for drivers, store in rankings
+        ])
+
+        # Many-to-many: a batch of deliveries against the union of their candidates
+        batches = [rankings[i:i + options['batch']] for i in range(0, len(rankings), options['batch'])]
+        client = FakeDistanceMatrixClient(latency_seconds=latency)
+        service = GoogleMapsService(client=client, estimate_cache=InMemoryEstimateCache())
+        self._report(f'{options["batch"]}x matrix + cache', client, len(rankings), lambda: [
+            service.distance_matrix(
+                list({driver.location for drivers, _ in batch for driver in drivers}),
+                list({store for _, store in batch})
+            )
+            for batch in batches
+        ])
+
+        self.stdout.write(self.style.SUCCESS('Benchmark complete'))
+
+    def _report(self, label, client, rankings, run):
+        started = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            f'{label:>24}: {rankings / elapsed:8.1f} rankings/s, '
+            f'{client.requests / rankings:6.2f} requests and {client.elements / rankings:6.1f} '
+            f'provider elements per ranking'
+        )
+
+    @staticmethod
+    def _ranking_service(maps_service):
+        """The notification service, only used for its ranking"""
+        return DeliveryNotificationService(
+            delivery_repository=None,
+            notification_service=None,
+            driver_location_repository=None,
+            notification_repository=None,
+            order_repository=None,
+            maps_service=maps_service
+        )
+
+    @staticmethod
+    def _random_point(rng, spread_meters):
+        return GeoPoint(
+            latitude=CENTER_LAT + rng.uniform(-spread_meters, spread_meters) / METERS_PER_DEGREE,
+            longitude=CENTER_LNG + rng.uniform(-spread_meters, spread_meters) / METERS_PER_DEGREE,
+        )
@@ -0,0 +1,143 @@
+import math
+import random
+import time
+import uuid
+from types import SimpleNamespace
+
+from django.core.management.base import BaseCommand
+
+from deliveries.application.services.delivery_services.location_service import LocationApplicationService
+from deliveries.domain.models.route_geometry import METERS_PER_DEGREE, decode_polyline, encode_polyline
+from deliveries.domain.models.value_objects import GeoPoint, RouteInfo
+
+# Center of the generated deliveries (Paris)
+CENTER_LAT = 48.8566
+CENTER_LNG = 2.3522
+
+
+class FakeDirections:
+    """Maps service returning a winding route between two points, counting its calls"""
+
+    def __init__(self, points_per_route):
+        self.points_per_route = points_per_route
+        self.calls = 0
+
+    def calculate_route(self, origin, destination):
+        self.calls += 1
+        points = []
+        for i in range(self.points_per_route):
+            t = i / (self.points_per_route - 1)
+            # Lateral wiggle of up to ~150m, zero at both ends
+            wiggle = math.sin(t * math.pi * 6) * math.sin(t * math.pi) * 150 / METERS_PER_DEGREE
+            points.append((
+                origin.latitude + (destination.latitude - origin.latitude) * t + wiggle,
+                origin.longitude + (destination.longitude - origin.longitude) * t - wiggle,
+            ))
+        distance = origin.distance_to(destination) * 1000 * 1.3
+        return RouteInfo(origin=origin, destination=destination, distance_meters=int(distance),
+                         duration_seconds=int(distance / 8), polyline=encode_polyline(points))
+
+
+class InMemoryRouteCache:
+    """The route cache methods of LocationCacheService, in memory"""
+
+    def __init__(self):
+        self.routes = {}
+        self.metrics = {}
+
+    def get_delivery_location(self, delivery_id):
+        return None
+
+    def get_delivery_route(self, delivery_id, destination):
+        return self.routes.get((delivery_id, destination))
+
+    def cache_delivery_route(self, delivery_id, route_info, expiry_seconds=3600):
+        self.routes[(delivery_id, route_info.destination)] = route_info
+        return True
+
+    def record_route_metrics(self, delivery_id, directions_call, snap_seconds=None):
+        metrics = self.metrics.setdefault(delivery_id, {'requests': 0, 'directions_calls': 0, 'snaps': []})
+        metrics['requests'] += 1
+        metrics['directions_calls'] += 1 if directions_call else 0
+        if snap_seconds is not None:
+            metrics['snaps'].append(snap_seconds)
+        return True
+
+
+class Command(BaseCommand):
+    help = (
+        'Simulates drivers pinging the route endpoint while following their route, with '
+        'GPS noise and occasional detours, and reports directions calls per delivery and '
+        'the cost of snapping a ping to the cached route. Runs offline with a fake provider.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--deliveries', type=int, default=200)
+        parser.add_argument('--pings', type=int, default=60, help='Route requests per delivery')
+        parser.add_argument('--route-points', type=int, nargs='+', default=[50, 200, 800],
+                            help='Polyline sizes to measure')
+        parser.add_argument('--deviation-meters', type=float, default=75)
+        parser.add_argument('--detour-probability', type=float, default=0.02)
+        parser.add_argument('--gps-noise-meters', type=float, default=15)
+
+    def handle(self, *args, **options):
+        for points_per_route in options['route_points']:
+            rng = random.Random(11)
+            maps_service = FakeDirections(points_per_route)
+            cache = InMemoryRouteCache()
+            deliveries = {}
+            service = LocationApplicationService(
+                delivery_repository=SimpleNamespace(get_by_id=deliveries.get),
+                delivery_location_repository=None,
+                maps_service=maps_service,
+                location_cache_service=cache,
+                route_deviation_meters=options['deviation_meters'],
+            )
+
+            started = time.perf_counter()
+            for _ in range(options['deliveries']):
+                delivery_id = uuid.uuid4()
+                store = self._random_point(rng, 3000)
+                deliveries[delivery_id] = SimpleNamespace(
+                    store_location_geopoint=store,
+                    delivery_location_geopoint=self._random_point(rng, 3000),
+                )
+                for position in self._drive(rng, service, delivery_id, store, options):
+                    service.get_delivery_route(delivery_id, current_location=position)
+            elapsed = time.perf_counter() - started
+
+            snaps = [snap for metrics in cache.metrics.values() for snap in metrics['snaps']]
+            requests = sum(metrics['requests'] for metrics in cache.metrics.values())
+            self.stdout.write(
+                f'{points_per_route:>4} route points: {maps_service.calls / options["deliveries"]:.2f} '
+                f'directions calls per delivery (uncached: {options["pings"]}), '
+                f'snap {sum(snaps) / len(snaps) * 1e6:.0f}us per ping, '
+                f'{elapsed / requests * 1e6:.0f}us per route request'
+            )
+
+        self.stdout.write(self.style.SUCCESS('Benchmark complete'))
+
+    def _drive(self, rng, service, delivery_id, store, options):
+        """Positions along the delivery's current route, with GPS noise and detours"""
+        route = service.get_delivery_route(delivery_id, current_location=store)
+        points = decode_polyline(route['polyline'])
+        for ping in range(1, options['pings']):
+            latitude, longitude = points[min(int(ping / options['pings'] * len(points)), len(points) - 1)]
+            noise = options['gps_noise_meters'] / METERS_PER_DEGREE
+            latitude += rng.uniform(-noise, noise)
+            longitude += rng.uniform(-noise, noise)
+            if rng.random() < options['detour_probability']:
+                # Leaves the route, the next request gets a new one from here
+                latitude += 400 / METERS_PER_DEGREE
+                position = GeoPoint(latitude=latitude, longitude=longitude)
+                route = service.get_delivery_route(delivery_id, current_location=position)
+                points = decode_polyline(route['polyline'])
+                continue
+            yield GeoPoint(latitude=latitude, longitude=longitude)
+
+    @staticmethod
+    def _random_point(rng, spread_meters):
+        return GeoPoint(
+            latitude=CENTER_LAT + rng.uniform(-spread_meters, spread_meters) / METERS_PER_DEGREE,
+            longitude=CENTER_LNG + rng.uniform(-spread_meters, spread_meters) / METERS_PER_DEGREE,
+        )
@@ -0,0 +1,138 @@
+import json
+import random
+import threading
+import time
+import uuid
+from datetime import datetime
+
+from django.core.management.base import BaseCommand
+
+from deliveries.domain.models.value_objects import GeoPoint
+from deliveries.infrastructure.services.redis_location_service import RedisLocationService
+
+# Center of the generated pings (Paris)
+CENTER_LAT = 48.8566
+CENTER_LNG = 2.3522
+
+
+class Command(BaseCommand):
+    help = (
+        'Load generator for RedisLocationService. Measures location pings/sec per worker '
+        'with the previous one-round-trip-per-command path and the pipelined path, '
+        'and nearby lookups with per-hit HGETALL versus a pipelined batch.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=4, help='Concurrent worker threads')
+        parser.add_argument('--pings', type=int, default=2000, help='Pings sent by each worker')
+        parser.add_argument('--deliveries', type=int, default=500, help='Distinct simulated deliveries')
+        parser.add_argument('--min-interval', type=float, default=10.0,
+                            help='Throttle interval used for the throttled run (seconds)')
+        parser.add_argument('--eta-debounce', type=float, default=5.0,
+                            help='ETA recompute debounce window used for the ingest run (seconds)')
+
+    def handle(self, *args, **options):
+        service = RedisLocationService()
+        run_id = uuid.uuid4().hex[:8]
+        delivery_ids = [f'loadtest-{run_id}-{i}' for i in range(options['deliveries'])]
+
+        try:
+            self._run('before (separate round trips)', options, delivery_ids,
+                      lambda delivery_id, point: self._legacy_update(service, delivery_id, point))
+            self._run('after (pipelined)', options, delivery_ids,
+                      lambda delivery_id, point: service.update_delivery_location(
+                          delivery_id, point, metadata={'status': 'in_transit'}))
+
+            # Throttled: most pings are rejected by a single SET NX before any other work
+            accepted = []
+            def throttled(delivery_id, point):
+                if service.allow_location_update(delivery_id, options['min_interval']):
+                    accepted.append(1)
+                    service.update_delivery_location(delivery_id, point, metadata={'status': 'in_transit'})
+            self._run('after (pipelined + throttle)', options, delivery_ids, throttled)
+            self.stdout.write(f'  accepted {len(accepted)} pings, the rest were throttled')
+
+            # Ingest path: cache write plus a coalesced ETA recompute claim per ping
+            claims = []
+            def ingest(delivery_id, point):
+                service.update_delivery_location(delivery_id, point)
+                if service.claim_eta_recompute(delivery_id, options['eta_debounce']):
+                    claims.append(1)
+            self._run('ingest (cache + ETA claim)', options, delivery_ids, ingest)
+            total_pings = options['workers'] * options['pings']
+            self.stdout.write(
+                f'  {len(claims)} ETA recomputes scheduled for {total_pings} pings '
+                f'(previously one Distance Matrix call per ping)'
+            )
+
+            center = GeoPoint(latitude=CENTER_LAT, longitude=CENTER_LNG)
+            self._time_lookup('nearby before (HGETALL per hit)', lambda: self._legacy_nearby(service, center))
+            self._time_lookup('nearby after (pipelined HGETALL)', lambda: service.find_nearby_deliveries(center, 5.0))
+        finally:
+            for delivery_id in delivery_ids:
+                service.clear_delivery_data(delivery_id)
+
+        self.stdout.write(self.style.SUCCESS('Load test complete'))
+
+    def _run(self, label, options, delivery_ids, ping):
+        workers = options['workers']
+        pings = options['pings']
+        durations = []
+
+        def worker(seed):
+            rng = random.Random(seed)
+            t0 = time.perf_counter()
+            for _ in range(pings):
+                point = GeoPoint(
+                    latitude=CENTER_LAT + rng.uniform(-0.05, 0.05),
+                    longitude=CENTER_LNG + rng.uniform(-0.05, 0.05)
+                )
+                ping(rng.choice(delivery_ids), point)
+            durations.append(time.perf_counter() - t0)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(workers)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        wall = time.perf_counter() - started
+
+        per_worker = sum(pings / d for d in durations) / len(durations)
+        self.stdout.write(
+            f'{label}: {per_worker:.0f} pings/sec per worker, '
+            f'{workers * pings / wall:.0f} pings/sec total ({workers} workers)'
+        )
+
+    def _time_lookup(self, label, lookup, repeat=50):
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            hits = lookup()
+        elapsed = (time.perf_counter() - t0) / repeat
+        self.stdout.write(f'{label}: {elapsed * 1000:.2f}ms per lookup ({len(hits)} hits)')
+
+    @staticmethod
+    def _legacy_update(service, delivery_id, point):
+        """The previous update path: one round trip per command"""
+        client = service.redis
+        client.geoadd(service.CURRENT_LOCATIONS_KEY, [point.longitude, point.latitude, delivery_id])
+        history_key = service.LOCATION_HISTORY_KEY.format(delivery_id)
+        client.lpush(history_key, json.dumps({
+            'lat': point.latitude, 'lng': point.longitude,
+            'timestamp': datetime.now().isoformat(), 'driver_id': None
+        }))
+        client.ltrim(history_key, 0, service.LOCATION_HISTORY_MAX_SIZE - 1)
+        client.hset(service.DELIVERY_META_KEY.format(delivery_id), mapping={'status': 'in_transit'})
+
+    @staticmethod
+    def _legacy_nearby(service, center):
+        """The previous nearby lookup: GEORADIUS then one HGETALL per hit"""
+        client = service.redis
+        nearby = client.georadius(
+            service.CURRENT_LOCATIONS_KEY, center.longitude, center.latitude, 5.0,
+            unit='km', withdist=True, withcoord=True, sort='ASC'
+        )
+        return [
+            (delivery_id, client.hgetall(service.DELIVERY_META_KEY.format(delivery_id)))
+            for delivery_id, _, _ in nearby
+        ]
@@ -0,0 +1,50 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from deliveries.infrastructure.config.geospatial_settings import (
+    DRIVER_LOCATION_HISTORY_RETENTION_DAYS,
+    DRIVER_LOCATION_PARTITIONS_AHEAD_DAYS,
+    DRIVER_LOCATION_COMPACT_AFTER_HOURS,
+    DRIVER_LOCATION_COMPACT_EPSILON_METERS,
+    DRIVER_LOCATION_TRIP_GAP_SECONDS
+)
+from deliveries.infrastructure.services.location_history_service import DriverLocationHistoryMaintenance
+
+
+class Command(BaseCommand):
+    help = (
+        'Creates the partitioned driver location history table and its daily partitions, '
+        'drops expired partitions and compacts old points. Migrate creates the table; '
+        'the hourly Celery task keeps it up to date afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days-ahead', type=int, default=DRIVER_LOCATION_PARTITIONS_AHEAD_DAYS)
+        parser.add_argument('--retention-days', type=int, default=DRIVER_LOCATION_HISTORY_RETENTION_DAYS)
+        parser.add_argument('--compact-after-hours', type=float, default=DRIVER_LOCATION_COMPACT_AFTER_HOURS)
+        parser.add_argument('--epsilon-meters', type=float, default=DRIVER_LOCATION_COMPACT_EPSILON_METERS)
+        parser.add_argument('--skip-compaction', action='store_true')
+
+    def handle(self, *args, **options):
+        maintenance = DriverLocationHistoryMaintenance()
+        maintenance.ensure_table()
+
+        created = maintenance.ensure_partitions(days_ahead=options['days_ahead'])
+        self.stdout.write(f'Partitions in place: {", ".join(created)}')
+
+        dropped = maintenance.drop_expired_partitions(options['retention_days'])
+        self.stdout.write(f'Dropped {len(dropped)} expired partitions')
+
+        if not options['skip_compaction']:
+            stats = maintenance.compact(
+                older_than=timedelta(hours=options['compact_after_hours']),
+                epsilon_meters=options['epsilon_meters'],
+                trip_gap_seconds=DRIVER_LOCATION_TRIP_GAP_SECONDS
+            )
+            self.stdout.write(
+                f'Compacted {stats.points_scanned} points over {stats.drivers} drivers '
+                f'and {stats.trips} trips: kept {stats.points_kept}, deleted {stats.points_deleted}'
+            )
+
+        self.stdout.write(self.style.SUCCESS('Driver location history is up to date'))
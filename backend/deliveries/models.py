@@ -14,8 +14,9 @@ from deliveries.infrastructure.django_models.delivery_orm_models.delivery_models
 from deliveries.infrastructure.django_models.driver_orm_models.driver_model import (
     DriverModel as Driver,
     DriverDeviceModel as DriverDevice,
-    DriverLocationModel as DriverLocation
+    DriverLocationModel as DriverLocation,
+    DriverLocationHistoryModel as DriverLocationHistory
 )
 
 # Re-export models with simplified names for Django admin and migrations
-__all__ = ['Delivery', 'DeliveryTimeline', 'DeliveryLocation', 'Driver', 'DriverDevice', 'DriverLocation']
+__all__ = ['Delivery', 'DeliveryTimeline', 'DeliveryLocation', 'Driver', 'DriverDevice', 'DriverLocation', 'DriverLocationHistory']
@@ -0,0 +1,59 @@
+import logging
+import uuid
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(ignore_result=True)
+def recompute_delivery_eta(delivery_id: str):
+    """Recompute the ETA of a delivery from its latest cached location
+    
+    Scheduled by the location ingest path at most once per debounce window,
+    so a burst of pings costs a single run.
+    """
+    from deliveries.infrastructure.factory import ApplicationServiceFactory
+    
+    location_service = ApplicationServiceFactory.create_location_application_service()
+    return location_service.recompute_eta(uuid.UUID(delivery_id))
+
+
+def schedule_eta_recompute(delivery_id: uuid.UUID, countdown: float) -> None:
+    """Queue recompute_delivery_eta for a delivery after `countdown` seconds"""
+    recompute_delivery_eta.apply_async(args=[str(delivery_id)], countdown=countdown)
+
+
+@shared_task(ignore_result=True)
+def maintain_driver_location_history():
+    """Rotate and compact the partitioned driver location history
+    
+    Pre-creates the next daily partitions, drops the expired ones and
+    downsamples points older than DRIVER_LOCATION_COMPACT_AFTER_HOURS.
+    """
+    from datetime import timedelta
+    
+    from deliveries.infrastructure.config.geospatial_settings import (
+        DRIVER_LOCATION_HISTORY_RETENTION_DAYS,
+        DRIVER_LOCATION_PARTITIONS_AHEAD_DAYS,
+        DRIVER_LOCATION_COMPACT_AFTER_HOURS,
+        DRIVER_LOCATION_COMPACT_EPSILON_METERS,
+        DRIVER_LOCATION_TRIP_GAP_SECONDS
+    )
+    from deliveries.infrastructure.services.location_history_service import DriverLocationHistoryMaintenance
+    
+    maintenance = DriverLocationHistoryMaintenance()
+    maintenance.ensure_table()
+    maintenance.ensure_partitions(days_ahead=DRIVER_LOCATION_PARTITIONS_AHEAD_DAYS)
+    dropped = maintenance.drop_expired_partitions(DRIVER_LOCATION_HISTORY_RETENTION_DAYS)
+    stats = maintenance.compact(
+        older_than=timedelta(hours=DRIVER_LOCATION_COMPACT_AFTER_HOURS),
+        epsilon_meters=DRIVER_LOCATION_COMPACT_EPSILON_METERS,
+        trip_gap_seconds=DRIVER_LOCATION_TRIP_GAP_SECONDS
+    )
+    
+    return {
+        'dropped_partitions': len(dropped),
+        'points_scanned': stats.points_scanned,
+        'points_deleted': stats.points_deleted
+    }
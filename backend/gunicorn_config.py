@@ -44,3 +44,16 @@ daemon = False
 
 # Reload the application if any of the watched files change
 reload = False  # Set to True for development
+
+
+def post_worker_init(worker):
+    """Warm per-worker in-memory indexes before the worker accepts requests"""
+    try:
+        from store.infrastructure.search.autocomplete_index import (
+            is_autocomplete_index_enabled, load_autocomplete_index
+        )
+        if is_autocomplete_index_enabled():
+            load_autocomplete_index()
+    except Exception as e:
+        # The index is loaded lazily on the first autocomplete request instead
+        worker.log.warning(f"Could not preload autocomplete index: {e}")
@@ -5,6 +5,7 @@ This module contains the ConversationService class, which implements the busines
 for creating, retrieving, and managing conversations.
 """
 from typing import List, Optional
+from datetime import datetime
 import uuid
 
 from ...domain.models import Conversation
@@ -66,3 +67,26 @@ class ConversationService:
             limit=limit,
             offset=offset
         )
+    
+    def update_last_read(
+        self,
+        conversation_id: uuid.UUID,
+        user_id: uuid.UUID,
+        read_at: Optional[datetime] = None
+    ) -> bool:
+        """
+        Record when a participant last read a conversation.
+        
+        Args:
+            conversation_id: ID of the conversation
+            user_id: ID of the participant
+            read_at: Read timestamp (default: current time)
+            
+        Returns:
+            True if the user is a participant and was updated, False otherwise
+        """
+        return self.conversation_repository.update_last_read(
+            conversation_id=conversation_id,
+            user_id=user_id,
+            read_at=read_at
+        )
@@ -8,7 +8,8 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime
 import uuid
 
-from ...domain.models import Message
+from ...domain.exceptions import NotConversationParticipantException
+from ...domain.models import Message, ReadWatermark
 from ...domain.repositories import MessageRepository, ConversationRepository
 
 
@@ -47,8 +48,9 @@ class MessageService:
         """
         Send a new message in a conversation.
         
-        This method creates a new message, saves it to the repository, and
-        updates the conversation's last_message_at timestamp.
+        The message is persisted and the conversation's last_message_at is
+        bumped in a single transaction. Broadcasting is left to the caller,
+        which sends it to the conversation group exactly once.
         
         Args:
             conversation_id: ID of the conversation
@@ -58,20 +60,12 @@ class MessageService:
             metadata: Additional message metadata
             
         Returns:
-            The created message
+            The persisted message
             
         Raises:
-            ValueError: If the conversation doesn't exist or the sender is not a participant
+            NotConversationParticipantException: If the conversation doesn't exist
+                or the sender is not a participant
         """
-        # Verify the conversation exists and the sender is a participant
-        conversation = self.conversation_repository.get_by_id(conversation_id)
-        if not conversation:
-            raise ValueError(f"Conversation {conversation_id} not found")
-        
-        if sender_id not in conversation.participants:
-            raise ValueError(f"User {sender_id} is not a participant in conversation {conversation_id}")
-        
-        # Create and save the message
         message = Message.create(
             conversation_id=conversation_id,
             sender_id=sender_id,
@@ -79,11 +73,11 @@ class MessageService:
             content_type=content_type,
             metadata=metadata
         )
-        saved_message = self.message_repository.create(message)
-        
-        # Update the conversation's last_message_at timestamp
-        conversation.update_last_message_time(saved_message.sent_at)
-        self.conversation_repository.update(conversation)
+        saved_message = self.message_repository.create_in_conversation(message)
+        if saved_message is None:
+            raise NotConversationParticipantException(
+                f"Conversation {conversation_id} not found or user {sender_id} is not a participant"
+            )
         
         return saved_message
     
@@ -170,8 +164,9 @@ class MessageService:
         """
         Mark messages as read by a specific user.
         
-        This method will only mark messages as read if the user is a recipient
-        (not the sender) and is a participant in the conversation.
+        Only messages the user received in conversations they participate in
+        count. The batch advances the user's read watermark of each conversation
+        with a single write, whatever the number of IDs.
         
         Args:
             message_ids: List of message IDs to mark as read
@@ -179,32 +174,39 @@ class MessageService:
             read_at: Read timestamp (default: current time)
             
         Returns:
-            Number of messages updated
+            Number of messages acknowledged
         """
-        # Verify the user is a participant in the conversations
-        # and is not the sender of the messages
-        valid_message_ids = []
-        for message_id in message_ids:
-            message = self.message_repository.get_by_id(message_id)
-            if not message:
-                continue
-                
-            conversation = self.conversation_repository.get_by_id(message.conversation_id)
-            if not conversation or user_id not in conversation.participants:
-                continue
-                
-            if message.sender_id != user_id:
-                valid_message_ids.append(message_id)
-        
-        if not valid_message_ids:
-            return 0
-            
         return self.message_repository.mark_as_read(
-            message_ids=valid_message_ids,
+            message_ids=message_ids,
             user_id=user_id,
             read_at=read_at
         )
     
+    def get_unread_count(self, conversation_id: uuid.UUID, user_id: uuid.UUID) -> int:
+        """
+        Get the number of messages a user hasn't read in a conversation.
+        
+        Args:
+            conversation_id: ID of the conversation
+            user_id: ID of the user
+            
+        Returns:
+            Number of unread messages
+        """
+        return self.message_repository.get_unread_count(conversation_id, user_id)
+    
+    def get_read_watermarks(self, conversation_id: uuid.UUID) -> List[ReadWatermark]:
+        """
+        Get how far each participant has read in a conversation.
+        
+        Args:
+            conversation_id: ID of the conversation
+            
+        Returns:
+            List of read watermarks
+        """
+        return self.message_repository.get_read_watermarks(conversation_id)
+    
     def delete_message(self, message_id: uuid.UUID, user_id: uuid.UUID) -> bool:
         """
         Delete a message.
@@ -229,32 +231,3 @@ class MessageService:
             raise ValueError("Only the sender can delete a message")
             
         return self.message_repository.delete(message_id)
-    
-    # def get_unread_count(self, user_id: uuid.UUID, conversation_id: Optional[uuid.UUID] = None) -> int:
-    #     """
-    #     Get the count of unread messages for a user.
-        
-    #     Args:
-    #         user_id: ID of the user
-    #         conversation_id: If provided, only count unread messages in this conversation
-            
-    #     Returns:
-    #         Number of unread messages
-    #     """
-    #     criteria = {
-    #         "read_at": None,
-    #         "sender_id__ne": user_id  # Not from the user
-    #     }
-        
-    #     if conversation_id:
-    #         criteria["conversation_id"] = conversation_id
-    #     else:
-    #         # Only count messages in conversations the user is part of
-    #         conversations = self.conversation_repository.get_by_participant(user_id)
-    #         conversation_ids = [conv.id for conv in conversations]
-    #         if not conversation_ids:
-    #             return 0
-    #         criteria["conversation_id__in"] = conversation_ids
-        
-    #     messages = self.message_repository.find(criteria)
-    #     return len(messages)
@@ -0,0 +1,11 @@
+"""
+Domain exceptions for the messaging app.
+"""
+
+from core.domain.exceptions import CoreDomainException
+
+
+class NotConversationParticipantException(CoreDomainException):
+    """Raised when a user acts on a conversation that doesn't exist or that they are not part of"""
+    def __init__(self, message="Conversation not found or you are not a participant"):
+        super().__init__(message, "not_conversation_participant")
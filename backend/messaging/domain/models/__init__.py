@@ -4,6 +4,6 @@ Domain models for the messaging system.
 This package contains the domain models for the messaging system,
 including entities and value objects.
 """
-from .entities import Message, Conversation, Attachment
+from .entities import Message, Conversation, Attachment, ReadWatermark
 
-__all__ = ['Message', 'Conversation', 'Attachment']
+__all__ = ['Message', 'Conversation', 'Attachment', 'ReadWatermark']
@@ -6,5 +6,6 @@ This package contains the core domain entities for the messaging system.
 from .message import Message
 from .conversation import Conversation
 from .attachment import Attachment
+from .read_watermark import ReadWatermark
 
-__all__ = ['Message', 'Conversation', 'Attachment']
+__all__ = ['Message', 'Conversation', 'Attachment', 'ReadWatermark']
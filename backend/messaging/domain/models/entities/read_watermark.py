@@ -0,0 +1,32 @@
+"""
+Read watermark entity for the messaging system.
+
+This module defines the ReadWatermark entity, which records how far a
+participant has read in a conversation.
+"""
+from datetime import datetime
+import uuid
+
+from pydantic import BaseModel
+
+
+class ReadWatermark(BaseModel):
+    """
+    Read position of one participant in one conversation.
+    
+    Every message sent up to the watermark message is considered read by the
+    participant, so a single row per (conversation, user) replaces per-message
+    read flags.
+    
+    Attributes:
+        conversation_id: ID of the conversation
+        user_id: ID of the participant
+        last_read_message_id: ID of the newest message the participant has read
+        last_read_message_sent_at: When that message was sent
+        last_read_at: When the participant read it
+    """
+    conversation_id: uuid.UUID
+    user_id: uuid.UUID
+    last_read_message_id: uuid.UUID
+    last_read_message_sent_at: datetime
+    last_read_at: datetime
@@ -7,6 +7,7 @@ from the business logic.
 """
 from abc import ABC, abstractmethod
 from typing import List, Optional, Dict, Any
+from datetime import datetime
 import uuid
 
 from ..models import Conversation
@@ -95,6 +96,22 @@ class ConversationRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def update_last_read(self, conversation_id: uuid.UUID, user_id: uuid.UUID,
+                         read_at: Optional[datetime] = None) -> bool:
+        """
+        Record when a participant last read a conversation.
+        
+        Args:
+            conversation_id: ID of the conversation
+            user_id: ID of the participant
+            read_at: Read timestamp (default: current time)
+            
+        Returns:
+            True if the user is a participant and was updated, False otherwise
+        """
+        pass
+    
     @abstractmethod
     def delete(self, conversation_id: uuid.UUID) -> bool:
         """
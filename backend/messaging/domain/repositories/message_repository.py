@@ -10,7 +10,7 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime
 import uuid
 
-from ..models import Message
+from ..models import Message, ReadWatermark
 
 
 class MessageRepository(ABC):
@@ -35,6 +35,22 @@ class MessageRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def create_in_conversation(self, message: Message) -> Optional[Message]:
+        """
+        Create a message and bump its conversation's last_message_at atomically.
+        
+        The write only happens if the sender is a participant in the conversation.
+        
+        Args:
+            message: The message to create
+            
+        Returns:
+            The persisted message, or None if the conversation doesn't exist
+            or the sender is not a participant
+        """
+        pass
+    
     @abstractmethod
     def update(self, message: Message) -> Message:
         """
@@ -103,13 +119,44 @@ class MessageRepository(ABC):
         """
         Mark messages as read by a specific user.
         
+        Only messages the user received in conversations they participate in
+        are considered. The user's read watermark of each conversation moves
+        forward to the newest of them, never backwards.
+        
         Args:
             message_ids: List of message IDs to mark as read
             user_id: ID of the user who read the messages
             read_at: Read timestamp (default: current time)
             
         Returns:
-            Number of messages updated
+            Number of messages acknowledged
+        """
+        pass
+    
+    @abstractmethod
+    def get_unread_count(self, conversation_id: uuid.UUID, user_id: uuid.UUID) -> int:
+        """
+        Count the messages a user hasn't read in a conversation.
+        
+        Args:
+            conversation_id: ID of the conversation
+            user_id: ID of the user
+            
+        Returns:
+            Number of messages from other participants sent after the user's watermark
+        """
+        pass
+    
+    @abstractmethod
+    def get_read_watermarks(self, conversation_id: uuid.UUID) -> List[ReadWatermark]:
+        """
+        Get the read position of every participant who has read a conversation.
+        
+        Args:
+            conversation_id: ID of the conversation
+            
+        Returns:
+            List of read watermarks
         """
         pass
     
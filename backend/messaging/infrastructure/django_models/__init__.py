@@ -6,10 +6,12 @@ This package contains the Django ORM models for storing messaging data in the da
 from .message_model import MessageModel
 from .conversation_model import ConversationModel, ConversationParticipantModel
 from .attachment_model import AttachmentModel
+from .read_watermark_model import ReadWatermarkModel
 
 __all__ = [
     'MessageModel',
     'ConversationModel',
     'ConversationParticipantModel',
-    'AttachmentModel'
+    'AttachmentModel',
+    'ReadWatermarkModel'
 ]
@@ -0,0 +1,60 @@
+"""
+Django model for read watermarks.
+
+This module defines the Django ORM model storing, for each participant of a
+conversation, the newest message they have read.
+"""
+from django.db import models
+from django.conf import settings
+from .conversation_model import ConversationModel
+from .message_model import MessageModel
+
+
+class ReadWatermarkModel(models.Model):
+    """
+    Django model for per-participant read watermarks.
+    
+    One row per (conversation, user), advanced with a single UPSERT per read
+    receipt batch. Unread counts are computed from `last_read_message_sent_at`
+    using the (conversation, -sent_at) index of MessageModel.
+    
+    Attributes:
+        conversation: Foreign key to the conversation
+        user: Foreign key to the participant
+        last_read_message: Newest message the participant has read
+        last_read_message_sent_at: When that message was sent (copied for index range scans)
+        last_read_at: When the participant read it
+    """
+    conversation = models.ForeignKey(
+        ConversationModel,
+        on_delete=models.CASCADE,
+        related_name='read_watermarks'
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='read_watermarks'
+    )
+    last_read_message = models.ForeignKey(
+        MessageModel,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name='+'
+    )
+    last_read_message_sent_at = models.DateTimeField()
+    last_read_at = models.DateTimeField()
+    
+    class Meta:
+        """Meta options for the ReadWatermarkModel."""
+        app_label = 'messaging'
+        db_table = 'messaging_read_watermark'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['conversation', 'user'],
+                name='messaging_read_watermark_conversation_user'
+            ),
+        ]
+    
+    def __str__(self):
+        """String representation of the read watermark."""
+        return f"User {self.user_id} read conversation {self.conversation_id} up to {self.last_read_message_sent_at}"
@@ -4,6 +4,7 @@ Django implementation of the ConversationRepository.
 This module provides a Django ORM implementation of the ConversationRepository interface.
 """
 from typing import List, Optional, Dict, Any
+from datetime import datetime
 import uuid
 
 from django.utils import timezone
@@ -176,6 +177,27 @@ class DjangoConversationRepository(ConversationRepository):
         # Convert to domain entities
         return [self._to_domain_entity(c) for c in conversations]
     
+    def update_last_read(self, conversation_id: uuid.UUID, user_id: uuid.UUID,
+                         read_at: Optional[datetime] = None) -> bool:
+        """
+        Record when a participant last read a conversation.
+        
+        Args:
+            conversation_id: ID of the conversation
+            user_id: ID of the participant
+            read_at: Read timestamp (default: current time)
+            
+        Returns:
+            True if the user is a participant and was updated, False otherwise
+        """
+        if read_at is None:
+            read_at = timezone.now()
+            
+        return ConversationParticipantModel.objects.filter(
+            conversation_id=conversation_id,
+            user_id=user_id
+        ).update(last_read_at=read_at) > 0
+    
     def delete(self, conversation_id: uuid.UUID) -> bool:
         """
         Delete a conversation.
@@ -7,10 +7,14 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime
 import uuid
 
+from django.db import connection, transaction
+from django.db.models import Exists, Q, Subquery
 from django.utils import timezone
 
-from ...domain import (Message, MessageRepository)
-from ..django_models import MessageModel
+from ...domain import (Message, MessageRepository, ReadWatermark)
+from ..django_models import (
+    ConversationModel, ConversationParticipantModel, MessageModel, ReadWatermarkModel
+)
 
 
 class DjangoMessageRepository(MessageRepository):
@@ -21,6 +25,38 @@ class DjangoMessageRepository(MessageRepository):
     to interact with the database.
     """
     
+    # Read receipt batch: validate, advance the watermarks and stamp first reads
+    # in one round trip. Data-modifying CTEs run even when not referenced.
+    MARK_AS_READ_SQL = f"""
+        WITH valid AS (
+            SELECT m.id, m.conversation_id, m.sent_at
+            FROM {MessageModel._meta.db_table} m
+            JOIN {ConversationParticipantModel._meta.db_table} p
+              ON p.conversation_id = m.conversation_id AND p.user_id = %(user_id)s
+            WHERE m.id = ANY(%(message_ids)s::uuid[]) AND m.sender_id <> %(user_id)s
+        ),
+        newest AS (
+            SELECT DISTINCT ON (conversation_id) conversation_id, id, sent_at
+            FROM valid
+            ORDER BY conversation_id, sent_at DESC, id DESC
+        ),
+        watermarks AS (
+            INSERT INTO {ReadWatermarkModel._meta.db_table} AS w
+                (conversation_id, user_id, last_read_message_id, last_read_message_sent_at, last_read_at)
+            SELECT conversation_id, %(user_id)s, id, sent_at, %(read_at)s FROM newest
+            ON CONFLICT (conversation_id, user_id) DO UPDATE SET
+                last_read_message_id = EXCLUDED.last_read_message_id,
+                last_read_message_sent_at = EXCLUDED.last_read_message_sent_at,
+                last_read_at = EXCLUDED.last_read_at
+            WHERE w.last_read_message_sent_at < EXCLUDED.last_read_message_sent_at
+        ),
+        first_reads AS (
+            UPDATE {MessageModel._meta.db_table} SET read_at = %(read_at)s
+            WHERE id IN (SELECT id FROM valid) AND read_at IS NULL
+        )
+        SELECT count(*) FROM valid
+    """
+    
     def create(self, message: Message) -> Message:
         """
         Create a new message in the database.
@@ -48,6 +84,47 @@ class DjangoMessageRepository(MessageRepository):
         # Convert back to domain entity
         return self._to_domain_entity(message_model)
     
+    def create_in_conversation(self, message: Message) -> Optional[Message]:
+        """
+        Create a message and bump its conversation's last_message_at atomically.
+        
+        Runs as one INSERT and one UPDATE in a transaction. The UPDATE is
+        filtered on the sender's participation, so it doubles as the
+        participant check: when it matches no row the insert is rolled back.
+        
+        Args:
+            message: The message to create
+            
+        Returns:
+            The persisted message, or None if the conversation doesn't exist
+            or the sender is not a participant
+        """
+        message_dict = message.model_dump()
+        with transaction.atomic():
+            message_model = MessageModel.objects.create(
+                id=message_dict['id'],
+                conversation_id=message_dict['conversation_id'],
+                sender_id=message_dict['sender_id'],
+                content=message_dict['content'],
+                content_type=message_dict['content_type'],
+                sent_at=message_dict['sent_at'],
+                delivered_at=message_dict['delivered_at'],
+                read_at=message_dict['read_at'],
+                metadata=message_dict['metadata']
+            )
+            
+            # Queryset update: no save(), no post_save signal, no participant re-sync
+            updated = ConversationModel.objects.filter(
+                id=message_model.conversation_id,
+                conversation_participants__user_id=message_model.sender_id
+            ).update(last_message_at=message_model.sent_at)
+            
+            if not updated:
+                transaction.set_rollback(True)
+                return None
+        
+        return self._to_domain_entity(message_model)
+    
     def update(self, message: Message) -> Message:
         """
         Update an existing message in the database.
@@ -165,29 +242,84 @@ class DjangoMessageRepository(MessageRepository):
         """
         Mark messages as read by a specific user.
         
+        The whole batch is one statement: it keeps the IDs the user received
+        in conversations they participate in, upserts the user's watermark of
+        each conversation to the newest of them (only moving it forward) and
+        stamps the legacy `read_at` of messages read for the first time.
+        
         Args:
             message_ids: List of message IDs to mark as read
             user_id: ID of the user who read the messages
             read_at: Read timestamp (default: current time)
             
         Returns:
-            Number of messages updated
+            Number of messages acknowledged
         """
         if not message_ids:
             return 0
             
         if read_at is None:
             read_at = timezone.now()
+        
+        with connection.cursor() as cursor:
+            cursor.execute(self.MARK_AS_READ_SQL, {
+                'message_ids': [str(message_id) for message_id in message_ids],
+                'user_id': str(user_id),
+                'read_at': read_at
+            })
+            return cursor.fetchone()[0]
+    
+    def get_unread_count(self, conversation_id: uuid.UUID, user_id: uuid.UUID) -> int:
+        """
+        Count the messages a user hasn't read in a conversation.
+        
+        A range scan of the (conversation, -sent_at) index above the user's
+        watermark, in a single query.
+        
+        Args:
+            conversation_id: ID of the conversation
+            user_id: ID of the user
             
-        # Update the messages
-        # Note: In a more complex system, we might track read status per user
-        # rather than a single read_at timestamp
-        updated = MessageModel.objects.filter(
-            id__in=message_ids,
-            read_at__isnull=True  # Only update if not already read
-        ).update(read_at=read_at)
+        Returns:
+            Number of messages from other participants sent after the user's watermark
+        """
+        watermark = ReadWatermarkModel.objects.filter(
+            conversation_id=conversation_id,
+            user_id=user_id
+        ).values('last_read_message_sent_at')[:1]
         
-        return updated
+        return MessageModel.objects.filter(
+            conversation_id=conversation_id
+        ).exclude(
+            sender_id=user_id
+        ).filter(
+            Q(sent_at__gt=Subquery(watermark)) | ~Exists(watermark)
+        ).count()
+    
+    def get_read_watermarks(self, conversation_id: uuid.UUID) -> List[ReadWatermark]:
+        """
+        Get the read position of every participant who has read a conversation.
+        
+        Args:
+            conversation_id: ID of the conversation
+            
+        Returns:
+            List of read watermarks
+        """
+        watermarks = ReadWatermarkModel.objects.filter(
+            conversation_id=conversation_id,
+            last_read_message__isnull=False
+        )
+        return [
+            ReadWatermark(
+                conversation_id=watermark.conversation_id,
+                user_id=watermark.user_id,
+                last_read_message_id=watermark.last_read_message_id,
+                last_read_message_sent_at=watermark.last_read_message_sent_at,
+                last_read_at=watermark.last_read_at
+            )
+            for watermark in watermarks
+        ]
     
     def delete(self, message_id: uuid.UUID) -> bool:
         """
@@ -219,8 +351,8 @@ class DjangoMessageRepository(MessageRepository):
         # Create a Pydantic model from the Django model
         return Message(
             id=model.id,
-            conversation_id=model.conversation.id,
-            sender_id=model.sender.id,
+            conversation_id=model.conversation_id,
+            sender_id=model.sender_id,
             content=model.content,
             content_type=model.content_type,
             sent_at=model.sent_at,
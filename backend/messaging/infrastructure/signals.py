@@ -2,6 +2,8 @@
 Signal handlers for the messaging system.
 
 This module contains Django signal handlers for various events in the messaging system.
+New messages are not broadcast from here: the send path broadcasts them once
+(see websocket/broadcast.py).
 """
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
@@ -10,65 +12,9 @@ from channels.layers import get_channel_layer
 
 from .django_models.message_model import MessageModel
 from .django_models.conversation_model import ConversationModel
-from ..domain.models.entities.message import Message
 from ..domain.models.entities.conversation import Conversation
 
 
-@receiver(post_save, sender=MessageModel)
-def message_saved(sender, instance, created, **kwargs):
-    """
-    Handle message save events.
-    
-    This signal handler is triggered when a message is saved to the database.
-    It broadcasts the message to all participants in the conversation via WebSockets.
-    
-    Args:
-        sender: The model class that sent the signal
-        instance: The actual instance being saved
-        created: A boolean indicating if this is a new instance
-        **kwargs: Additional keyword arguments
-    """
-    # Convert the message model to a domain entity
-    message = Message(
-        id=instance.id,
-        conversation_id=instance.conversation_id,
-        sender_id=instance.sender_id,
-        content=instance.content,
-        content_type=instance.content_type,
-        sent_at=instance.sent_at,
-        delivered_at=instance.delivered_at,
-        read_by=instance.read_by,
-        metadata=instance.metadata or {}
-    )
-    
-    # Get the channel layer
-    channel_layer = get_channel_layer()
-    
-    # Prepare the message data for WebSocket broadcast
-    message_data = {
-        'type': 'chat.message',
-        'message': {
-            'id': str(message.id),
-            'conversation_id': str(message.conversation_id),
-            'sender_id': str(message.sender_id),
-            'content': message.content,
-            'content_type': message.content_type,
-            'sent_at': message.sent_at.isoformat() if message.sent_at else None,
-            'delivered_at': message.delivered_at.isoformat() if message.delivered_at else None,
-            'read_by': [str(user_id) for user_id in message.read_by],
-            'metadata': message.metadata
-        },
-        'event': 'message.created' if created else 'message.updated'
-    }
-    
-    # Broadcast the message to the conversation group
-    group_name = f'conversation_{message.conversation_id}'
-    async_to_sync(channel_layer.group_send)(
-        group_name,
-        message_data
-    )
-
-
 @receiver(post_delete, sender=MessageModel)
 def message_deleted(sender, instance, **kwargs):
     """
@@ -0,0 +1,57 @@
+"""
+Broadcasting of chat events to conversation groups.
+
+Every new message is sent to its conversation group exactly once, either by
+the WebSocket handler that created it or, for messages created over the REST
+API, by broadcast_message_created.
+"""
+import uuid
+from typing import Any, Dict
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+
+from ...domain.models import Message
+
+
+def conversation_group_name(conversation_id: uuid.UUID) -> str:
+    """
+    Get the channel group name of a conversation.
+    
+    Args:
+        conversation_id: ID of the conversation
+        
+    Returns:
+        Channel layer group name
+    """
+    return f"conversation_{conversation_id}"
+
+
+def message_created_event(message: Message) -> Dict[str, Any]:
+    """
+    Build the channel layer event announcing a new message.
+    
+    Args:
+        message: The persisted message
+        
+    Returns:
+        Event dispatched to ChatConsumer.chat_message
+    """
+    from .serializers import MessageSerializer
+    return {
+        "type": "chat_message",
+        "message": MessageSerializer(message).data
+    }
+
+
+def broadcast_message_created(message: Message) -> None:
+    """
+    Send a new message to its conversation group from synchronous code.
+    
+    Args:
+        message: The persisted message
+    """
+    async_to_sync(get_channel_layer().group_send)(
+        conversation_group_name(message.conversation_id),
+        message_created_event(message)
+    )
@@ -203,3 +203,14 @@ class ChatConsumer(BaseConsumer):
             return False
         
         return uuid.UUID(str(user_id)) in conversation.participants
+    
+    @database_sync_to_async
+    def update_last_read(self) -> None:
+        """
+        Update the user's last read timestamp for the conversation.
+        """
+        conversation_service = ServiceFactory.get_conversation_service()
+        conversation_service.update_last_read(
+            conversation_id=self.conversation_id,
+            user_id=uuid.UUID(str(self.user.id))
+        )
@@ -11,6 +11,7 @@ from typing import Dict, Any, List
 from channels.db import database_sync_to_async
 
 from .base import BaseHandler
+from ..broadcast import message_created_event
 from ....infrastructure.factory import ServiceFactory
 
 # Set up logging
@@ -60,13 +61,10 @@ class MessageHandler(BaseHandler):
                 metadata=metadata
             )
             
-            # Broadcast the message to all participants
+            # The only broadcast of this message
             await self.consumer.channel_layer.group_send(
                 self.consumer.group_name,
-                {
-                    "type": "chat_message",
-                    "message": self.consumer.serialize_message(message)
-                }
+                message_created_event(message)
             )
         except Exception as e:
             logger.exception("Error creating message")
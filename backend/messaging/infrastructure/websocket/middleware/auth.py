@@ -16,6 +16,7 @@ from channels.db import database_sync_to_async
 
 # Import from the_user_app for token blacklist checking and validation
 from the_user_app.infrastructure.factory import UserFactory
+from the_user_app.infrastructure.services.user_snapshot_cache import get_user_snapshot
 
 from rest_framework_simplejwt.tokens import UntypedToken
 from rest_framework_simplejwt.exceptions import TokenError
@@ -108,14 +109,20 @@ class JwtAuthMiddleware(BaseMiddleware):
     @database_sync_to_async
     def get_user(self, user_id):
         """
-        Get a user by ID.
+        Get an active user by ID, through the short-lived user snapshot cache.
         
         Args:
             user_id: ID of the user
             
         Returns:
-            User object if found, None otherwise
+            User object if found and active, None otherwise
         """
+        user = get_user_snapshot(user_id, lambda: self._load_user(user_id))
+        if user is None or not user.is_active:
+            return None
+        return user
+    
+    def _load_user(self, user_id):
         try:
             return self.User.objects.get(id=user_id)
         except self.User.DoesNotExist:
@@ -9,7 +9,9 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 import uuid
 
+from ....domain.exceptions import NotConversationParticipantException
 from ....infrastructure.factory import ServiceFactory
+from ....infrastructure.websocket.broadcast import broadcast_message_created
 from ..serializers import (
     MessageSerializer,
     MessageCreateSerializer,
@@ -56,15 +58,7 @@ class MessageViewSet(viewsets.ViewSet):
             user_id = uuid.UUID(str(request.user.id))
             conversation_id = serializer.validated_data["conversation_id"]
             
-            # Verify the user is a participant in the conversation
-            conversation = self.conversation_service.get_conversation(conversation_id)
-            if not conversation or user_id not in conversation.participants:
-                return Response(
-                    {"error": "Conversation not found or you are not a participant"},
-                    status=status.HTTP_403_FORBIDDEN
-                )
-            
-            # Create the message
+            # Create the message, the participant check is part of the write
             message = self.message_service.send_message(
                 conversation_id=conversation_id,
                 sender_id=user_id,
@@ -72,16 +66,24 @@ class MessageViewSet(viewsets.ViewSet):
                 content_type=serializer.validated_data.get("content_type", "text"),
                 metadata=serializer.validated_data.get("metadata", {})
             )
-            
-            # Serialize the message
-            response_serializer = MessageSerializer(message)
-            
-            return Response(response_serializer.data, status=status.HTTP_201_CREATED)
+        except NotConversationParticipantException:
+            return Response(
+                {"error": "Conversation not found or you are not a participant"},
+                status=status.HTTP_403_FORBIDDEN
+            )
         except ValueError as e:
             return Response(
                 {"error": str(e)},
                 status=status.HTTP_400_BAD_REQUEST
             )
+        
+        # Deliver the message to connected participants
+        broadcast_message_created(message)
+        
+        # Serialize the message
+        response_serializer = MessageSerializer(message)
+        
+        return Response(response_serializer.data, status=status.HTTP_201_CREATED)
     
     def retrieve(self, request, pk=None):
         """
@@ -0,0 +1,102 @@
+import time
+import uuid
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from messaging.infrastructure.django_models import (
+    ConversationModel, ConversationParticipantModel, MessageModel
+)
+from messaging.infrastructure.factory import RepositoryFactory, ServiceFactory
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmarks marking a batch of messages read: the previous per-message '
+        'validation (two lookups per ID) against the single-statement watermark '
+        'upsert. Runs inside a transaction that is rolled back.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--messages', type=int, default=500, help='Messages in the receipt batch')
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            message_ids, reader_id, conversation_id = self._create_fixture(options['messages'])
+
+            before_time, before_queries = self._measure(lambda: self._legacy_mark_as_read(message_ids, reader_id))
+            # Reset so the second run does the same amount of work
+            MessageModel.objects.filter(id__in=message_ids).update(read_at=None)
+
+            message_service = ServiceFactory.get_message_service()
+            after_time, after_queries = self._measure(
+                lambda: message_service.mark_as_read(message_ids=message_ids, user_id=reader_id)
+            )
+            unread = message_service.get_unread_count(conversation_id, reader_id)
+
+            transaction.set_rollback(True)
+
+        count = len(message_ids)
+        self.stdout.write(f'before: {before_time * 1000:.1f}ms, {before_queries} queries for {count} messages')
+        self.stdout.write(f'after:  {after_time * 1000:.1f}ms, {after_queries} queries for {count} messages')
+        self.stdout.write(f'unread after the batch: {unread}')
+        self.stdout.write(self.style.SUCCESS('Benchmark complete'))
+
+    def _create_fixture(self, count):
+        User = get_user_model()
+        run_id = uuid.uuid4().hex[:8]
+        sender = User.objects.create_user(email=f'receipts-{run_id}-sender@example.com', first_name='Sender')
+        reader = User.objects.create_user(email=f'receipts-{run_id}-reader@example.com', first_name='Reader')
+
+        conversation = ConversationModel.objects.create(type='direct')
+        ConversationParticipantModel.objects.bulk_create([
+            ConversationParticipantModel(conversation=conversation, user=sender),
+            ConversationParticipantModel(conversation=conversation, user=reader),
+        ])
+
+        started = timezone.now() - timedelta(hours=1)
+        messages = MessageModel.objects.bulk_create([
+            MessageModel(
+                conversation=conversation,
+                sender=sender,
+                content=f'message {i}'
+            )
+            for i in range(count)
+        ])
+        # sent_at is auto_now_add, spread it out so the watermark has an order to follow
+        for i, message in enumerate(messages):
+            message.sent_at = started + timedelta(seconds=i)
+        MessageModel.objects.bulk_update(messages, ['sent_at'])
+
+        return [message.id for message in messages], reader.id, conversation.id
+
+    @staticmethod
+    def _legacy_mark_as_read(message_ids, user_id):
+        """The previous validation: a message and a conversation lookup per ID"""
+        message_repository = RepositoryFactory.get_message_repository()
+        conversation_repository = RepositoryFactory.get_conversation_repository()
+        valid_message_ids = []
+        for message_id in message_ids:
+            message = message_repository.get_by_id(message_id)
+            if not message:
+                continue
+            conversation = conversation_repository.get_by_id(message.conversation_id)
+            if not conversation or user_id not in conversation.participants:
+                continue
+            if message.sender_id != user_id:
+                valid_message_ids.append(message_id)
+        return MessageModel.objects.filter(
+            id__in=valid_message_ids, read_at__isnull=True
+        ).update(read_at=timezone.now())
+
+    @staticmethod
+    def _measure(operation):
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            operation()
+            elapsed = time.perf_counter() - started
+        return elapsed, len(queries.captured_queries)
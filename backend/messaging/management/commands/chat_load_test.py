@@ -0,0 +1,128 @@
+import asyncio
+import time
+import uuid
+
+from asgiref.sync import async_to_sync
+from channels.routing import URLRouter
+from channels.testing import WebsocketCommunicator
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import override_settings
+
+from core.management.query_counter import QueryCounter
+from messaging.infrastructure.django_models import ConversationModel, ConversationParticipantModel
+from messaging.infrastructure.websocket.routing import websocket_urlpatterns
+
+
+class Command(BaseCommand):
+    help = (
+        'WebSocket load test for the chat send path. Connects several participants '
+        'to one conversation over the in-memory channel layer, sends messages through '
+        'ChatConsumer and reports messages/sec, DB queries per message and frames '
+        'received per message per client (1.0 means a single broadcast).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--clients', type=int, default=5, help='Connected participants')
+        parser.add_argument('--messages', type=int, default=200, help='Messages sent in total')
+        parser.add_argument('--timeout', type=float, default=5.0,
+                            help='Seconds to wait for a frame before giving up')
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        run_id = uuid.uuid4().hex[:8]
+
+        users = [
+            User.objects.create_user(
+                email=f'chat-load-{run_id}-{i}@example.com',
+                password=None,
+                first_name=f'Load {i}'
+            )
+            for i in range(options['clients'])
+        ]
+        conversation = ConversationModel.objects.create(type='group', title=f'Load test {run_id}')
+        for user in users:
+            ConversationParticipantModel.objects.create(conversation=conversation, user=user)
+
+        counter = QueryCounter(enabled=False)
+        try:
+            # Consumers run their sync DB calls on this thread, so one wrapper sees them all
+            with override_settings(CHANNEL_LAYERS={'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}}), \
+                    connection.execute_wrapper(counter):
+                elapsed, frames = async_to_sync(self._run)(conversation.id, users, counter, options)
+        finally:
+            conversation.delete()
+            User.objects.filter(id__in=[user.id for user in users]).delete()
+
+        messages = options['messages']
+        self.stdout.write(f'{messages} messages in {elapsed:.2f}s: {messages / elapsed:.1f} messages/sec')
+        self.stdout.write(f'DB queries per message: {counter.count / messages:.2f}')
+        self.stdout.write(
+            f'Frames per message per client: {frames / (messages * len(users)):.2f}'
+        )
+        self.stdout.write(self.style.SUCCESS('Load test complete'))
+
+    async def _run(self, conversation_id, users, counter, options):
+        application = URLRouter(websocket_urlpatterns)
+        communicators = []
+        for user in users:
+            communicator = WebsocketCommunicator(
+                application, f'/ws/messaging/conversations/{conversation_id}/'
+            )
+            communicator.scope['user'] = user
+            connected, _ = await communicator.connect()
+            if not connected:
+                raise RuntimeError(f'User {user.id} could not connect')
+            communicators.append(communicator)
+
+        # Skip the connection and presence frames
+        for communicator in communicators:
+            await self._drain(communicator)
+
+        messages = options['messages']
+        counter.enabled = True
+        started = time.perf_counter()
+
+        for i in range(messages):
+            sender = communicators[i % len(communicators)]
+            await sender.send_json_to({'type': 'message', 'content': f'load test message {i}'})
+
+        received = await asyncio.gather(*[
+            self._receive_messages(communicator, messages, options['timeout'])
+            for communicator in communicators
+        ])
+
+        elapsed = time.perf_counter() - started
+        counter.enabled = False
+
+        # Count duplicates that arrive after every client has all messages
+        for index, communicator in enumerate(communicators):
+            received[index] += await self._drain(communicator, count_type='message')
+            await communicator.disconnect()
+
+        return elapsed, sum(received)
+
+    @staticmethod
+    async def _receive_messages(communicator, expected, timeout):
+        """Receive frames until `expected` message frames arrived"""
+        count = 0
+        while count < expected:
+            frame = await communicator.receive_json_from(timeout=timeout)
+            if frame.get('type') == 'message':
+                count += 1
+            elif frame.get('type') == 'error':
+                raise RuntimeError(frame['data']['message'])
+        return count
+
+    @staticmethod
+    async def _drain(communicator, count_type=None, timeout=0.2):
+        """Read pending frames, returning how many had type `count_type`"""
+        count = 0
+        while True:
+            try:
+                frame = await communicator.receive_json_from(timeout=timeout)
+            except asyncio.TimeoutError:
+                return count
+            if count_type and frame.get('type') == count_type:
+                count += 1
@@ -0,0 +1,113 @@
+import asyncio
+import statistics
+import time
+import uuid
+from datetime import timedelta
+
+from asgiref.sync import async_to_sync
+from channels.generic.websocket import AsyncWebsocketConsumer
+from channels.testing import WebsocketCommunicator
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import override_settings
+from django.utils import timezone
+
+from core.management.query_counter import QueryCounter
+from messaging.infrastructure.websocket.middleware.auth import JwtAuthMiddlewareStack
+from the_user_app.infrastructure.django_models.orm_models import BlacklistedTokenModel
+from the_user_app.infrastructure.factory import UserFactory
+from the_user_app.infrastructure.services.user_snapshot_cache import USER_SNAPSHOT_KEY
+
+
+class AuthenticatedEchoConsumer(AsyncWebsocketConsumer):
+    """Accepts authenticated connections, so the handshake cost is the auth cost"""
+
+    async def connect(self):
+        if self.scope["user"].is_authenticated:
+            await self.accept()
+        else:
+            await self.close(code=4001)
+
+
+class Command(BaseCommand):
+    help = (
+        'Reconnect storm against the websocket JWT middleware. Many clients reconnect '
+        'at once with valid tokens; reports connects/sec, p50/p99 handshake latency and '
+        'DB queries per connect, first with the blacklist filter and user snapshot cache '
+        'disabled, then enabled.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=50, help='Distinct users reconnecting')
+        parser.add_argument('--connects', type=int, default=2000, help='Handshakes per phase')
+        parser.add_argument('--concurrency', type=int, default=200, help='Handshakes in flight')
+        parser.add_argument('--blacklisted', type=int, default=10000,
+                            help='Unrelated blacklisted tokens seeded in the table')
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        run_id = uuid.uuid4().hex[:8]
+        auth_repository = UserFactory.create_auth_repository()
+
+        users = [
+            User.objects.create_user(email=f'storm-{run_id}-{i}@example.com', first_name=f'Storm {i}')
+            for i in range(options['users'])
+        ]
+        tokens = [auth_repository.create_tokens(user.id).access_token for user in users]
+
+        expires_at = timezone.now() + timedelta(days=1)
+        BlacklistedTokenModel.objects.bulk_create([
+            BlacklistedTokenModel(token=f'storm-{run_id}-{i}', user=users[0], expires_at=expires_at)
+            for i in range(options['blacklisted'])
+        ], batch_size=5000)
+
+        try:
+            with override_settings(AUTH_TOKEN_BLACKLIST_FILTER_ENABLED=False,
+                                   AUTH_USER_SNAPSHOT_TTL_SECONDS=0):
+                self._report('uncached', self._run_phase(tokens, options))
+
+            UserFactory.create_token_blacklist_filter().rebuild()
+            cache.delete_many([USER_SNAPSHOT_KEY.format(user.id) for user in users])
+            self._report('cached', self._run_phase(tokens, options))
+        finally:
+            # Cascades to the seeded blacklist rows
+            User.objects.filter(id__in=[user.id for user in users]).delete()
+
+        self.stdout.write(self.style.SUCCESS('Reconnect storm complete'))
+
+    def _run_phase(self, tokens, options):
+        counter = QueryCounter()
+        with connection.execute_wrapper(counter):
+            started = time.perf_counter()
+            latencies = async_to_sync(self._storm)(tokens, options['connects'], options['concurrency'])
+            elapsed = time.perf_counter() - started
+        return latencies, elapsed, counter.count
+
+    async def _storm(self, tokens, connects, concurrency):
+        application = JwtAuthMiddlewareStack(AuthenticatedEchoConsumer.as_asgi())
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def reconnect(i):
+            async with semaphore:
+                communicator = WebsocketCommunicator(application, f'/ws/?token={tokens[i % len(tokens)]}')
+                started = time.perf_counter()
+                connected, _ = await communicator.connect()
+                latency = time.perf_counter() - started
+                await communicator.disconnect()
+                if not connected:
+                    raise RuntimeError('Handshake rejected for a valid token')
+                return latency
+
+        return await asyncio.gather(*[reconnect(i) for i in range(connects)])
+
+    def _report(self, label, result):
+        latencies, elapsed, queries = result
+        ordered = sorted(latencies)
+        p99 = ordered[max(int(len(ordered) * 0.99) - 1, 0)]
+        self.stdout.write(
+            f'{label:>8}: {len(ordered) / elapsed:.1f} connects/sec, '
+            f'p50 {statistics.median(ordered) * 1000:.1f}ms, p99 {p99 * 1000:.1f}ms, '
+            f'{queries / len(ordered):.2f} queries/connect'
+        )
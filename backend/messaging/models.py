@@ -8,8 +8,9 @@ from messaging.infrastructure.django_models import (
     MessageModel as Message,
     ConversationModel as Conversation,
     ConversationParticipantModel as ConversationParticipant,
-    AttachmentModel as Attachment
+    AttachmentModel as Attachment,
+    ReadWatermarkModel as ReadWatermark
 )
 
 # Re-export models with simplified names for Django admin and migrations
-__all__ = ['Message', 'Conversation', 'ConversationParticipant', 'Attachment']
+__all__ = ['Message', 'Conversation', 'ConversationParticipant', 'Attachment', 'ReadWatermark']
@@ -3,6 +3,8 @@ from typing import List, Tuple, Optional
 from decimal import Decimal
 from datetime import datetime
 
+from django.db import transaction
+
 from orders.domain.models.entities import Order
 from orders.domain.models.constants import OrderStatus, OrderEventType
 from orders.domain.repositories.repository_interfaces import (
@@ -64,7 +66,7 @@ class OrderApplicationService:
         total_items = sum(item['quantity'] for item in items)
         total_amount = sum(Decimal(str(item['product_price'])) * item['quantity'] for item in items)
         
-        # Create order with items in a single transaction
+        # Create order with items and its timeline event in a single transaction
         order = self.order_repository.create_with_items(
             user_id=user_id, 
             store_brand_id=store_brand_id, 
@@ -76,14 +78,8 @@ class OrderApplicationService:
             cart_id=None,
             store_brand_name=store_brand_name,
             store_brand_image_logo=store_brand_image_logo,
-            user_store_distance=user_store_distance
-        )
-        
-        # Create timeline event
-        self.order_timeline_repository.create(
-            order.id,
-            OrderEventType.CREATED,
-            f"Order created with {len(items)} items"
+            user_store_distance=user_store_distance,
+            timeline_notes=f"Order created with {len(items)} items"
         )
         
         # Publish domain event
@@ -93,66 +89,65 @@ class OrderApplicationService:
         
         return True, "Order created successfully", order
         
-    def create_order_from_cart(self, cart_id: uuid.UUID, store_brand_address: str, user_store_distance: float = 0.0) -> Tuple[bool, str, Optional[Order]]:
+    def create_order_from_cart(self, cart_id: uuid.UUID, store_brand_address: str = "",
+                               user_store_distance: float = 0.0) -> Tuple[bool, str, Optional[Order]]:
         """
         Create a new order from an existing cart
         
+        The cart is read in the same transaction that writes the order, its
+        items and its timeline event, so the order holds the committed cart
+        rather than a cached copy. The order is returned as created, without
+        reloading it.
+        
         Args:
             cart_id: UUID of the cart to convert
+            store_brand_address: Address of the store brand
             user_store_distance: Distance between user and store in meters
             
         Returns:
             Tuple of (success, message, order)
         """
-        # Get cart with items using the cart service
-        cart = self.cart_service.get_cart(cart_id)
-        if not cart:
-            return False, "Cart not found", None
+        with transaction.atomic():
+            # Inside a transaction the hydrated cart cache is bypassed
+            cart = self.cart_service.get_cart(cart_id)
+            if not cart:
+                return False, "Cart not found", None
+                
+            if cart.is_empty():
+                return False, "Cart is empty", None
             
-        if cart.is_empty():
-            return False, "Cart is empty", None
-        
-        # Validate user exists
-        user_info = self.user_service.get_user_by_id(cart.user_id)
-        if not user_info:
-            return False, "User not found", None
-        
-        # Convert cart items to the format expected by create_with_items
-        items_data = [
-            {
-                'store_product_id': item.store_product_id,
-                'quantity': item.quantity,
-                'product_name': item.product_name,
-                'product_image_url': item.product_image_url,
-                'product_image_thumbnail': item.product_image_thumbnail,
-                'product_price': item.product_price,
-                'product_description': item.product_description,
-                'item_total_price': item.item_total_price
-            } for item in cart.items
-        ]
-        
-        # Create order with items in a single transaction
-        order = self.order_repository.create_with_items(
-            user_id=cart.user_id,
-            store_brand_id=cart.store_brand_id,
-            items_data=items_data,
-            cart_total_price=cart.cart_total_price,
-            cart_total_items=cart.cart_total_items,
-            status=OrderStatus.PENDING,
-            payment_id=None,
-            cart_id=cart_id,
-            store_brand_name=cart.store_brand_name,
-            store_brand_image_logo=cart.store_brand_image_logo,
-            user_store_distance=user_store_distance,
-            store_brand_address=store_brand_address,
-        )
-        
-        # Create timeline event
-        self.order_timeline_repository.create(
-            order.id,
-            OrderEventType.CREATED,
-            f"Order created from cart with {len(cart.items)} items"
-        )
+            # No user check: a cart is deleted with its user
+            
+            # Convert cart items to the format expected by create_with_items
+            items_data = [
+                {
+                    'store_product_id': item.store_product_id,
+                    'quantity': item.quantity,
+                    'product_name': item.product_name,
+                    'product_image_url': item.product_image_url,
+                    'product_image_thumbnail': item.product_image_thumbnail,
+                    'product_price': item.product_price,
+                    'product_description': item.product_description,
+                    'item_total_price': item.item_total_price
+                } for item in cart.items
+            ]
+            
+            # The order, its items and its timeline event join this transaction
+            order = self.order_repository.create_with_items(
+                user_id=cart.user_id,
+                store_brand_id=cart.store_brand_id,
+                items_data=items_data,
+                cart_total_price=cart.cart_total_price,
+                cart_total_items=cart.cart_total_items,
+                status=OrderStatus.PENDING,
+                payment_id=None,
+                cart_id=cart_id,
+                store_brand_name=cart.store_brand_name,
+                store_brand_image_logo=cart.store_brand_image_logo,
+                user_store_distance=user_store_distance,
+                store_brand_address=store_brand_address,
+                timeline_notes=f"Order created from cart with {len(cart.items)} items"
+            )
         
         # Publish domain event
         event_bus.publish(OrderCreatedEvent.create(
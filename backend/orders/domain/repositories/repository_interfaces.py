@@ -42,9 +42,10 @@ class OrderRepository(ABC):
                          store_brand_name: str = "",
                          store_brand_image_logo: str = "",
                          store_brand_address: str = "",
-                         user_store_distance: float = 0.0
+                         user_store_distance: float = 0.0,
+                         timeline_notes: Optional[str] = None
                          ) -> Order:
-        """Create a new order with its items in a single transaction
+        """Create a new order with its items and its creation timeline event in a single transaction
         
         Args:
             user_id: User ID
@@ -59,9 +60,10 @@ class OrderRepository(ABC):
             store_brand_image_logo: Store brand logo URL
             store_brand_address: Store brand address
             user_store_distance: Distance between user and store in meters
+            timeline_notes: Notes of the creation timeline event
             
         Returns:
-            Order domain entity with items
+            Order domain entity with items, fee and total price
         """
         pass
     
@@ -1,13 +1,17 @@
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 from decimal import Decimal
+import uuid
 from django.db import transaction
 from datetime import datetime
 
+from orders.domain.models.constants import OrderEventType
 from orders.domain.models.entities import Order, OrderItem
 from orders.domain.repositories.repository_interfaces import OrderRepository
-from orders.infrastructure.django_models.orm_models import OrderModel, OrderItemModel
-from .order_utils import order_model_to_domain, calculate_order_fee_and_total
+from orders.infrastructure.django_models.orm_models import OrderModel, OrderItemModel, OrderTimelineModel
+from .order_utils import order_model_to_domain
+
+CENTS = Decimal('0.01')
 
 
 class DjangoOrderRepository(OrderRepository):
@@ -25,9 +29,14 @@ class DjangoOrderRepository(OrderRepository):
                          store_brand_name: str = "",
                          store_brand_image_logo: str = "",
                          store_brand_address: str = "",
-                         user_store_distance: float = 0.0
+                         user_store_distance: float = 0.0,
+                         timeline_notes: Optional[str] = None
                          ) -> Order:
-        """Create a new order with its items in a single transaction
+        """Create a new order with its items and its creation timeline event in a single transaction
+        
+        The fee and total price are computed from the in-memory order before
+        anything is written, and the entity is returned without reloading it:
+        three INSERTs (order, items, timeline event) whatever the number of items.
         
         Args:
             user_id: User ID
@@ -42,78 +51,91 @@ class DjangoOrderRepository(OrderRepository):
             store_brand_image_logo: Store brand logo URL
             store_brand_address: Store brand address
             user_store_distance: Distance between user and store in meters
+            timeline_notes: Notes of the creation timeline event
             
         Returns:
             Order domain entity with items
         """
+        order_id = uuid.uuid4()
+        
+        order_items = []
+        item_models = []
+        for item_data in items_data:
+            quantity = item_data.get('quantity')
+            product_price = Decimal(str(item_data.get('product_price')))
+            item_model = OrderItemModel(
+                order_id=order_id,
+                store_product_id=item_data.get('store_product_id'),
+                quantity=quantity,
+                product_price=product_price,
+                item_total_price=product_price * quantity
+            )
+            item_models.append(item_model)
+            
+            order_items.append(OrderItem(
+                id=item_model.id,
+                order_id=order_id,
+                store_product_id=item_data.get('store_product_id'),
+                quantity=quantity,
+                product_name=item_data.get('product_name'),
+                product_image_url=item_data.get('product_image_url'),
+                product_image_thumbnail=item_data.get('product_image_thumbnail'),
+                product_price=float(product_price),
+                product_description=item_data.get('product_description'),
+                item_total_price=float(item_model.item_total_price)
+            ))
+        
+        order = Order(
+            id=order_id,
+            user_id=user_id,
+            store_brand_id=store_brand_id,
+            cart_id=cart_id,
+            store_brand_name=store_brand_name,
+            store_brand_image_logo=store_brand_image_logo,
+            store_brand_address=store_brand_address,
+            items=order_items,
+            cart_total_price=cart_total_price,
+            cart_total_items=cart_total_items,
+            status=status,
+            fee=0.0,
+            order_total_price=0.0,
+            total_time=0.0,
+            user_store_distance=user_store_distance,
+            payment_id=payment_id
+        )
+        
+        # Same rounding as the stored columns, so the entity matches a reload
+        order.calculate_order_total_price()
+        fee = Decimal(str(order.fee)).quantize(CENTS)
+        order_total_price = Decimal(str(order.order_total_price)).quantize(CENTS)
+        order.fee = float(fee)
+        order.order_total_price = float(order_total_price)
+        
         with transaction.atomic():
-            # Create the order model
-            order_model = OrderModel.objects.create(
+            OrderModel.objects.create(
+                id=order_id,
                 user_id=user_id,
                 store_brand_id=store_brand_id,
                 cart_total_price=cart_total_price,
                 cart_total_items=cart_total_items,
+                fee=fee,
+                order_total_price=order_total_price,
+                total_time=order.total_time,
                 status=status,
                 payment_id=payment_id,
                 cart_id=cart_id,
                 user_store_distance=user_store_distance,
                 store_brand_address=store_brand_address,
             )
-            
-            # Create order items in bulk
-            order_items = []
-            item_models = []
-            
-            for item_data in items_data:
-                # Create ORM model
-                item_model = OrderItemModel(
-                    order_id=order_model.id,
-                    store_product_id=item_data.get('store_product_id'),
-                    quantity=item_data.get('quantity'),
-                    product_price=Decimal(str(item_data.get('product_price'))),
-                    item_total_price=Decimal(str(item_data.get('product_price'))) * item_data.get('quantity')
-                )
-                item_models.append(item_model)
-                
-                # Create domain entity
-                order_item = OrderItem(
-                    order_id=order_model.id,
-                    store_product_id=item_data.get('store_product_id'),
-                    quantity=item_data.get('quantity'),
-                    product_name=item_data.get('product_name'),
-                    product_image_url=item_data.get('product_image_url'),
-                    product_image_thumbnail=item_data.get('product_image_thumbnail'),
-                    product_price=item_data.get('product_price'),
-                    product_description=item_data.get('product_description'),
-                    item_total_price=item_data.get('product_price') * item_data.get('quantity')
-                )
-                order_items.append(order_item)
-            
-            # Bulk create the item models
             OrderItemModel.objects.bulk_create(item_models)
-            
-            # Calculate fee and total price
-            calculate_order_fee_and_total(order_model)
-            
-            # Create a domain entity with the provided store brand details and items
-            return Order(
-                id=order_model.id,
-                user_id=user_id,
-                store_brand_id=store_brand_id,
-                cart_id=cart_id,
-                store_brand_name=store_brand_name,
-                store_brand_image_logo=store_brand_image_logo,
-                store_brand_address=store_brand_address,
-                cart_total_price=cart_total_price,
-                cart_total_items=cart_total_items,
-                status=status,
-                payment_id=payment_id,
-                fee=float(order_model.fee),
-                order_total_price=float(order_model.order_total_price),
-                user_store_distance=user_store_distance,
-                items=order_items
+            OrderTimelineModel.objects.create(
+                order_id=order_id,
+                event_type=OrderEventType.CREATED,
+                notes=timeline_notes
             )
         
+        return order
+        
     def get_by_id(self, order_id: UUID) -> Optional[Order]:
         """Get an order by ID"""
         try:
@@ -62,6 +62,7 @@ def order_model_to_domain(order_model: OrderModel) -> Order:
         schedule_for=order_model.schedule_for,
         fee=float(order_model.fee),
         order_total_price=float(order_model.order_total_price),
+        total_time=order_model.total_time,
         user_store_distance=float(order_model.user_store_distance),
         payment_id=order_model.payment.id if order_model.payment else None
     )
@@ -70,12 +70,9 @@ class OrderViewSet(viewsets.ModelViewSet):
         )
         
         if success:
-            # Get the order with items to return
-            order_with_items = order_service.get_order_with_items(order.id)
-            
-            # Use the domain entity directly with the serializer
+            # The created order already holds its items, no need to reload it
             return Response(
-                OrderSerializer(order_with_items).data,
+                OrderSerializer(order).data,
                 status=status.HTTP_201_CREATED
             )
         else:
@@ -152,16 +149,14 @@ class OrderViewSet(viewsets.ModelViewSet):
             # Create order from cart
             success, message, order = order_service.create_order_from_cart(
                 cart_id=cart_id,
+                store_brand_address=request.data.get('store_brand_address', ''),
                 user_store_distance=user_store_distance
             )
             
             if success:
-                # Get the order with items to return
-                order_with_items = order_service.get_order_with_items(order.id)
-                
-                # Use the domain entity directly with the serializer
+                # The created order already holds its items, no need to reload it
                 return Response(
-                    OrderSerializer(order_with_items).data,
+                    OrderSerializer(order).data,
                     status=status.HTTP_201_CREATED
                 )
             else:
@@ -0,0 +1,109 @@
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from cart.management.fixtures import create_cart_fixture, create_store_fixture
+from core.management.query_counter import QueryCounter
+from orders.application.services.order_service import OrderApplicationService
+from orders.domain.models.constants import OrderEventType, OrderStatus
+from orders.infrastructure.django_models.orm_models import OrderItemModel, OrderModel, OrderTimelineModel
+from orders.infrastructure.django_repositories.order_utils import calculate_order_fee_and_total
+from orders.infrastructure.factory import RepositoryFactory
+
+
+def previous_create_order_from_cart(order_service, cart_id, store_brand_address):
+    """The previous order creation, as the create-from-cart endpoint ran it
+
+    User check, order and items insert, fee computed by reloading the order and
+    its items with their products, separate timeline insert, and the endpoint
+    reloading the order before serializing it.
+    """
+    cart = order_service.cart_service.get_cart(cart_id)
+    order_service.user_service.get_user_by_id(cart.user_id)
+    with transaction.atomic():
+        order_model = OrderModel.objects.create(
+            user_id=cart.user_id,
+            store_brand_id=cart.store_brand_id,
+            cart_total_price=cart.cart_total_price,
+            cart_total_items=cart.cart_total_items,
+            status=OrderStatus.PENDING,
+            cart_id=cart_id,
+            store_brand_address=store_brand_address,
+        )
+        OrderItemModel.objects.bulk_create([
+            OrderItemModel(
+                order_id=order_model.id,
+                store_product_id=item.store_product_id,
+                quantity=item.quantity,
+                product_price=Decimal(str(item.product_price)),
+                item_total_price=Decimal(str(item.product_price)) * item.quantity
+            )
+            for item in cart.items
+        ])
+        calculate_order_fee_and_total(order_model)
+    OrderTimelineModel.objects.create(
+        order_id=order_model.id,
+        event_type=OrderEventType.CREATED,
+        notes=f"Order created from cart with {len(cart.items)} items"
+    )
+    return order_service.get_order_with_items(order_model.id)
+
+
+def create_order_from_cart(order_service, cart_id, store_brand_address):
+    """Order creation as the create-from-cart endpoint runs it
+
+    The endpoint checks the cart owner on the cached cart, the order is built
+    from the cart read again in its transaction.
+    """
+    order_service.cart_service.get_cart(cart_id)
+    _, _, order = order_service.create_order_from_cart(cart_id, store_brand_address)
+    return order
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures orders/s and queries per order when creating orders from carts of '
+        'several sizes, with the previous flow (reload for the fee, separate timeline '
+        'insert, reload for the response) and the single transaction. The cart lookup '
+        'done by the endpoint is included. The fixture is rolled back at the end.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', type=str, default='5,50,200', help='Comma-separated cart sizes')
+        parser.add_argument('--orders', type=int, default=100, help='Orders per cart size and mode')
+
+    def handle(self, *args, **options):
+        sizes = [int(size) for size in options['sizes'].split(',')]
+        order_service = OrderApplicationService(
+            order_repository=RepositoryFactory.create_order_repository(),
+            order_item_repository=RepositoryFactory.create_order_item_repository(),
+            order_timeline_repository=RepositoryFactory.create_order_timeline_repository(),
+            user_service=RepositoryFactory.create_user_service(),
+            cart_service=RepositoryFactory.create_cart_service()
+        )
+
+        with transaction.atomic():
+            user, store_brand, _, store_products = create_store_fixture(max(sizes), label='Bench')
+
+            for size in sizes:
+                cart = create_cart_fixture(user, store_brand, store_products[:size])
+                for mode, create in (('previous', previous_create_order_from_cart),
+                                     ('single transaction', create_order_from_cart)):
+                    counter = QueryCounter()
+                    with connection.execute_wrapper(counter):
+                        started = time.perf_counter()
+                        for _ in range(options['orders']):
+                            order = create(order_service, cart.id, '1 rue de la Paix')
+                        elapsed = time.perf_counter() - started
+
+                    self.stdout.write(
+                        f'{size:>4} lines, {mode:>18}: {options["orders"] / elapsed:8.1f} orders/s, '
+                        f'{counter.count / options["orders"]:.1f} queries per order, '
+                        f'fee {order.fee:.2f}, total {order.order_total_price:.2f}'
+                    )
+
+            transaction.set_rollback(True)
+
+        self.stdout.write(self.style.SUCCESS('Benchmark complete (fixture rolled back)'))
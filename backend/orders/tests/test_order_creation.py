@@ -0,0 +1,67 @@
+"""
+Query-count regression tests for order creation
+
+An order, its items and its creation timeline event are written with one
+INSERT each, whatever the number of items, and nothing is read back.
+"""
+from decimal import Decimal
+
+from django.test import TransactionTestCase
+
+from cart.management.fixtures import create_store_fixture
+from orders.domain.models.constants import OrderEventType
+from orders.infrastructure.django_models.orm_models import OrderTimelineModel
+from orders.infrastructure.django_repositories.order_repository import DjangoOrderRepository
+
+ORDER_SIZES = (1, 5, 50)
+
+# Order, items and timeline event
+ORDER_CREATE_QUERIES = 3
+
+
+class OrderCreationQueryCountTests(TransactionTestCase):
+    """create_with_items runs ORDER_CREATE_QUERIES queries for any number of items
+
+    A TransactionTestCase, so the savepoint of a nested transaction is not counted.
+    """
+
+    def setUp(self):
+        self.user, self.store_brand, _, self.store_products = create_store_fixture(
+            max(ORDER_SIZES), label='Order', price=Decimal('2.50')
+        )
+        self.repository = DjangoOrderRepository()
+
+    def create_order(self, size):
+        return self.repository.create_with_items(
+            user_id=self.user.id,
+            store_brand_id=self.store_brand.id,
+            items_data=[
+                {'store_product_id': store_product.id, 'quantity': 2, 'product_name': f'Product {i}',
+                 'product_image_url': '', 'product_image_thumbnail': '', 'product_price': 2.5,
+                 'product_description': ''}
+                for i, store_product in enumerate(self.store_products[:size])
+            ],
+            cart_total_price=5.0 * size,
+            cart_total_items=2 * size,
+            user_store_distance=1500.0,
+            timeline_notes='Created'
+        )
+
+    def test_create_with_items(self):
+        for size in ORDER_SIZES:
+            with self.subTest(size=size):
+                with self.assertNumQueries(ORDER_CREATE_QUERIES):
+                    order = self.create_order(size)
+                self.assertEqual(len(order.items), size)
+
+    def test_created_order_matches_the_stored_one(self):
+        order = self.create_order(5)
+        stored = self.repository.get_by_id(order.id)
+
+        self.assertGreater(order.fee, 0)
+        self.assertEqual((order.fee, order.order_total_price, order.total_time),
+                         (stored.fee, stored.order_total_price, stored.total_time))
+        self.assertEqual(sorted(item.id for item in order.items), sorted(item.id for item in stored.items))
+        self.assertTrue(OrderTimelineModel.objects.filter(
+            order_id=order.id, event_type=OrderEventType.CREATED, notes='Created'
+        ).exists())
@@ -1,3 +1,4 @@
+from dataclasses import asdict
 from typing import List, Dict, Optional, Tuple
 import uuid
 
@@ -7,7 +8,7 @@ from store.domain.repositories.repository_interfaces import (
 )
 from store.domain.services.cache_service import CacheService
 from store.domain.services.search_analytics_service import SearchAnalyticsService
-from store.domain.value_objects.pagination import PaginationParams, PagedResult
+from store.domain.value_objects.pagination import PaginationParams
 
 
 class SearchProductsService:
@@ -43,142 +44,133 @@ class SearchProductsService:
         if not clean_query or len(clean_query) < 2:
             return []
         
-        # Try to get from cache first
-        # Include store_brand_id in cache key if provided
-        store_key = f':{store_brand_id}' if store_brand_id else ''
-        cache_key = f'autocomplete{store_key}:{clean_query}'
-        cached_results = self.cache_service.get(cache_key)
-        
-        if cached_results:
-            return cached_results
-            
-        # Get suggestions from repository
+        # Suggestions come from an in-memory index in the repository, which is
+        # cheaper than a cache round trip and has no per-prefix hit rate problem
         suggestions = self.product_repository.get_autocomplete_suggestions(
             partial_query=clean_query,
             store_brand_id=store_brand_id,
             limit=limit
         )
         
-        # Cache the results with a short timeout (5 minutes)
-        # Autocomplete results should be relatively fresh, but we still want some caching
-        # to handle repeated requests for common prefixes
-        self.cache_service.set(cache_key, suggestions, timeout=300)  # 5 minutes
-        
         return suggestions
     
     def search_products(self, query: str, 
                         store_id: Optional[uuid.UUID] = None,
                         page: int = 1,
                         page_size: int = 10,
+                        cursor: Optional[str] = None,
                         ) -> Tuple[Dict[uuid.UUID, Tuple[str, List[ProductWithDetails]]], Dict[str, int]]:
         """
         Search for products with optional store filtering
         
+        Ordering and the page window are applied by the repository in SQL,
+        so only the requested page is loaded.
+        
         Args:
             query: Search query string
             store_id: Optional store ID to filter by (None for global search)
+            page: Page number (1-based)
+            page_size: Number of products per page (per store for global search)
+            cursor: Optional keyset cursor from a previous store-specific page,
+                    takes precedence over page for deep pagination
             
         Returns:
+            Tuple of (results, metadata), whether the page comes from the cache or not.
             For store-specific search: List of matching products
             For global search: Dictionary mapping store IDs to tuples of (category_path, list of products)
         """
         # Clean and validate query
         clean_query = query.strip()
         if not clean_query or len(clean_query) < 2:
-            return {} if store_id is None else []
+            return ({} if store_id is None else []), {}
             
         # Default pagination
-        pagination = PaginationParams(page=page, page_size=page_size)
+        pagination = PaginationParams(page=int(page), page_size=int(page_size))
         
         # Generate cache key based on whether this is a global or store-specific search
+        # The page window is part of the key since only that page is fetched
         cache_key = self.cache_service.generate_search_key(
             query=clean_query, 
-            store_id=str(store_id) if store_id else None
+            store_id=str(store_id) if store_id else None,
+            filters={
+                'page': pagination.page,
+                'page_size': pagination.page_size,
+                'cursor': cursor
+            }
         )
-        cached_results = self.cache_service.get(cache_key)
-        
-        if cached_results:
-            # return cached results
-            return cached_results
+        cached_page = self.cache_service.get(cache_key)
+        if cached_page is not None:
+            # Same shape as a freshly computed page
+            return self._page_from_payload(cached_page)
         
         # Execute search based on whether this is global or store-specific
         if store_id:
             # Store-specific search
-            all_products = self.product_repository.search_products_in_one_store(store_id, clean_query)
-            query_complexity = 0.3  # Lower complexity for store-specific search
-
-            # Apply pagination
-            start_idx = pagination.offset
-            end_idx = start_idx + pagination.limit
-            paginated_products = all_products[start_idx:end_idx]
-            
-            # Record analytics if service is available
-            if self.analytics_service:
-                self.analytics_service.record_search(
-                    query=clean_query,
-                    store_id=store_id,
-                    result_count=len(all_products)
-                )
-            
-            # Cache results with adaptive TTL
-            product_ids = [str(product.product_id) for product in all_products]
-            self.cache_service.set_with_adaptive_timeout(
-                key=cache_key,
-                value=product_ids,
-                complexity=query_complexity,
-                result_size=len(all_products)
+            search_page = self.product_repository.search_products_in_one_store(
+                store_id, clean_query, pagination, cursor=cursor
             )
+            query_complexity = 0.3  # Lower complexity for store-specific search
+            result_count = search_page.total_items
             
-            # Return paginated products and metadata
-            metadata = {'total_products': len(all_products)}
-            return paginated_products, metadata
+            results = search_page.items
+            metadata = {
+                'total_products': search_page.total_items,
+                'total_is_exact': search_page.total_is_exact,
+                'next_cursor': search_page.next_cursor
+            }
+            page_size_cached = len(results)
         else:
-            # Global search across all stores
-            products_by_store = self.product_repository.search_products_in_all_stores(clean_query)
+            # Global search across all stores, already paginated per store
+            results, store_totals = self.product_repository.search_products_in_all_stores(
+                clean_query, pagination
+            )
             query_complexity = 0.7  # Higher complexity for global search
-
-            # Process all stores in a single loop (for pagination, analytics, and caching)
-            paginated_results = {}
-            total_products = 0
-            cache_structure = {}
-            metadata = {'store_counts': {}}
+            result_count = sum(store_totals.values())
             
-            for store_id, (category_path, products) in products_by_store.items():
-                # Count total products for analytics
-                total_products += len(products)
-                
-                # Prepare cache structure for this store
-                cache_structure[str(store_id)] = {
-                    'category_path': category_path,
-                    'product_ids': [str(product.product_id) for product in products]
-                }
-                
-                # Apply pagination to this store's products
-                start_idx = pagination.offset
-                end_idx = start_idx + pagination.limit
-                paginated_store_products = products[start_idx:end_idx]
-                
-                # Only include stores that have products after pagination
-                if paginated_store_products:
-                    paginated_results[store_id] = (category_path, paginated_store_products)
-
-                metadata['store_counts'][str(store_id)] = len(products)
-            
-            # Record analytics if service is available
-            if self.analytics_service:
-                self.analytics_service.record_search(
-                    query=clean_query,
-                    store_id=None,
-                    result_count=total_products
-                )
-            
-            self.cache_service.set_with_adaptive_timeout(
-                key=cache_key,
-                value=cache_structure,
-                complexity=query_complexity,
-                result_size=total_products
+            metadata = {
+                'store_counts': {str(store_id): count for store_id, count in store_totals.items()}
+            }
+            page_size_cached = sum(len(products) for _, products in results.values())
+        
+        # Record analytics if service is available
+        if self.analytics_service:
+            self.analytics_service.record_search(
+                query=clean_query,
+                store_id=store_id,
+                result_count=result_count
             )
-            
-            return paginated_results, metadata
-            
-   
\ No newline at end of file
+        
+        # Cache the whole page with adaptive TTL, so a hit needs no database work
+        self.cache_service.set_with_adaptive_timeout(
+            key=cache_key,
+            value=self._page_to_payload(results, metadata),
+            complexity=query_complexity,
+            result_size=page_size_cached
+        )
+        
+        return results, metadata
+    
+    @staticmethod
+    def _page_to_payload(results, metadata: Dict) -> Dict:
+        """Plain-data form of a search page, cheap to pickle and rebuild"""
+        if isinstance(results, dict):
+            items = {
+                store_id: (category_path, [asdict(product) for product in products])
+                for store_id, (category_path, products) in results.items()
+            }
+        else:
+            items = [asdict(product) for product in results]
+        return {'items': items, 'metadata': metadata}
+    
+    @staticmethod
+    def _page_from_payload(payload: Dict):
+        """Rebuild the (results, metadata) tuple returned on a cache miss"""
+        items = payload['items']
+        if isinstance(items, dict):
+            results = {
+                store_id: (category_path, [ProductWithDetails(**product) for product in products])
+                for store_id, (category_path, products) in items.items()
+            }
+        else:
+            results = [ProductWithDetails(**product) for product in items]
+        return results, payload['metadata']
@@ -1,4 +1,4 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from store.domain.models.entities import StoreBrand, StoreBrandLocation
 from store.domain.services.cache_service import CacheService
@@ -7,10 +7,8 @@ from store.domain.value_objects.coordinates import Coordinates
 from store.domain.repositories.repository_interfaces import(
     StoreBrandRepository
 )
-from store.config.constants import (
-    DEFAULT_SEARCH_RADIUS, 
-    LOCATION_CACHE_TIMEOUT
-)
+from store.application.services.store_location_grid import StoreLocationGrid
+from store.config.constants import DEFAULT_SEARCH_RADIUS
 
 class StoreBrandLocationService:
     """Application service for finding nearby store brands
@@ -23,10 +21,12 @@ class StoreBrandLocationService:
     def __init__(self, 
                  store_brand_repository: StoreBrandRepository,
                  store_location_service: StoreLocationService,
-                 cache_service: CacheService):
+                 cache_service: CacheService,
+                 location_grid: Optional[StoreLocationGrid] = None):
         self.store_brand_repository = store_brand_repository
         self.store_location_service = store_location_service
         self.cache_service = cache_service
+        self.location_grid = location_grid or StoreLocationGrid(store_location_service, cache_service)
     
     def list_all_store_brands(self) -> List[StoreBrand]:
         
@@ -56,29 +56,21 @@ class StoreBrandLocationService:
         
         coordinates, address_obj = geocode_result
         
-        # Generate cache key based on location and brand_slugs
-        cache_key = self.cache_service.generate_store_location_key(coordinates, radius_km, address)
-        
-        # Try to get from cache first
-        cached_results = self.cache_service.get(cache_key)
-        if cached_results:
-            return cached_results
-        
-        # Cache miss - need to query for locations
-        return self._find_and_cache_nearby_brands(coordinates, radius_km, cache_key)
+        return self.find_nearby_store_brands(coordinates, radius_km)
     
-    def _find_and_cache_nearby_brands(
+    def find_nearby_store_brands(
         self,
         coordinates: Coordinates,
-        radius_km: float,
-        cache_key: str = None
+        radius_km: float = DEFAULT_SEARCH_RADIUS,
     ) -> List[StoreBrandLocation]:
-        """Find nearby store brands and cache the results
+        """Find the closest location of each store brand around coordinates
+        
+        Locations come from the geohash grid cache, the location service is
+        only called for the cells and brands it doesn't hold yet.
         
         Args:
             coordinates: User's coordinates
             radius_km: Search radius in kilometers
-            cache_key: Optional cache key to store results under
             
         Returns:
             List of StoreBrandLocation entities
@@ -86,31 +78,14 @@ class StoreBrandLocationService:
         # Get all store brands we need to search for
         store_brands = self.store_brand_repository.get_all_store_brands()
         
-        # Find the closest location for each store brand
-        results = []
-        for brand in store_brands:
-            # Search for this specific brand near the coordinates
-            place = self.store_location_service.find_store_brand_by_name(
-                name=brand.name,
-                brand_type=brand.type,
-                coordinates=coordinates,
-                radius_km=radius_km
-            )
-            
-            # If we found a place for this brand
-            if place:
-                # Create a copy of the brand with location data
-                brand_with_location = self._create_brand_with_location(brand, place)
-                results.append(brand_with_location)
-            else:
-                # No location found, skip this brand
-                continue
-        
-        # Cache the results if we have a cache key
-        if cache_key:
-            self.cache_service.set(cache_key, results, LOCATION_CACHE_TIMEOUT)
+        places = self.location_grid.find_closest_locations(store_brands, coordinates, radius_km)
         
-        return results
+        # Brands without a location in the radius are skipped
+        return [
+            self._create_brand_with_location(brand, places[str(brand.id)])
+            for brand in store_brands
+            if str(brand.id) in places
+        ]
     
     def _create_brand_with_location(self, brand: StoreBrand, place: Dict[str, Any]) -> StoreBrandLocation:
         """Create a StoreBrandLocation entity from brand and place info
@@ -0,0 +1,222 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, List, Tuple
+
+from store.domain.models.entities import StoreBrand
+from store.domain.services.cache_service import CacheService
+from store.domain.services.store_location_service import StoreLocationService
+from store.domain.value_objects import geohash
+from store.domain.value_objects.coordinates import Coordinates
+from store.config.constants import (
+    GRID_CACHE_TIMEOUT,
+    GRID_KEY_PREFIX,
+    GRID_PRECISION,
+    LOCATION_FETCH_WORKERS,
+    MAX_RESULTS_STORES_BRANDS_NEARBY,
+    POPULAR_LOCATION_THRESHOLD,
+)
+
+logger = logging.getLogger(__name__)
+
+_executors: Dict[str, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def _executor(name: str, max_workers: int) -> ThreadPoolExecutor:
+    """Process-wide thread pool, so concurrency stays bounded across requests"""
+    with _executors_lock:
+        if name not in _executors:
+            _executors[name] = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        return _executors[name]
+
+
+class StoreLocationGrid:
+    """Geohash-cell cache of store brand locations
+
+    Each cell holds, per brand, the locations found inside it. A lookup reads
+    every cell covering the search circle in one round trip, asks the location
+    provider once per brand for the circle around the cells it has never seen,
+    and keeps the closest location of each brand within the radius. Users a few
+    streets apart, or searching with a different radius, share the same cells.
+    """
+
+    def __init__(self,
+                 store_location_service: StoreLocationService,
+                 cache_service: CacheService,
+                 precision: int = GRID_PRECISION,
+                 max_workers: int = LOCATION_FETCH_WORKERS,
+                 popular_threshold: int = POPULAR_LOCATION_THRESHOLD):
+        self.store_location_service = store_location_service
+        self.cache_service = cache_service
+        self.precision = precision
+        self.popular_threshold = popular_threshold
+        self.fetch_executor = _executor('store-location-fetch', max_workers)
+        self.prewarm_executor = _executor('store-location-prewarm', 2)
+
+    def find_closest_locations(self,
+                               store_brands: List[StoreBrand],
+                               coordinates: Coordinates,
+                               radius_km: float) -> Dict[str, Dict[str, Any]]:
+        """Find the closest location of each store brand within a radius
+
+        Args:
+            store_brands: Brands to look for
+            coordinates: User's coordinates
+            radius_km: Search radius in kilometers
+
+        Returns:
+            Place information of the closest location, by brand ID (as a string),
+            with 'distance' in meters from the user
+        """
+        cells = geohash.cells_covering(coordinates, radius_km, self.precision)
+        entries = self._load_cells(cells, store_brands)
+        self._record_hit(coordinates, radius_km, cells, store_brands)
+
+        closest: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        for entry in entries.values():
+            for brand_id, places in entry.items():
+                for place in places:
+                    distance_km = coordinates.distance_to(
+                        Coordinates(latitude=place['latitude'], longitude=place['longitude'])
+                    )
+                    if distance_km <= radius_km and (brand_id not in closest or distance_km < closest[brand_id][0]):
+                        closest[brand_id] = (distance_km, place)
+
+        return {
+            brand_id: {**place, 'distance': distance_km * 1000}
+            for brand_id, (distance_km, place) in closest.items()
+        }
+
+    def _load_cells(self, cells: List[str], store_brands: List[StoreBrand]) -> Dict[str, Dict[str, List[Dict]]]:
+        """Cached entries of the cells, completed with the provider for missing brands"""
+        keys = self._cell_keys(cells)
+        cached = self.cache_service.get_many(list(keys.values()))
+        entries = {cell: dict(cached.get(keys[cell]) or {}) for cell in cells}
+
+        missing = {}
+        for brand in store_brands:
+            brand_cells = [cell for cell in cells if str(brand.id) not in entries[cell]]
+            if brand_cells:
+                missing[str(brand.id)] = (brand, brand_cells)
+        if not missing:
+            return entries
+
+        futures = {
+            self.fetch_executor.submit(self._fetch_brand_locations, brand, brand_cells): brand
+            for brand, brand_cells in missing.values()
+        }
+        changed = set()
+        for future in as_completed(futures):
+            brand = futures[future]
+            try:
+                located = future.result()
+            except Exception as e:
+                # Not cached, the next lookup asks again
+                logger.warning(f"Error finding {brand.name} locations: {str(e)}")
+                continue
+            for cell, places in located.items():
+                entries[cell][str(brand.id)] = places
+                changed.add(cell)
+
+        if changed:
+            self.cache_service.set_many({keys[cell]: entries[cell] for cell in changed}, GRID_CACHE_TIMEOUT)
+        return entries
+
+    def _fetch_brand_locations(self, brand: StoreBrand, cells: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Locations of a brand in each cell, from one provider call covering them all
+
+        Places are bucketed into their cell, and cells without any are recorded
+        as empty. When the provider truncates its results, only the cells closer
+        than the farthest returned place are complete; the others are asked
+        for one by one.
+        """
+        center, radius_km = self._covering_circle(cells)
+        places = self.store_location_service.find_store_brand_locations(
+            name=brand.name,
+            brand_type=brand.type,
+            coordinates=center,
+            radius_km=radius_km
+        )
+
+        located: Dict[str, List[Dict[str, Any]]] = {cell: [] for cell in cells}
+        farthest_km = 0.0
+        for place in places:
+            if place.get('latitude') is None or place.get('longitude') is None:
+                continue
+            coordinates = Coordinates(latitude=place['latitude'], longitude=place['longitude'])
+            farthest_km = max(farthest_km, center.distance_to(coordinates))
+            cell = geohash.encode(float(coordinates.latitude), float(coordinates.longitude), self.precision)
+            if cell in located:
+                # The distance is relative to the search center, it is recomputed per user
+                located[cell].append({key: value for key, value in place.items() if key != 'distance'})
+
+        if len(places) < MAX_RESULTS_STORES_BRANDS_NEARBY:
+            return located
+
+        for cell in cells:
+            if center.distance_to(geohash.center(cell)) + geohash.cell_radius_km(cell) > farthest_km:
+                located[cell] = self._fetch_cell_locations(cell, brand)
+        return located
+
+    @staticmethod
+    def _covering_circle(cells: List[str]) -> Tuple[Coordinates, float]:
+        """Center and radius in kilometers of a circle containing every cell"""
+        cell_bounds = [geohash.bounds(cell) for cell in cells]
+        center = Coordinates(
+            latitude=(min(b[0] for b in cell_bounds) + max(b[1] for b in cell_bounds)) / 2,
+            longitude=(min(b[2] for b in cell_bounds) + max(b[3] for b in cell_bounds)) / 2
+        )
+        radius_km = max(
+            center.distance_to(geohash.center(cell)) + geohash.cell_radius_km(cell) for cell in cells
+        )
+        return center, radius_km
+
+    def _fetch_cell_locations(self, cell: str, brand: StoreBrand) -> List[Dict[str, Any]]:
+        """Locations of a brand inside a cell, from the provider"""
+        places = self.store_location_service.find_store_brand_locations(
+            name=brand.name,
+            brand_type=brand.type,
+            coordinates=geohash.center(cell),
+            radius_km=geohash.cell_radius_km(cell)
+        )
+        if len(places) >= MAX_RESULTS_STORES_BRANDS_NEARBY:
+            logger.debug(f"Cell {cell} may hold more {brand.name} locations than the provider returned")
+
+        located = []
+        for place in places:
+            if place.get('latitude') is None or place.get('longitude') is None:
+                continue
+            if geohash.contains(cell, Coordinates(latitude=place['latitude'], longitude=place['longitude'])):
+                # The distance is relative to the cell center, it is recomputed per user
+                located.append({key: value for key, value in place.items() if key != 'distance'})
+        return located
+
+    def _record_hit(self, coordinates: Coordinates, radius_km: float,
+                    cells: List[str], store_brands: List[StoreBrand]) -> None:
+        """Count lookups around a cell and prewarm its surroundings once it is popular"""
+        center_cell = geohash.encode(coordinates.latitude, coordinates.longitude, self.precision)
+        hits = self.cache_service.increment(f"{GRID_KEY_PREFIX}:hits:{center_cell}", GRID_CACHE_TIMEOUT)
+        if hits != self.popular_threshold:
+            return
+
+        # Users slightly further away need the ring of cells just outside this lookup
+        height, _ = geohash.cell_size(self.precision)
+        ring = [
+            cell for cell in geohash.cells_covering(coordinates, radius_km + height * 111.32, self.precision)
+            if cell not in cells
+        ]
+        self.prewarm_executor.submit(self._prewarm, ring, store_brands)
+
+    def _prewarm(self, cells: Iterable[str], store_brands: List[StoreBrand]) -> None:
+        try:
+            self._load_cells(list(cells), store_brands)
+        except Exception as e:
+            logger.warning(f"Error prewarming store location cells: {str(e)}")
+
+    def _cell_keys(self, cells: List[str]) -> Dict[str, str]:
+        """Cache keys of the cells, in the current location and brand generations"""
+        generation = '.'.join(
+            str(g) for g in self.cache_service.get_generations(['all', 'location', 'brand'])
+        )
+        return {cell: f"{GRID_KEY_PREFIX}:g{generation}:{cell}" for cell in cells}
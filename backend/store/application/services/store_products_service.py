@@ -29,7 +29,8 @@ class StoreProductsService:
         """
         # Try to get from cache first
         if self.cache_service:
-            cache_key = f'store_products:{store_id}'
+            generation = self.cache_service.get_generation(f"store:{store_id}")
+            cache_key = f'store_products:{store_id}:g{generation}'
             cached_products = self.cache_service.get(cache_key)
             
             if cached_products:
@@ -61,7 +62,9 @@ class StoreProductsService:
             A list of ProductWithDetails domain entities
         """
         if self.cache_service:
-            cache_key = f'store_products_by_category:{category_path}'
+            # Invalidated by changes to the store's products or to the category
+            generations = self.cache_service.get_generations([f"store:{store_brand_id}", f"category:{category_path}"])
+            cache_key = f'store_products_by_category:{store_brand_id}:{category_path}:g{generations[0]}.{generations[1]}'
             cached_products = self.cache_service.get(cache_key)
             
             if cached_products:
@@ -8,6 +8,7 @@ GRID_KEY_PREFIX = f"{CACHE_KEY_PREFIX}:grid"
 ADDRESS_KEY_PREFIX = f"{CACHE_KEY_PREFIX}:address"
 BRAND_KEY_PREFIX = f"{CACHE_KEY_PREFIX}:brand"
 LOCATION_KEY_PREFIX = f"{CACHE_KEY_PREFIX}:location"
+GENERATION_KEY_PREFIX = f"{CACHE_KEY_PREFIX}:gen"
 
 # Coordinate precision for caching (in decimal places) 
 # Users in the same area will share the same cache
@@ -26,8 +27,12 @@ GRID_CACHE_TIMEOUT = 604800  # 1 week
 LOCATION_CACHE_TIMEOUT = 2592000  # 30 days
 POPULAR_LOCATION_THRESHOLD = 5  # Number of hits to consider a location popular
 
-# Grid precision for caching (in degrees)
-GRID_PRECISION = 0.01  # Approximately 1km
+# Grid precision for caching (geohash length)
+# Each cell caches the store locations found inside it, nearby users share cells
+GRID_PRECISION = 5  # Cells of about 4.9km x 4.9km at the equator, 4.9km x 3.2km in France
+
+# Brand lookups against the location provider run concurrently, bounded by this
+LOCATION_FETCH_WORKERS = 8
 
 # Default search radius (in km)
 DEFAULT_SEARCH_RADIUS = 10
@@ -36,6 +41,13 @@ DEFAULT_SEARCH_RADIUS = 10
 # for finding the nearest locations of stores brands
 MAX_RESULTS_STORES_BRANDS_NEARBY = 10
 
+# Search result counting is capped so broad queries don't scan every match
+# Totals above this value are reported as an estimate
+SEARCH_COUNT_CAP = 1000
+
+# Share of cache writes whose payload is serialized again to measure its size
+CACHE_SIZE_SAMPLE_RATE = 0.05
+
 # Cache timeout weights
 COMPLEXITY_WEIGHT = 0.7
 SIZE_WEIGHT = 0.3
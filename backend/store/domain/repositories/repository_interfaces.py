@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Dict, List, Tuple, Optional
 import uuid
 from ..models.entities import StoreBrand, ProductWithDetails
+from ..value_objects.pagination import PaginationParams, SearchPage
 
 class StoreBrandRepository(ABC):
     """Repository interface for StoreBrand domain model"""
@@ -21,29 +22,37 @@ class ProductRepository(ABC):
         
     @abstractmethod
     def search_products_in_all_stores(self, 
-            query: str) -> Dict[uuid.UUID, Tuple[str, List[ProductWithDetails]]]:
+            query: str,
+            pagination: PaginationParams
+            ) -> Tuple[Dict[uuid.UUID, Tuple[str, List[ProductWithDetails]]], Dict[uuid.UUID, int]]:
 
         """Search for products with price information by query string in all stores
         
         Args:
             query: The search query string
+            pagination: Page window applied to each store's results
             
         Returns:
-            Dictionary of store brand IDs to Tuple of category path and list of ProductWithDetails objects
+            Tuple of (store brand IDs to Tuple of category path and the page of ProductWithDetails objects,
+                      store brand IDs to the total number of matches in that store)
         """
         pass
         
     @abstractmethod
     def search_products_in_one_store(self, store_brand_id: uuid.UUID, 
-            query: str) -> List[ProductWithDetails]:
+            query: str,
+            pagination: PaginationParams,
+            cursor: Optional[str] = None) -> SearchPage[ProductWithDetails]:
         """Search for products with price information by query string in a store
         
         Args:
             store_brand_id: UUID of the store brand to search in
             query: The search query string
+            pagination: Page to return (used when no cursor is given)
+            cursor: Optional keyset cursor returned with the previous page
             
         Returns:
-            List of ProductWithDetails objects
+            SearchPage of ProductWithDetails objects with a (possibly capped) total
         """
         pass
         
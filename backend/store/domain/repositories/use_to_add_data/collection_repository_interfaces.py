@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
 import uuid
 from datetime import datetime
 from store.domain.models.use_to_add_data.collection_entities import ProductCollectionBatch, CollectedProduct
@@ -98,6 +98,31 @@ class CollectedProductRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def iter_products_by_batch(self, batch_id: uuid.UUID, chunk_size: int) -> Iterator[List[CollectedProduct]]:
+        """Iterate over the collected products of a batch in chunks
+        
+        Args:
+            batch_id: UUID of the batch
+            chunk_size: Maximum number of products per chunk
+            
+        Returns:
+            Iterator of CollectedProduct lists
+        """
+        pass
+    
+    @abstractmethod
+    def bulk_update_product_status(self, statuses: Dict[uuid.UUID, Optional[str]]) -> int:
+        """Mark many collected products processed or in error in one statement
+        
+        Args:
+            statuses: Error message per product ID, None for processed products
+            
+        Returns:
+            Number of products updated
+        """
+        pass
+    
     @abstractmethod
     def bulk_create_collected_products(self, products: List[CollectedProduct]) -> List[CollectedProduct]:
         """Create multiple collected products in a single operation
@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, List, Optional
 import uuid
 
 from ...models.entities import Category, Product, StoreProduct
+from ...models.use_to_add_data.collection_entities import CollectedProduct
 
 class ProductProcessingRepository(ABC):
     """Repository interface for processing collected products into permanent storage"""
@@ -95,3 +96,22 @@ class ProductProcessingRepository(ABC):
             Created StoreProduct object
         """
         pass
+    
+    @abstractmethod
+    def bulk_process_collected_products(self, 
+                                        store_brand_id: uuid.UUID, 
+                                        collected_products: List[CollectedProduct]) -> Dict[uuid.UUID, Optional[str]]:
+        """Create or update the categories, products and store products of many collected products
+        
+        Works on the whole list at once: existing categories and products are
+        resolved in one query each, missing ones are inserted in bulk and store
+        products are upserted with their new prices.
+        
+        Args:
+            store_brand_id: UUID of the store brand the products were collected for
+            collected_products: Collected products to process
+            
+        Returns:
+            Error message per collected product ID, None for the ones processed
+        """
+        pass
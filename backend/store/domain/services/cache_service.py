@@ -29,6 +29,41 @@ class CacheService(ABC):
         """
         pass
     
+    @abstractmethod
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Get several values from the cache in one round trip
+        
+        Args:
+            keys: Cache keys to look up
+            
+        Returns:
+            The values found, by key; missing keys are left out
+        """
+        pass
+    
+    @abstractmethod
+    def set_many(self, values: Dict[str, Any], timeout: int) -> None:
+        """Set several values in the cache in one round trip
+        
+        Args:
+            values: Values to store, by key
+            timeout: Cache timeout in seconds
+        """
+        pass
+    
+    @abstractmethod
+    def increment(self, key: str, timeout: int) -> int:
+        """Increment a counter, creating it with the given timeout
+        
+        Args:
+            key: Counter key
+            timeout: Timeout in seconds of a new counter
+            
+        Returns:
+            The new value of the counter
+        """
+        pass
+    
     @abstractmethod
     def set_with_adaptive_timeout(self, key: str, value: Any, 
                                  complexity: float = 0.5, 
@@ -78,6 +113,51 @@ class CacheService(ABC):
         """
         pass
     
+    @abstractmethod
+    def get_generation(self, namespace: str) -> int:
+        """Get the current generation of a cache namespace
+        
+        Args:
+            namespace: Namespace name, e.g. "store:<id>"
+            
+        Returns:
+            Generation number embedded in the namespace's keys
+        """
+        pass
+    
+    @abstractmethod
+    def get_generations(self, namespaces: List[str]) -> List[int]:
+        """Get the current generations of several namespaces at once
+        
+        Args:
+            namespaces: Namespace names
+            
+        Returns:
+            The generations, in the order of the namespaces
+        """
+        pass
+    
+    @abstractmethod
+    def bump_generation(self, namespace: str) -> int:
+        """Invalidate every key of a namespace by moving it to a new generation
+        
+        Args:
+            namespace: Namespace name, e.g. "store:<id>"
+            
+        Returns:
+            The new generation number
+        """
+        pass
+    
+    @abstractmethod
+    def get_cache_metrics(self) -> List[Dict]:
+        """Get hit ratio and payload size metrics per key family
+        
+        Returns:
+            One dict per key family
+        """
+        pass
+    
     @abstractmethod
     def clear_cache(self, cache_type: str) -> None:
         """Clear specific or all cache types"""
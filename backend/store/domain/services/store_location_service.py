@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
 from store.domain.value_objects.coordinates import Coordinates
 from store.domain.value_objects.address import Address
@@ -34,6 +34,21 @@ class StoreLocationService(ABC):
             Store brand information if found, None otherwise
         """
         pass
+    
+    @abstractmethod
+    def find_store_brand_locations(self, name: str, brand_type: str, coordinates: Coordinates, radius_km: float) -> List[Dict[str, Any]]:
+        """Find the locations of a store brand near the specified coordinates
+        
+        Args:
+            name: Name of the store brand to search for
+            brand_type: Type of the brand to search for
+            coordinates: Center point for the search
+            radius_km: Search radius in kilometers
+            
+        Returns:
+            Store brand locations, closest first
+        """
+        pass
 
 
 
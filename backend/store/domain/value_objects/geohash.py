@@ -0,0 +1,135 @@
+"""
+Geohash cells used to share store location lookups between nearby users.
+
+A geohash of length n names a cell of the lat/lng grid obtained by halving
+longitude and latitude alternately 5*n times. Length 5 cells are about
+4.9km x 4.9km at the equator (narrower in longitude further north).
+"""
+import math
+from typing import List, Tuple
+
+from store.domain.value_objects.coordinates import Coordinates
+
+BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+
+
+def encode(latitude: float, longitude: float, precision: int) -> str:
+    """Geohash of the cell containing a point
+
+    Args:
+        latitude: Latitude in degrees
+        longitude: Longitude in degrees
+        precision: Number of characters of the geohash
+
+    Returns:
+        Geohash string
+    """
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    longitude = (longitude + 180.0) % 360.0 - 180.0
+    geohash = []
+    bits, value, even = 0, 0, True
+    while len(geohash) < precision:
+        # Bits alternate between longitude (even) and latitude (odd)
+        target, rng = (longitude, lng_range) if even else (latitude, lat_range)
+        middle = (rng[0] + rng[1]) / 2
+        if target >= middle:
+            value = (value << 1) | 1
+            rng[0] = middle
+        else:
+            value <<= 1
+            rng[1] = middle
+        even = not even
+        bits += 1
+        if bits == 5:
+            geohash.append(BASE32[value])
+            bits, value = 0, 0
+    return ''.join(geohash)
+
+
+def bounds(geohash: str) -> Tuple[float, float, float, float]:
+    """Bounds of a cell as (min_latitude, max_latitude, min_longitude, max_longitude)"""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    even = True
+    for char in geohash:
+        value = BASE32.index(char)
+        for shift in range(4, -1, -1):
+            rng = lng_range if even else lat_range
+            middle = (rng[0] + rng[1]) / 2
+            if (value >> shift) & 1:
+                rng[0] = middle
+            else:
+                rng[1] = middle
+            even = not even
+    return lat_range[0], lat_range[1], lng_range[0], lng_range[1]
+
+
+def cell_size(precision: int) -> Tuple[float, float]:
+    """Height and width of the cells of a precision, in degrees"""
+    total_bits = 5 * precision
+    lat_bits = total_bits // 2
+    lng_bits = total_bits - lat_bits
+    return 180.0 / 2 ** lat_bits, 360.0 / 2 ** lng_bits
+
+
+def center(geohash: str) -> Coordinates:
+    """Center point of a cell"""
+    min_lat, max_lat, min_lng, max_lng = bounds(geohash)
+    return Coordinates(latitude=(min_lat + max_lat) / 2, longitude=(min_lng + max_lng) / 2)
+
+
+def contains(geohash: str, coordinates: Coordinates) -> bool:
+    """Whether a point falls inside a cell"""
+    min_lat, max_lat, min_lng, max_lng = bounds(geohash)
+    return (min_lat <= float(coordinates.latitude) < max_lat
+            and min_lng <= float(coordinates.longitude) < max_lng)
+
+
+def cell_radius_km(geohash: str) -> float:
+    """Distance from the center of a cell to its corners, in kilometers"""
+    min_lat, max_lat, min_lng, max_lng = bounds(geohash)
+    # The corner closest to the equator is the farthest from the center
+    corner_lat = min_lat if abs(min_lat) < abs(max_lat) else max_lat
+    return center(geohash).distance_to(Coordinates(latitude=corner_lat, longitude=max_lng))
+
+
+def distance_to_cell_km(geohash: str, coordinates: Coordinates) -> float:
+    """Distance from a point to the closest point of a cell, 0 inside the cell"""
+    min_lat, max_lat, min_lng, max_lng = bounds(geohash)
+    closest = Coordinates(
+        latitude=min(max(float(coordinates.latitude), min_lat), max_lat),
+        longitude=min(max(float(coordinates.longitude), min_lng), max_lng)
+    )
+    return coordinates.distance_to(closest)
+
+
+def cells_covering(coordinates: Coordinates, radius_km: float, precision: int) -> List[str]:
+    """Cells that intersect a circle
+
+    Args:
+        coordinates: Center of the circle
+        radius_km: Radius of the circle in kilometers
+        precision: Geohash length of the cells
+
+    Returns:
+        Geohashes of every cell with at least one point within radius_km
+    """
+    latitude, longitude = float(coordinates.latitude), float(coordinates.longitude)
+    lat_delta = radius_km / 111.32
+    lng_delta = radius_km / max(111.32 * math.cos(math.radians(latitude)), 1e-6)
+    height, width = cell_size(precision)
+
+    # Walk the cell centers of the circle's bounding box
+    min_lat, _, min_lng, _ = bounds(encode(max(latitude - lat_delta, -90.0), longitude - lng_delta, precision))
+    rows = int(math.ceil((min(latitude + lat_delta, 90.0) - min_lat) / height))
+    columns = min(int(math.ceil((longitude + lng_delta - min_lng) / width)), int(360 / width))
+
+    cells = []
+    for row in range(rows):
+        cell_lat = min(min_lat + (row + 0.5) * height, 90.0 - height / 2)
+        for column in range(columns):
+            geohash = encode(cell_lat, min_lng + (column + 0.5) * width, precision)
+            if geohash not in cells and distance_to_cell_km(geohash, coordinates) <= radius_km:
+                cells.append(geohash)
+    return cells
@@ -64,3 +64,17 @@ class PagedResult(Generic[T]):
     def previous_page(self) -> Optional[int]:
         """Get previous page number if it exists"""
         return self.page - 1 if self.has_previous else None
+
+
+@dataclass(frozen=True)
+class SearchPage(Generic[T]):
+    """Value object representing one page of ranked search results
+    
+    total_items is exact when total_is_exact is True, otherwise it is a lower
+    bound coming from a capped count.
+    next_cursor is an opaque keyset cursor for fetching the following page.
+    """
+    items: List[T]
+    total_items: int
+    total_is_exact: bool = True
+    next_cursor: Optional[str] = None
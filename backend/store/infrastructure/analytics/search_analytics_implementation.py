@@ -1,105 +1,197 @@
 """
 Implementation of search analytics service.
+
+Searches are buffered in process and written in batches (see
+search_event_buffer). Each batch is inserted into the raw SearchQueryLog and
+folded into SearchQueryHourlyRollup in the same transaction; the analytics
+queries read the hourly rollups instead of scanning the raw log.
 """
 from typing import Dict, List, Optional
 import uuid
 from datetime import datetime, timedelta
 
-from django.db import models
+from django.conf import settings
+from django.db import connection, models, transaction
+from django.db.models.functions import Cast, TruncDay
 from django.utils import timezone
 
 from store.domain.services.search_analytics_service import SearchAnalyticsService
-from store.infrastructure.django_models.analytics_models import SearchQueryLog
+from store.infrastructure.analytics.search_event_buffer import SearchEvent, SearchEventBuffer
+from store.infrastructure.django_models.analytics_models import SearchQueryLog, SearchQueryHourlyRollup
+
+ROLLUP_TABLE = SearchQueryHourlyRollup._meta.db_table
+LOG_TABLE = SearchQueryLog._meta.db_table
+
+# Adds a batch's counts to the existing rollup rows
+UPSERT_ROLLUPS_SQL = f"""
+    INSERT INTO {ROLLUP_TABLE} AS r (hour, query, store_id, search_count, zero_result_count, result_count_sum)
+    SELECT * FROM unnest(%s::timestamptz[], %s::varchar[], %s::uuid[], %s::int[], %s::int[], %s::bigint[])
+    ON CONFLICT (hour, query, store_id) DO UPDATE SET
+        search_count = r.search_count + EXCLUDED.search_count,
+        zero_result_count = r.zero_result_count + EXCLUDED.zero_result_count,
+        result_count_sum = r.result_count_sum + EXCLUDED.result_count_sum
+"""
+
+# Recomputes the rollups of a time range from the raw log
+REBUILD_ROLLUPS_SQL = f"""
+    INSERT INTO {ROLLUP_TABLE} AS r (hour, query, store_id, search_count, zero_result_count, result_count_sum)
+    SELECT date_trunc('hour', timestamp), query, store_id,
+           count(*), count(*) FILTER (WHERE result_count = 0), sum(result_count)
+    FROM {LOG_TABLE}
+    WHERE timestamp >= %s
+    GROUP BY 1, 2, 3
+    ON CONFLICT (hour, query, store_id) DO UPDATE SET
+        search_count = EXCLUDED.search_count,
+        zero_result_count = EXCLUDED.zero_result_count,
+        result_count_sum = EXCLUDED.result_count_sum
+"""
+
+
+def persist_search_events(events: List[SearchEvent]) -> None:
+    """
+    Write a batch of search events: one bulk insert into the raw log and one
+    upsert of the hourly rollups, in a single transaction
+
+    Args:
+        events: Buffered search events
+    """
+    if not events:
+        return
+
+    rollups: Dict[tuple, List[int]] = {}
+    for event in events:
+        hour = event.timestamp.replace(minute=0, second=0, microsecond=0)
+        counts = rollups.setdefault((hour, event.query, event.store_id), [0, 0, 0])
+        counts[0] += 1
+        counts[1] += 1 if event.result_count == 0 else 0
+        counts[2] += event.result_count
+
+    keys = list(rollups)
+    with transaction.atomic():
+        SearchQueryLog.objects.bulk_create([
+            SearchQueryLog(
+                query=event.query,
+                store_id=event.store_id,
+                user_id=event.user_id,
+                result_count=event.result_count,
+                timestamp=event.timestamp
+            )
+            for event in events
+        ])
+        with connection.cursor() as cursor:
+            cursor.execute(UPSERT_ROLLUPS_SQL, [
+                [key[0] for key in keys],
+                [key[1] for key in keys],
+                [str(key[2]) if key[2] else None for key in keys],
+                [rollups[key][0] for key in keys],
+                [rollups[key][1] for key in keys],
+                [rollups[key][2] for key in keys],
+            ])
+
+
+def rebuild_hourly_rollups(since: datetime) -> int:
+    """
+    Recompute the hourly rollups from the raw log, e.g. after a backfill
+
+    Args:
+        since: Start of the range to rebuild
+
+    Returns:
+        Number of rollup rows written
+    """
+    since = since.replace(minute=0, second=0, microsecond=0)
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(REBUILD_ROLLUPS_SQL, [since])
+        return cursor.rowcount
+
+
+search_event_buffer = SearchEventBuffer(
+    writer=persist_search_events,
+    flush_size=getattr(settings, 'STORE_SEARCH_ANALYTICS_FLUSH_SIZE', 500),
+    flush_interval=getattr(settings, 'STORE_SEARCH_ANALYTICS_FLUSH_INTERVAL', 5.0),
+    max_events=getattr(settings, 'STORE_SEARCH_ANALYTICS_MAX_BUFFERED', 50000)
+)
 
 
 class DjangoSearchAnalyticsService(SearchAnalyticsService):
     """Django ORM implementation of SearchAnalyticsService"""
-    
-    def record_search(self, query: str, store_id: Optional[uuid.UUID] = None, 
+
+    def __init__(self, buffer: Optional[SearchEventBuffer] = search_event_buffer):
+        """
+        Args:
+            buffer: Event buffer, None to write every search synchronously
+        """
+        self.buffer = buffer
+
+    def record_search(self, query: str, store_id: Optional[uuid.UUID] = None,
                      result_count: int = 0, user_id: Optional[uuid.UUID] = None) -> None:
         """Record a search query for analytics"""
-        SearchQueryLog.objects.create(
+        event = SearchEvent(
             query=query,
             store_id=store_id,
-            result_count=result_count,
             user_id=user_id,
-            timestamp=timezone.now()
+            result_count=result_count
         )
-    
-    def get_popular_searches(self, limit: int = 10, 
+        if self.buffer is not None and getattr(settings, 'STORE_SEARCH_ANALYTICS_BUFFERED', True):
+            self.buffer.add(event)
+        else:
+            persist_search_events([event])
+
+    def get_popular_searches(self, limit: int = 10,
                             store_id: Optional[uuid.UUID] = None,
                             days: int = 7) -> List[Dict]:
         """Get most popular searches within a time period"""
-        time_threshold = timezone.now() - timedelta(days=days)
-        
-        # Base query
-        query = SearchQueryLog.objects.filter(timestamp__gte=time_threshold)
-        
-        # Apply store filter if provided
-        if store_id:
-            query = query.filter(store_id=store_id)
-        
-        # Aggregate and order
         popular_searches = (
-            query
+            self._rollups(days, store_id)
             .values('query')
             .annotate(
-                count=models.Count('id'),
-                avg_results=models.Avg('result_count')
+                count=models.Sum('search_count'),
+                avg_results=self._average_results()
             )
             .order_by('-count')[:limit]
         )
-        
+
         return list(popular_searches)
-    
-    def get_search_trends(self, days: int = 30, 
+
+    def get_search_trends(self, days: int = 30,
                          store_id: Optional[uuid.UUID] = None) -> List[Dict]:
         """Get search trends over time"""
-        time_threshold = timezone.now() - timedelta(days=days)
-        
-        # Base query
-        query = SearchQueryLog.objects.filter(timestamp__gte=time_threshold)
-        
-        # Apply store filter if provided
-        if store_id:
-            query = query.filter(store_id=store_id)
-        
-        # Group by day and count
         trends = (
-            query
-            .annotate(day=models.functions.TruncDay('timestamp'))
+            self._rollups(days, store_id)
+            .annotate(day=TruncDay('hour'))
             .values('day')
             .annotate(
-                count=models.Count('id'),
-                avg_results=models.Avg('result_count')
+                count=models.Sum('search_count'),
+                avg_results=self._average_results()
             )
             .order_by('day')
         )
-        
+
         return list(trends)
-    
+
     def get_zero_result_searches(self, limit: int = 10,
                                 store_id: Optional[uuid.UUID] = None,
                                 days: int = 7) -> List[Dict]:
         """Get searches that returned zero results"""
-        time_threshold = timezone.now() - timedelta(days=days)
-        
-        # Base query for zero results
-        query = SearchQueryLog.objects.filter(
-            timestamp__gte=time_threshold,
-            result_count=0
-        )
-        
-        # Apply store filter if provided
-        if store_id:
-            query = query.filter(store_id=store_id)
-        
-        # Aggregate and order
         zero_result_searches = (
-            query
+            self._rollups(days, store_id)
+            .filter(zero_result_count__gt=0)
             .values('query')
-            .annotate(count=models.Count('id'))
+            .annotate(count=models.Sum('zero_result_count'))
             .order_by('-count')[:limit]
         )
-        
+
         return list(zero_result_searches)
+
+    def _rollups(self, days: int, store_id: Optional[uuid.UUID]):
+        """Rollup rows of the last `days` days, optionally for one store"""
+        time_threshold = (timezone.now() - timedelta(days=days)).replace(minute=0, second=0, microsecond=0)
+        query = SearchQueryHourlyRollup.objects.filter(hour__gte=time_threshold)
+        if store_id:
+            query = query.filter(store_id=store_id)
+        return query
+
+    @staticmethod
+    def _average_results():
+        """Average result count of the aggregated searches"""
+        return Cast(models.Sum('result_count_sum'), models.FloatField()) / models.Sum('search_count')
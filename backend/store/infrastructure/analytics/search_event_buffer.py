@@ -0,0 +1,116 @@
+"""
+In-process buffer for search analytics events.
+
+Recording a search only appends to a bounded deque; a background thread
+hands the buffered events to a writer every `flush_size` events or
+`flush_interval` seconds, whichever comes first. Events are analytics, not
+business data: when the buffer is full the oldest ones are dropped (and
+counted) instead of slowing down searches, and events still buffered when a
+process is killed are lost. A normal interpreter exit flushes what is left.
+"""
+import atexit
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, List, Optional
+import uuid
+
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SearchEvent:
+    """One search, as recorded by the analytics service"""
+    query: str
+    store_id: Optional[uuid.UUID]
+    user_id: Optional[uuid.UUID]
+    result_count: int
+    timestamp: datetime = field(default_factory=timezone.now)
+
+
+class SearchEventBuffer:
+    """Bounded buffer of search events flushed in batches by a background thread"""
+
+    def __init__(self, writer: Callable[[List[SearchEvent]], None], flush_size: int = 500,
+                 flush_interval: float = 5.0, max_events: int = 50000):
+        """
+        Args:
+            writer: Persists a batch of events, called from the flush thread
+            flush_size: Flush as soon as this many events are buffered
+            flush_interval: Flush at least this often (seconds) while events are buffered
+            max_events: Buffer capacity, older events are dropped beyond it
+        """
+        self.writer = writer
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self._events = deque(maxlen=max_events)
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self.dropped = 0
+
+    def add(self, event: SearchEvent) -> None:
+        """Buffer an event; never blocks on I/O"""
+        self._ensure_thread()
+        with self._lock:
+            if len(self._events) == self._events.maxlen:
+                self.dropped += 1
+            self._events.append(event)
+            size = len(self._events)
+        if size >= self.flush_size:
+            self._wakeup.set()
+
+    def flush(self) -> int:
+        """
+        Write every buffered event now
+
+        Returns:
+            Number of events written
+        """
+        written = 0
+        while True:
+            with self._lock:
+                batch = [self._events.popleft() for _ in range(min(self.flush_size, len(self._events)))]
+            if not batch:
+                return written
+            try:
+                self.writer(batch)
+                written += len(batch)
+            except Exception as e:
+                logger.error(f"Error writing {len(batch)} search analytics events: {str(e)}")
+                return written
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def _ensure_thread(self) -> None:
+        # Started lazily, and again in a forked worker where the parent's thread doesn't exist
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name="search-analytics-flush", daemon=True)
+            self._thread.start()
+            atexit.register(self.flush)
+
+    def _run(self) -> None:
+        from django.db import close_old_connections
+
+        last_flush = time.monotonic()
+        while True:
+            self._wakeup.wait(timeout=self.flush_interval)
+            self._wakeup.clear()
+            now = time.monotonic()
+            if len(self._events) >= self.flush_size or now - last_flush >= self.flush_interval:
+                close_old_connections()
+                self.flush()
+                last_flush = now
@@ -3,6 +3,7 @@ Django ORM models for analytics data.
 """
 import uuid
 from django.db import models
+from django.utils import timezone
 
 
 class SearchQueryLog(models.Model):
@@ -12,7 +13,8 @@ class SearchQueryLog(models.Model):
     store_id = models.UUIDField(null=True, blank=True)
     user_id = models.UUIDField(null=True, blank=True)
     result_count = models.IntegerField(default=0)
-    timestamp = models.DateTimeField(auto_now_add=True)
+    # Defaulted rather than auto_now_add so buffered events keep the time of the search
+    timestamp = models.DateTimeField(default=timezone.now)
     
     class Meta:
         indexes = [
@@ -21,3 +23,29 @@ class SearchQueryLog(models.Model):
             models.Index(fields=['timestamp']),
             models.Index(fields=['result_count']),
         ]
+
+
+class SearchQueryHourlyRollup(models.Model):
+    """Searches aggregated per hour, query and store, read by the analytics queries"""
+    hour = models.DateTimeField()
+    query = models.CharField(max_length=255)
+    # NULL for searches across all stores
+    store_id = models.UUIDField(null=True, blank=True)
+    search_count = models.IntegerField(default=0)
+    zero_result_count = models.IntegerField(default=0)
+    # Sum of result counts, so the average can be derived after re-aggregation
+    result_count_sum = models.BigIntegerField(default=0)
+    
+    class Meta:
+        db_table = 'search_query_hourly_rollups'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['hour', 'query', 'store_id'],
+                name='search_rollup_hour_query_store',
+                nulls_distinct=False
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['hour']),
+            models.Index(fields=['store_id', 'hour']),
+        ]
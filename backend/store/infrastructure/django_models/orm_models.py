@@ -68,21 +68,40 @@ class ProductModel(models.Model):
     # Field to store pre-computed search vectors
     search_vector = SearchVectorField(null=True)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the text the vector was computed from, for the dirty check in save()
+        instance._loaded_search_text = (instance.__dict__.get('name'), instance.__dict__.get('description'))
+        return instance
+    
     def save(self, *args, **kwargs):
-        """Override save to update search vector"""
+        """Override save to keep the search vector up to date
+        
+        See store.infrastructure.search.search_vector_maintenance for the modes.
+        """
+        from store.infrastructure.search.search_vector_maintenance import (
+            MODE_ALWAYS, MODE_TRIGGER, SEARCH_VECTOR_SOURCE_FIELDS,
+            get_search_vector_mode, search_vector_expression,
+        )
+        
+        adding = self._state.adding
         # First save the model to ensure it exists in the database
         super().save(*args, **kwargs)
         
-        # Then update the search vector
-        from django.contrib.postgres.search import SearchVector
-    
+        mode = get_search_vector_mode()
+        if mode == MODE_TRIGGER:
+            return  # The trigger computed the vector in the same statement
+        if mode != MODE_ALWAYS and not adding:
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None and not set(update_fields) & set(SEARCH_VECTOR_SOURCE_FIELDS):
+                return
+            if getattr(self, '_loaded_search_text', None) == (self.name, self.description):
+                return
+        
         # Update only this instance
-        type(self).objects.filter(pk=self.pk).update(
-            search_vector=(
-                SearchVector('name', weight='A', config='french') +
-                SearchVector('description', weight='B', config='french')
-            )
-        )
+        type(self).objects.filter(pk=self.pk).update(search_vector=search_vector_expression())
+        self._loaded_search_text = (self.name, self.description)
     
     class Meta:
         # Uses GIN index for fast fuzzy matching
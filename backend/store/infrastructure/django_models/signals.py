@@ -0,0 +1,103 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from store.infrastructure.django_models.orm_models import CategoryModel, ProductModel, StoreProductModel
+from store.infrastructure.external_services.cache_service import (
+    invalidate_category_cache,
+    invalidate_search_cache,
+)
+from store.infrastructure.search.autocomplete_index import (
+    autocomplete_index,
+    publish_product_change,
+)
+
+# The in-process autocomplete index is updated after the transaction commits,
+# so suggestions never show a name that was rolled back. Changes are always
+# published so that web workers pick up saves made by other processes.
+
+@receiver(post_save, sender=ProductModel)
+def update_autocomplete_on_product_save(sender, instance, **kwargs):
+    """Refresh the product's name in the autocomplete index when a ProductModel is saved"""
+    product_id, name = instance.pk, instance.name
+
+    def apply():
+        if autocomplete_index.is_loaded:
+            autocomplete_index.upsert_product(product_id, name)
+        publish_product_change(product_id)
+
+    transaction.on_commit(apply)
+
+@receiver(post_delete, sender=ProductModel)
+def update_autocomplete_on_product_delete(sender, instance, **kwargs):
+    """Remove the product from the autocomplete index when a ProductModel is deleted"""
+    product_id = instance.pk
+
+    def apply():
+        if autocomplete_index.is_loaded:
+            autocomplete_index.remove_product(product_id)
+        publish_product_change(product_id)
+
+    transaction.on_commit(apply)
+
+@receiver(post_save, sender=StoreProductModel)
+def update_autocomplete_on_store_product_save(sender, instance, created, **kwargs):
+    """Make the product visible in the store's suggestions when it is added to a store"""
+    if not created:
+        return
+    product_id, store_brand_id = instance.product_id, instance.store_brand_id
+
+    def apply():
+        if autocomplete_index.is_loaded:
+            autocomplete_index.add_product_to_store(product_id, store_brand_id)
+        publish_product_change(product_id)
+
+    transaction.on_commit(apply)
+
+@receiver(post_delete, sender=StoreProductModel)
+def update_autocomplete_on_store_product_delete(sender, instance, **kwargs):
+    """Hide the product from the store's suggestions when it is no longer sold there"""
+    product_id, store_brand_id = instance.product_id, instance.store_brand_id
+
+    def apply():
+        if autocomplete_index.is_loaded:
+            # The product may still be sold in another category of the same store
+            still_sold = StoreProductModel.objects.filter(
+                product_id=product_id, store_brand_id=store_brand_id
+            ).exists()
+            if not still_sold:
+                autocomplete_index.remove_product_from_store(product_id, store_brand_id)
+        publish_product_change(product_id)
+
+    transaction.on_commit(apply)
+
+# Cached search pages embed a per-store generation; a change to a product or
+# to what a store sells moves the affected stores to a new generation.
+
+@receiver(post_save, sender=ProductModel)
+@receiver(post_delete, sender=ProductModel)
+def invalidate_search_cache_on_product_change(sender, instance, created=False, **kwargs):
+    """Invalidate the cached searches of every store selling the product"""
+    if created:
+        return  # Not sold anywhere yet
+    store_brand_ids = list(StoreProductModel.objects.filter(
+        product_id=instance.pk
+    ).values_list('store_brand_id', flat=True).distinct())
+
+    transaction.on_commit(lambda: invalidate_search_cache(store_brand_ids))
+
+@receiver(post_save, sender=StoreProductModel)
+@receiver(post_delete, sender=StoreProductModel)
+def invalidate_search_cache_on_store_product_change(sender, instance, **kwargs):
+    """Invalidate the cached searches of the store"""
+    store_brand_id = instance.store_brand_id
+
+    transaction.on_commit(lambda: invalidate_search_cache([store_brand_id]))
+
+@receiver(post_save, sender=CategoryModel)
+@receiver(post_delete, sender=CategoryModel)
+def invalidate_category_cache_on_category_change(sender, instance, **kwargs):
+    """Invalidate the cached pages of the category"""
+    category_path = str(instance.path)
+
+    transaction.on_commit(lambda: invalidate_category_cache([category_path]))
@@ -3,6 +3,7 @@ import uuid
 
 from store.domain.models.entities import ProductWithDetails
 from store.domain.repositories.repository_interfaces import ProductRepository
+from store.domain.value_objects.pagination import PaginationParams, SearchPage
 from store.infrastructure.django_models.orm_models import (
     ProductModel, 
 )
@@ -15,49 +16,84 @@ class DjangoProductRepository(ProductRepository):
         # Repository initialization
         self.search_service = CombinedSearchStrategy()
 
-    def search_products_in_one_store(self, store_id: uuid.UUID, query: str) -> List[ProductWithDetails]:
-        """Search for products with price information by query string in a store"""
-        # Use the search service to find matching products for this store
-        matching_product_ids = self.search_service.search_products(query, store_id=store_id)
+    def search_products_in_one_store(self, store_id: uuid.UUID, query: str,
+                                     pagination: PaginationParams,
+                                     cursor: Optional[str] = None) -> SearchPage[ProductWithDetails]:
+        """Search for products with price information by query string in a store
+        
+        Only the requested page of product IDs is fetched from the database.
+        """
+        # Use the search service to find one page of matching products for this store
+        page = self.search_service.search_products_page(
+            query,
+            store_id=store_id,
+            limit=pagination.limit,
+            offset=pagination.offset,
+            cursor=cursor
+        )
+        
+        if not page.items:
+            return SearchPage(items=[], total_items=page.total_items,
+                              total_is_exact=page.total_is_exact)
             
         # Import the utility class
         from store.infrastructure.django_repositories.repository_utils import QueryUtils
         
         # Build optimized query using the utility
         store_products = QueryUtils.build_optimized_query(
-            store_id=store_id,
-            product_id__in=matching_product_ids
+            store_brand_id=store_id,
+            product_id__in=page.items
         )
         
-        # Convert to domain models using the utility
-        return QueryUtils.build_product_details_from_queryset(store_products)
+        # Convert to domain models and restore relevance order
+        rank = {product_id: position for position, product_id in enumerate(page.items)}
+        products = QueryUtils.build_product_details_from_queryset(store_products)
+        products.sort(key=lambda product: rank[product.product_id])
+        
+        return SearchPage(
+            items=products,
+            total_items=page.total_items,
+            total_is_exact=page.total_is_exact,
+            next_cursor=page.next_cursor
+        )
 
-    def search_products_in_all_stores(self, query: str) -> Dict[uuid.UUID, Tuple[str, List[ProductWithDetails]]]:
+    def search_products_in_all_stores(self, query: str, pagination: PaginationParams
+                                      ) -> Tuple[Dict[uuid.UUID, Tuple[str, List[ProductWithDetails]]], Dict[uuid.UUID, int]]:
         """Search for products with price information by query string in all stores
         
         Args:
             query: The search query string
+            pagination: Page window applied to each store's results
             
         Returns:
-            Dictionary mapping store IDs to tuples of (category_path, list of products)
+            Tuple of (store IDs -> (category_path, list of products for the page),
+                      store IDs -> total number of matches in that store)
         """
-        # Use the search service to find matching products
-        matching_product_ids = self.search_service.search_products(query)
+        # Use the search service to find one page of matching products per store
+        page_by_store, store_counts = self.search_service.search_store_products_per_store(
+            query,
+            limit=pagination.limit,
+            offset=pagination.offset
+        )
         
-        if not matching_product_ids:
-            return {}  # Return empty dict if no matches
+        if not page_by_store:
+            return {}, store_counts  # Return empty dict if no matches on this page
             
         # Import the utility class
         from store.infrastructure.django_repositories.repository_utils import QueryUtils
         
         # Build optimized query using the utility
         # QueryUtils.build_optimized_query already includes select_related
-        store_products = QueryUtils.build_optimized_query(
-            product_id__in=matching_product_ids
-        )
+        rank = {
+            store_product_id: position
+            for store_product_ids in page_by_store.values()
+            for position, store_product_id in enumerate(store_product_ids)
+        }
+        store_products = QueryUtils.build_optimized_query(id__in=list(rank))
         
-        # Get a flat list of products with details
+        # Get a flat list of products with details, in relevance order per store
         products_list = QueryUtils.build_product_details_from_queryset(store_products)
+        products_list.sort(key=lambda product: rank[product.store_product_id])
         
         # Group products by store ID
         products_by_store = {}
@@ -71,11 +107,36 @@ class DjangoProductRepository(ProductRepository):
             # Add product to the list for this store
             products_by_store[product.store_id][1].append(product)
         
-        return products_by_store
+        return products_by_store, store_counts
     
     def get_autocomplete_suggestions(self, partial_query: str, store_brand_id: Optional[uuid.UUID] = None, limit: int = 10) -> List[str]:
         """Get autocomplete suggestions for a partial query string
         
+        Served from the in-process autocomplete index, falling back to the
+        database when the index is disabled.
+        
+        Args:
+            partial_query: The partial search query typed by the user
+            store_brand_id: Optional UUID of the store brand to limit suggestions to
+            limit: Maximum number of suggestions to return
+            
+        Returns:
+            List of ProductName objects that match the partial query
+        """
+        from store.domain.models.entities import ProductName
+        from store.infrastructure.search.autocomplete_index import (
+            get_autocomplete_index, is_autocomplete_index_enabled
+        )
+        
+        if not is_autocomplete_index_enabled():
+            return self.get_autocomplete_suggestions_from_db(partial_query, store_brand_id, limit)
+        
+        names = get_autocomplete_index().suggest(partial_query, store_brand_id=store_brand_id, limit=limit)
+        return [ProductName(name) for name in names]
+
+    def get_autocomplete_suggestions_from_db(self, partial_query: str, store_brand_id: Optional[uuid.UUID] = None, limit: int = 10) -> List[str]:
+        """Get autocomplete suggestions for a partial query string with a database query
+        
         Args:
             partial_query: The partial search query typed by the user
             store_brand_id: Optional UUID of the store brand to limit suggestions to
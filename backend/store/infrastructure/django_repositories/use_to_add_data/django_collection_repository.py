@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
 import uuid
 from datetime import datetime
 
@@ -126,6 +126,34 @@ class DjangoCollectedProductRepository(CollectedProductRepository):
         except Exception:
             return False
     
+    def iter_products_by_batch(self, batch_id: uuid.UUID, chunk_size: int) -> Iterator[List[CollectedProduct]]:
+        """Iterate over the collected products of a batch in chunks, paging on the primary key"""
+        products = CollectedProductModel.objects.filter(batch_id=batch_id).order_by('id')
+        last_id = None
+        while True:
+            page = products if last_id is None else products.filter(id__gt=last_id)
+            chunk = list(page[:chunk_size])
+            if not chunk:
+                return
+            last_id = chunk[-1].id
+            yield [self._product_model_to_domain(model) for model in chunk]
+    
+    def bulk_update_product_status(self, statuses: Dict[uuid.UUID, Optional[str]]) -> int:
+        """Mark many collected products processed or in error in one statement"""
+        if not statuses:
+            return 0
+        models = [
+            CollectedProductModel(
+                id=product_id,
+                status='error' if error_message else 'processed',
+                error_message=error_message
+            )
+            for product_id, error_message in statuses.items()
+        ]
+        return CollectedProductModel.objects.bulk_update(
+            models, ['status', 'error_message'], batch_size=len(models)
+        )
+    
     @transaction.atomic
     def bulk_create_collected_products(self, products: List[CollectedProduct]) -> List[CollectedProduct]:
         """Create multiple collected products in a single operation"""
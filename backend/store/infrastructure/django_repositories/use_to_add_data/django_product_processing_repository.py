@@ -1,9 +1,35 @@
-from typing import Optional
+from decimal import Decimal, InvalidOperation
+from typing import Dict, List, Optional, Set, Tuple
 import uuid
 
+from django.db import transaction
+
 from store.domain.models.entities import Category, Product, StoreProduct
+from store.domain.models.use_to_add_data.collection_entities import CollectedProduct
 from store.domain.repositories.use_to_add_data.product_processing_repository import ProductProcessingRepository
 from store.infrastructure.django_models.orm_models import CategoryModel, ProductModel, StoreProductModel
+from store.infrastructure.external_services.cache_service import invalidate_search_cache
+from store.infrastructure.search.autocomplete_index import publish_full_reload
+from store.infrastructure.search.search_vector_maintenance import refresh_search_vectors
+
+CENTS = Decimal('0.01')
+# Store product prices are DecimalField(max_digits=10, decimal_places=2)
+MAX_PRICE = Decimal('99999999.99')
+
+
+def _to_price(value) -> Decimal:
+    """Convert a collected price to the Decimal stored in the database
+    
+    Raises:
+        ValueError: If the value is not a finite, non-negative price that fits the column
+    """
+    try:
+        price = Decimal(str(value)).quantize(CENTS)
+    except (InvalidOperation, ValueError):
+        raise ValueError(f"Invalid price {value!r}")
+    if not price.is_finite() or price < 0 or price > MAX_PRICE:
+        raise ValueError(f"Invalid price {value!r}")
+    return price
 
 class DjangoProductProcessingRepository(ProductProcessingRepository):
     """Django ORM implementation of ProductProcessingRepository"""
@@ -136,3 +162,132 @@ class DjangoProductProcessingRepository(ProductProcessingRepository):
             price=store_product_model.price,
             price_per_unit=store_product_model.price_per_unit
         )
+    
+    def bulk_process_collected_products(self, 
+                                        store_brand_id: uuid.UUID, 
+                                        collected_products: List[CollectedProduct]) -> Dict[uuid.UUID, Optional[str]]:
+        """Create or update the categories, products and store products of many collected products"""
+        results: Dict[uuid.UUID, Optional[str]] = {}
+        valid = []
+        prices: Dict[uuid.UUID, Tuple[Decimal, Decimal]] = {}
+        for product in collected_products:
+            if not product.slug or not product.category_slug or not product.category_path.strip('.'):
+                results[product.id] = "Missing product slug, category slug or category path"
+                continue
+            # Checked before anything is written: a bad row must not roll back the chunk
+            try:
+                prices[product.id] = (_to_price(product.price), _to_price(product.price_per_unit))
+            except ValueError as e:
+                results[product.id] = str(e)
+                continue
+            valid.append(product)
+        
+        with transaction.atomic():
+            category_ids = self._resolve_categories(store_brand_id, valid)
+            product_ids, created_product_ids = self._resolve_products(valid)
+            
+            # Keyed on the unique constraint: a later row for the same product wins
+            store_products: Dict[Tuple[uuid.UUID, uuid.UUID], StoreProductModel] = {}
+            for product in valid:
+                category_id = category_ids.get(product.category_path.strip('.'))
+                product_id = product_ids.get(product.slug)
+                if category_id is None:
+                    results[product.id] = f"Category '{product.category_path}' conflicts with an existing category name or slug"
+                    continue
+                if product_id is None:
+                    results[product.id] = f"Product '{product.slug}' could not be created"
+                    continue
+                price, price_per_unit = prices[product.id]
+                store_products[(category_id, product_id)] = StoreProductModel(
+                    store_brand_id=store_brand_id,
+                    product_id=product_id,
+                    category_id=category_id,
+                    price=price,
+                    price_per_unit=price_per_unit
+                )
+                results[product.id] = None
+            
+            if store_products:
+                StoreProductModel.objects.bulk_create(
+                    list(store_products.values()),
+                    update_conflicts=True,
+                    unique_fields=['store_brand', 'category', 'product'],
+                    update_fields=['price', 'price_per_unit']
+                )
+            refresh_search_vectors(created_product_ids)
+            
+            # bulk_create skips the signals that keep the autocomplete index
+            # and the cached search pages fresh
+            if created_product_ids or store_products:
+                transaction.on_commit(publish_full_reload)
+                transaction.on_commit(lambda: invalidate_search_cache([store_brand_id]))
+        
+        return results
+    
+    def _resolve_categories(self, store_brand_id: uuid.UUID, 
+                            collected_products: List[CollectedProduct]) -> Dict[str, uuid.UUID]:
+        """Map each category path to its ID, inserting the missing categories"""
+        by_path = {product.category_path.strip('.'): product for product in collected_products}
+        if not by_path:
+            return {}
+        
+        category_ids = {
+            str(path): category_id
+            for path, category_id in CategoryModel.objects.filter(path__in=list(by_path)).values_list('path', 'id')
+        }
+        missing = [
+            CategoryModel(name=product.category_name, path=path, slug=product.category_slug)
+            for path, product in by_path.items() if path not in category_ids
+        ]
+        if missing:
+            # Categories sharing a name or slug with an existing one are left out
+            CategoryModel.objects.bulk_create(missing, ignore_conflicts=True)
+            category_ids.update(
+                (str(path), category_id)
+                for path, category_id in CategoryModel.objects.filter(
+                    path__in=[category.path for category in missing]
+                ).values_list('path', 'id')
+            )
+        
+        StoreBrandLink = CategoryModel.store_brand.through
+        StoreBrandLink.objects.bulk_create(
+            [StoreBrandLink(categorymodel_id=category_id, storebrandmodel_id=store_brand_id)
+             for category_id in category_ids.values()],
+            ignore_conflicts=True
+        )
+        return category_ids
+    
+    def _resolve_products(self, collected_products: List[CollectedProduct]) -> Tuple[Dict[str, uuid.UUID], Set[uuid.UUID]]:
+        """Map each product slug to its ID, inserting the missing products
+        
+        Returns:
+            Tuple of (ID per slug, IDs of the products created)
+        """
+        by_slug = {product.slug: product for product in collected_products}
+        if not by_slug:
+            return {}, set()
+        
+        product_ids = dict(ProductModel.objects.filter(slug__in=list(by_slug)).values_list('slug', 'id'))
+        missing = [
+            ProductModel(
+                name=product.name,
+                slug=slug,
+                quantity=product.quantity,
+                unit=product.unit,
+                description=product.description,
+                image_url=product.image_url
+            )
+            for slug, product in by_slug.items() if slug not in product_ids
+        ]
+        if not missing:
+            return product_ids, set()
+        
+        ProductModel.objects.bulk_create(missing, ignore_conflicts=True)
+        inserted = dict(ProductModel.objects.filter(
+            slug__in=[product.slug for product in missing]
+        ).values_list('slug', 'id'))
+        product_ids.update(inserted)
+        
+        # Rows inserted concurrently by another batch keep their own IDs
+        generated_ids = {product.id for product in missing}
+        return product_ids, {product_id for product_id in inserted.values() if product_id in generated_ids}
@@ -0,0 +1,118 @@
+"""
+Hit ratio and payload size metrics for the store caches, per key family.
+
+A key family is the first two segments of a cache key, e.g.
+`store_search:store` or `store:location`. Counters are kept in process and
+added to a Redis hash per family every FLUSH_INTERVAL seconds, so recording
+a hit costs no round trip and the totals cover every worker.
+
+Measuring a payload means serializing it again, so only a sample of the
+writes is measured; the average size is taken over that sample.
+"""
+import logging
+import random
+import threading
+import time
+from typing import Dict, List, Optional
+
+from store.config.constants import CACHE_SIZE_SAMPLE_RATE, STATS_KEY_PREFIX
+
+logger = logging.getLogger(__name__)
+
+CACHE_METRICS_KEY = f"{STATS_KEY_PREFIX}:cache:{{}}"
+CACHE_METRICS_FAMILIES_KEY = f"{STATS_KEY_PREFIX}:cache:families"
+
+FIELDS = ('hits', 'misses', 'sets', 'sized_sets', 'payload_bytes')
+
+
+def key_family(key: str) -> str:
+    """Family of a cache key: its first two ':'-separated segments"""
+    return ':'.join(key.split(':', 2)[:2])
+
+
+def should_measure_payload() -> bool:
+    """Whether this write is part of the payload size sample"""
+    return random.random() < CACHE_SIZE_SAMPLE_RATE
+
+
+class CacheMetrics:
+    """In-process cache counters periodically added to shared Redis hashes"""
+
+    FLUSH_INTERVAL = 10.0
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[str, int]] = {}
+        self._last_flush = time.monotonic()
+
+    def record_get(self, key: str, hit: bool) -> None:
+        self._increment(key_family(key), 'hits' if hit else 'misses', 1)
+
+    def record_set(self, key: str, payload_bytes: Optional[int] = None) -> None:
+        """Count a write, with its size when it was measured"""
+        family = key_family(key)
+        self._increment(family, 'sets', 1)
+        if payload_bytes is not None:
+            self._increment(family, 'sized_sets', 1)
+            self._increment(family, 'payload_bytes', payload_bytes)
+
+    def flush(self) -> None:
+        """Add the local counters to the shared hashes and reset them"""
+        with self._lock:
+            counters, self._counters = self._counters, {}
+            self._last_flush = time.monotonic()
+        if not counters:
+            return
+        try:
+            from django_redis import get_redis_connection
+            pipe = get_redis_connection("default").pipeline(transaction=False)
+            for family, values in counters.items():
+                pipe.sadd(CACHE_METRICS_FAMILIES_KEY, family)
+                for field, value in values.items():
+                    pipe.hincrby(CACHE_METRICS_KEY.format(family), field, value)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Could not publish cache metrics: {e}")
+
+    def snapshot(self) -> List[Dict]:
+        """
+        Totals across every process, per key family
+
+        Returns:
+            One dict per family with hits, misses, hit_ratio, sets and avg_payload_bytes
+        """
+        self.flush()
+        from django_redis import get_redis_connection
+        redis = get_redis_connection("default")
+
+        families = sorted(family.decode() for family in redis.smembers(CACHE_METRICS_FAMILIES_KEY))
+        pipe = redis.pipeline(transaction=False)
+        for family in families:
+            pipe.hgetall(CACHE_METRICS_KEY.format(family))
+
+        metrics = []
+        for family, raw in zip(families, pipe.execute()):
+            values = {field: int(raw.get(field.encode(), 0)) for field in FIELDS}
+            lookups = values['hits'] + values['misses']
+            metrics.append({
+                'family': family,
+                'hits': values['hits'],
+                'misses': values['misses'],
+                'hit_ratio': values['hits'] / lookups if lookups else 0.0,
+                'sets': values['sets'],
+                'avg_payload_bytes': (
+                    values['payload_bytes'] / values['sized_sets'] if values['sized_sets'] else 0.0
+                ),
+            })
+        return metrics
+
+    def _increment(self, family: str, field: str, value: int) -> None:
+        with self._lock:
+            counters = self._counters.setdefault(family, dict.fromkeys(FIELDS, 0))
+            counters[field] += value
+            due = time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL
+        if due:
+            self.flush()
+
+
+cache_metrics = CacheMetrics()
@@ -1,31 +1,107 @@
 from typing import Any, Dict, Optional, List
 import json
 import hashlib
+import pickle
+import time
 from django.core.cache import cache
 from store.domain.services.cache_service import CacheService
 from store.domain.value_objects.coordinates import Coordinates
 from store.config.constants import (
-    CACHE_KEY_PREFIX,
-    ADDRESS_KEY_PREFIX,
-    BRAND_KEY_PREFIX,
     LOCATION_KEY_PREFIX,
     MIN_TIMEOUT,
     MAX_TIMEOUT,
     COMPLEXITY_WEIGHT,
     SIZE_WEIGHT,
-    COORDINATE_PRECISION
+    COORDINATE_PRECISION,
+    GENERATION_KEY_PREFIX
 )
+from store.infrastructure.external_services.cache_metrics import cache_metrics, should_measure_payload
 
 class DjangoCacheService(CacheService):
     """Service for caching data with monitoring capabilities"""
     
     def get(self, key: str) -> Any:
         """Get value from cache"""
-        return cache.get(key)
+        value = cache.get(key)
+        cache_metrics.record_get(key, hit=value is not None)
+        return value
     
     def set(self, key: str, value: Any, timeout: int) -> None:
         """Set value in cache"""
         cache.set(key, value, timeout)
+        cache_metrics.record_set(key, self._sampled_size(value))
+    
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Get several values from cache in one round trip"""
+        values = cache.get_many(keys)
+        for key in keys:
+            cache_metrics.record_get(key, hit=values.get(key) is not None)
+        return values
+    
+    def set_many(self, values: Dict[str, Any], timeout: int) -> None:
+        """Set several values in cache in one round trip"""
+        cache.set_many(values, timeout)
+        for key, value in values.items():
+            cache_metrics.record_set(key, self._sampled_size(value))
+    
+    @staticmethod
+    def _sampled_size(value: Any) -> Optional[int]:
+        """Serialized size of a sample of the written values, None for the others"""
+        if not should_measure_payload():
+            return None
+        # Same serialization as the Redis backend, to report the stored size
+        return len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+    
+    def increment(self, key: str, timeout: int) -> int:
+        """Increment a counter, creating it with the given timeout"""
+        if cache.add(key, 1, timeout):
+            return 1
+        try:
+            return cache.incr(key)
+        except ValueError:
+            # Expired between add and incr
+            cache.add(key, 1, timeout)
+            return 1
+    
+    def get_generation(self, namespace: str) -> int:
+        """Get the current generation of a cache namespace
+        
+        Keys embedding the generation are invalidated all at once by
+        bump_generation and then age out by TTL.
+        """
+        return self.get_generations([namespace])[0]
+    
+    def get_generations(self, namespaces: List[str]) -> List[int]:
+        """Get the current generations of several namespaces in one round trip
+        
+        Args:
+            namespaces: Namespace names
+            
+        Returns:
+            The generations, in the order of the namespaces
+        """
+        keys = [f"{GENERATION_KEY_PREFIX}:{namespace}" for namespace in namespaces]
+        generations = cache.get_many(keys)
+        for key in keys:
+            if generations.get(key) is None:
+                # Start from the clock so a counter lost to eviction never goes back
+                # to a value that stale keys were built with
+                cache.add(key, int(time.time() * 1000), timeout=None)
+                generations[key] = cache.get(key)
+        return [generations[key] for key in keys]
+    
+    def bump_generation(self, namespace: str) -> int:
+        """Invalidate every key built with the namespace's current generation"""
+        key = f"{GENERATION_KEY_PREFIX}:{namespace}"
+        try:
+            return cache.incr(key)
+        except ValueError:
+            cache.add(key, int(time.time() * 1000), timeout=None)
+            return cache.incr(key)
+    
+    def get_cache_metrics(self) -> List[Dict]:
+        """Hit ratio and average payload size per key family, across processes"""
+        return cache_metrics.snapshot()
     
     def set_with_adaptive_timeout(self, key: str, value: Any, 
                                  complexity: float = 0.5, 
@@ -77,16 +153,22 @@ class DjangoCacheService(CacheService):
         lat_rounded = round(coordinates.latitude, COORDINATE_PRECISION)
         lng_rounded = round(coordinates.longitude, COORDINATE_PRECISION)
         
+        # Location results list brands, so clearing either cache type invalidates them
+        namespaces = ['all', 'location', 'brand']
+        if address:
+            namespaces.append('address')
+        generation = '.'.join(str(g) for g in self.get_generations(namespaces))
+        
         # Create base key with coordinates and radius
         if address:
-            key = f"{LOCATION_KEY_PREFIX}:{address}:{lat_rounded}:{lng_rounded}:{radius_km}"
+            key = f"{LOCATION_KEY_PREFIX}:g{generation}:{address}:{lat_rounded}:{lng_rounded}:{radius_km}"
         else:
-            key = f"{LOCATION_KEY_PREFIX}:{lat_rounded}:{lng_rounded}:{radius_km}"
+            key = f"{LOCATION_KEY_PREFIX}:g{generation}:{lat_rounded}:{lng_rounded}:{radius_km}"
         
         # Sort to ensure consistent key regardless of order
-        sorted_slugs = sorted(brand_slugs)
-        brands_str = "-".join(sorted_slugs)
-        key = f"{key}:{brands_str}"
+        if brand_slugs:
+            brands_str = "-".join(sorted(brand_slugs))
+            key = f"{key}:{brands_str}"
             
         return key
 
@@ -112,22 +194,54 @@ class DjangoCacheService(CacheService):
         key_json = json.dumps(key_parts, sort_keys=True)
         key_hash = hashlib.md5(key_json.encode()).hexdigest()
         
-        # Create final key
+        # Create final key, in the generation of the store (or of global searches),
+        # and of the category when the search is restricted to one
         prefix = 'store_search'
+        namespaces = ['all', f"store:{store_id}" if store_id else "search:global"]
+        category_path = (filters or {}).get('category_path')
+        if category_path:
+            namespaces.append(f"category:{category_path}")
+        generation = '.'.join(str(g) for g in self.get_generations(namespaces))
         if store_id:
-            return f"{prefix}:store:{store_id}:{key_hash}"
+            return f"{prefix}:store:{store_id}:g{generation}:{key_hash}"
         else:
-            return f"{prefix}:global:{key_hash}"
+            return f"{prefix}:global:g{generation}:{key_hash}"
 
     def clear_cache(self, cache_type: Optional[str] = None) -> None:
-        """Clear specific or all cache types"""
-        if cache_type == 'address':
-            cache.delete_pattern(f"{ADDRESS_KEY_PREFIX}:*")
-        elif cache_type == 'brand':
-            cache.delete_pattern(f"{BRAND_KEY_PREFIX}:*")
+        """Clear specific or all cache types
+        
+        Moves the cache type's namespace to a new generation, a single INCR
+        whatever the size of the keyspace; the old keys are no longer read
+        and expire with their TTL.
+        """
+        if cache_type in ('address', 'brand', 'location'):
+            self.bump_generation(cache_type)
         else:
-            cache.delete_pattern(f"{CACHE_KEY_PREFIX}:*")
+            self.bump_generation('all')
 
     def delete(self, key: str) -> None:
         """Delete value from cache"""
-        cache.delete(key)
\ No newline at end of file
+        cache.delete(key)
+
+
+def invalidate_search_cache(store_brand_ids) -> None:
+    """Move the cached search pages of some stores, and all global searches, to a new generation
+    
+    Args:
+        store_brand_ids: IDs of the store brands whose products changed
+    """
+    cache_service = DjangoCacheService()
+    for store_brand_id in set(store_brand_ids):
+        cache_service.bump_generation(f"store:{store_brand_id}")
+    cache_service.bump_generation("search:global")
+
+
+def invalidate_category_cache(category_paths) -> None:
+    """Move the cached pages of some categories to a new generation
+    
+    Args:
+        category_paths: Paths of the categories that changed
+    """
+    cache_service = DjangoCacheService()
+    for category_path in set(category_paths):
+        cache_service.bump_generation(f"category:{category_path}")
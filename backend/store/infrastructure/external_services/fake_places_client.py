@@ -0,0 +1,79 @@
+"""
+Offline stand-in for the googlemaps client's Places nearby search.
+
+Replays recorded Places API responses from JSON, so the store location code
+can be exercised and benchmarked without network access or an API key:
+
+    client = FakePlacesClient.from_file('places_recording.json')
+    service = GoogleMapsService(client=client)
+
+A recording is either a single response ({"results": [...]}) replayed for
+every search, or a mapping of keyword to response.
+"""
+import json
+import math
+import random
+from typing import Any, Dict, Optional, Tuple
+
+
+class FakePlacesClient:
+    """Replays recorded Places API responses and counts the searches made"""
+
+    def __init__(self, recording: Dict[str, Any]):
+        """
+        Args:
+            recording: A Places API response, or a dict of responses by keyword
+        """
+        self.recording = recording
+        self.calls = 0
+
+    @classmethod
+    def from_file(cls, path: str) -> 'FakePlacesClient':
+        """Load a recording saved as JSON"""
+        with open(path, encoding='utf-8') as recording_file:
+            return cls(json.load(recording_file))
+
+    def places_nearby(self, location: Optional[Tuple[float, float]] = None, radius: Optional[int] = None,
+                      keyword: Optional[str] = None, type: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        """Same signature and response shape as googlemaps.Client.places_nearby"""
+        self.calls += 1
+        if 'results' in self.recording:
+            return self.recording
+        return self.recording.get(keyword or '', {'results': [], 'status': 'ZERO_RESULTS'})
+
+    @staticmethod
+    def generate_response(location: Tuple[float, float], count: int, radius_m: float,
+                          name: str = 'Carrefour', seed: int = 0) -> Dict[str, Any]:
+        """
+        Build a response shaped like the Places API one, with places spread around a location
+
+        Args:
+            location: (latitude, longitude) of the search
+            count: Number of places
+            radius_m: Places are spread up to this distance
+            name: Name of the places
+            seed: Random seed, for reproducible recordings
+
+        Returns:
+            A Places API nearby search response
+        """
+        rng = random.Random(seed)
+        latitude, longitude = location
+        results = []
+        for i in range(count):
+            distance = radius_m * math.sqrt(rng.random()) / 111320
+            angle = rng.random() * 2 * math.pi
+            results.append({
+                'place_id': f'fake-{seed}-{i}',
+                'name': name,
+                'vicinity': f'{rng.randint(1, 200)} Rue {rng.choice(["de Rivoli", "Oberkampf", "de la Paix"])}, Paris',
+                'types': ['supermarket', 'store'],
+                'business_status': 'OPERATIONAL',
+                'rating': round(rng.uniform(3, 5), 1),
+                'user_ratings_total': rng.randint(10, 2000),
+                'geometry': {'location': {
+                    'lat': latitude + distance * math.cos(angle),
+                    'lng': longitude + distance * math.sin(angle) / math.cos(math.radians(latitude)),
+                }},
+            })
+        return {'results': results, 'status': 'OK'}
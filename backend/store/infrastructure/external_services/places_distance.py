@@ -0,0 +1,66 @@
+"""
+Batch distance kernel for place candidates.
+
+Distances from one origin to every candidate are computed with numpy in a
+single pass instead of a Python haversine call per place, then filtered by
+radius and sorted, so callers only build result dicts for the places they keep.
+"""
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from store.domain.value_objects.coordinates import Coordinates
+
+EARTH_RADIUS_M = 6371000.0
+
+
+def haversine_m(origin: Coordinates, latitudes: Sequence[float], longitudes: Sequence[float]) -> np.ndarray:
+    """
+    Great-circle distances from an origin to many points
+
+    Args:
+        origin: Point distances are measured from
+        latitudes: Latitudes of the points, in degrees
+        longitudes: Longitudes of the points, in degrees
+
+    Returns:
+        Distances in meters, in the order of the points
+    """
+    lat = np.radians(np.asarray(latitudes, dtype=np.float64))
+    lng = np.radians(np.asarray(longitudes, dtype=np.float64))
+    origin_lat = np.radians(float(origin.latitude))
+    origin_lng = np.radians(float(origin.longitude))
+
+    a = (np.sin((lat - origin_lat) / 2) ** 2
+         + np.cos(origin_lat) * np.cos(lat) * np.sin((lng - origin_lng) / 2) ** 2)
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def nearest_within(origin: Coordinates,
+                   latitudes: Sequence[float],
+                   longitudes: Sequence[float],
+                   radius_m: Optional[float] = None,
+                   limit: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Closest points to an origin, optionally within a radius
+
+    Args:
+        origin: Point distances are measured from
+        latitudes: Latitudes of the candidates, in degrees
+        longitudes: Longitudes of the candidates, in degrees
+        radius_m: Drop candidates further than this, in meters
+        limit: Keep at most this many candidates
+
+    Returns:
+        Indices of the kept candidates, closest first, and their distances in meters
+    """
+    distances = haversine_m(origin, latitudes, longitudes)
+    indices = np.arange(len(distances))
+    if radius_m is not None:
+        indices = indices[distances <= radius_m]
+
+    if limit is not None and limit < len(indices):
+        # Partial selection, only the kept candidates are sorted
+        indices = indices[np.argpartition(distances[indices], limit - 1)[:limit]]
+    indices = indices[np.argsort(distances[indices], kind='stable')]
+    return indices, distances[indices]
@@ -1,24 +1,34 @@
 import os
+import re
 from typing import Optional, Dict, Any, List, Tuple
 from googlemaps import Client
 from django.conf import settings
 from unittest.mock import MagicMock
 
+from core.infrastructure.services.geocode_cache import cached_geocode
 from store.domain.value_objects.coordinates import Coordinates
 from store.domain.value_objects.address import Address
 from store.domain.services.store_location_service import StoreLocationService
 from store.config.constants import MAX_RESULTS_STORES_BRANDS_NEARBY
+from store.infrastructure.external_services.places_distance import nearest_within
+
+# "12 Rue de Rivoli" -> street number and route
+STREET_PATTERN = re.compile(r'^(\d+)\s+(.+)$')
 
 
 class GoogleMapsService(StoreLocationService):
     """Service for interacting with Google Maps API"""
     
-    def __init__(self, test_mode=False):
+    def __init__(self, test_mode=False, client=None):
         """Initialize the Google Maps service.
 
         Args:
             test_mode: If True, skips API key validation and uses mock client
+            client: Optional client to use instead of Google's, e.g. a FakePlacesClient
         """
+        if client is not None:
+            self.client = client
+            return
         if test_mode:
             self.client = MagicMock()
             return
@@ -34,13 +44,15 @@ class GoogleMapsService(StoreLocationService):
         self.client = Client(key=api_key)
     
     def geocode_address(self, address_str: str) -> Optional[Tuple[Coordinates, Address]]:
-        """Convert address string to coordinates and structured address"""
+        """Convert address string to coordinates and structured address
+        
+        Results, including addresses that can't be resolved, go through the
+        shared geocode cache.
+        """
         try:
-            results = self.client.geocode(address_str)
-            if not results:
+            result = cached_geocode(address_str, self._geocode)
+            if result is None:
                 return None
-                
-            result = results[0]
             
             # Extract location
             location = result['geometry']['location']
@@ -83,6 +95,11 @@ class GoogleMapsService(StoreLocationService):
             print(f"Error geocoding address: {e}")
             return None
 
+    def _geocode(self, address_str: str) -> Optional[Dict[str, Any]]:
+        """First Google Geocoding API result for an address, None if there is none"""
+        results = self.client.geocode(address_str)
+        return results[0] if results else None
+
     def find_store_brand_by_name(self, name: str, brand_type: str, coordinates: Coordinates, radius_km: float) -> Optional[Dict[str, Any]]:
         """Find a store brand by name near the specified coordinates
         
@@ -109,6 +126,25 @@ class GoogleMapsService(StoreLocationService):
         # Return the first (closest) match, or None if no matches
         return places[0] if places else None
     
+    def find_store_brand_locations(self, name: str, brand_type: str, coordinates: Coordinates, radius_km: float) -> List[Dict[str, Any]]:
+        """Find the locations of a store brand near the specified coordinates
+        
+        Args:
+            name: Name of the store brand to search for
+            brand_type: Type of the brand to search for
+            coordinates: Center point for the search
+            radius_km: Search radius in kilometers
+            
+        Returns:
+            Store brand locations, closest first
+        """
+        return self._find_store_brands_nearby(
+            coordinates=coordinates,
+            radius_m=int(radius_km * 1000),
+            type=brand_type,
+            keyword=name,
+        )
+    
     def _find_store_brands_nearby(self, coordinates: Coordinates, radius_m: int, 
                           type: str, keyword: str = None) -> List[Dict[str, Any]]:
         """Find nearby store brands using Google Places API
@@ -134,76 +170,89 @@ class GoogleMapsService(StoreLocationService):
             rank_by='distance' if radius_m > 50000 else None  # Use rank_by for large radii
         )
         
-        # Process and enhance the results
+        return self._parse_places(places_result.get('results', []), coordinates)
+    
+    def _parse_places(self, results: List[Dict[str, Any]], coordinates: Coordinates) -> List[Dict[str, Any]]:
+        """Turn raw Places API results into place information, closest first
+        
+        Distances are computed for every candidate in one batch, then only the
+        MAX_RESULTS_STORES_BRANDS_NEARBY closest are parsed.
+        
+        Args:
+            results: Raw results of a Places API nearby search
+            coordinates: The coordinates the search was made around
+            
+        Returns:
+            List of store brand results with location and address information
+        """
+        located, unlocated = [], []
+        for place in results:
+            location = place.get('geometry', {}).get('location', {})
+            if location.get('lat') is not None and location.get('lng') is not None:
+                located.append(place)
+            else:
+                unlocated.append(place)
+        
+        indices, distances = nearest_within(
+            coordinates,
+            [place['geometry']['location']['lat'] for place in located],
+            [place['geometry']['location']['lng'] for place in located],
+            limit=MAX_RESULTS_STORES_BRANDS_NEARBY
+        )
+        
         places = []
-        for place in places_result.get('results', [])[:MAX_RESULTS_STORES_BRANDS_NEARBY]:
-            # Extract basic information
-            place_info = {
-                'place_id': place.get('place_id'),
-                'name': place.get('name'),
-                'vicinity': place.get('vicinity', ''),
-                'types': place.get('types', []),
-                'business_status': place.get('business_status'),
-                'rating': place.get('rating'),
-                'user_ratings_total': place.get('user_ratings_total'),
-            }
+        for index, distance in zip(indices.tolist(), distances.tolist()):
+            place = located[index]
+            place_info = self._place_info(place)
+            place_info['latitude'] = place['geometry']['location']['lat']
+            place_info['longitude'] = place['geometry']['location']['lng']
+            place_info['distance'] = distance  # Distance in meters
+            places.append(place_info)
+        
+        # Places without a location come last, as before they had no distance
+        for place in unlocated[:MAX_RESULTS_STORES_BRANDS_NEARBY - len(places)]:
+            places.append(self._place_info(place))
+        
+        return places
+    
+    def _place_info(self, place: Dict[str, Any]) -> Dict[str, Any]:
+        """Basic and address information of a raw Places API result"""
+        place_info = {
+            'place_id': place.get('place_id'),
+            'name': place.get('name'),
+            'vicinity': place.get('vicinity', ''),
+            'types': place.get('types', []),
+            'business_status': place.get('business_status'),
+            'rating': place.get('rating'),
+            'user_ratings_total': place.get('user_ratings_total'),
+        }
+        
+        # Parse address components from vicinity
+        address_parts = place_info['vicinity'].split(', ')
+        if len(address_parts) >= 2:
+            # Simple parsing - this could be enhanced with more detailed address parsing
+            street = address_parts[0]
+            city = address_parts[-1]
             
-            # Extract location information
-            if 'geometry' in place and 'location' in place['geometry']:
-                location = place['geometry']['location']
-                place_info['latitude'] = location.get('lat')
-                place_info['longitude'] = location.get('lng')
-                
-                # Calculate distance from search point
-                from math import radians, cos, sin, asin, sqrt
-                def haversine(lat1, lon1, lat2, lon2):
-                    # Convert decimal degrees to radians
-                    lon1, lat1, lon2, lat2 = map(radians, [lon1, lat1, lon2, lat2])
-                    # Haversine formula
-                    dlon = lon2 - lon1
-                    dlat = lat2 - lat1
-                    a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-                    c = 2 * asin(sqrt(a))
-                    r = 6371000  # Radius of earth in meters
-                    return c * r
-                
-                # Calculate distance
-                distance = haversine(
-                    coordinates.latitude, coordinates.longitude,
-                    place_info['latitude'], place_info['longitude']
-                )
-                place_info['distance'] = distance  # Distance in meters
+            # Try to extract street number and route
+            street_match = STREET_PATTERN.match(street)
+            if street_match:
+                place_info['street_number'] = street_match.group(1)
+                place_info['route'] = street_match.group(2)
+            else:
+                place_info['street_number'] = ''
+                place_info['route'] = street
             
-            # Parse address components from vicinity
-            address_parts = place_info['vicinity'].split(', ')
-            if len(address_parts) >= 2:
-                # Simple parsing - this could be enhanced with more detailed address parsing
-                street = address_parts[0]
-                city = address_parts[-1]
-                
-                # Try to extract street number and route
-                import re
-                street_match = re.match(r'^(\d+)\s+(.+)$', street)
-                if street_match:
-                    place_info['street_number'] = street_match.group(1)
-                    place_info['route'] = street_match.group(2)
-                else:
-                    place_info['street_number'] = ''
-                    place_info['route'] = street
-                
-                place_info['city'] = city
-                
-                # Create an Address object
-                address = Address(
-                    street_number=place_info.get('street_number', ''),
-                    route=place_info.get('route', ''),
-                    city=place_info.get('city', ''),
-                    postal_code='',  # Not available in nearby search
-                    country=''  # Not available in nearby search
-                )
-                place_info['address'] = address
+            place_info['city'] = city
             
-            places.append(place_info)
+            # Create an Address object
+            address = Address(
+                street_number=place_info.get('street_number', ''),
+                route=place_info.get('route', ''),
+                city=place_info.get('city', ''),
+                postal_code='',  # Not available in nearby search
+                country=''  # Not available in nearby search
+            )
+            place_info['address'] = address
         
-        return places
-    
\ No newline at end of file
+        return place_info
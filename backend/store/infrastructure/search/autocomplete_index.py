@@ -0,0 +1,412 @@
+"""
+In-process autocomplete index for product names.
+
+Suggestions are served from memory instead of running an `istartswith` +
+`TrigramSimilarity` query on every keystroke:
+- a sorted array of lowercased names per store, searched with bisect for prefixes
+- a trigram inverted list shared by all stores, used as a fuzzy fallback
+  with the same similarity measure as PostgreSQL's pg_trgm
+
+The index is loaded once per worker process and kept up to date incrementally
+from ProductModel / StoreProductModel signals. Changes made by other processes
+are picked up through a version counter in the shared cache.
+"""
+import bisect
+import logging
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+from store.config.constants import CACHE_KEY_PREFIX
+
+logger = logging.getLogger(__name__)
+
+AUTOCOMPLETE_VERSION_KEY = f"{CACHE_KEY_PREFIX}:autocomplete:version"
+AUTOCOMPLETE_CHANGE_KEY = f"{CACHE_KEY_PREFIX}:autocomplete:change:{{}}"
+AUTOCOMPLETE_CHANGE_TIMEOUT = 3600  # Changes older than this force a full reload
+AUTOCOMPLETE_MAX_REPLAY = 1000  # Above this many pending changes, reload everything
+AUTOCOMPLETE_SYNC_INTERVAL = 5  # Seconds between checks of the shared version counter
+
+_WORD_RE = re.compile(r'[^\W_]+')
+
+
+def extract_trigrams(text: str) -> FrozenSet[str]:
+    """Extract trigrams the way pg_trgm does (lowercased words padded with 2 spaces before, 1 after)"""
+    trigrams = set()
+    for word in _WORD_RE.findall(text.lower()):
+        padded = f"  {word} "
+        for i in range(len(padded) - 2):
+            trigrams.add(padded[i:i + 3])
+    return frozenset(trigrams)
+
+
+class AutocompleteIndex:
+    """
+    Per-store prefix and trigram index over product names
+
+    The key `None` holds every product, for suggestions that are not scoped
+    to a store brand. All public methods are thread-safe.
+    """
+
+    def __init__(self, similarity_threshold: float = 0.3):
+        self.similarity_threshold = similarity_threshold
+        self._lock = threading.RLock()
+        self._clear()
+
+    def _clear(self) -> None:
+        # Distinct names
+        self._name_ids: Dict[str, int] = {}
+        self._names: Dict[int, str] = {}
+        self._name_trigrams: Dict[int, FrozenSet[str]] = {}
+        self._postings: Dict[str, Set[int]] = {}
+        self._next_name_id = 0
+
+        # Products
+        self._product_names: Dict[uuid.UUID, str] = {}
+        self._product_stores: Dict[uuid.UUID, Set[uuid.UUID]] = {}
+
+        # Per-store views: name_id -> number of products using it, and sorted (lowercased name, name_id)
+        self._store_refs: Dict[Optional[uuid.UUID], Dict[int, int]] = {}
+        self._store_sorted: Dict[Optional[uuid.UUID], List[Tuple[str, int]]] = {}
+
+        self.is_loaded = False
+        self.version = 0
+
+    # ---- loading ----------------------------------------------------------
+
+    def load(self, products: Iterable[Tuple[uuid.UUID, str]],
+             store_products: Iterable[Tuple[uuid.UUID, uuid.UUID]],
+             version: int = 0) -> None:
+        """
+        Replace the whole index
+
+        Args:
+            products: (product_id, name) pairs
+            store_products: (product_id, store_brand_id) pairs
+            version: Shared change version the data corresponds to
+        """
+        product_stores: Dict[uuid.UUID, Set[uuid.UUID]] = {}
+        for product_id, store_brand_id in store_products:
+            product_stores.setdefault(product_id, set()).add(store_brand_id)
+
+        with self._lock:
+            self._clear()
+            for product_id, name in products:
+                self._product_names[product_id] = name
+                self._product_stores[product_id] = product_stores.get(product_id, set())
+                name_id = self._intern(name)
+                for store_key in (None, *self._product_stores[product_id]):
+                    self._store_refs.setdefault(store_key, {})
+                    refs = self._store_refs[store_key]
+                    refs[name_id] = refs.get(name_id, 0) + 1
+
+            # Sort once instead of inserting one name at a time
+            for store_key, refs in self._store_refs.items():
+                self._store_sorted[store_key] = sorted(
+                    (self._names[name_id].lower(), name_id) for name_id in refs
+                )
+
+            self.version = version
+            self.is_loaded = True
+
+    def _intern(self, name: str) -> int:
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = self._next_name_id
+            self._next_name_id += 1
+            self._name_ids[name] = name_id
+            self._names[name_id] = name
+            trigrams = extract_trigrams(name)
+            self._name_trigrams[name_id] = trigrams
+            for trigram in trigrams:
+                self._postings.setdefault(trigram, set()).add(name_id)
+        return name_id
+
+    def _release(self, name_id: int) -> None:
+        """Drop a name once no store references it anymore"""
+        if name_id in self._store_refs.get(None, {}):
+            return
+        name = self._names.pop(name_id)
+        del self._name_ids[name]
+        for trigram in self._name_trigrams.pop(name_id):
+            posting = self._postings.get(trigram)
+            if posting is not None:
+                posting.discard(name_id)
+                if not posting:
+                    del self._postings[trigram]
+
+    def _add_ref(self, store_key: Optional[uuid.UUID], name_id: int) -> None:
+        refs = self._store_refs.setdefault(store_key, {})
+        if name_id in refs:
+            refs[name_id] += 1
+            return
+        refs[name_id] = 1
+        bisect.insort(self._store_sorted.setdefault(store_key, []), (self._names[name_id].lower(), name_id))
+
+    def _remove_ref(self, store_key: Optional[uuid.UUID], name_id: int) -> None:
+        refs = self._store_refs.get(store_key)
+        if not refs or name_id not in refs:
+            return
+        refs[name_id] -= 1
+        if refs[name_id]:
+            return
+        del refs[name_id]
+        entries = self._store_sorted[store_key]
+        entry = (self._names[name_id].lower(), name_id)
+        position = bisect.bisect_left(entries, entry)
+        if position < len(entries) and entries[position] == entry:
+            del entries[position]
+
+    # ---- incremental updates ---------------------------------------------
+
+    def upsert_product(self, product_id: uuid.UUID, name: str,
+                       store_ids: Optional[Iterable[uuid.UUID]] = None) -> None:
+        """
+        Add a product or update its name and, optionally, its stores
+
+        Args:
+            product_id: Product UUID
+            name: Current product name
+            store_ids: Store brands selling the product, None to keep the known ones
+        """
+        with self._lock:
+            stores = set(store_ids) if store_ids is not None else set(self._product_stores.get(product_id, set()))
+            self.remove_product(product_id)
+
+            name_id = self._intern(name)
+            self._product_names[product_id] = name
+            self._product_stores[product_id] = stores
+            for store_key in (None, *stores):
+                self._add_ref(store_key, name_id)
+
+    def remove_product(self, product_id: uuid.UUID) -> None:
+        """Remove a product from every store"""
+        with self._lock:
+            name = self._product_names.pop(product_id, None)
+            stores = self._product_stores.pop(product_id, set())
+            if name is None:
+                return
+            name_id = self._name_ids[name]
+            for store_key in (*stores, None):
+                self._remove_ref(store_key, name_id)
+            self._release(name_id)
+
+    def add_product_to_store(self, product_id: uuid.UUID, store_brand_id: uuid.UUID) -> None:
+        """Make a known product visible in a store's suggestions"""
+        with self._lock:
+            name = self._product_names.get(product_id)
+            stores = self._product_stores.get(product_id)
+            if name is None or store_brand_id in stores:
+                return
+            stores.add(store_brand_id)
+            self._add_ref(store_brand_id, self._name_ids[name])
+
+    def remove_product_from_store(self, product_id: uuid.UUID, store_brand_id: uuid.UUID) -> None:
+        """Hide a product from a store's suggestions"""
+        with self._lock:
+            name = self._product_names.get(product_id)
+            stores = self._product_stores.get(product_id)
+            if name is None or store_brand_id not in stores:
+                return
+            stores.discard(store_brand_id)
+            self._remove_ref(store_brand_id, self._name_ids[name])
+
+    # ---- queries ----------------------------------------------------------
+
+    def suggest(self, partial_query: str, store_brand_id: Optional[uuid.UUID] = None,
+                limit: int = 10) -> List[str]:
+        """
+        Get name suggestions: prefix matches first, then trigram matches by similarity
+
+        Args:
+            partial_query: The partial search query typed by the user
+            store_brand_id: Optional UUID of the store brand to limit suggestions to
+            limit: Maximum number of suggestions to return
+
+        Returns:
+            List of distinct product names
+        """
+        clean_query = partial_query.strip().lower()
+        if not clean_query or limit <= 0:
+            return []
+
+        with self._lock:
+            entries = self._store_sorted.get(store_brand_id)
+            if not entries:
+                return []
+
+            # Prefix matches are contiguous in the sorted array
+            results: List[str] = []
+            seen: Set[int] = set()
+            position = bisect.bisect_left(entries, (clean_query, -1))
+            while position < len(entries) and len(results) < limit:
+                lowered, name_id = entries[position]
+                if not lowered.startswith(clean_query):
+                    break
+                results.append(self._names[name_id])
+                seen.add(name_id)
+                position += 1
+
+            if len(results) < limit:
+                for name_id in self._similar_names(clean_query, self._store_refs[store_brand_id], seen):
+                    results.append(self._names[name_id])
+                    if len(results) >= limit:
+                        break
+
+            return results
+
+    def _similar_names(self, query: str, store_refs: Dict[int, int], exclude: Set[int]) -> List[int]:
+        """Names above the similarity threshold, most similar first"""
+        query_trigrams = extract_trigrams(query)
+        if not query_trigrams:
+            return []
+
+        # similarity = shared / (|query| + |name| - shared) and |name| >= shared,
+        # so a match needs shared > threshold * |query|. Counting is done by
+        # Counter.update, which runs in C over each posting list.
+        query_size = len(query_trigrams)
+        min_shared = int(self.similarity_threshold * query_size) + 1
+        shared_counts: Counter = Counter()
+        for trigram in query_trigrams:
+            posting = self._postings.get(trigram)
+            if posting:
+                shared_counts.update(posting)
+
+        scored = []
+        for name_id, shared in shared_counts.items():
+            if shared < min_shared or name_id in exclude or name_id not in store_refs:
+                continue
+            similarity = shared / (query_size + len(self._name_trigrams[name_id]) - shared)
+            if similarity > self.similarity_threshold:
+                scored.append((-similarity, self._names[name_id], name_id))
+
+        scored.sort()
+        return [name_id for _, _, name_id in scored]
+
+
+# Process-wide index shared by every request in the worker
+autocomplete_index = AutocompleteIndex()
+_sync_lock = threading.Lock()
+_last_sync = 0.0
+
+
+def is_autocomplete_index_enabled() -> bool:
+    """Whether suggestions are served from the in-process index"""
+    return getattr(settings, 'STORE_AUTOCOMPLETE_INDEX_ENABLED', True)
+
+
+def _current_version() -> int:
+    return cache.get(AUTOCOMPLETE_VERSION_KEY) or 0
+
+
+def load_autocomplete_index(index: AutocompleteIndex = autocomplete_index) -> AutocompleteIndex:
+    """Load the index from ProductModel / StoreProductModel"""
+    from store.infrastructure.django_models.orm_models import ProductModel, StoreProductModel
+
+    started = time.perf_counter()
+    version = _current_version()
+    index.load(
+        ProductModel.objects.values_list('id', 'name').iterator(chunk_size=5000),
+        StoreProductModel.objects.values_list('product_id', 'store_brand_id').distinct().iterator(chunk_size=5000),
+        version=version
+    )
+    logger.info(
+        f"Loaded autocomplete index with {len(index._product_names)} products "
+        f"in {time.perf_counter() - started:.2f}s"
+    )
+    return index
+
+
+def refresh_products(product_ids: Iterable[uuid.UUID], index: AutocompleteIndex = autocomplete_index) -> None:
+    """Reload some products (name and stores) from the database into the index"""
+    from store.infrastructure.django_models.orm_models import ProductModel, StoreProductModel
+
+    product_ids = set(product_ids)
+    if not product_ids:
+        return
+    names = dict(ProductModel.objects.filter(id__in=product_ids).values_list('id', 'name'))
+    stores: Dict[uuid.UUID, Set[uuid.UUID]] = {}
+    for product_id, store_brand_id in StoreProductModel.objects.filter(
+        product_id__in=product_ids
+    ).values_list('product_id', 'store_brand_id'):
+        stores.setdefault(product_id, set()).add(store_brand_id)
+
+    for product_id in product_ids:
+        if product_id in names:
+            index.upsert_product(product_id, names[product_id], stores.get(product_id, set()))
+        else:
+            index.remove_product(product_id)
+
+
+def publish_product_change(product_id: uuid.UUID) -> None:
+    """Record a product change so other worker processes refresh it"""
+    try:
+        cache.add(AUTOCOMPLETE_VERSION_KEY, 0, timeout=None)
+        version = cache.incr(AUTOCOMPLETE_VERSION_KEY)
+        cache.set(AUTOCOMPLETE_CHANGE_KEY.format(version), str(product_id), AUTOCOMPLETE_CHANGE_TIMEOUT)
+    except Exception as e:
+        # Other processes fall back to their periodic full reload
+        logger.warning(f"Could not publish autocomplete change for product {product_id}: {e}")
+
+
+def publish_full_reload() -> None:
+    """Ask every process to reload its index, e.g. after bulk writes that skip signals"""
+    try:
+        cache.add(AUTOCOMPLETE_VERSION_KEY, 0, timeout=None)
+        cache.incr(AUTOCOMPLETE_VERSION_KEY, AUTOCOMPLETE_MAX_REPLAY + 1)
+    except Exception as e:
+        logger.warning(f"Could not publish autocomplete reload: {e}")
+
+
+def sync_autocomplete_index(index: AutocompleteIndex = autocomplete_index, force: bool = False) -> None:
+    """
+    Apply changes published by other processes since the last sync
+
+    Checks the shared version at most every AUTOCOMPLETE_SYNC_INTERVAL seconds.
+    Replays the changed product IDs when possible, otherwise reloads everything.
+    """
+    global _last_sync
+
+    now = time.monotonic()
+    if not force and now - _last_sync < AUTOCOMPLETE_SYNC_INTERVAL:
+        return
+    if not _sync_lock.acquire(blocking=False):
+        return  # Another thread is syncing; serve the current data meanwhile
+    try:
+        _last_sync = now
+        remote_version = _current_version()
+        if remote_version == index.version:
+            return
+
+        pending = remote_version - index.version
+        if 0 < pending <= AUTOCOMPLETE_MAX_REPLAY:
+            keys = [AUTOCOMPLETE_CHANGE_KEY.format(v) for v in range(index.version + 1, remote_version + 1)]
+            changes = cache.get_many(keys)
+            if len(changes) == len(keys):
+                refresh_products((uuid.UUID(product_id) for product_id in changes.values()), index=index)
+                index.version = remote_version
+                return
+
+        # Too far behind, expired change keys or a reset counter
+        load_autocomplete_index(index)
+    except Exception as e:
+        logger.error(f"Error syncing autocomplete index: {e}")
+    finally:
+        _sync_lock.release()
+
+
+def get_autocomplete_index() -> AutocompleteIndex:
+    """Return the process-wide index, loading it on first use"""
+    if not autocomplete_index.is_loaded:
+        with _sync_lock:
+            if not autocomplete_index.is_loaded:
+                load_autocomplete_index(autocomplete_index)
+    else:
+        sync_autocomplete_index(autocomplete_index)
+    return autocomplete_index
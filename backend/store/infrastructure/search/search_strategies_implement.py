@@ -1,72 +1,71 @@
 """
 Implementation of search strategies for the product.
 """
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+import base64
+import json
 import uuid
 
 from django.db.models import(
-    Q, F, Case, When, Value, 
-    IntegerField, FloatField, 
-    ExpressionWrapper
+    Q, F, Case, When, Value, Count,
+    IntegerField, FloatField,
+    ExpressionWrapper, QuerySet, Window
 )
+from django.db.models.functions import RowNumber
 from django.contrib.postgres.search import(
     SearchQuery, SearchRank, TrigramSimilarity
 )
 
+from store.config.constants import SEARCH_COUNT_CAP
 from store.domain.services.search_service import SearchStrategy
+from store.domain.value_objects.pagination import SearchPage
 from store.infrastructure.django_models.orm_models import(
     ProductModel, StoreProductModel
 )
 
+# Relevance of each strategy tier is offset by this value so that a single
+# `relevance` column orders results the same way as (strategy_used, score).
+# Scores inside a tier stay well below it (fts_rank * 10, trgm_sim * 5, 1)
+TIER_WEIGHT = 100.0
+
 class CombinedSearchStrategy(SearchStrategy[uuid.UUID]):
     """
     Search strategy that combines full-text search, trigram similarity, and basic search
     in a single optimized database query
     """
-    
-    def __init__(self, min_query_length: int = 2):
+
+    def __init__(self, min_query_length: int = 2, count_cap: int = SEARCH_COUNT_CAP):
         """
         Initialize the combined search strategy
-        
+
         Args:
             min_query_length: Minimum query length for this strategy to be applicable
+            count_cap: Maximum number of matches counted when estimating totals
         """
         self.min_query_length = min_query_length
-        
-    def search_products(self, query: str, 
-                        store_id: Optional[uuid.UUID] = None
-                        ) -> List[uuid.UUID]:
+        self.count_cap = count_cap
+
+    def _annotate_relevance(self, queryset: QuerySet, query: str, prefix: str = '') -> QuerySet:
         """
-        Execute combined search using multiple techniques in a single query
-        
+        Annotate a queryset with the combined relevance score and keep only matches
+
         Args:
-            query: The search query
-            store_id: Optional UUID of store to search within
-                
+            queryset: ProductModel queryset, or a queryset related to it
+            query: The cleaned search query
+            prefix: Lookup prefix to reach product fields (e.g. 'product__')
+
         Returns:
-            List of matching product IDs ordered by relevance
+            Queryset annotated with `relevance`, filtered to matching rows
         """
-        # Clean the query
-        clean_query = query.strip()
-        
         # Create search query object for full-text search
-        search_query = SearchQuery(clean_query, config='french')
-        
-        # Build base query with store filter if needed
-        base_query = ProductModel.objects
-        if store_id:
-            product_ids = StoreProductModel.objects.filter(
-                store_id=store_id
-            ).values_list('product_id', flat=True)
-            base_query = base_query.filter(id__in=product_ids)
-        
-        # Execute a single query that combines all search techniques
-        matching_product_ids = base_query.annotate(
+        search_query = SearchQuery(query, config='french')
+
+        return queryset.annotate(
             # Full-text search rank
-            fts_rank=SearchRank('search_vector', search_query),
+            fts_rank=SearchRank(f'{prefix}search_vector', search_query),
             # Trigram similarity
-            name_sim=TrigramSimilarity('name', clean_query),
-            desc_sim=TrigramSimilarity('description', clean_query),
+            name_sim=TrigramSimilarity(f'{prefix}name', query),
+            desc_sim=TrigramSimilarity(f'{prefix}description', query),
             # Combined trigram similarity with weights
             trgm_sim=ExpressionWrapper(
                 (F('name_sim') * 0.7) + (F('desc_sim') * 0.3),
@@ -75,34 +74,182 @@ class CombinedSearchStrategy(SearchStrategy[uuid.UUID]):
             # Determine which strategy matched
             strategy_used=Case(
                 # Full-text search hit
-                When(fts_rank__gt=0.1, then=Value(1)),
+                When(fts_rank__gt=0.1, then=Value(3)),
                 # Trigram similarity hit
                 When(trgm_sim__gt=0.3, then=Value(2)),
                 # Basic search hit
                 When(
-                    Q(name__icontains=clean_query) | 
-                    Q(description__icontains=clean_query),
-                    then=Value(3)
+                    Q(**{f'{prefix}name__icontains': query}) |
+                    Q(**{f'{prefix}description__icontains': query}),
+                    then=Value(1)
                 ),
                 default=Value(0),
                 output_field=IntegerField()
             ),
-            # Combined score for sorting
+            # Combined score for sorting, strategy tier first
             relevance=Case(
-                When(strategy_used=1, then=F('fts_rank') * 10),
-                When(strategy_used=2, then=F('trgm_sim') * 5),
-                When(strategy_used=3, then=Value(1)),
-                default=Value(0),
+                When(strategy_used=3, then=F('fts_rank') * 10 + Value(3 * TIER_WEIGHT)),
+                When(strategy_used=2, then=F('trgm_sim') * 5 + Value(2 * TIER_WEIGHT)),
+                When(strategy_used=1, then=Value(1 + TIER_WEIGHT)),
+                default=Value(0.0),
                 output_field=FloatField()
             )
         ).filter(
             # Include results from any strategy
-            Q(fts_rank__gt=0.1) | 
-            Q(trgm_sim__gt=0.3) | 
-            Q(name__icontains=clean_query) |
-            Q(description__icontains=clean_query)
-        ).order_by(
-            '-strategy_used', '-relevance'
-        ).values_list('id', flat=True)
-        
+            strategy_used__gt=0
+        )
+
+    def _ranked_products(self, query: str, store_id: Optional[uuid.UUID] = None) -> QuerySet:
+        """Build the ranked ProductModel queryset, optionally limited to one store"""
+        base_query = ProductModel.objects.all()
+        if store_id:
+            product_ids = StoreProductModel.objects.filter(
+                store_brand_id=store_id
+            ).values('product_id')
+            base_query = base_query.filter(id__in=product_ids)
+
+        return self._annotate_relevance(base_query, query).order_by('-relevance', 'id')
+
+    def _count(self, queryset: QuerySet) -> Tuple[int, bool]:
+        """
+        Count matches up to the configured cap
+
+        Returns:
+            Tuple of (count, is_exact)
+        """
+        # COUNT(*) over a LIMITed subquery stops scanning after cap + 1 rows
+        count = queryset.order_by().values('id')[:self.count_cap + 1].count()
+        if count > self.count_cap:
+            return self.count_cap, False
+        return count, True
+
+    @staticmethod
+    def encode_cursor(relevance: float, product_id: uuid.UUID) -> str:
+        """Encode the (relevance, id) position of a row as an opaque cursor"""
+        raw = json.dumps([relevance, str(product_id)])
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Optional[Tuple[float, uuid.UUID]]:
+        """Decode a cursor produced by encode_cursor, None if it is malformed"""
+        try:
+            relevance, product_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return float(relevance), uuid.UUID(product_id)
+        except (ValueError, TypeError):
+            return None
+
+    def search_products(self, query: str,
+                        store_id: Optional[uuid.UUID] = None
+                        ) -> List[uuid.UUID]:
+        """
+        Execute combined search using multiple techniques in a single query
+
+        Args:
+            query: The search query
+            store_id: Optional UUID of store to search within
+
+        Returns:
+            List of matching product IDs ordered by relevance
+        """
+        # Clean the query
+        clean_query = query.strip()
+
+        matching_product_ids = self._ranked_products(clean_query, store_id).values_list('id', flat=True)
+
         return list(matching_product_ids)
+
+    def search_products_page(self, query: str,
+                             store_id: Optional[uuid.UUID] = None,
+                             limit: int = 10,
+                             offset: int = 0,
+                             cursor: Optional[str] = None
+                             ) -> SearchPage[uuid.UUID]:
+        """
+        Execute combined search and return only one page of product IDs
+
+        Ordering and the page window are applied in SQL. Shallow pages use
+        LIMIT/OFFSET; deep pages should pass the `next_cursor` of the
+        previous page, which seeks on (relevance, id) instead of skipping rows.
+
+        Args:
+            query: The search query
+            store_id: Optional UUID of store to search within
+            limit: Page size
+            offset: Number of rows to skip (ignored when a cursor is given)
+            cursor: Keyset cursor returned with the previous page
+
+        Returns:
+            SearchPage of product IDs ordered by relevance
+        """
+        clean_query = query.strip()
+        ranked = self._ranked_products(clean_query, store_id)
+
+        total, is_exact = self._count(ranked)
+
+        position = self.decode_cursor(cursor) if cursor else None
+        if position:
+            relevance, last_id = position
+            page_query = ranked.filter(
+                Q(relevance__lt=relevance) | Q(relevance=relevance, id__gt=last_id)
+            )
+        else:
+            page_query = ranked[offset:] if offset else ranked
+
+        rows = list(page_query.values_list('id', 'relevance')[:limit])
+
+        next_cursor = None
+        if len(rows) == limit:
+            last_id, last_relevance = rows[-1]
+            next_cursor = self.encode_cursor(last_relevance, last_id)
+
+        return SearchPage(
+            items=[product_id for product_id, _ in rows],
+            total_items=total,
+            total_is_exact=is_exact,
+            next_cursor=next_cursor
+        )
+
+    def search_store_products_per_store(self, query: str,
+                                        limit: int = 10,
+                                        offset: int = 0
+                                        ) -> Tuple[Dict[uuid.UUID, List[uuid.UUID]], Dict[uuid.UUID, int]]:
+        """
+        Execute combined search across all stores, paginated per store
+
+        A ROW_NUMBER() window partitioned by store keeps only the requested page
+        of each store in SQL, and per-store totals come from a GROUP BY count.
+
+        Args:
+            query: The search query
+            limit: Page size for each store
+            offset: Number of rows to skip in each store
+
+        Returns:
+            Tuple of (store ID -> ordered StoreProduct IDs for the page,
+                      store ID -> total matches in that store)
+        """
+        clean_query = query.strip()
+        matches = self._annotate_relevance(StoreProductModel.objects.all(), clean_query, prefix='product__')
+
+        page_rows = matches.annotate(
+            row_number=Window(
+                expression=RowNumber(),
+                partition_by=[F('store_brand_id')],
+                # The store product ID is unique, a product can be listed in several categories
+                order_by=[F('relevance').desc(), F('id').asc()]
+            )
+        ).filter(
+            row_number__gt=offset,
+            row_number__lte=offset + limit
+        ).order_by('store_brand_id', 'row_number').values_list('store_brand_id', 'id')
+
+        page_by_store: Dict[uuid.UUID, List[uuid.UUID]] = {}
+        for store_id, store_product_id in page_rows:
+            page_by_store.setdefault(store_id, []).append(store_product_id)
+
+        store_counts = {
+            row['store_brand_id']: row['total']
+            for row in matches.order_by().values('store_brand_id').annotate(total=Count('id'))
+        }
+
+        return page_by_store, store_counts
@@ -0,0 +1,177 @@
+"""
+Maintenance of the products.search_vector column.
+
+Three modes, chosen with the STORE_SEARCH_VECTOR_MODE setting:
+- 'always': ProductModel.save recomputes the vector with a second UPDATE
+  after every save (the original behaviour)
+- 'dirty': the second UPDATE only runs when the product is new or its name
+  or description changed since it was loaded
+- 'trigger': a BEFORE INSERT/UPDATE trigger computes the vector inside the
+  write itself and save() never issues the extra UPDATE. The trigger is
+  installed with `manage_search_vectors install-trigger`; without it the
+  mode falls back to 'dirty'. Whether it exists is checked once per process,
+  so workers must be restarted after installing it.
+
+Rows written with bulk_create/update() bypass save(); outside trigger mode
+they are refreshed with refresh_search_vectors or rebuild_search_vectors.
+"""
+import logging
+import time
+import uuid
+from typing import Callable, Iterable, Optional
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchVector
+from django.db import connection
+
+from store.infrastructure.django_models.orm_models import ProductModel
+
+logger = logging.getLogger(__name__)
+
+MODE_ALWAYS = 'always'
+MODE_DIRTY = 'dirty'
+MODE_TRIGGER = 'trigger'
+MODES = (MODE_ALWAYS, MODE_DIRTY, MODE_TRIGGER)
+
+# Product fields the vector is computed from
+SEARCH_VECTOR_SOURCE_FIELDS = ('name', 'description')
+
+PRODUCTS_TABLE = ProductModel._meta.db_table
+TRIGGER_NAME = f"{PRODUCTS_TABLE}_search_vector_trigger"
+TRIGGER_FUNCTION = f"{PRODUCTS_TABLE}_search_vector_update"
+
+# Whether the trigger exists, looked up on the first use of trigger mode
+_trigger_installed: Optional[bool] = None
+
+
+def get_search_vector_mode() -> str:
+    """Current maintenance mode, defaulting to 'dirty'
+
+    Trigger mode falls back to 'dirty' when the trigger is not installed,
+    otherwise saved products would keep stale vectors.
+    """
+    global _trigger_installed
+    mode = getattr(settings, 'STORE_SEARCH_VECTOR_MODE', MODE_DIRTY)
+    if mode not in MODES:
+        logger.warning(f"Unknown STORE_SEARCH_VECTOR_MODE '{mode}', using '{MODE_DIRTY}'")
+        return MODE_DIRTY
+    if mode == MODE_TRIGGER:
+        if _trigger_installed is None:
+            _trigger_installed = search_vector_trigger_installed()
+            if not _trigger_installed:
+                logger.error(
+                    f"STORE_SEARCH_VECTOR_MODE is '{MODE_TRIGGER}' but the {TRIGGER_NAME} trigger is missing, "
+                    f"using '{MODE_DIRTY}'. Run `manage_search_vectors install-trigger`."
+                )
+        if not _trigger_installed:
+            return MODE_DIRTY
+    return mode
+
+
+def search_vector_expression():
+    """The weighted french vector stored in products.search_vector"""
+    return (
+        SearchVector('name', weight='A', config='french') +
+        SearchVector('description', weight='B', config='french')
+    )
+
+
+def refresh_search_vectors(product_ids: Iterable[uuid.UUID]) -> int:
+    """
+    Recompute search_vector for many products in one statement
+
+    Args:
+        product_ids: IDs of the products to refresh
+
+    Returns:
+        Number of products updated, 0 in trigger mode where the
+        trigger already computed them
+    """
+    product_ids = list(product_ids)
+    if not product_ids or get_search_vector_mode() == MODE_TRIGGER:
+        return 0
+    return ProductModel.objects.filter(id__in=product_ids).update(search_vector=search_vector_expression())
+
+
+def rebuild_search_vectors(store_brand_id: Optional[uuid.UUID] = None, chunk_size: int = 5000,
+                           progress: Optional[Callable[[int, int, float], None]] = None) -> int:
+    """
+    Recompute search_vector in chunks, paging on the primary key
+
+    Each chunk is its own UPDATE, so locks are held briefly and an
+    interrupted rebuild keeps the chunks already done.
+
+    Args:
+        store_brand_id: Only rebuild products sold by this store brand, all products if None
+        chunk_size: Products per UPDATE
+        progress: Called after each chunk with (done, total, elapsed seconds)
+
+    Returns:
+        Number of products updated
+    """
+    products = ProductModel.objects.all()
+    if store_brand_id is not None:
+        products = products.filter(storeproductmodel__store_brand_id=store_brand_id).distinct()
+    ids = products.order_by('id').values_list('id', flat=True)
+
+    total = ids.count()
+    done = 0
+    started = time.perf_counter()
+    last_id = None
+    while True:
+        page = ids if last_id is None else ids.filter(id__gt=last_id)
+        chunk = list(page[:chunk_size])
+        if not chunk:
+            break
+        last_id = chunk[-1]
+        done += ProductModel.objects.filter(id__in=chunk).update(search_vector=search_vector_expression())
+        if progress:
+            progress(done, total, time.perf_counter() - started)
+
+    logger.info(f"Rebuilt search vectors for {done} products")
+    return done
+
+
+def install_search_vector_trigger() -> None:
+    """Create (or replace) the trigger computing search_vector on insert and text updates"""
+    global _trigger_installed
+    with connection.cursor() as cursor:
+        cursor.execute(f"""
+            CREATE OR REPLACE FUNCTION {TRIGGER_FUNCTION}() RETURNS trigger AS $$
+            BEGIN
+                NEW.search_vector :=
+                    setweight(to_tsvector('french'::regconfig, COALESCE(NEW.name, '')), 'A') ||
+                    setweight(to_tsvector('french'::regconfig, COALESCE(NEW.description, '')), 'B');
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql
+        """)
+        cursor.execute(f"DROP TRIGGER IF EXISTS {TRIGGER_NAME} ON {PRODUCTS_TABLE}")
+        # UPDATE OF limits the work to writes that touch the source columns
+        cursor.execute(f"""
+            CREATE TRIGGER {TRIGGER_NAME}
+            BEFORE INSERT OR UPDATE OF {', '.join(SEARCH_VECTOR_SOURCE_FIELDS)} ON {PRODUCTS_TABLE}
+            FOR EACH ROW EXECUTE FUNCTION {TRIGGER_FUNCTION}()
+        """)
+    _trigger_installed = True
+
+
+def drop_search_vector_trigger() -> None:
+    """Remove the search_vector trigger and its function"""
+    global _trigger_installed
+    with connection.cursor() as cursor:
+        cursor.execute(f"DROP TRIGGER IF EXISTS {TRIGGER_NAME} ON {PRODUCTS_TABLE}")
+        cursor.execute(f"DROP FUNCTION IF EXISTS {TRIGGER_FUNCTION}()")
+    _trigger_installed = False
+
+
+def search_vector_trigger_installed() -> bool:
+    """Whether the search_vector trigger exists on the products table"""
+    with connection.cursor() as cursor:
+        cursor.execute("""
+            SELECT EXISTS (
+                SELECT 1 FROM pg_trigger
+                WHERE tgname = %s AND tgrelid = %s::regclass
+            )
+        """, [TRIGGER_NAME, PRODUCTS_TABLE])
+        return cursor.fetchone()[0]
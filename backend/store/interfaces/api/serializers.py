@@ -135,7 +135,9 @@ class SearchResponseSerializer(serializers.Serializer):
         # Return only what's needed from metadata
         if self.is_store_specific:
             return {
-                'total_products': self.search_metadata.get('total_products', 0)
+                'total_products': self.search_metadata.get('total_products', 0),
+                'total_is_exact': self.search_metadata.get('total_is_exact', True),
+                'next_cursor': self.search_metadata.get('next_cursor')
             }
         else:
             return {
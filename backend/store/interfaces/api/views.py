@@ -153,11 +153,13 @@ class SearchViewSet(viewsets.ViewSet):
         """Search for products globally or within a specific store
         url: stores/search/products/
         method: GET
-        query parameters: q (required), page (default=1), page_size (default=10), store_id (optional)"""
+        query parameters: q (required), page (default=1), page_size (default=10), store_id (optional),
+                          cursor (optional, next_cursor of the previous store-specific page)"""
         query = request.query_params.get('q', '')
         store_id = request.query_params.get('store_id')
         page = request.query_params.get('page', 1)
         page_size = request.query_params.get('page_size', 10)
+        cursor = request.query_params.get('cursor')
         
         if not query:
             raise QuerySearchRequiredException()
@@ -174,7 +176,8 @@ class SearchViewSet(viewsets.ViewSet):
             query=query,
             store_id=store_uuid,
             page=page,
-            page_size=page_size
+            page_size=page_size,
+            cursor=cursor
         )
 
         # Use the dedicated response serializer
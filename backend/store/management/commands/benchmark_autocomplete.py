@@ -0,0 +1,122 @@
+import random
+import statistics
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from store.infrastructure.django_models.orm_models import (
+    CategoryModel, ProductModel, StoreBrandModel, StoreProductModel
+)
+from store.infrastructure.django_repositories.django_product_repository import DjangoProductRepository
+from store.infrastructure.search.autocomplete_index import AutocompleteIndex, load_autocomplete_index
+
+WORDS = [
+    'lait', 'demi', 'écrémé', 'entier', 'bio', 'yaourt', 'nature', 'fraise', 'vanille', 'chocolat',
+    'beurre', 'doux', 'salé', 'fromage', 'emmental', 'comté', 'camembert', 'pain', 'complet', 'mie',
+    'baguette', 'céréales', 'miel', 'confiture', 'abricot', 'pomme', 'poire', 'banane', 'orange', 'citron',
+    'jambon', 'poulet', 'boeuf', 'haché', 'saumon', 'thon', 'riz', 'pâtes', 'farine', 'sucre',
+    'café', 'moulu', 'thé', 'vert', 'jus', 'eau', 'gazeuse', 'huile', 'olive', 'tomate',
+]
+
+
+class Command(BaseCommand):
+    help = (
+        'Compares autocomplete latency of the in-process index against the SQL path '
+        'on a generated product fixture. The fixture is rolled back at the end.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--products', type=int, default=100000, help='Number of products in the fixture')
+        parser.add_argument('--queries', type=int, default=500, help='Number of queries per path')
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+
+        with transaction.atomic():
+            store_brand, names = self._create_fixture(options['products'], rng)
+
+            t0 = time.perf_counter()
+            index = load_autocomplete_index(AutocompleteIndex())
+            self.stdout.write(f'Index build: {time.perf_counter() - t0:.2f}s')
+
+            queries = self._make_queries(names, options['queries'], rng)
+            repository = DjangoProductRepository()
+
+            for label, store_brand_id in (('all stores', None), ('one store', store_brand.id)):
+                self.stdout.write(f'-- {label} --')
+                self._measure(
+                    'index', queries,
+                    lambda q: index.suggest(q, store_brand_id=store_brand_id, limit=10)
+                )
+                self._measure(
+                    'sql', queries,
+                    lambda q: repository.get_autocomplete_suggestions_from_db(q, store_brand_id, 10)
+                )
+
+            transaction.set_rollback(True)
+
+        self.stdout.write(self.style.SUCCESS('Benchmark complete (fixture rolled back)'))
+
+    def _create_fixture(self, count, rng):
+        self.stdout.write(f'Creating {count} products...')
+        run_id = uuid.uuid4().hex[:8]
+        store_brand = StoreBrandModel.objects.create(
+            name=f'Bench {run_id}', type='bench', slug=f'bench-{run_id}'
+        )
+        category = CategoryModel.objects.create(
+            name=f'Bench {run_id}', path=f'bench_{run_id}', slug=f'bench-{run_id}'
+        )
+
+        names = []
+        products = []
+        for i in range(count):
+            name = ' '.join(rng.sample(WORDS, rng.randint(2, 4))).capitalize()
+            names.append(name)
+            products.append(ProductModel(
+                name=name, slug=f'bench-{run_id}-{i}', quantity=1, unit='u', description=name
+            ))
+        ProductModel.objects.bulk_create(products, batch_size=5000)
+
+        # Half of the products are sold in the benchmark store
+        StoreProductModel.objects.bulk_create(
+            [
+                StoreProductModel(
+                    store_brand=store_brand, product=product, category=category,
+                    price=1, price_per_unit=1
+                )
+                for product in products[::2]
+            ],
+            batch_size=5000
+        )
+        return store_brand, names
+
+    def _make_queries(self, names, count, rng):
+        queries = []
+        for _ in range(count):
+            name = rng.choice(names).lower()
+            if rng.random() < 0.8:
+                # Typed prefix
+                queries.append(name[:rng.randint(2, min(8, len(name)))])
+            else:
+                # Prefix with a typo, needs the fuzzy fallback
+                word = list(name[:rng.randint(5, min(10, len(name)))])
+                i = rng.randint(1, len(word) - 2)
+                word[i], word[i + 1] = word[i + 1], word[i]
+                queries.append(''.join(word))
+        return queries
+
+    def _measure(self, label, queries, suggest):
+        latencies = []
+        for query in queries:
+            t0 = time.perf_counter()
+            suggest(query)
+            latencies.append(time.perf_counter() - t0)
+        latencies.sort()
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        self.stdout.write(
+            f'{label}: p50 {statistics.median(latencies) * 1000:.3f}ms, '
+            f'p99 {p99 * 1000:.3f}ms, {len(queries) / sum(latencies):.0f} queries/sec'
+        )
@@ -0,0 +1,80 @@
+import time
+import uuid
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django_redis import get_redis_connection
+
+from store.config.constants import GENERATION_KEY_PREFIX
+from store.infrastructure.external_services.cache_service import DjangoCacheService
+
+# Keys written per pipeline when filling the keyspace
+FILL_CHUNK = 10_000
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures invalidation latency against keyspace size: delete_pattern (a SCAN '
+        'of the whole keyspace) vs a generation bump (one INCR). Fills the cache with '
+        'throwaway keys under a benchmark prefix and removes them afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000],
+                            help='Keyspace sizes to measure')
+        parser.add_argument('--lookups', type=int, default=1000,
+                            help='Key generations timed to measure the generation read overhead')
+
+    def handle(self, *args, **options):
+        redis = get_redis_connection("default")
+        cache_service = DjangoCacheService()
+        prefix = f'store:bench_invalidation:{uuid.uuid4().hex[:8]}'
+        filled = 0
+
+        try:
+            for size in sorted(options['sizes']):
+                filled = self._fill(redis, prefix, filled, size)
+                keyspace = redis.dbsize()
+
+                started = time.perf_counter()
+                cache_service.bump_generation(f'{prefix}:namespace')
+                bump = time.perf_counter() - started
+
+                # Matches nothing, so the same keys are scanned again at the next size
+                started = time.perf_counter()
+                cache.delete_pattern(f'{prefix}:missing:*')
+                scan = time.perf_counter() - started
+
+                self.stdout.write(
+                    f'{size:>10,} keys ({keyspace:,} in db): delete_pattern {scan * 1000:,.1f}ms, '
+                    f'generation bump {bump * 1000:.2f}ms'
+                )
+
+            self._measure_key_generation(cache_service, options['lookups'])
+        finally:
+            cache.delete_pattern(f'{prefix}:*')
+            cache.delete(f'{GENERATION_KEY_PREFIX}:{prefix}:namespace')
+
+        self.stdout.write(self.style.SUCCESS('Benchmark complete'))
+
+    def _fill(self, redis, prefix, filled, size):
+        """Add keys until the benchmark prefix holds `size` of them"""
+        started = time.perf_counter()
+        while filled < size:
+            pipe = redis.pipeline(transaction=False)
+            for i in range(filled, min(filled + FILL_CHUNK, size)):
+                pipe.set(cache.make_key(f'{prefix}:key:{i}'), b'x', ex=3600)
+            pipe.execute()
+            filled = min(filled + FILL_CHUNK, size)
+        self.stdout.write(f'Filled {size:,} keys in {time.perf_counter() - started:.1f}s')
+        return filled
+
+    def _measure_key_generation(self, cache_service, lookups):
+        """Cost added to every cached read by embedding generations in the key"""
+        store_id = str(uuid.uuid4())
+        started = time.perf_counter()
+        for i in range(lookups):
+            cache_service.generate_search_key(f'query {i}', store_id=store_id,
+                                              filters={'category_path': 'fruits_et_legumes.fruits'})
+        elapsed = time.perf_counter() - started
+        self.stdout.write(f'generate_search_key with generations: {elapsed / lookups * 1e6:.0f}us per key')
@@ -0,0 +1,89 @@
+import re
+import time
+from math import asin, cos, radians, sin, sqrt
+
+from django.core.management.base import BaseCommand
+
+from store.domain.value_objects.coordinates import Coordinates
+from store.infrastructure.external_services.fake_places_client import FakePlacesClient
+from store.infrastructure.external_services.places_distance import nearest_within
+from store.infrastructure.external_services.store_location_google_maps_service import GoogleMapsService
+
+ORIGIN = (48.8566, 2.3522)
+
+
+class Command(BaseCommand):
+    help = (
+        'Times distance filtering of Places candidates offline, from 10 to 10k candidates: '
+        'a Python haversine and address parse per place vs the numpy batch kernel that '
+        'only parses the kept places. Replays a recorded response, or generates one.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000, 10000])
+        parser.add_argument('--recording', help='Places API response JSON to replay instead of generated ones')
+        parser.add_argument('--radius-m', type=float, default=5000)
+        parser.add_argument('--runs', type=int, default=20)
+
+    def handle(self, *args, **options):
+        origin = Coordinates(*ORIGIN)
+
+        if options['recording']:
+            recorded = FakePlacesClient.from_file(options['recording'])
+            responses = [recorded.places_nearby(location=ORIGIN, radius=int(options['radius_m']))]
+        else:
+            responses = [
+                FakePlacesClient.generate_response(ORIGIN, size, options['radius_m'] * 1.5, seed=size)
+                for size in options['sizes']
+            ]
+
+        for response in responses:
+            client = FakePlacesClient(response)
+            service = GoogleMapsService(client=client)
+            results = response['results']
+            latitudes = [place['geometry']['location']['lat'] for place in results]
+            longitudes = [place['geometry']['location']['lng'] for place in results]
+
+            per_place = self._time(lambda: _per_place(results, origin), options['runs'])
+            kernel = self._time(
+                lambda: nearest_within(origin, latitudes, longitudes, radius_m=options['radius_m']),
+                options['runs']
+            )
+            service_call = self._time(
+                lambda: service.find_store_brand_locations('Carrefour', 'supermarket', origin,
+                                                           options['radius_m'] / 1000),
+                options['runs']
+            )
+            self.stdout.write(
+                f'{len(results):>6} candidates: per-place {per_place * 1000:8.3f}ms, '
+                f'kernel {kernel * 1000:7.3f}ms, full service call {service_call * 1000:7.3f}ms'
+            )
+
+        self.stdout.write(self.style.SUCCESS('Benchmark complete'))
+
+    @staticmethod
+    def _time(function, runs):
+        durations = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            function()
+            durations.append(time.perf_counter() - started)
+        return min(durations)
+
+
+def _per_place(results, origin):
+    """Previous approach applied to every candidate: haversine and regex per place, then sort"""
+    places = []
+    for place in results:
+        location = place['geometry']['location']
+        lon1, lat1, lon2, lat2 = map(radians, [origin.longitude, origin.latitude, location['lng'], location['lat']])
+        a = sin((lat2 - lat1) / 2) ** 2 + cos(lat1) * cos(lat2) * sin((lon2 - lon1) / 2) ** 2
+        street = place['vicinity'].split(', ')[0]
+        match = re.match(r'^(\d+)\s+(.+)$', street)
+        places.append({
+            'place_id': place['place_id'],
+            'distance': 2 * asin(sqrt(a)) * 6371000,
+            'street_number': match.group(1) if match else '',
+        })
+    places.sort(key=lambda place: place['distance'])
+    return places
@@ -0,0 +1,95 @@
+import time
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from core.management.query_counter import QueryCounter
+from store.application.services.use_to_add_data.product_processing_service import ProductProcessingService
+from store.infrastructure.django_models.orm_models import StoreBrandModel
+from store.infrastructure.django_models.use_to_add_data.collection_models import ProductCollectionBatchModel
+from store.infrastructure.django_repositories.use_to_add_data.django_collection_repository import (
+    DjangoCollectedProductRepository,
+    DjangoProductCollectionBatchRepository,
+)
+from store.infrastructure.django_repositories.use_to_add_data.django_product_processing_repository import (
+    DjangoProductProcessingRepository,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures rows/sec of ProductProcessingService.process_batch on generated '
+        'batches of collected products. Each size runs in its own transaction, '
+        'which is rolled back.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', type=str, default='10000,100000,1000000',
+                            help='Comma-separated numbers of collected products')
+        parser.add_argument('--categories', type=int, default=200, help='Distinct categories per batch')
+        parser.add_argument('--chunk-size', type=int, default=2000, help='Products processed per chunk')
+
+    def handle(self, *args, **options):
+        for size in (int(value) for value in options['sizes'].split(',')):
+            with transaction.atomic():
+                batch_id = self._create_batch(size, options['categories'])
+
+                service = ProductProcessingService(
+                    batch_repository=DjangoProductCollectionBatchRepository(),
+                    product_repository=DjangoCollectedProductRepository(),
+                    product_processing_repository=DjangoProductProcessingRepository(),
+                    chunk_size=options['chunk_size']
+                )
+                counter = QueryCounter()
+                with connection.execute_wrapper(counter):
+                    started = time.perf_counter()
+                    success_count, error_count, _ = service.process_batch(batch_id)
+                    elapsed = time.perf_counter() - started
+
+                transaction.set_rollback(True)
+
+            self.stdout.write(
+                f'{size:>9} rows: {elapsed:.2f}s, {size / elapsed:,.0f} rows/sec, '
+                f'{counter.count} queries ({counter.count * 1000 / size:.1f} per 1000 rows), '
+                f'{success_count} processed, {error_count} errors'
+            )
+
+        self.stdout.write(self.style.SUCCESS('Benchmark complete'))
+
+    def _create_batch(self, size, categories):
+        run_id = uuid.uuid4().hex[:8]
+        store_brand = StoreBrandModel.objects.create(
+            name=f'Bench {run_id}', type='supermarket', slug=f'bench-{run_id}'
+        )
+        collector = get_user_model().objects.create_user(
+            email=f'ingestion-{run_id}@example.com', first_name='Collector'
+        )
+        batch = ProductCollectionBatchModel.objects.create(
+            store_brand=store_brand, collector=collector, name=f'Bench {run_id}', status='completed'
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute("""
+                INSERT INTO collected_products (
+                    id, batch_id, name, slug, quantity, unit, description,
+                    category_name, category_path, category_slug,
+                    price, price_per_unit, image_url, status
+                )
+                SELECT gen_random_uuid(), %(batch_id)s,
+                       'Bench product ' || i, %(prefix)s || '-' || i, 1, 'pcs', 'Generated product ' || i,
+                       'Bench category ' || %(run_id)s || ' ' || (i %% %(categories)s),
+                       'bench_' || %(run_id)s || '.c' || (i %% %(categories)s),
+                       %(prefix)s || '-c' || (i %% %(categories)s),
+                       round((1 + random() * 20)::numeric, 2), round((1 + random() * 20)::numeric, 2),
+                       'stores/default.png', 'pending'
+                FROM generate_series(1, %(size)s) AS i
+            """, {
+                'batch_id': batch.id,
+                'prefix': f'bench-{run_id}',
+                'run_id': run_id,
+                'categories': categories,
+                'size': size,
+            })
+        return batch.id
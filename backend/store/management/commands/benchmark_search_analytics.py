@@ -0,0 +1,132 @@
+import statistics
+import time
+import uuid
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, models, transaction
+from django.db.models.functions import TruncDay
+from django.utils import timezone
+
+from store.infrastructure.analytics.search_analytics_implementation import (
+    DjangoSearchAnalyticsService,
+    LOG_TABLE,
+    persist_search_events,
+    rebuild_hourly_rollups,
+)
+from store.infrastructure.analytics.search_event_buffer import SearchEventBuffer
+from store.infrastructure.django_models.analytics_models import SearchQueryLog
+
+# Rows generated per INSERT when filling the log
+GENERATE_CHUNK = 1_000_000
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures the search analytics pipeline: time spent in record_search on the '
+        'request path (inline insert vs buffered), then the three analytics queries on '
+        'the raw log vs the hourly rollups over a generated log. Runs inside a transaction '
+        'that is rolled back.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--log-rows', type=int, default=50_000_000, help='Rows in the generated log')
+        parser.add_argument('--records', type=int, default=2000, help='record_search calls timed per mode')
+        parser.add_argument('--distinct-queries', type=int, default=20000)
+        parser.add_argument('--stores', type=int, default=50)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self._measure_recording(options['records'])
+            self._fill_log(options['log_rows'], options['distinct_queries'], options['stores'])
+
+            started = time.perf_counter()
+            rollup_rows = rebuild_hourly_rollups(timezone.now() - timedelta(days=31))
+            self.stdout.write(f'Built {rollup_rows} rollup rows in {time.perf_counter() - started:.1f}s')
+            connection.cursor().execute('ANALYZE')
+
+            self._measure_queries()
+            transaction.set_rollback(True)
+
+        self.stdout.write(self.style.SUCCESS('Benchmark complete'))
+
+    def _measure_recording(self, records):
+        inline = DjangoSearchAnalyticsService(buffer=None)
+        # Nothing is flushed while timing, the buffer is written once afterwards
+        buffer = SearchEventBuffer(writer=persist_search_events, flush_size=records + 1,
+                                   flush_interval=3600, max_events=records + 1)
+        buffered = DjangoSearchAnalyticsService(buffer=buffer)
+
+        for label, service in (('inline insert', inline), ('buffered', buffered)):
+            durations = []
+            for i in range(records):
+                started = time.perf_counter()
+                service.record_search(query=f'bench {i % 100}', store_id=None, result_count=i % 7)
+                durations.append(time.perf_counter() - started)
+            ordered = sorted(durations)
+            self.stdout.write(
+                f'record_search {label:>13}: mean {statistics.mean(ordered) * 1e6:.0f}us, '
+                f'p99 {ordered[int(len(ordered) * 0.99) - 1] * 1e6:.0f}us'
+            )
+
+        started = time.perf_counter()
+        buffer.flush()
+        self.stdout.write(f'Flushed {records} buffered events in {(time.perf_counter() - started) * 1000:.1f}ms')
+
+    def _fill_log(self, rows, distinct_queries, stores):
+        store_ids = [str(uuid.uuid4()) for _ in range(stores)]
+        done = 0
+        started = time.perf_counter()
+        with connection.cursor() as cursor:
+            while done < rows:
+                count = min(GENERATE_CHUNK, rows - done)
+                # Skewed query popularity, 20% global searches, 10% zero results
+                cursor.execute(f"""
+                    INSERT INTO {LOG_TABLE} (id, query, store_id, user_id, result_count, timestamp)
+                    SELECT gen_random_uuid(),
+                           'query ' || floor(power(random(), 3) * %s)::int,
+                           CASE WHEN random() < 0.2 THEN NULL
+                                ELSE (%s::uuid[])[1 + floor(random() * %s)::int] END,
+                           NULL,
+                           CASE WHEN random() < 0.1 THEN 0 ELSE floor(random() * 100)::int END,
+                           now() - random() * interval '30 days'
+                    FROM generate_series(1, %s)
+                """, [distinct_queries, store_ids, stores, count])
+                done += count
+                self.stdout.write(f'Generated {done}/{rows} log rows ({done / (time.perf_counter() - started):,.0f} rows/sec)')
+        self.store_id = uuid.UUID(store_ids[0])
+
+    def _measure_queries(self):
+        service = DjangoSearchAnalyticsService(buffer=None)
+        since = timezone.now() - timedelta(days=7)
+        raw = SearchQueryLog.objects.filter(timestamp__gte=since)
+        raw_month = SearchQueryLog.objects.filter(timestamp__gte=timezone.now() - timedelta(days=30))
+
+        cases = [
+            ('popular searches',
+             lambda: list(raw.values('query').annotate(count=models.Count('id'), avg_results=models.Avg('result_count')).order_by('-count')[:10]),
+             lambda: service.get_popular_searches(limit=10)),
+            ('popular searches (store)',
+             lambda: list(raw.filter(store_id=self.store_id).values('query').annotate(count=models.Count('id')).order_by('-count')[:10]),
+             lambda: service.get_popular_searches(limit=10, store_id=self.store_id)),
+            ('search trends',
+             lambda: list(raw_month.annotate(day=TruncDay('timestamp')).values('day').annotate(count=models.Count('id')).order_by('day')),
+             lambda: service.get_search_trends(days=30)),
+            ('zero-result searches',
+             lambda: list(raw.filter(result_count=0).values('query').annotate(count=models.Count('id')).order_by('-count')[:10]),
+             lambda: service.get_zero_result_searches(limit=10)),
+        ]
+        for label, before, after in cases:
+            self.stdout.write(
+                f'{label:>24}: raw log {self._time(before) * 1000:,.0f}ms, '
+                f'rollups {self._time(after) * 1000:,.1f}ms'
+            )
+
+    @staticmethod
+    def _time(query, runs=3):
+        durations = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            query()
+            durations.append(time.perf_counter() - started)
+        return min(durations)
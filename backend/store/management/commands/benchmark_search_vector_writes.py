@@ -0,0 +1,62 @@
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import override_settings
+
+from store.infrastructure.django_models.orm_models import ProductModel
+from store.infrastructure.search.search_vector_maintenance import (
+    MODES,
+    MODE_TRIGGER,
+    install_search_vector_trigger,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Compares ProductModel.save throughput under the three search_vector modes '
+        '(always, dirty, trigger) for saves that leave the text unchanged and saves '
+        'that change the description. Runs inside a transaction that is rolled back.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--products', type=int, default=2000, help='Products saved per run')
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            run_id = uuid.uuid4().hex[:8]
+            ProductModel.objects.bulk_create([
+                ProductModel(
+                    name=f'Produit {i}', slug=f'bench-vector-{run_id}-{i}', quantity=1, unit='pcs',
+                    description=f'Description du produit {i}'
+                )
+                for i in range(options['products'])
+            ])
+            products = list(ProductModel.objects.filter(slug__startswith=f'bench-vector-{run_id}-'))
+
+            for mode in MODES:
+                if mode == MODE_TRIGGER:
+                    # DDL is transactional in PostgreSQL, the rollback removes it
+                    install_search_vector_trigger()
+                with override_settings(STORE_SEARCH_VECTOR_MODE=mode):
+                    unchanged = self._time_saves(products, lambda product, i: setattr(product, 'quantity', i))
+                    changed = self._time_saves(
+                        products, lambda product, i: setattr(product, 'description', f'{mode} {i} bio')
+                    )
+                self.stdout.write(
+                    f'{mode:>8}: {unchanged:,.0f} saves/sec with unchanged text, '
+                    f'{changed:,.0f} saves/sec with a new description'
+                )
+
+            transaction.set_rollback(True)
+
+        self.stdout.write(self.style.SUCCESS('Benchmark complete'))
+
+    @staticmethod
+    def _time_saves(products, change):
+        started = time.perf_counter()
+        for i, product in enumerate(products):
+            change(product, i)
+            product.save()
+        return len(products) / (time.perf_counter() - started)
@@ -0,0 +1,158 @@
+import math
+import random
+import statistics
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from store.application.services.store_location_grid import StoreLocationGrid
+from store.config.constants import LOCATION_CACHE_TIMEOUT, MAX_RESULTS_STORES_BRANDS_NEARBY
+from store.domain.models.entities import StoreBrand
+from store.domain.services.store_location_service import StoreLocationService
+from store.domain.value_objects.coordinates import Coordinates
+from store.infrastructure.external_services.cache_service import DjangoCacheService
+
+# Benchmark runs use a private in-memory cache, never the shared Redis
+BENCHMARK_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                                'LOCATION': 'benchmark-store-location', 'OPTIONS': {'MAX_ENTRIES': 1_000_000}}}
+
+CITIES = [(48.8566, 2.3522), (45.7640, 4.8357), (43.2965, 5.3698), (44.8378, -0.5792), (50.6292, 3.0573)]
+
+
+class SyntheticPlacesService(StoreLocationService):
+    """Location provider over generated stores, counting the calls it receives"""
+
+    def __init__(self, store_brands, stores_per_city, spread_km, latency):
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+        rng = random.Random(42)
+        self.stores = {
+            brand.name: [
+                (brand.name, *_offset(rng, lat, lng, spread_km * 2))
+                for lat, lng in CITIES for _ in range(stores_per_city)
+            ]
+            for brand in store_brands
+        }
+
+    def geocode_address(self, address):
+        # Lookups start from coordinates, synthetic addresses are never geocoded
+        return None
+
+    def find_store_brand_by_name(self, name, brand_type, coordinates, radius_km):
+        places = self.find_store_brand_locations(name, brand_type, coordinates, radius_km)
+        return places[0] if places else None
+
+    def find_store_brand_locations(self, name, brand_type, coordinates, radius_km):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.latency)
+        places = []
+        for i, (_, lat, lng) in enumerate(self.stores[name]):
+            distance_km = coordinates.distance_to(Coordinates(latitude=lat, longitude=lng))
+            if distance_km <= radius_km:
+                places.append({'place_id': f'{name}-{i}', 'name': name, 'vicinity': '',
+                               'latitude': lat, 'longitude': lng, 'distance': distance_km * 1000})
+        places.sort(key=lambda place: place['distance'])
+        return places[:MAX_RESULTS_STORES_BRANDS_NEARBY]
+
+
+def _offset(rng, lat, lng, spread_km):
+    """Random point within spread_km of a center"""
+    distance = spread_km * math.sqrt(rng.random())
+    angle = rng.random() * 2 * math.pi
+    return (lat + distance * math.cos(angle) / 111.32,
+            lng + distance * math.sin(angle) / (111.32 * math.cos(math.radians(lat))))
+
+
+class Command(BaseCommand):
+    help = (
+        'Counts location provider calls per 1k nearby-brand lookups: the previous '
+        'per-query cache with one sequential call per brand, vs the geohash grid with '
+        'concurrent fetches. Also reports the calls and latency of the first lookup '
+        'around each city, when nothing is cached yet. Uses generated stores and users '
+        'clustered around French cities, and a private in-memory cache.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--lookups', type=int, default=1000)
+        parser.add_argument('--brands', type=int, default=6)
+        parser.add_argument('--stores-per-city', type=int, default=25)
+        parser.add_argument('--spread-km', type=float, default=6.0, help='Users are spread this far from city centers')
+        parser.add_argument('--radius', type=float, default=10.0)
+        parser.add_argument('--latency-ms', type=float, default=20.0, help='Simulated provider latency')
+
+    def handle(self, *args, **options):
+        rng = random.Random(7)
+        store_brands = [
+            StoreBrand(name=f'Brand {i}', slug=f'brand-{i}', type='supermarket', image_logo='', image_banner='')
+            for i in range(options['brands'])
+        ]
+        users = []
+        for _ in range(options['lookups']):
+            city = rng.choice(CITIES)
+            users.append((city, Coordinates(*_offset(rng, *city, options['spread_km']))))
+
+        for label, lookup_factory in (('per-query cache', self._legacy_lookup), ('geohash grid', self._grid_lookup)):
+            with override_settings(CACHES=BENCHMARK_CACHES):
+                provider = SyntheticPlacesService(store_brands, options['stores_per_city'],
+                                                  options['spread_km'], options['latency_ms'] / 1000)
+                lookup, finish = lookup_factory(provider, store_brands, options['radius'])
+                found = 0
+                first_calls, first_latencies = [], []
+                seen_cities = set()
+                started = time.perf_counter()
+                for city, coordinates in users:
+                    calls = provider.calls
+                    lookup_started = time.perf_counter()
+                    found += lookup(coordinates)
+                    if city not in seen_cities:
+                        seen_cities.add(city)
+                        first_latencies.append(time.perf_counter() - lookup_started)
+                        first_calls.append(provider.calls - calls)
+                finish()
+                elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f'{label:>15}: {provider.calls:,} provider calls '
+                f'({provider.calls * 1000 / len(users):,.0f} per 1k lookups), '
+                f'{found / len(users):.2f} brands found per lookup, {elapsed:.1f}s'
+            )
+            self.stdout.write(
+                f'{"":>17}first lookup per city: {statistics.mean(first_calls):.1f} calls, '
+                f'{statistics.mean(first_latencies) * 1000:.0f}ms avg, '
+                f'{max(first_latencies) * 1000:.0f}ms max'
+            )
+
+        self.stdout.write(self.style.SUCCESS('Benchmark complete'))
+
+    @staticmethod
+    def _legacy_lookup(provider, store_brands, radius_km):
+        """Previous behaviour: cache keyed by rounded coordinates, one call per brand on a miss"""
+        cache_service = DjangoCacheService()
+
+        def lookup(coordinates):
+            key = cache_service.generate_store_location_key(coordinates, radius_km, brand_slugs=None)
+            results = cache_service.get(key)
+            if results is None:
+                results = [
+                    place for place in (
+                        provider.find_store_brand_by_name(brand.name, brand.type, coordinates, radius_km)
+                        for brand in store_brands
+                    ) if place
+                ]
+                cache_service.set(key, results, LOCATION_CACHE_TIMEOUT)
+            return len(results)
+
+        return lookup, lambda: None
+
+    @staticmethod
+    def _grid_lookup(provider, store_brands, radius_km):
+        grid = StoreLocationGrid(provider, DjangoCacheService())
+
+        def lookup(coordinates):
+            return len(grid.find_closest_locations(store_brands, coordinates, radius_km))
+
+        # Let background prewarming finish so its calls are counted, the command exits next
+        return lookup, lambda: grid.prewarm_executor.shutdown(wait=True)
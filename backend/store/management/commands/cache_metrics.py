@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from store.infrastructure.external_services.cache_service import DjangoCacheService
+
+
+class Command(BaseCommand):
+    help = 'Shows the hit ratio and average payload size of the store caches, per key family.'
+
+    def handle(self, *args, **options):
+        metrics = DjangoCacheService().get_cache_metrics()
+        if not metrics:
+            self.stdout.write('No cache activity recorded yet')
+            return
+
+        self.stdout.write(f'{"family":<24} {"hits":>10} {"misses":>10} {"hit ratio":>10} {"avg payload":>12}')
+        for family in metrics:
+            self.stdout.write(
+                f'{family["family"]:<24} {family["hits"]:>10} {family["misses"]:>10} '
+                f'{family["hit_ratio"]:>10.1%} {family["avg_payload_bytes"]:>10,.0f} B'
+            )
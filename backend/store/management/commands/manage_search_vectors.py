@@ -0,0 +1,63 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from store.infrastructure.django_models.orm_models import StoreBrandModel
+from store.infrastructure.search.search_vector_maintenance import (
+    drop_search_vector_trigger,
+    get_search_vector_mode,
+    install_search_vector_trigger,
+    rebuild_search_vectors,
+    search_vector_trigger_installed,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Maintains products.search_vector. `rebuild` recomputes the vectors of one store '
+        '(or all products) in chunked UPDATEs, `install-trigger` / `drop-trigger` manage the '
+        'database trigger used by STORE_SEARCH_VECTOR_MODE = "trigger", `status` shows both.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('action', choices=['rebuild', 'install-trigger', 'drop-trigger', 'status'])
+        parser.add_argument('--store-brand', type=str, help='Slug or ID of the store brand to rebuild')
+        parser.add_argument('--chunk-size', type=int, default=5000, help='Products per UPDATE')
+
+    def handle(self, *args, **options):
+        action = options['action']
+
+        if action == 'install-trigger':
+            install_search_vector_trigger()
+            self.stdout.write(self.style.SUCCESS('search_vector trigger installed'))
+        elif action == 'drop-trigger':
+            drop_search_vector_trigger()
+            self.stdout.write(self.style.SUCCESS('search_vector trigger dropped'))
+        elif action == 'status':
+            installed = search_vector_trigger_installed()
+            self.stdout.write(f'Mode: {get_search_vector_mode()}')
+            self.stdout.write(f'Trigger installed: {"yes" if installed else "no"}')
+        else:
+            store_brand_id = self._get_store_brand_id(options['store_brand'])
+            updated = rebuild_search_vectors(
+                store_brand_id=store_brand_id,
+                chunk_size=options['chunk_size'],
+                progress=self._report_progress
+            )
+            self.stdout.write(self.style.SUCCESS(f'Rebuilt search vectors for {updated} products'))
+
+    def _get_store_brand_id(self, value):
+        if not value:
+            return None
+        store_brand = StoreBrandModel.objects.filter(slug=value).first()
+        if store_brand is None:
+            try:
+                store_brand = StoreBrandModel.objects.filter(id=value).first()
+            except Exception:
+                store_brand = None
+        if store_brand is None:
+            raise CommandError(f'Store brand {value} not found')
+        return store_brand.id
+
+    def _report_progress(self, done, total, elapsed):
+        rate = done / elapsed if elapsed else 0
+        percent = done * 100 / total if total else 100
+        self.stdout.write(f'{done}/{total} products ({percent:.0f}%), {rate:,.0f} products/sec')
@@ -16,5 +16,11 @@ from store.infrastructure.django_models.use_to_add_data.collection_models import
     CollectedProductModel as CollectedProduct
 )
 
+from store.infrastructure.django_models.analytics_models import (
+    SearchQueryLog,
+    SearchQueryHourlyRollup
+)
+
 # Re-export models with simplified names for Django admin and migrations
-__all__ = ['StoreBrand', 'Category', 'Product', 'StoreProduct', 'ProductCollectionBatch', 'CollectedProduct']
+__all__ = ['StoreBrand', 'Category', 'Product', 'StoreProduct', 'ProductCollectionBatch', 'CollectedProduct',
+           'SearchQueryLog', 'SearchQueryHourlyRollup']
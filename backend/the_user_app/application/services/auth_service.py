@@ -1,7 +1,9 @@
 from typing import Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone as dt_timezone
 from django.utils.timezone import now
 import uuid
+import jwt
+from rest_framework_simplejwt.settings import api_settings
 
 from core.domain.services.logging_service_interface import LoggingServiceInterface
 from core.domain.value_objects.result import Result
@@ -146,10 +148,8 @@ class AuthApplicationService:
                 })
                 return Result.success(True)
             
-            # Blacklist token
-            # In a real implementation, we would decode the token to get the expiration time
-            # For simplicity, we'll use a placeholder expiration time
-            expiration = datetime.now().isoformat()
+            # Blacklist token until its own expiry, after which JWT validation rejects it anyway
+            expiration = self._token_expiration(refresh_token).isoformat()
             self.auth_repository.blacklist_token(refresh_token, user_id, expiration)
             
             self.logger.info("User logged out successfully", {
@@ -165,3 +165,19 @@ class AuthApplicationService:
                 'exception': str(e)
             })
             return Result.failure(e)
+    
+    @staticmethod
+    def _token_expiration(token: str) -> datetime:
+        """Read the `exp` claim of a token, defaulting to a full refresh lifetime
+        
+        Args:
+            token: Encoded JWT
+            
+        Returns:
+            Timezone-aware expiry datetime
+        """
+        try:
+            payload = jwt.decode(token, options={"verify_signature": False})
+            return datetime.fromtimestamp(payload["exp"], tz=dt_timezone.utc)
+        except (jwt.InvalidTokenError, KeyError, TypeError, ValueError):
+            return now() + api_settings.REFRESH_TOKEN_LIFETIME
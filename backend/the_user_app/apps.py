@@ -4,7 +4,17 @@ from django.apps import AppConfig
 class TheUserAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'the_user_app'
-    
+
     def ready(self):
         # Import the models module to ensure Django can discover the models
         import the_user_app.models
+
+        from django.db.models.signals import post_delete, post_save
+        from the_user_app.infrastructure.django_models.orm_models import CustomUserModel
+        from the_user_app.infrastructure.services.user_snapshot_cache import invalidate_user_snapshot
+
+        # Drop cached auth snapshots whenever a user row changes
+        post_save.connect(invalidate_user_snapshot, sender=CustomUserModel,
+                          dispatch_uid='the_user_app.user_snapshot.save')
+        post_delete.connect(invalidate_user_snapshot, sender=CustomUserModel,
+                            dispatch_uid='the_user_app.user_snapshot.delete')
@@ -1,17 +1,26 @@
-from typing import Tuple
+from typing import Optional, Tuple
 import uuid
 from datetime import datetime
 
+from django.db import transaction
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from the_user_app.domain.models.entities import LogoutEvent, BlacklistedToken
 from the_user_app.domain.repositories.auth_repository_interfaces import AuthRepository
 from the_user_app.domain.value_objects.value_objects import AuthTokens
 from the_user_app.infrastructure.django_models.orm_models import CustomUserModel, LogoutEventModel, BlacklistedTokenModel
+from the_user_app.infrastructure.services.token_blacklist_filter import TokenBlacklistFilter
 
 class DjangoAuthRepository(AuthRepository):
     """Django ORM implementation of AuthRepository"""   
     
+    def __init__(self, blacklist_filter: Optional[TokenBlacklistFilter] = None):
+        """
+        Args:
+            blacklist_filter: Bloom filter consulted before the blacklist table
+        """
+        self.blacklist_filter = blacklist_filter
+    
     def create_tokens(self, user_id: uuid.UUID) -> AuthTokens:
         """Create access and refresh tokens for a user
         
@@ -66,6 +75,10 @@ class DjangoAuthRepository(AuthRepository):
                 expires_at=expires_datetime
             )
             
+            if self.blacklist_filter:
+                blacklist_filter = self.blacklist_filter
+                transaction.on_commit(lambda: blacklist_filter.add(token, expires_datetime))
+            
             return self._token_to_domain(blacklisted_token_model)
         except CustomUserModel.DoesNotExist:
             raise ValueError(f"User with ID {user_id} not found")
@@ -79,6 +92,9 @@ class DjangoAuthRepository(AuthRepository):
         Returns:
             True if token is blacklisted, False otherwise
         """
+        # Only possible members of the filter need the database lookup
+        if self.blacklist_filter and not self.blacklist_filter.might_contain(token):
+            return False
         return BlacklistedTokenModel.objects.filter(token=token).exists()
     
     def record_logout(self, logout_event: LogoutEvent) -> LogoutEvent:
@@ -14,6 +14,7 @@ from the_user_app.infrastructure.django_repositories.django_task_performer_profi
 from the_user_app.infrastructure.django_repositories.django_verification_code_repository import DjangoVerificationCodeRepository
 from the_user_app.infrastructure.services.verification_service_impl import VerificationServiceImpl
 from the_user_app.infrastructure.services.template_service_impl import DjangoTemplateService
+from the_user_app.infrastructure.services.token_blacklist_filter import TokenBlacklistFilter
 
 from core.infrastructure.factories.logging_factory import CoreLoggingFactory
 from core.infrastructure.factories.communication_factory import CommunicationFactory
@@ -39,6 +40,7 @@ class UserFactory:
     _template_service = None
     _verification_code_repository = None
     _verification_application_service = None
+    _token_blacklist_filter = None
     
     @staticmethod
     def create_user_repository() -> UserRepository:
@@ -65,7 +67,19 @@ class UserFactory:
         Returns:
             AuthRepository implementation
         """
-        return DjangoAuthRepository()
+        return DjangoAuthRepository(blacklist_filter=UserFactory.create_token_blacklist_filter())
+    
+    @staticmethod
+    def create_token_blacklist_filter() -> TokenBlacklistFilter:
+        """Create the process-wide token blacklist Bloom filter
+        
+        Returns:
+            TokenBlacklistFilter instance
+        """
+        if UserFactory._token_blacklist_filter is None:
+            UserFactory._token_blacklist_filter = TokenBlacklistFilter()
+        
+        return UserFactory._token_blacklist_filter
     
     @staticmethod
     def create_auth_service() -> AuthApplicationService:
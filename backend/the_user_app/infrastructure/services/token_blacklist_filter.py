@@ -0,0 +1,287 @@
+"""
+Bloom filter in front of the token blacklist.
+
+The filter answers "definitely not blacklisted" without touching the database;
+only positives (real or false) fall through to the blacklisted_token table.
+
+Bits live in Redis so every process sees the same filter, and each process
+keeps a local copy of the bitmaps. Bloom filters can't forget a member, so
+tokens are grouped into one filter per expiry day: a day's filter expires in
+Redis once every token in it has passed its `exp`, and from then on the token
+is rejected by the JWT checks anyway.
+
+Every few seconds a process reads the version of each daily filter, bumped by
+every write, and a presence bit stored past the end of each bitmap. Only the
+bitmaps whose version changed are fetched again.
+
+The presence bit is set once a day's filter has been loaded from the database.
+A missing bit means the filter was never loaded or was evicted from the cache
+Redis; until a rebuild restores it every lookup is reported as a possible
+member, so the filter never hides a blacklisted token.
+"""
+import hashlib
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBlacklistFilter:
+    """Redis-backed Bloom filter of blacklisted tokens, bucketed by expiry day"""
+
+    FILTER_KEY = "auth:blacklist:bloom:{:%Y%m%d}"
+    VERSIONS_KEY = "auth:blacklist:bloom:versions"
+    REBUILD_LOCK_KEY = "auth:blacklist:bloom:rebuild"
+
+    REBUILD_LOCK_SECONDS = 60
+    # Days past the live window whose filter a rebuild creates, so the day
+    # entering the window at midnight is already loaded
+    PRELOAD_DAYS = 2
+
+    def __init__(self, redis_client=None, size_bits: Optional[int] = None,
+                 hash_count: Optional[int] = None, refresh_seconds: Optional[float] = None):
+        """
+        Args:
+            redis_client: Raw (bytes) Redis client, defaults to the cache connection
+            size_bits: Bits per daily filter
+            hash_count: Number of bit positions per token
+            refresh_seconds: Maximum age of the local copy of the filter versions
+        """
+        self._redis = redis_client
+        self.size_bits = size_bits or getattr(settings, 'AUTH_TOKEN_BLACKLIST_FILTER_BITS', 2 ** 20)
+        self.hash_count = hash_count or getattr(settings, 'AUTH_TOKEN_BLACKLIST_FILTER_HASHES', 7)
+        self.refresh_seconds = refresh_seconds if refresh_seconds is not None else getattr(
+            settings, 'AUTH_TOKEN_BLACKLIST_FILTER_REFRESH_SECONDS', 2.0
+        )
+
+        self._lock = threading.Lock()
+        self._bitmaps: Dict[str, bytes] = {}
+        self._versions: Dict[str, Optional[bytes]] = {}
+        self._ready = False
+        self._loaded_at = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return getattr(settings, 'AUTH_TOKEN_BLACKLIST_FILTER_ENABLED', True)
+
+    @property
+    def redis(self):
+        if self._redis is None:
+            from django_redis import get_redis_connection
+            self._redis = get_redis_connection("default")
+        return self._redis
+
+    def might_contain(self, token: str) -> bool:
+        """
+        Check whether a token may be blacklisted
+
+        Args:
+            token: Token to check
+
+        Returns:
+            False only when the token is certainly not blacklisted
+        """
+        if not self.enabled:
+            return True
+        try:
+            self._refresh_if_stale()
+        except Exception as e:
+            logger.error(f"Error loading the token blacklist filter: {str(e)}")
+            return True
+
+        if not self._ready:
+            self._schedule_rebuild()
+            return True
+
+        offsets = self._offsets(token)
+        for bitmap in self._bitmaps.values():
+            if all(self._get_bit(bitmap, offset) for offset in offsets):
+                return True
+        return False
+
+    def add(self, token: str, expires_at: datetime) -> None:
+        """
+        Add a blacklisted token to the filter of its expiry day
+
+        Args:
+            token: Blacklisted token
+            expires_at: Token expiry (`exp` claim)
+        """
+        if not self.enabled:
+            return
+        try:
+            self._add_many([(token, expires_at)])
+        except Exception as e:
+            # The token is in the database; send lookups there until a rebuild picks it up
+            logger.error(f"Error adding token to the blacklist filter: {str(e)}")
+            try:
+                self.redis.setbit(self.FILTER_KEY.format(self._expiry_day(expires_at)), self.size_bits, 0)
+            except Exception:
+                pass
+            with self._lock:
+                self._ready = False
+
+    def rebuild(self, tokens: Optional[Iterable[Tuple[str, datetime]]] = None) -> int:
+        """
+        Reload every daily filter from the blacklisted tokens that haven't expired
+
+        Args:
+            tokens: (token, expires_at) pairs, defaults to the blacklist table
+
+        Returns:
+            Number of tokens added
+        """
+        if tokens is None:
+            from the_user_app.infrastructure.django_models.orm_models import BlacklistedTokenModel
+            tokens = BlacklistedTokenModel.objects.filter(
+                expires_at__gt=timezone.now()
+            ).values_list('token', 'expires_at').iterator(chunk_size=5000)
+
+        count = 0
+        batch: List[Tuple[str, datetime]] = []
+        for item in tokens:
+            batch.append(item)
+            if len(batch) >= 1000:
+                count += self._add_many(batch)
+                batch = []
+        count += self._add_many(batch)
+
+        # Mark every daily filter as loaded, including the days without tokens
+        today = timezone.now().astimezone(dt_timezone.utc).date()
+        days = [today + timedelta(days=offset) for offset in range(self._live_days() + self.PRELOAD_DAYS)]
+        keys = [self.FILTER_KEY.format(day) for day in days]
+        pipe = self.redis.pipeline(transaction=False)
+        for key, day in zip(keys, days):
+            pipe.setbit(key, self.size_bits, 1)
+            pipe.expireat(key, self._end_of_day(day))
+            pipe.hincrby(self.VERSIONS_KEY, key, 1)
+        pipe.hkeys(self.VERSIONS_KEY)
+        *_, version_keys = pipe.execute()
+        expired = [key for key in version_keys if key.decode() < keys[0]]
+        if expired:
+            self.redis.hdel(self.VERSIONS_KEY, *expired)
+
+        with self._lock:
+            self._loaded_at = 0.0
+        logger.info(f"Rebuilt the token blacklist filter with {count} tokens")
+        return count
+
+    def _add_many(self, tokens: List[Tuple[str, datetime]]) -> int:
+        if not tokens:
+            return 0
+        pipe = self.redis.pipeline(transaction=False)
+        keys = {}
+        for token, expires_at in tokens:
+            day = self._expiry_day(expires_at)
+            key = self.FILTER_KEY.format(day)
+            keys[key] = day
+            for offset in self._offsets(token):
+                pipe.setbit(key, offset, 1)
+        for key, day in keys.items():
+            # Every token in the bucket has expired by the end of the day
+            pipe.expireat(key, self._end_of_day(day))
+            pipe.hincrby(self.VERSIONS_KEY, key, 1)
+        pipe.execute()
+
+        # Writers see their own inserts straight away
+        with self._lock:
+            self._loaded_at = 0.0
+        return len(tokens)
+
+    def _refresh_if_stale(self) -> None:
+        now = time.monotonic()
+        if now - self._loaded_at < self.refresh_seconds:
+            return
+        with self._lock:
+            if now - self._loaded_at < self.refresh_seconds:
+                return
+            keys = self._live_keys()
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.hmget(self.VERSIONS_KEY, keys)
+            for key in keys:
+                pipe.getbit(key, self.size_bits)
+            versions, *present = pipe.execute()
+
+            # A version lost with the versions hash reads as changed
+            changed = [
+                (key, version) for key, version, loaded in zip(keys, versions, present)
+                if loaded and (version is None or self._versions.get(key) != version)
+            ]
+            if changed:
+                pipe = self.redis.pipeline(transaction=False)
+                for key, _ in changed:
+                    pipe.get(key)
+                bitmaps = pipe.execute()
+                for (key, version), bitmap in zip(changed, bitmaps):
+                    self._bitmaps[key] = bitmap or b''
+                    self._versions[key] = version
+                # Restore lost versions, or the bitmaps would be fetched at every refresh
+                lost = [key for key, version in changed if version is None]
+                if lost:
+                    pipe = self.redis.pipeline(transaction=False)
+                    for key in lost:
+                        pipe.hsetnx(self.VERSIONS_KEY, key, 0)
+                    pipe.execute()
+
+            live = {key for key, loaded in zip(keys, present) if loaded}
+            self._bitmaps = {key: bitmap for key, bitmap in self._bitmaps.items() if key in live}
+            self._versions = {key: version for key, version in self._versions.items() if key in live}
+            self._ready = len(live) == len(keys)
+            self._loaded_at = now
+
+    def _live_days(self) -> int:
+        """Number of daily filters, from today, that can still hold unexpired tokens"""
+        lifetime = settings.SIMPLE_JWT.get('REFRESH_TOKEN_LIFETIME', timedelta(days=30))
+        return lifetime.days + 2
+
+    def _live_keys(self) -> List[str]:
+        """Keys of the daily filters that can still hold unexpired tokens"""
+        today = timezone.now().astimezone(dt_timezone.utc).date()
+        return [self.FILTER_KEY.format(today + timedelta(days=offset)) for offset in range(self._live_days())]
+
+    def _schedule_rebuild(self) -> None:
+        """Rebuild in the background, once across every process"""
+        if not self.redis.set(self.REBUILD_LOCK_KEY, 1, nx=True, ex=self.REBUILD_LOCK_SECONDS):
+            return
+
+        def run():
+            try:
+                self.rebuild()
+            except Exception as e:
+                logger.error(f"Error rebuilding the token blacklist filter: {str(e)}")
+            finally:
+                from django.db import connection
+                connection.close()
+
+        threading.Thread(target=run, name="token-blacklist-filter-rebuild", daemon=True).start()
+
+    def _offsets(self, token: str) -> List[int]:
+        # Double hashing: k positions from two 64-bit halves of one digest
+        digest = hashlib.sha256(token.encode()).digest()
+        h1 = int.from_bytes(digest[:8], 'big')
+        h2 = int.from_bytes(digest[8:16], 'big') | 1
+        return [(h1 + i * h2) % self.size_bits for i in range(self.hash_count)]
+
+    @staticmethod
+    def _get_bit(bitmap: bytes, offset: int) -> bool:
+        # Redis numbers bits from the most significant bit of the first byte
+        index = offset >> 3
+        if index >= len(bitmap):
+            return False
+        return bool(bitmap[index] & (0x80 >> (offset & 7)))
+
+    @staticmethod
+    def _end_of_day(day) -> int:
+        return int((datetime(day.year, day.month, day.day, tzinfo=dt_timezone.utc) + timedelta(days=1)).timestamp())
+
+    @staticmethod
+    def _expiry_day(expires_at: datetime):
+        if timezone.is_naive(expires_at):
+            expires_at = timezone.make_aware(expires_at, dt_timezone.utc)
+        return expires_at.astimezone(dt_timezone.utc).date()
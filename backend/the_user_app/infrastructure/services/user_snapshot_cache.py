@@ -0,0 +1,82 @@
+"""
+Short-lived cache of user rows for token authentication.
+
+Every authenticated HTTP request and websocket connect resolves the `user_id`
+claim to a user. The snapshot keeps that row in the Django cache for a few
+seconds so bursts of requests (or a reconnect storm) don't hit the database
+once each. Saving or deleting a user drops the snapshot.
+
+Only the fields authentication and permission checks read are cached, never
+the password hash. The user is rebuilt with the other fields deferred, so
+reading one of them loads it from the database.
+"""
+import logging
+from typing import Callable, Optional
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+logger = logging.getLogger(__name__)
+
+USER_SNAPSHOT_KEY = "auth:user:fields:{}"
+
+USER_SNAPSHOT_FIELDS = (
+    'id', 'email', 'username', 'first_name', 'last_name',
+    'is_active', 'is_staff', 'is_superuser',
+)
+
+
+def get_snapshot_ttl() -> int:
+    """Snapshot lifetime in seconds, 0 disables the cache"""
+    return getattr(settings, 'AUTH_USER_SNAPSHOT_TTL_SECONDS', 30)
+
+
+def get_user_snapshot(user_id, loader: Callable[[], Optional[object]]):
+    """
+    Get a user from the snapshot cache, loading it on a miss
+
+    Args:
+        user_id: ID of the user
+        loader: Called on a miss, returns the user or None
+
+    Returns:
+        The user, or None if the loader found none. Missing and inactive
+        users are not cached.
+    """
+    ttl = get_snapshot_ttl()
+    if ttl <= 0:
+        return loader()
+
+    key = USER_SNAPSHOT_KEY.format(user_id)
+    try:
+        snapshot = cache.get(key)
+    except Exception as e:
+        logger.error(f"Error reading user snapshot {user_id}: {str(e)}")
+        return loader()
+    if snapshot is not None:
+        return user_from_snapshot(snapshot)
+
+    user = loader()
+    if user is not None and user.is_active:
+        try:
+            cache.set(key, {field: getattr(user, field) for field in USER_SNAPSHOT_FIELDS}, ttl)
+        except Exception as e:
+            logger.error(f"Error caching user snapshot {user_id}: {str(e)}")
+    return user
+
+
+def user_from_snapshot(snapshot: dict):
+    """Rebuild a user from its cached fields, the other fields are deferred"""
+    user_model = get_user_model()
+    field_names = [field.attname for field in user_model._meta.concrete_fields if field.attname in snapshot]
+    return user_model.from_db(DEFAULT_DB_ALIAS, field_names, [snapshot[name] for name in field_names])
+
+
+def invalidate_user_snapshot(sender, instance, **kwargs) -> None:
+    """post_save/post_delete receiver dropping the user's snapshot"""
+    try:
+        cache.delete(USER_SNAPSHOT_KEY.format(instance.pk))
+    except Exception as e:
+        logger.error(f"Error invalidating user snapshot {instance.pk}: {str(e)}")
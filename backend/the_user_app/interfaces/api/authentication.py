@@ -0,0 +1,21 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+
+from the_user_app.infrastructure.services.user_snapshot_cache import get_user_snapshot
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication resolving the token's user through the user snapshot cache"""
+
+    def get_user(self, validated_token):
+        """Get the user for a validated token, hitting the database only on a cache miss"""
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is None:
+            return super().get_user(validated_token)
+
+        user = get_user_snapshot(user_id, lambda: super(CachedJWTAuthentication, self).get_user(validated_token))
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return user
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from the_user_app.infrastructure.factory import UserFactory
+
+
+class Command(BaseCommand):
+    help = (
+        'Reloads the token blacklist Bloom filter from the unexpired rows of the '
+        'blacklisted_token table. Lookups go to the database until this has run once, '
+        'which also happens automatically on the first lookup.'
+    )
+
+    def handle(self, *args, **options):
+        count = UserFactory.create_token_blacklist_filter().rebuild()
+        self.stdout.write(self.style.SUCCESS(f'Token blacklist filter rebuilt with {count} tokens'))